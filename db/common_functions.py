@@ -13,22 +13,36 @@
 # limitations under the License.
 
 import os.path
+import queue
 import sqlite3
 import sys
+import threading
 import time
 import traceback
+from urllib.request import pathname2url
+import warnings
 
+# Number of prepared statements each connection keeps, so that queries with
+# bound parameters run many times (e.g. once per subproblem) are only
+# compiled once
+STATEMENT_CACHE_SIZE = 512
 
-def connect_to_database(db_path="../db/io.db", timeout=5, detect_types=0):
+
+def connect_to_database(
+    db_path="../db/io.db", timeout=5, detect_types=0, read_only=False
+):
     """
     :param db_path: str, the path to the database, relative to the
         current working directory, defaults to "../db/io.db"
     :param timeout: int, number of seconds the connection should wait for the
         database lock to go away before raising an exception, defaults to 5
     :param detect_types: int, type detection parameter, defaults to 0
+    :param read_only: boolean, open the database in read-only mode, defaults
+        to False
     :return: the sqlite3 database connection object
 
-    Connect to a database and return the connection object.
+    Connect to a database and return the connection object. The connection
+    caches up to STATEMENT_CACHE_SIZE prepared statements by their SQL.
     """
 
     if not os.path.isfile(db_path):
@@ -37,7 +51,16 @@ def connect_to_database(db_path="../db/io.db", timeout=5, detect_types=0):
             "specify a different database file?".format(os.path.abspath(db_path))
         )
 
-    conn = sqlite3.connect(db_path, timeout=timeout, detect_types=detect_types)
+    if read_only:
+        db_path = "file:{}?mode=ro".format(pathname2url(os.path.abspath(db_path)))
+
+    conn = sqlite3.connect(
+        db_path,
+        uri=read_only,
+        timeout=timeout,
+        detect_types=detect_types,
+        cached_statements=STATEMENT_CACHE_SIZE,
+    )
 
     # Enforce foreign keys (default = not enforced)
     conn.execute("PRAGMA foreign_keys=ON;")
@@ -45,6 +68,28 @@ def connect_to_database(db_path="../db/io.db", timeout=5, detect_types=0):
     return conn
 
 
+def set_bulk_import_pragmas(conn, cache_size_kib=65536):
+    """
+    :param conn: the sqlite3 database connection object
+    :param cache_size_kib: int, the size of the page cache in KiB, defaults
+        to 64 MiB
+    :return:
+
+    Tune a connection for bulk writes (e.g. importing results): fsync less
+    often (synchronous = NORMAL), truncate the rollback journal rather than
+    deleting it at every commit, and keep temporary tables, indices, and
+    more pages in memory. These settings only apply to this connection. The
+    journal mode is only changed from the default (DELETE) mode, so that
+    databases in WAL mode stay in WAL mode.
+    """
+    conn.execute("PRAGMA synchronous = NORMAL;")
+    conn.execute("PRAGMA temp_store = MEMORY;")
+    conn.execute("PRAGMA cache_size = -{};".format(int(cache_size_kib)))
+    journal_mode = conn.execute("PRAGMA journal_mode;").fetchone()[0]
+    if journal_mode.lower() == "delete":
+        conn.execute("PRAGMA journal_mode = TRUNCATE;")
+
+
 def spin_on_database_lock(
     conn, cursor, sql, data, many=True, max_attempts=61, interval=10, quiet=True
 ):
@@ -57,14 +102,24 @@ def spin_on_database_lock(
         default is True (i.e. use executemany)
     :param max_attempts: how long to wait for the database lock to be
         released; the default is 600 seconds, but that can be overridden
-    :param interval: how frequently to poll the database for whether
-        the lock has been released; the default is 10 seconds, but that can
-        be overridden
+    :param interval: how long each attempt waits for the database lock to
+        be released before it is retried; the default is 10 seconds, but
+        that can be overridden
     :param quiet: boolean; set to False to see the SQL query
 
-    If the database is locked, wait for the lock to be released for a
-    certain amount of time and occasionally retry to execute the SQL
-    statement until the timeout.
+    Execute a write statement and commit.
+
+    If the connection's writes are routed to a DatabaseWriter (see
+    DatabaseWriter.register_connection), the statement is sent to the
+    writer, which owns the database's write connection, and this function
+    returns once the writer has committed it, so writers in the same
+    process never contend for the database lock.
+
+    Otherwise, the statement is executed on the connection. If the database
+    is locked, SQLite's busy handler waits for up to *interval* seconds for
+    the lock to be released (retrying as soon as it is rather than sleeping
+    for the whole interval), and the statement is retried until
+    *max_attempts* attempts have been made.
 
     To lock the database deliberately, run the following:
         PRAGMA locking_mode = EXCLUSIVE;
@@ -75,37 +130,753 @@ def spin_on_database_lock(
     if not quiet:
         print(sql)
 
-    for i in range(0, max_attempts):
-        if i == 0:
-            # print("initial attempt")
-            pass
-        else:
-            print("...retrying (attempt {} of {})...".format(i, max_attempts))
+    writer = _DATABASE_WRITERS.get(conn)
+    if writer is not None:
         try:
-            if many:
-                cursor.executemany(sql, data)
-            else:
-                cursor.execute(sql, data)
-            conn.commit()
-        except sqlite3.OperationalError as e:
-            if "locked" in str(e):
-                print(
-                    "Database is locked, sleeping for {} seconds, "
-                    "then retrying.".format(interval)
-                )
-                if i == max_attempts:
-                    print(
-                        "Database still locked after {} seconds. "
-                        "Exiting.".format(max_attempts * interval)
-                    )
-                    sys.exit(1)
+            writer.execute(sql=sql, data=data, many=many)
+        except sqlite3.Error:
+            print("Error while running the following query:\n", sql)
+            traceback.print_exc()
+            sys.exit()
+        return
+
+    busy_timeout = conn.execute("PRAGMA busy_timeout;").fetchone()[0]
+    conn.execute("PRAGMA busy_timeout = {};".format(int(interval * 1000)))
+    try:
+        for i in range(0, max_attempts):
+            if i > 0:
+                print("...retrying (attempt {} of {})...".format(i, max_attempts))
+            attempt_start = time.time()
+            try:
+                if many:
+                    cursor.executemany(sql, data)
                 else:
-                    time.sleep(interval)
+                    cursor.execute(sql, data)
+                conn.commit()
+            except sqlite3.OperationalError as e:
+                if "locked" in str(e):
+                    print("Database is locked, retrying.")
+                    # SQLite returns immediately instead of calling the busy
+                    # handler if waiting could deadlock, so wait for the rest
+                    # of the interval before retrying
+                    time.sleep(max(0, interval - (time.time() - attempt_start)))
+                else:
+                    print("Error while running the following query:\n", sql)
+                    traceback.print_exc()
+                    sys.exit()
+            # Do this if exception not caught
             else:
-                print("Error while running the following query:\n", sql)
-                traceback.print_exc()
-                sys.exit()
-        # Do this if exception not caught
+                break
+        else:
+            print(
+                "Database still locked after {} seconds. "
+                "Exiting.".format(max_attempts * interval)
+            )
+            sys.exit(1)
+    finally:
+        conn.execute("PRAGMA busy_timeout = {};".format(busy_timeout))
+
+
+# The DatabaseWriter each connection's writes are routed to
+_DATABASE_WRITERS = dict()
+
+
+class DeferredWrites(object):
+    """
+    Collect the writes done with spin_on_database_lock on the registered
+    connections instead of executing them, e.g. to prepare the writes in a
+    worker process and execute them with the DatabaseWriter in the main
+    process. The collected (sql, data, many) requests are in *requests*.
+    """
+
+    def __init__(self):
+        self.requests = []
+
+    def register_connection(self, conn):
+        """
+        :param conn: the connection object
+        """
+        _DATABASE_WRITERS[conn] = self
+
+    def unregister_connection(self, conn):
+        """
+        :param conn: the connection object
+        """
+        if _DATABASE_WRITERS.get(conn) is self:
+            del _DATABASE_WRITERS[conn]
+
+    def execute(self, sql, data, many=True):
+        """
+        :param sql: the SQL statement
+        :param data: the data to bind to the SQL statement
+        :param many: boolean for whether to use executemany or execute
+        """
+        self.requests.append((sql, list(data) if many else data, many))
+
+
+class _WriteRequest(object):
+    """
+    A write statement queued for the DatabaseWriter; *done* is set once it
+    has been committed or has failed (with the exception in *error*).
+    """
+
+    def __init__(self, sql, data, many, wait):
+        self.sql = sql
+        self.data = data
+        self.many = many
+        self.wait = wait
+        self.done = threading.Event()
+        self.error = None
+
+
+class DatabaseWriter(object):
+    """
+    A single-writer service for a database: a thread that owns the only
+    write connection to the database and executes the write requests that
+    other threads put on its queue.
+
+    Instead of each thread writing with its own connection (and waiting
+    for the others to release the database lock), the requests are
+    executed in the order they were queued, and all requests waiting in
+    the queue are committed together in a single transaction, so the
+    number of commits goes down as the number of threads writing goes up.
+    If a statement in a batch fails, the batch is rolled back and its
+    requests are re-executed one at a time, so that only the failing
+    request gets the error.
+
+    Optionally, the writer switches the database to WAL mode, so that
+    connections reading from the database (e.g. the UI, or the threads
+    reading results to import) are not blocked while it writes and do not
+    block its commits. The journal mode is persistent: the database stays
+    in WAL mode, which keeps -wal and -shm files next to the database file
+    and doesn't work on network filesystems, so WAL mode is off by default.
+
+    Usage:
+        with DatabaseWriter(db_path=db_path) as writer:
+            writer.register_connection(conn)
+            # spin_on_database_lock(conn=conn, ...) now sends the
+            # statements to the writer
+            ...
+
+    Connections that are registered with the writer can still be used for
+    reading. Temporary tables created with spin_on_database_lock belong to
+    the writer's connection, so they can only be used in statements that
+    are also sent to the writer.
+    """
+
+    def __init__(self, db_path, timeout=600, max_batch_size=1000, wal=False):
+        """
+        :param db_path: str, the path to the database
+        :param timeout: int, number of seconds the writer's connection should
+            wait for the database lock (e.g. held by another process) to go
+            away before raising an exception, defaults to 600
+        :param max_batch_size: int, the maximum number of requests to commit
+            in a single transaction, defaults to 1000
+        :param wal: boolean, whether to switch the database to WAL mode
+            (permanently), defaults to False
+        """
+        self.db_path = db_path
+        self.timeout = timeout
+        self.max_batch_size = max_batch_size
+        self.wal = wal
+
+        self._requests = queue.Queue()
+        self._thread = None
+        self._connected = threading.Event()
+        self._connection_error = None
+        self._error = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close(raise_errors=exc_type is None)
+
+    def start(self):
+        """
+        Start the writer thread and wait for it to connect to the database.
+        """
+        self._thread = threading.Thread(
+            target=self._run, name="DatabaseWriter", daemon=True
+        )
+        self._thread.start()
+        self._connected.wait()
+        if self._connection_error is not None:
+            raise self._connection_error
+
+    def register_connection(self, conn):
+        """
+        :param conn: the connection object
+
+        Route the writes done with spin_on_database_lock on this connection
+        to the writer.
+        """
+        _DATABASE_WRITERS[conn] = self
+
+    def unregister_connection(self, conn):
+        """
+        :param conn: the connection object
+        """
+        if _DATABASE_WRITERS.get(conn) is self:
+            del _DATABASE_WRITERS[conn]
+
+    def execute(self, sql, data, many=True, wait=True):
+        """
+        :param sql: the SQL statement to execute
+        :param data: the data to bind to the SQL statement
+        :param many: boolean for whether to use executemany or execute; the
+            default is True (i.e. use executemany)
+        :param wait: boolean for whether to wait for the statement to be
+            committed (and raise its error if it fails); the default is True.
+            Errors of statements not waited for are raised by the next call
+            to execute, flush, or close.
+
+        Queue a write statement.
+        """
+        self._raise_error()
+        if self._thread is None or not self._thread.is_alive():
+            raise RuntimeError("The database writer is not running.")
+
+        request = _WriteRequest(sql=sql, data=data, many=many, wait=wait)
+        self._requests.put(request)
+        if wait:
+            request.done.wait()
+            if request.error is not None:
+                raise request.error
+
+    def flush(self):
+        """
+        Wait for all queued statements to be committed.
+        """
+        self.execute(sql=None, data=None)
+        self._raise_error()
+
+    def close(self, raise_errors=True):
+        """
+        :param raise_errors: boolean for whether to raise the error of a
+            failed statement that was not waited for; the default is True
+
+        Commit the queued statements, stop the writer thread, and close its
+        connection.
+        """
+        for conn in [
+            conn for (conn, writer) in _DATABASE_WRITERS.items() if writer is self
+        ]:
+            self.unregister_connection(conn)
+
+        if self._thread is not None and self._thread.is_alive():
+            self._requests.put(None)
+            self._thread.join()
+        if raise_errors:
+            self._raise_error()
+
+    def _raise_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _run(self):
+        try:
+            conn = connect_to_database(db_path=self.db_path, timeout=self.timeout)
+            if self.wal:
+                conn.execute("PRAGMA journal_mode = WAL;")
+            set_bulk_import_pragmas(conn=conn)
+        except Exception as e:
+            self._connection_error = e
+            self._connected.set()
+            return
+        self._connected.set()
+
+        stop = False
+        while not stop:
+            batch = [self._requests.get()]
+            while len(batch) < self.max_batch_size:
+                try:
+                    batch.append(self._requests.get_nowait())
+                except queue.Empty:
+                    break
+            if None in batch:
+                stop = True
+                batch = batch[: batch.index(None)]
+
+            if self._execute_batch(conn=conn, batch=batch) is not None:
+                # Find out which request failed
+                for request in batch:
+                    request.error = self._execute_batch(conn=conn, batch=[request])
+
+            for request in batch:
+                if request.error is not None and not request.wait:
+                    self._error = request.error
+                request.done.set()
+
+        conn.close()
+
+    @staticmethod
+    def _execute_batch(conn, batch):
+        """
+        :param conn: the writer's connection
+        :param batch: list of the requests to commit in one transaction
+        :return: the exception if a statement failed (after rolling back
+            the transaction); otherwise None
+        """
+        c = conn.cursor()
+        try:
+            for request in batch:
+                if request.sql is None:
+                    continue
+                if request.many:
+                    c.executemany(request.sql, request.data)
+                else:
+                    c.execute(request.sql, request.data)
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            return e
+        return None
+
+
+class QueryCache(object):
+    """
+    Cache of the results of the read queries run while getting the inputs of
+    a scenario's subproblems. Queries that don't depend on the subproblem
+    (e.g. the project portfolio or operational characteristics) have the
+    same SQL and parameters for every subproblem, so their results can be
+    shared.
+
+    To avoid holding on to the results of the subproblem-specific queries
+    (e.g. the timepoint-indexed inputs), a query's results are only cached
+    the second time the query is run; after that, they are served from the
+    cache. Any statement other than a SELECT clears the cache.
+
+    If the inputs of all of the scenario's subproblems/stages are written
+    through the cache, their (subproblem, stage) directory names are kept in
+    subproblem_stages, so that the time series inputs can be queried once
+    for all of them (see write_time_series_model_inputs).
+
+    If profiling, the number of executions of each query and the time spent
+    executing it and fetching its results are kept in query_times.
+    """
+
+    def __init__(self, subproblem_stages=None, profile=False):
+        """
+        :param subproblem_stages: list of the (subproblem, stage) directory
+            names of the scenario in the order their inputs are written, or
+            None if only some of the subproblems' inputs are written through
+            the cache
+        :param profile: Boolean, whether to time the queries
+        """
+        self.seen = set()
+        self.results = dict()
+        self.hits = 0
+        self.subproblem_stages = subproblem_stages
+        self.query_times = dict() if profile else None
+
+    def clear(self):
+        self.seen.clear()
+        self.results.clear()
+
+    def record_query_time(self, sql, seconds, executions):
+        """
+        :param sql: the query
+        :param seconds: the time spent executing the query or fetching its
+            results
+        :param executions: the number of executions to add
+        :return:
+        """
+        query_time = self.query_times.setdefault(sql, [0, 0.0])
+        query_time[0] += executions
+        query_time[1] += seconds
+
+    def get_query_profile(self):
+        """
+        :return: list of the (sql, executions, seconds) of the queries,
+            sorted by decreasing time
+        """
+        return sorted(
+            [
+                (sql, executions, seconds)
+                for (sql, (executions, seconds)) in self.query_times.items()
+            ],
+            key=lambda query: query[2],
+            reverse=True,
+        )
+
+
+class CachedConnection(object):
+    """
+    Wrap a database connection so that the SELECT queries run through its
+    cursors are served from a QueryCache where possible. Everything else is
+    passed through to the connection.
+    """
+
+    def __init__(self, conn, cache):
+        """
+        :param conn: the sqlite3 database connection object
+        :param cache: the QueryCache
+        """
+        self._conn = conn
+        self._cache = cache
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    @property
+    def subproblem_stages(self):
+        return self._cache.subproblem_stages
+
+    def cursor(self):
+        return CachedCursor(cursor=self._conn.cursor(), cache=self._cache)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+
+class CachedCursor(object):
+    """
+    Cursor returned by CachedConnection. Results served from the cache are
+    returned by the fetch methods and iteration like the results of the
+    underlying cursor. If the cache is profiling, the time spent in execute
+    and in the fetch methods is recorded for the query last executed.
+    """
+
+    def __init__(self, cursor, cache):
+        """
+        :param cursor: the sqlite3 cursor object
+        :param cache: the QueryCache
+        """
+        self._cursor = cursor
+        self._cache = cache
+        self._sql = None
+        self._description = None
+        self._rows = None
+        self._position = 0
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        row = self.fetchone()
+        if row is None:
+            raise StopIteration
+        return row
+
+    @property
+    def description(self):
+        if self._rows is not None:
+            return self._description
+        return self._cursor.description
+
+    def _timed(self, method, *args, executions=0):
+        if self._cache.query_times is None:
+            return method(*args)
+        start = time.perf_counter()
+        try:
+            return method(*args)
+        finally:
+            self._cache.record_query_time(
+                sql=self._sql,
+                seconds=time.perf_counter() - start,
+                executions=executions,
+            )
+
+    def execute(self, sql, parameters=()):
+        self._sql = sql
+        return self._timed(self._execute, sql, parameters, executions=1)
+
+    def _execute(self, sql, parameters):
+        self._rows = None
+        if not sql.lstrip().upper().startswith(("SELECT", "WITH")):
+            self._cache.clear()
+            self._cursor.execute(sql, parameters)
+            return self
+
+        key = (sql, tuple(parameters))
+        if key in self._cache.results:
+            self._cache.hits += 1
+            self._description, rows = self._cache.results[key]
+        elif key in self._cache.seen:
+            self._cursor.execute(sql, parameters)
+            rows = self._cursor.fetchall()
+            self._description = self._cursor.description
+            self._cache.results[key] = (self._description, rows)
         else:
-            # print("...done.")
-            break
+            self._cache.seen.add(key)
+            self._cursor.execute(sql, parameters)
+            return self
+
+        self._rows = rows
+        self._position = 0
+        return self
+
+    def executemany(self, sql, seq_of_parameters):
+        self._sql = sql
+        self._rows = None
+        self._cache.clear()
+        self._timed(self._cursor.executemany, sql, seq_of_parameters, executions=1)
+        return self
+
+    def fetchone(self):
+        return self._timed(self._fetchone)
+
+    def fetchmany(self, size=None):
+        return self._timed(self._fetchmany, size)
+
+    def fetchall(self):
+        return self._timed(self._fetchall)
+
+    def _fetchone(self):
+        if self._rows is None:
+            return self._cursor.fetchone()
+        if self._position >= len(self._rows):
+            return None
+        self._position += 1
+        return self._rows[self._position - 1]
+
+    def _fetchmany(self, size):
+        if self._rows is None:
+            return self._cursor.fetchmany(
+                self._cursor.arraysize if size is None else size
+            )
+        size = self.arraysize if size is None else size
+        rows = self._rows[self._position : self._position + size]
+        self._position += len(rows)
+        return rows
+
+    def _fetchall(self):
+        if self._rows is None:
+            return self._cursor.fetchall()
+        rows = self._rows[self._position :]
+        self._position = len(self._rows)
+        return rows
+
+
+# The views that can be materialized for the subscenario IDs of a scenario
+# with the prefix of the subscenario ID columns they are filtered by (see
+# MATERIALIZED VIEWS in db_schema.sql)
+MATERIALIZED_VIEWS = [
+    ("project_operational_horizons", "project"),
+    ("project_operational_timepoints", "project"),
+    ("transmission_operational_timepoints", "transmission"),
+]
+
+# The subscenario IDs the materialized views are keyed by
+MATERIALIZED_VIEW_SUBSCENARIO_COLUMNS = [
+    "temporal_scenario_id",
+    "project_portfolio_scenario_id",
+    "project_operational_chars_scenario_id",
+    "project_specified_capacity_scenario_id",
+    "project_new_cost_scenario_id",
+    "transmission_portfolio_scenario_id",
+    "transmission_operational_chars_scenario_id",
+    "transmission_specified_capacity_scenario_id",
+    "transmission_new_cost_scenario_id",
+]
+
+
+def get_view_columns(conn, view):
+    """
+    :param conn: the database connection object
+    :param view: str, the name of the view in the main database
+    :return: list of the view's column names
+    """
+    return [
+        column[1] for column in conn.execute("PRAGMA main.table_info({});".format(view))
+    ]
+
+
+def materialized_views_exist(conn):
+    """
+    :param conn: the database connection object
+    :return: boolean, whether the database has the tables of the
+        MATERIALIZED_VIEWS (databases created before they were added to the
+        schema don't)
+    """
+    tables = ["materialized_operational_subscenarios"] + [
+        "materialized_{}".format(view) for (view, _) in MATERIALIZED_VIEWS
+    ]
+    n_tables = conn.execute(
+        """SELECT COUNT(*)
+        FROM sqlite_master
+        WHERE type = 'table'
+        AND name IN ({});""".format(
+            ", ".join(["?"] * len(tables))
+        ),
+        tables,
+    ).fetchone()[0]
+
+    return n_tables == len(tables)
+
+
+def materialize_operational_timepoints(conn, scenario_id):
+    """
+    :param conn: the database connection object
+    :param scenario_id: int
+    :return: the materialization_id of the scenario's subscenario IDs, or
+        None if the database doesn't have the materialized views' tables
+
+    Materialize the rows of the MATERIALIZED_VIEWS for the scenario's
+    subscenario IDs, i.e. the rows the input queries select from the views
+    with the scenario's IDs, unless they are already materialized (e.g. for
+    a previous run of the scenario or for another scenario with the same
+    IDs). Materializations whose IDs are no longer those of any scenario
+    (e.g. after the scenario's IDs were changed) are deleted first.
+
+    All changes are made in a single transaction, so that a
+    materialization is never left incomplete.
+    """
+    if not materialized_views_exist(conn=conn):
+        warnings.warn(
+            "The database doesn't have the materialized operational "
+            "timepoints tables (see MATERIALIZED VIEWS in db_schema.sql). "
+            "Reading the operational timepoints from the views."
+        )
+        return None
+
+    c = conn.cursor()
+
+    subscenario_ids = c.execute(
+        """SELECT {}
+        FROM scenarios
+        WHERE scenario_id = ?;""".format(
+            ", ".join(MATERIALIZED_VIEW_SUBSCENARIO_COLUMNS)
+        ),
+        (scenario_id,),
+    ).fetchone()
+
+    with conn:
+        # Delete the materializations not used by any scenario
+        unused_materializations = """
+            SELECT materialization_id
+            FROM materialized_operational_subscenarios
+            WHERE NOT EXISTS (
+                SELECT scenario_id
+                FROM scenarios
+                WHERE {}
+            )""".format(
+            " AND ".join(
+                "scenarios.{column} IS "
+                "materialized_operational_subscenarios.{column}".format(column=column)
+                for column in MATERIALIZED_VIEW_SUBSCENARIO_COLUMNS
+            )
+        )
+        for (view, _) in MATERIALIZED_VIEWS:
+            c.execute(
+                """DELETE FROM materialized_{}
+                WHERE materialization_id IN ({});""".format(
+                    view, unused_materializations
+                )
+            )
+        c.execute(
+            """DELETE FROM materialized_operational_subscenarios
+            WHERE materialization_id IN ({});""".format(
+                unused_materializations
+            )
+        )
+
+        # IDs that are not specified are NULL, so they are compared with IS
+        materialization = c.execute(
+            """SELECT materialization_id
+            FROM materialized_operational_subscenarios
+            WHERE {};""".format(
+                " AND ".join(
+                    "{} IS ?".format(column)
+                    for column in MATERIALIZED_VIEW_SUBSCENARIO_COLUMNS
+                )
+            ),
+            subscenario_ids,
+        ).fetchone()
+        if materialization is not None:
+            return materialization[0]
+
+        c.execute(
+            """INSERT INTO materialized_operational_subscenarios ({})
+            VALUES ({});""".format(
+                ", ".join(MATERIALIZED_VIEW_SUBSCENARIO_COLUMNS),
+                ", ".join(["?"] * len(MATERIALIZED_VIEW_SUBSCENARIO_COLUMNS)),
+            ),
+            subscenario_ids,
+        )
+        materialization_id = c.lastrowid
+
+        # Select the rows with the same filters as the input queries
+        ids = dict(zip(MATERIALIZED_VIEW_SUBSCENARIO_COLUMNS, subscenario_ids))
+        for (view, prefix) in MATERIALIZED_VIEWS:
+            columns = ", ".join(get_view_columns(conn=conn, view=view))
+            c.execute(
+                """INSERT INTO materialized_{view} (materialization_id, {columns})
+                SELECT ?, {columns}
+                FROM {view}
+                WHERE {prefix}_portfolio_scenario_id = ?
+                AND {prefix}_operational_chars_scenario_id = ?
+                AND temporal_scenario_id = ?
+                AND ({prefix}_specified_capacity_scenario_id = ?
+                     OR {prefix}_new_cost_scenario_id = ?);""".format(
+                    view=view, columns=columns, prefix=prefix
+                ),
+                (
+                    materialization_id,
+                    ids[prefix + "_portfolio_scenario_id"],
+                    ids[prefix + "_operational_chars_scenario_id"],
+                    ids["temporal_scenario_id"],
+                    ids[prefix + "_specified_capacity_scenario_id"],
+                    ids[prefix + "_new_cost_scenario_id"],
+                ),
+            )
+
+    return materialization_id
+
+
+def use_materialized_operational_timepoints(conn, materialization_id):
+    """
+    :param conn: the sqlite3 database connection object
+    :param materialization_id: int, the materialization of the scenario's
+        subscenario IDs (see materialize_operational_timepoints)
+    :return:
+
+    Make the queries run on this connection read the MATERIALIZED_VIEWS
+    from their materialization rather than evaluate the views: temporary
+    views with the same names are created, which take precedence over the
+    views in the main database. The queries must use the subscenario IDs
+    of the materialization.
+    """
+    for (view, _) in MATERIALIZED_VIEWS:
+        conn.execute(
+            """CREATE TEMPORARY VIEW {view} AS
+            SELECT {columns}
+            FROM main.materialized_{view}
+            WHERE materialization_id = {materialization_id};""".format(
+                view=view,
+                columns=", ".join(get_view_columns(conn=conn, view=view)),
+                materialization_id=int(materialization_id),
+            )
+        )
+
+
+def clear_materialized_operational_timepoints(conn):
+    """
+    :param conn: the database connection object
+    :return:
+
+    Delete all materializations of the MATERIALIZED_VIEWS, e.g. when the
+    data of a subscenario they may depend on are deleted. Nothing is done if
+    the database doesn't have the materialized views' tables.
+    """
+    if not materialized_views_exist(conn=conn):
+        return
+
+    c = conn.cursor()
+    for table in [
+        "materialized_{}".format(view) for (view, _) in MATERIALIZED_VIEWS
+    ] + ["materialized_operational_subscenarios"]:
+        spin_on_database_lock(
+            conn=conn,
+            cursor=c,
+            sql="DELETE FROM {};".format(table),
+            data=(),
+            many=False,
+        )
+    c.close()
@@ -194,6 +194,18 @@ PRIMARY KEY (scenario_id, subproblem_id, stage_id),
 FOREIGN KEY (scenario_id) REFERENCES scenarios (scenario_id)
 );
 
+-- The subproblems/stages whose results have been imported since the
+-- scenario's results were last processed; process_results only
+-- re-aggregates these
+DROP TABLE IF EXISTS results_scenario_subproblem_stages_to_process;
+CREATE TABLE results_scenario_subproblem_stages_to_process (
+scenario_id INTEGER,
+subproblem_id INTEGER,
+stage_id INTEGER,
+PRIMARY KEY (scenario_id, subproblem_id, stage_id),
+FOREIGN KEY (scenario_id) REFERENCES scenarios (scenario_id)
+);
+
 
 -------------------------------------------------------------------------------
 ---- SUBSCENARIOS AND INPUTS -----
@@ -2685,6 +2697,89 @@ FOREIGN KEY (solver_options_id)
 -- Project operational chars ID and fuel ID
 
 
+-----------------------------
+-- -- MATERIALIZED VIEWS -- --
+-----------------------------
+
+-- The project_operational_horizons, project_operational_timepoints, and
+-- transmission_operational_timepoints views are built from a chain of
+-- nested views that is evaluated again by every input query that uses them.
+-- Optionally, their rows for the subscenario IDs of a scenario can be
+-- materialized in these tables when getting the scenario's inputs (see
+-- materialize_operational_timepoints in db/common_functions.py); the input
+-- queries then read from the tables instead of the views. Each
+-- materialization is keyed by the subscenario IDs the views depend on, so
+-- it is shared by the scenarios with the same IDs. A new materialization
+-- is created when a scenario's subscenario IDs change, materializations no
+-- longer used by any scenario are deleted, and all materializations are
+-- deleted when the data of a subscenario are deleted.
+DROP TABLE IF EXISTS materialized_operational_subscenarios;
+CREATE TABLE materialized_operational_subscenarios (
+materialization_id INTEGER PRIMARY KEY AUTOINCREMENT,
+temporal_scenario_id INTEGER,
+project_portfolio_scenario_id INTEGER,
+project_operational_chars_scenario_id INTEGER,
+project_specified_capacity_scenario_id INTEGER,
+project_new_cost_scenario_id INTEGER,
+transmission_portfolio_scenario_id INTEGER,
+transmission_operational_chars_scenario_id INTEGER,
+transmission_specified_capacity_scenario_id INTEGER,
+transmission_new_cost_scenario_id INTEGER
+);
+
+DROP TABLE IF EXISTS materialized_project_operational_horizons;
+CREATE TABLE materialized_project_operational_horizons (
+materialization_id INTEGER,
+project_portfolio_scenario_id INTEGER,
+project_operational_chars_scenario_id INTEGER,
+project_specified_capacity_scenario_id INTEGER,
+project_new_cost_scenario_id INTEGER,
+temporal_scenario_id INTEGER,
+operational_type VARCHAR(32),
+hydro_operational_chars_scenario_id INTEGER,
+subproblem_id INTEGER,
+stage_id INTEGER,
+project VARCHAR(64),
+horizon INTEGER,
+FOREIGN KEY (materialization_id) REFERENCES
+    materialized_operational_subscenarios (materialization_id)
+);
+
+DROP TABLE IF EXISTS materialized_project_operational_timepoints;
+CREATE TABLE materialized_project_operational_timepoints (
+materialization_id INTEGER,
+project_portfolio_scenario_id INTEGER,
+project_operational_chars_scenario_id INTEGER,
+project_specified_capacity_scenario_id INTEGER,
+project_new_cost_scenario_id INTEGER,
+temporal_scenario_id INTEGER,
+operational_type VARCHAR(32),
+variable_generator_profile_scenario_id INTEGER,
+subproblem_id INTEGER,
+stage_id INTEGER,
+project VARCHAR(64),
+timepoint INTEGER,
+FOREIGN KEY (materialization_id) REFERENCES
+    materialized_operational_subscenarios (materialization_id)
+);
+
+DROP TABLE IF EXISTS materialized_transmission_operational_timepoints;
+CREATE TABLE materialized_transmission_operational_timepoints (
+materialization_id INTEGER,
+transmission_portfolio_scenario_id INTEGER,
+transmission_operational_chars_scenario_id INTEGER,
+transmission_specified_capacity_scenario_id INTEGER,
+transmission_new_cost_scenario_id INTEGER,
+temporal_scenario_id INTEGER,
+operational_type VARCHAR(32),
+subproblem_id INTEGER,
+stage_id INTEGER,
+transmission_line VARCHAR(64),
+timepoint INTEGER,
+FOREIGN KEY (materialization_id) REFERENCES
+    materialized_operational_subscenarios (materialization_id)
+);
+
 -------------------
 -- -- RESULTS -- --
 -------------------
@@ -3777,6 +3872,132 @@ Total_Export_Penalty_Cost FLOAT,
 PRIMARY KEY (scenario_id, subproblem_id, stage_id)
 );
 
+---------------------
+-- -- INDEXES -- --
+---------------------
+
+-- The primary keys of the timepoint-level results tables start with
+-- (scenario_id, project/line/zone/BA, ...), so they can't be used to find
+-- the rows of a subproblem and stage (or their timepoints) without scanning
+-- all of the scenario's results. These indexes are used when deleting prior
+-- results for a subproblem/stage on import (which would otherwise scan a
+-- growing number of rows for each subproblem), and by the aggregations in
+-- process_results that group by subproblem, stage, and timepoint.
+
+CREATE INDEX IF NOT EXISTS results_project_availability_endogenous_subproblem_stage_tmp_idx
+ON results_project_availability_endogenous (scenario_id, subproblem_id, stage_id, timepoint);
+
+CREATE INDEX IF NOT EXISTS results_project_dispatch_subproblem_stage_tmp_idx
+ON results_project_dispatch (scenario_id, subproblem_id, stage_id, timepoint);
+
+CREATE INDEX IF NOT EXISTS results_project_lf_reserves_up_subproblem_stage_tmp_idx
+ON results_project_lf_reserves_up (scenario_id, subproblem_id, stage_id, timepoint);
+
+CREATE INDEX IF NOT EXISTS results_project_lf_reserves_down_subproblem_stage_tmp_idx
+ON results_project_lf_reserves_down (scenario_id, subproblem_id, stage_id, timepoint);
+
+CREATE INDEX IF NOT EXISTS results_project_regulation_up_subproblem_stage_tmp_idx
+ON results_project_regulation_up (scenario_id, subproblem_id, stage_id, timepoint);
+
+CREATE INDEX IF NOT EXISTS results_project_regulation_down_subproblem_stage_tmp_idx
+ON results_project_regulation_down (scenario_id, subproblem_id, stage_id, timepoint);
+
+CREATE INDEX IF NOT EXISTS results_project_frequency_response_subproblem_stage_tmp_idx
+ON results_project_frequency_response (scenario_id, subproblem_id, stage_id, timepoint);
+
+CREATE INDEX IF NOT EXISTS results_project_spinning_reserves_subproblem_stage_tmp_idx
+ON results_project_spinning_reserves (scenario_id, subproblem_id, stage_id, timepoint);
+
+CREATE INDEX IF NOT EXISTS results_project_costs_operations_subproblem_stage_tmp_idx
+ON results_project_costs_operations (scenario_id, subproblem_id, stage_id, timepoint);
+
+CREATE INDEX IF NOT EXISTS results_project_fuel_burn_subproblem_stage_tmp_idx
+ON results_project_fuel_burn (scenario_id, subproblem_id, stage_id, timepoint);
+
+CREATE INDEX IF NOT EXISTS results_project_carbon_emissions_subproblem_stage_tmp_idx
+ON results_project_carbon_emissions (scenario_id, subproblem_id, stage_id, timepoint);
+
+CREATE INDEX IF NOT EXISTS results_project_period_energy_target_subproblem_stage_tmp_idx
+ON results_project_period_energy_target (scenario_id, subproblem_id, stage_id, timepoint);
+
+CREATE INDEX IF NOT EXISTS results_transmission_imports_exports_subproblem_stage_tmp_idx
+ON results_transmission_imports_exports (scenario_id, subproblem_id, stage_id, timepoint);
+
+CREATE INDEX IF NOT EXISTS results_transmission_operations_subproblem_stage_tmp_idx
+ON results_transmission_operations (scenario_id, subproblem_id, stage_id, timepoint);
+
+CREATE INDEX IF NOT EXISTS results_transmission_hurdle_costs_subproblem_stage_tmp_idx
+ON results_transmission_hurdle_costs (scenario_id, subproblem_id, stage_id, timepoint);
+
+CREATE INDEX IF NOT EXISTS results_transmission_carbon_emissions_subproblem_stage_tmp_idx
+ON results_transmission_carbon_emissions (scenario_id, subproblem_id, stage_id, timepoint);
+
+CREATE INDEX IF NOT EXISTS results_transmission_simultaneous_flows_subproblem_stage_tmp_idx
+ON results_transmission_simultaneous_flows (scenario_id, subproblem_id, stage_id, timepoint);
+
+CREATE INDEX IF NOT EXISTS results_system_load_balance_subproblem_stage_tmp_idx
+ON results_system_load_balance (scenario_id, subproblem_id, stage_id, timepoint);
+
+CREATE INDEX IF NOT EXISTS results_system_market_participation_subproblem_stage_tmp_idx
+ON results_system_market_participation (scenario_id, subproblem_id, stage_id, timepoint);
+
+CREATE INDEX IF NOT EXISTS results_system_lf_reserves_up_balance_subproblem_stage_tmp_idx
+ON results_system_lf_reserves_up_balance (scenario_id, subproblem_id, stage_id, timepoint);
+
+CREATE INDEX IF NOT EXISTS results_system_lf_reserves_down_balance_subproblem_stage_tmp_idx
+ON results_system_lf_reserves_down_balance (scenario_id, subproblem_id, stage_id, timepoint);
+
+CREATE INDEX IF NOT EXISTS results_system_regulation_up_balance_subproblem_stage_tmp_idx
+ON results_system_regulation_up_balance (scenario_id, subproblem_id, stage_id, timepoint);
+
+CREATE INDEX IF NOT EXISTS results_system_regulation_down_balance_subproblem_stage_tmp_idx
+ON results_system_regulation_down_balance (scenario_id, subproblem_id, stage_id, timepoint);
+
+CREATE INDEX IF NOT EXISTS results_system_frequency_response_balance_subproblem_stage_tmp_idx
+ON results_system_frequency_response_balance (scenario_id, subproblem_id, stage_id, timepoint);
+
+CREATE INDEX IF NOT EXISTS results_system_frequency_response_partial_balance_subproblem_stage_tmp_idx
+ON results_system_frequency_response_partial_balance (scenario_id, subproblem_id, stage_id, timepoint);
+
+CREATE INDEX IF NOT EXISTS results_system_spinning_reserves_balance_subproblem_stage_tmp_idx
+ON results_system_spinning_reserves_balance (scenario_id, subproblem_id, stage_id, timepoint);
+
+-- UI dispatch plot queries (by scenario, load zone, and a set of
+-- timepoints); the index on the dispatch by technology table is a covering
+-- index, so the table itself is not read
+CREATE INDEX IF NOT EXISTS results_project_dispatch_by_technology_lz_tmp_idx
+ON results_project_dispatch_by_technology (scenario_id, load_zone, timepoint,
+technology, power_mw);
+
+CREATE INDEX IF NOT EXISTS results_project_curtailment_variable_lz_tmp_idx
+ON results_project_curtailment_variable (scenario_id, load_zone, timepoint);
+
+CREATE INDEX IF NOT EXISTS results_project_curtailment_hydro_lz_tmp_idx
+ON results_project_curtailment_hydro (scenario_id, load_zone, timepoint);
+
+-- The project_operational_timepoints and transmission_operational_timepoints
+-- views join the timepoints to the operational periods; with this covering
+-- index the timepoints of a subproblem/stage and period are found without
+-- reading the inputs_temporal table
+CREATE INDEX IF NOT EXISTS inputs_temporal_period_idx
+ON inputs_temporal (temporal_scenario_id, subproblem_id, stage_id, period,
+timepoint);
+
+-- The input queries select the operational timepoints/horizons of an
+-- operational type and subproblem/stage from the materialized views (see
+-- MATERIALIZED VIEWS)
+CREATE INDEX IF NOT EXISTS materialized_project_operational_horizons_idx
+ON materialized_project_operational_horizons (materialization_id,
+operational_type, subproblem_id, stage_id);
+
+CREATE INDEX IF NOT EXISTS materialized_project_operational_timepoints_idx
+ON materialized_project_operational_timepoints (materialization_id,
+operational_type, subproblem_id, stage_id);
+
+CREATE INDEX IF NOT EXISTS materialized_transmission_operational_timepoints_idx
+ON materialized_transmission_operational_timepoints (materialization_id,
+subproblem_id, stage_id);
+
 ---------------
 --- OPTIONS ---
 ---------------
@@ -22,7 +22,10 @@ import pandas as pd
 import sys
 import warnings
 
-from db.common_functions import spin_on_database_lock
+from db.common_functions import (
+    clear_materialized_operational_timepoints,
+    spin_on_database_lock,
+)
 import db.utilities.custom_functions as custom
 
 
@@ -921,6 +924,9 @@ def generic_delete_subscenario(
         conn=conn, cursor=c, sql=del_subscenario_sql, data=delete_data, many=False
     )
 
+    # The materialized operational timepoints may include the deleted data
+    clear_materialized_operational_timepoints(conn=conn)
+
     c.close()
 
 
@@ -0,0 +1,426 @@
+# Copyright 2016-2020 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+The *update_indexes.py* script creates the indexes defined in the INDEXES
+section of *db_schema.sql* in an existing GridPath database, e.g. one that
+was created before the indexes were added to the schema. Databases created
+with *create_database.py* already have the indexes. The indexes are created
+with CREATE INDEX IF NOT EXISTS, so the script can be re-run safely.
+
+>>> python update_indexes.py --database PATH/TO/DB
+
+Creating the indexes on a database with a lot of results can take a few
+minutes. Use the *--analyze* flag to also gather the table and index
+statistics the SQLite query planner uses to choose between indexes.
+
+Use the *--benchmark* flag (together with *--scenario_id*) to time the
+import and UI queries the indexes are designed for before and after
+creating them (on a copy of the database, which is then discarded).
+"""
+
+from argparse import ArgumentParser
+import os.path
+import re
+import shutil
+import sys
+import tempfile
+import time
+
+from db.common_functions import connect_to_database
+
+
+DB_SCHEMA = os.path.join(os.path.dirname(__file__), "..", "db_schema.sql")
+
+
+def get_index_statements(db_schema=DB_SCHEMA):
+    """
+    :param db_schema: the path to the database schema file
+    :return: list of (index name, CREATE INDEX statement) tuples
+
+    Get the CREATE INDEX statements from the database schema file.
+    """
+    with open(db_schema, "r") as f:
+        # Remove the comments
+        schema = "\n".join(line.split("--")[0] for line in f.read().splitlines())
+
+    statements = []
+    for statement in schema.split(";"):
+        statement = " ".join(statement.split())
+        match = re.match(
+            r"CREATE INDEX IF NOT EXISTS (\w+) ON", statement, re.IGNORECASE
+        )
+        if match:
+            statements.append((match.group(1), statement + ";"))
+
+    return statements
+
+
+def create_indexes(conn, statements, analyze, quiet):
+    """
+    :param conn: the database connection object
+    :param statements: list of (index name, CREATE INDEX statement) tuples
+    :param analyze: boolean; whether to run ANALYZE after creating the
+        indexes
+    :param quiet: boolean
+    :return:
+
+    Indexes on tables that don't exist in the database (e.g. tables added to
+    the schema after the database was created) are skipped.
+    """
+    tables = [
+        row[0]
+        for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table';"
+        ).fetchall()
+    ]
+    for (name, sql) in statements:
+        table = re.match(
+            r"CREATE INDEX IF NOT EXISTS \w+ ON (\w+)", sql, re.IGNORECASE
+        ).group(1)
+        if table not in tables:
+            if not quiet:
+                print("...skipping index {} (no table {})".format(name, table))
+            continue
+        if not quiet:
+            print("...creating index {}".format(name))
+        conn.execute(sql)
+    conn.commit()
+
+    if analyze:
+        if not quiet:
+            print("...analyzing")
+        conn.execute("ANALYZE;")
+        conn.commit()
+
+
+def drop_indexes(conn, statements):
+    """
+    :param conn: the database connection object
+    :param statements: list of (index name, CREATE INDEX statement) tuples
+    :return:
+    """
+    for (name, sql) in statements:
+        conn.execute("DROP INDEX IF EXISTS {};".format(name))
+    conn.commit()
+
+
+def get_benchmark_queries(conn, scenario_id):
+    """
+    :param conn: the database connection object
+    :param scenario_id: the scenario whose results to query
+    :return: list of (description, list of (SQL, parameters) tuples) tuples
+
+    Representative queries for results import (deleting a subproblem's prior
+    results, and re-importing them, as the indexes also have to be updated
+    when inserting the results), process_results (aggregations over all of
+    the scenario's results or, as when processing newly imported results,
+    over a subproblem and stage), the UI (dispatch plot), and getting the
+    inputs (project operational timepoints). The statements that modify the database are rolled back
+    after timing them.
+
+    The rows of the subproblem and stage are copied to a temporary table, so
+    that the re-import inserts the same rows in the same order as the
+    original import.
+    """
+    c = conn.cursor()
+    subproblem, stage = c.execute(
+        """SELECT subproblem_id, stage_id
+        FROM results_project_dispatch
+        WHERE scenario_id = ?
+        LIMIT 1;""",
+        (scenario_id,),
+    ).fetchone()
+    load_zone = c.execute(
+        """SELECT load_zone
+        FROM results_project_dispatch
+        WHERE scenario_id = ?
+        LIMIT 1;""",
+        (scenario_id,),
+    ).fetchone()[0]
+    timepoints = [
+        tmp[0]
+        for tmp in c.execute(
+            """SELECT DISTINCT timepoint
+            FROM results_project_dispatch
+            WHERE scenario_id = ?
+            AND subproblem_id = ?
+            AND stage_id = ?;""",
+            (scenario_id, subproblem, stage),
+        ).fetchall()
+    ]
+    temporal_scenario_id = c.execute(
+        """SELECT temporal_scenario_id FROM scenarios WHERE scenario_id = ?""",
+        (scenario_id,),
+    ).fetchone()[0]
+
+    c.execute("DROP TABLE IF EXISTS temp.benchmark_dispatch;")
+    c.execute(
+        """CREATE TEMP TABLE benchmark_dispatch AS
+        SELECT * FROM results_project_dispatch
+        WHERE scenario_id = ? AND subproblem_id = ? AND stage_id = ?
+        ORDER BY rowid;""",
+        (scenario_id, subproblem, stage),
+    )
+    conn.commit()
+
+    delete_dispatch = (
+        """DELETE FROM results_project_dispatch
+        WHERE scenario_id = ? AND subproblem_id = ? AND stage_id = ?;""",
+        (scenario_id, subproblem, stage),
+    )
+
+    return [
+        ("import: delete subproblem/stage dispatch results", [delete_dispatch]),
+        (
+            "import: re-import subproblem/stage dispatch results",
+            [
+                delete_dispatch,
+                (
+                    """INSERT INTO results_project_dispatch
+                    SELECT * FROM temp.benchmark_dispatch;""",
+                    (),
+                ),
+            ],
+        ),
+        (
+            "process_results: dispatch by technology",
+            [
+                (
+                    """SELECT subproblem_id, stage_id, timepoint, load_zone,
+                    technology, sum(power_mw) AS power_mw
+                    FROM results_project_dispatch
+                    WHERE scenario_id = ?
+                    GROUP BY subproblem_id, stage_id, timepoint, load_zone,
+                    technology
+                    ORDER BY subproblem_id, stage_id, timepoint, load_zone,
+                    technology;""",
+                    (scenario_id,),
+                )
+            ],
+        ),
+        (
+            "process_results: variable curtailment (all)",
+            [
+                (
+                    """SELECT scenario_id, subproblem_id, stage_id, timepoint,
+                    load_zone,
+                    sum(scheduled_curtailment_mw) AS scheduled_curtailment_mw
+                    FROM results_project_dispatch
+                    WHERE operational_type = 'gen_var'
+                    AND scenario_id = ?
+                    GROUP BY scenario_id, subproblem_id, stage_id, timepoint,
+                    load_zone;""",
+                    (scenario_id,),
+                )
+            ],
+        ),
+        (
+            "process_results: variable curtailment (subproblem/stage)",
+            [
+                (
+                    """SELECT scenario_id, subproblem_id, stage_id, timepoint,
+                    load_zone,
+                    sum(scheduled_curtailment_mw) AS scheduled_curtailment_mw
+                    FROM results_project_dispatch
+                    WHERE operational_type = 'gen_var'
+                    AND scenario_id = ?
+                    AND (subproblem_id, stage_id) IN (SELECT ?, ?)
+                    GROUP BY scenario_id, subproblem_id, stage_id, timepoint,
+                    load_zone;""",
+                    (scenario_id, subproblem, stage),
+                )
+            ],
+        ),
+        (
+            "UI: dispatch plot power by technology",
+            [
+                (
+                    """SELECT timepoint, technology, power_mw
+                    FROM results_project_dispatch_by_technology
+                    WHERE scenario_id = ?
+                    AND load_zone = ?
+                    AND timepoint IN ({});""".format(
+                        ",".join(["?"] * len(timepoints))
+                    ),
+                    tuple([scenario_id, load_zone] + timepoints),
+                )
+            ],
+        ),
+        (
+            "get_inputs: timepoints in a subproblem/stage period",
+            [
+                (
+                    """SELECT timepoint
+                    FROM inputs_temporal
+                    WHERE temporal_scenario_id = ?
+                    AND subproblem_id = ?
+                    AND stage_id = ?
+                    AND period = (
+                        SELECT MIN(period) FROM inputs_temporal
+                        WHERE temporal_scenario_id = ?
+                    );""",
+                    (temporal_scenario_id, subproblem, stage, temporal_scenario_id),
+                )
+            ],
+        ),
+    ]
+
+
+def time_queries(conn, queries, repeat):
+    """
+    :param conn: the database connection object
+    :param queries: list of (description, list of (SQL, parameters) tuples)
+        tuples
+    :param repeat: int, number of times to run each query
+    :return: dictionary of the best time (in seconds) by query description
+    """
+    times = dict()
+    for (description, statements) in queries:
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for (sql, params) in statements:
+                conn.execute(sql, params).fetchall()
+            elapsed = time.perf_counter() - start
+            conn.rollback()
+            best = elapsed if best is None else min(best, elapsed)
+        times[description] = best
+
+    return times
+
+
+def benchmark(db_path, scenario_id, statements, repeat):
+    """
+    :param db_path: the path to the database
+    :param scenario_id: the scenario whose results to query
+    :param statements: list of (index name, CREATE INDEX statement) tuples
+    :param repeat: int, number of times to run each query
+    :return:
+
+    Time the benchmark queries without and with the indexes on a copy of
+    the database.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_copy = os.path.join(tmp_dir, "benchmark.db")
+        shutil.copyfile(db_path, db_copy)
+        conn = connect_to_database(db_path=db_copy)
+
+        queries = get_benchmark_queries(conn=conn, scenario_id=scenario_id)
+
+        drop_indexes(conn=conn, statements=statements)
+        without_indexes = time_queries(conn=conn, queries=queries, repeat=repeat)
+
+        create_start = time.perf_counter()
+        create_indexes(conn=conn, statements=statements, analyze=True, quiet=True)
+        create_time = time.perf_counter() - create_start
+        with_indexes = time_queries(conn=conn, queries=queries, repeat=repeat)
+
+        conn.close()
+
+    print("Creating the indexes took {:.3f} s".format(create_time))
+    print("{:<55} {:>12} {:>12}".format("query", "before (ms)", "after (ms)"))
+    for (description, statements) in queries:
+        print(
+            "{:<55} {:>12.3f} {:>12.3f}".format(
+                description,
+                without_indexes[description] * 1000,
+                with_indexes[description] * 1000,
+            )
+        )
+
+
+def parse_arguments(args):
+    """
+    :param args: the script arguments specified by the user
+    :return: the parsed known argument values (<class 'argparse.Namespace'>
+    Python object)
+
+    Parse the known arguments.
+    """
+    parser = ArgumentParser(add_help=True)
+
+    parser.add_argument(
+        "--database",
+        default="../io.db",
+        help="The database file path relative to the current "
+        "working directory. Defaults to ../io.db ",
+    )
+    parser.add_argument(
+        "--db_schema",
+        default=DB_SCHEMA,
+        help="The database schema file with the index definitions. Defaults "
+        "to db_schema.sql in the db directory.",
+    )
+    parser.add_argument(
+        "--analyze",
+        default=False,
+        action="store_true",
+        help="Run ANALYZE after creating the indexes.",
+    )
+    parser.add_argument(
+        "--benchmark",
+        default=False,
+        action="store_true",
+        help="Time the queries the indexes are designed for with and without "
+        "the indexes on a copy of the database instead of updating the "
+        "database.",
+    )
+    parser.add_argument(
+        "--scenario_id",
+        type=int,
+        help="The scenario whose results to query in the benchmark.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of times to run each benchmark query. Defaults to 5.",
+    )
+    parser.add_argument("--quiet", default=False, action="store_true")
+
+    parsed_arguments = parser.parse_known_args(args=args)[0]
+
+    return parsed_arguments
+
+
+def main(args=None):
+    if args is None:
+        args = sys.argv[1:]
+    parsed_args = parse_arguments(args=args)
+
+    statements = get_index_statements(db_schema=parsed_args.db_schema)
+
+    if parsed_args.benchmark:
+        if parsed_args.scenario_id is None:
+            raise ValueError("Specify the --scenario_id to benchmark.")
+        benchmark(
+            db_path=parsed_args.database,
+            scenario_id=parsed_args.scenario_id,
+            statements=statements,
+            repeat=parsed_args.repeat,
+        )
+    else:
+        conn = connect_to_database(db_path=parsed_args.database)
+        create_indexes(
+            conn=conn,
+            statements=statements,
+            analyze=parsed_args.analyze,
+            quiet=parsed_args.quiet,
+        )
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
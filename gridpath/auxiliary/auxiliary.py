@@ -19,16 +19,71 @@ Various auxiliary functions used in other modules
 from importlib import import_module
 import os.path
 import pandas as pd
+from pyomo.environ import Param
 import traceback
 
 
+# Parsed input files, keyed by the absolute file path, which includes the
+# scenario, subproblem, and stage directories; each entry holds the file's
+# (modification time, size) stamp, the parsed DataFrame, and the column
+# projections requested so far
+_INPUT_FILE_CACHE = dict()
+
+
+def read_input_file(file_path, usecols=None, dtype=None):
+    """
+    :param file_path: path to a tab-delimited input file
+    :param usecols: list of columns to return; all columns if None
+    :param dtype: dictionary of {column: type} to cast the returned columns to
+    :return: pandas DataFrame
+
+    Parse an input file only once and memoize the column projections
+    requested from it, as files such as projects.tab are read by many
+    modules when building the model. The cached entry is discarded if the
+    file's modification time or size change.
+
+    Note that the returned DataFrame is shared between callers, so it must
+    not be modified in place.
+    """
+    file_path = os.path.abspath(file_path)
+    file_stat = os.stat(file_path)
+    stamp = (file_stat.st_mtime_ns, file_stat.st_size)
+
+    if file_path not in _INPUT_FILE_CACHE or _INPUT_FILE_CACHE[file_path][0] != stamp:
+        _INPUT_FILE_CACHE[file_path] = (stamp, pd.read_csv(file_path, sep="\t"), {})
+
+    (_, df, projections) = _INPUT_FILE_CACHE[file_path]
+
+    if usecols is None and dtype is None:
+        return df
+
+    projection_key = (
+        None if usecols is None else tuple(usecols),
+        None if dtype is None else tuple(sorted(dtype.items(), key=str)),
+    )
+    if projection_key not in projections:
+        projection_df = df if usecols is None else df[list(usecols)]
+        if dtype is not None:
+            projection_df = projection_df.astype(dtype)
+        projections[projection_key] = projection_df
+
+    return projections[projection_key]
+
+
+def clear_input_file_cache():
+    """
+    Empty the parsed-input cache (e.g. once a subproblem/stage is solved).
+    """
+    _INPUT_FILE_CACHE.clear()
+
+
 def get_required_subtype_modules_from_projects_file(
     scenario_directory, subproblem, stage, which_type, prj_or_tx="project"
 ):
     """
     Get a list of unique types from projects.tab.
     """
-    project_df = pd.read_csv(
+    project_df = read_input_file(
         os.path.join(
             scenario_directory,
             str(subproblem),
@@ -36,7 +91,7 @@ def get_required_subtype_modules_from_projects_file(
             "inputs",
             "{}s.tab".format(prj_or_tx),
         ),
-        sep="\t",
+        usecols=[which_type],
     )
 
     required_modules = project_df[which_type].unique()
@@ -103,6 +158,90 @@ def join_sets(mod, set_name_list):
     return joined_set
 
 
+def get_indexed_subset(mod, component_name, index, index_position, subset_position):
+    """
+    :param mod: the Pyomo model
+    :param component_name: str; the name of a multi-dimensional set (e.g.
+        PRJ_OPR_TMPS) or of a one-dimensional param (e.g. period), in which
+        case its (index, value) pairs are grouped
+    :param index: the index of the subset to return (e.g. a timepoint)
+    :param index_position: int; the position of the index in the set's (or
+        the param's (index, value)) tuples
+    :param subset_position: int; the position of the subset elements in the
+        set's (or the param's (index, value)) tuples
+    :return: list of the subset elements for the index, in the order of the
+        component
+
+    Initialize an indexed set derived from a multi-dimensional set or a param,
+    e.g. the operational projects in each timepoint from PRJ_OPR_TMPS. All
+    subsets are built in a single pass over the component the first time this
+    is called and memoized on the model, so initializing the indexed set
+    costs O(|component|) rather than O(|component| x |indices|).
+    """
+    if not hasattr(mod, "_indexed_subsets"):
+        mod._indexed_subsets = dict()
+
+    grouping = (component_name, index_position, subset_position)
+    if grouping not in mod._indexed_subsets:
+        component = getattr(mod, component_name)
+        if isinstance(component, Param):
+            tuples = ((idx, component[idx]) for idx in component)
+        else:
+            tuples = component
+
+        subsets = dict()
+        for t in tuples:
+            if t[index_position] not in subsets:
+                subsets[t[index_position]] = [t[subset_position]]
+            else:
+                subsets[t[index_position]].append(t[subset_position])
+
+        mod._indexed_subsets[grouping] = subsets
+
+    return mod._indexed_subsets[grouping].get(index, [])
+
+
+def get_zone_timepoint_subset(mod, prj_tmp_set_name, zone_param_name, zone, tmp):
+    """
+    :param mod: the Pyomo model
+    :param prj_tmp_set_name: str; the name of a two-dimensional
+        project-timepoint set (e.g. PRJ_OPR_TMPS)
+    :param zone_param_name: str; the name of the param giving each project's
+        zone (e.g. load_zone or a reserve's BA param); projects not in the
+        param's index are skipped
+    :param zone: the zone of the subset to return
+    :param tmp: the timepoint of the subset to return
+    :return: list of the projects in the zone and timepoint, in the order of
+        the project-timepoint set
+
+    Get the projects in a zone and timepoint for zone-timepoint indexed
+    expressions such as *Power_Production_in_Zone_MW*. Like
+    *get_indexed_subset*, all subsets are built in a single pass over the
+    project-timepoint set and memoized on the model, so building an expression
+    over all zones and timepoints scales linearly with the number of
+    project-timepoints rather than with zones x project-timepoints.
+    """
+    if not hasattr(mod, "_indexed_subsets"):
+        mod._indexed_subsets = dict()
+
+    grouping = (prj_tmp_set_name, zone_param_name)
+    if grouping not in mod._indexed_subsets:
+        zone_param = getattr(mod, zone_param_name)
+        subsets = dict()
+        for (prj, t) in getattr(mod, prj_tmp_set_name):
+            if prj not in zone_param:
+                continue
+            key = (zone_param[prj], t)
+            if key not in subsets:
+                subsets[key] = [prj]
+            else:
+                subsets[key].append(prj)
+
+        mod._indexed_subsets[grouping] = subsets
+
+    return mod._indexed_subsets[grouping].get((zone, tmp), [])
+
+
 def subset_init_by_param_value(mod, set_name, param_name, param_value):
     """
     Initialize subset based on a param value.
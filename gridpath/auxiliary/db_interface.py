@@ -1,3 +1,8 @@
+import csv
+import math
+import os.path
+import re
+
 from db.common_functions import spin_on_database_lock
 
 
@@ -178,6 +183,238 @@ def setup_results_import(conn, cursor, table, scenario_id, subproblem, stage):
     )
 
 
+def import_results_into_table(
+    conn, cursor, table, scenario_id, subproblem, stage, columns, results, order_by
+):
+    """
+    :param conn: the connection object
+    :param cursor: the cursor object
+    :param table: the results table we'll be inserting into
+    :param scenario_id:
+    :param subproblem:
+    :param stage:
+    :param columns: list of the names of the columns to insert, in the
+        order of the values in each results row
+    :param results: list of the complete results rows (tuples)
+    :param order_by: list of the columns to sort the rows by
+    :return:
+
+    Bulk results import: delete prior results and insert the complete rows
+    in a single sorted batch. This is the same as inserting the rows into a
+    temporary table first and then inserting them into the persistent table
+    with INSERT ... SELECT ... ORDER BY (see setup_results_import), but the
+    rows are sorted in memory, so we skip the temporary table copy. Values
+    are sorted as SQLite would sort them after applying the column type
+    affinities (NULLs first, then numbers, then text).
+    """
+    # Delete prior results
+    del_sql = """
+        DELETE FROM {} 
+        WHERE scenario_id = ?
+        AND subproblem_id = ?
+        AND stage_id = ?;
+        """.format(
+        table
+    )
+    spin_on_database_lock(
+        conn=conn,
+        cursor=cursor,
+        sql=del_sql,
+        data=(scenario_id, subproblem, stage),
+        many=False,
+    )
+
+    # Sort the rows
+    numeric_columns = get_numeric_affinity_columns(cursor=cursor, table=table)
+    sort_columns = [(columns.index(col), col in numeric_columns) for col in order_by]
+    results = sorted(
+        results,
+        key=lambda row: tuple(
+            get_sort_value(row[i], numeric) for (i, numeric) in sort_columns
+        ),
+    )
+
+    # Insert the sorted rows into the persistent table
+    insert_sql = """
+        INSERT INTO {}
+        ({})
+        VALUES ({});
+        """.format(
+        table, ", ".join(columns), ", ".join(["?"] * len(columns))
+    )
+    spin_on_database_lock(conn=conn, cursor=cursor, sql=insert_sql, data=results)
+
+
+def get_numeric_affinity_columns(cursor, table):
+    """
+    :param cursor: the cursor object
+    :param table: the table name
+    :return: set of the table's columns with a numeric type affinity
+
+    Columns with INTEGER, REAL, or NUMERIC affinity (see the SQLite rules
+    for determining column affinity from the declared type).
+    """
+    numeric_columns = set()
+    for column in cursor.execute("PRAGMA table_info({});".format(table)).fetchall():
+        col_name, col_type = column[1], column[2].upper()
+        if any(t in col_type for t in ["CHAR", "CLOB", "TEXT", "BLOB"]):
+            continue
+        elif col_type == "":
+            continue
+        else:
+            numeric_columns.add(col_name)
+
+    return numeric_columns
+
+
+# Text that SQLite converts to a number when stored in a column with a
+# numeric type affinity, i.e. a well-formed integer or real literal with
+# optional leading and trailing spaces (but not e.g. "nan", "inf", "1_000",
+# or hexadecimal literals, which Python's float() would also accept)
+SQLITE_NUMERIC_TEXT = re.compile(
+    r"^\s*[+-]?(\d+(\.\d*)?|\.\d+)([eE][+-]?\d+)?\s*$", re.ASCII
+)
+
+
+def get_sort_value(value, numeric):
+    """
+    :param value: the value to be inserted
+    :param numeric: boolean; whether the column has a numeric type affinity
+    :return: a key with which the value sorts as it would in SQLite
+
+    SQLite sorts NULLs first, then numbers, then text. Text values that
+    are numeric literals (see SQLITE_NUMERIC_TEXT) are stored (and sorted)
+    as numbers in numeric columns; numbers are stored as text in text
+    columns. Float NaNs are stored as NULLs.
+    """
+    if value is None:
+        return 0, 0
+    elif isinstance(value, float) and math.isnan(value):
+        return 0, 0
+    elif isinstance(value, (int, float)):
+        return (1, value) if numeric else (2, str(value))
+    elif numeric and SQLITE_NUMERIC_TEXT.match(str(value)):
+        return 1, float(value)
+    else:
+        return 2, str(value)
+
+
+# Restrict a results query to the scenario's subproblems/stages whose
+# results have been imported since the results were last processed (takes
+# the scenario_id as parameter)
+SUBPROBLEM_STAGES_TO_PROCESS_FILTER = """(subproblem_id, stage_id) IN (
+    SELECT subproblem_id, stage_id
+    FROM results_scenario_subproblem_stages_to_process
+    WHERE scenario_id = ?)"""
+
+
+def create_subproblem_stages_to_process_table(conn, cursor):
+    """
+    :param conn: the connection object
+    :param cursor: the cursor object
+    :return:
+
+    Create the results_scenario_subproblem_stages_to_process table if it
+    doesn't exist, e.g. in a database created before the table was added to
+    the schema (see db_schema.sql).
+    """
+    spin_on_database_lock(
+        conn=conn,
+        cursor=cursor,
+        sql="""CREATE TABLE IF NOT EXISTS
+        results_scenario_subproblem_stages_to_process (
+        scenario_id INTEGER,
+        subproblem_id INTEGER,
+        stage_id INTEGER,
+        PRIMARY KEY (scenario_id, subproblem_id, stage_id),
+        FOREIGN KEY (scenario_id) REFERENCES scenarios (scenario_id)
+        );""",
+        data=(),
+        many=False,
+    )
+
+
+def mark_subproblem_stage_to_process(conn, cursor, scenario_id, subproblem, stage):
+    """
+    :param conn: the connection object
+    :param cursor: the cursor object
+    :param scenario_id:
+    :param subproblem:
+    :param stage:
+    :return:
+
+    Record that the results of a subproblem/stage have been imported, so
+    that process_results re-aggregates them.
+    """
+    spin_on_database_lock(
+        conn=conn,
+        cursor=cursor,
+        sql="""INSERT OR IGNORE INTO results_scenario_subproblem_stages_to_process
+        (scenario_id, subproblem_id, stage_id)
+        VALUES (?, ?, ?);""",
+        data=(scenario_id, subproblem, stage),
+        many=False,
+    )
+
+
+def mark_all_subproblem_stages_to_process(conn, cursor, scenario_id):
+    """
+    :param conn: the connection object
+    :param cursor: the cursor object
+    :param scenario_id:
+    :return:
+
+    Mark all subproblems/stages with imported results (i.e. in the
+    results_scenario table) for processing.
+    """
+    spin_on_database_lock(
+        conn=conn,
+        cursor=cursor,
+        sql="""INSERT OR IGNORE INTO results_scenario_subproblem_stages_to_process
+        (scenario_id, subproblem_id, stage_id)
+        SELECT scenario_id, subproblem_id, stage_id
+        FROM results_scenario
+        WHERE scenario_id = ?;""",
+        data=(scenario_id,),
+        many=False,
+    )
+
+
+def get_subproblem_stages_to_process(cursor, scenario_id):
+    """
+    :param cursor: the cursor object
+    :param scenario_id:
+    :return: list of the (subproblem, stage) tuples marked for processing
+    """
+    return cursor.execute(
+        """SELECT subproblem_id, stage_id
+        FROM results_scenario_subproblem_stages_to_process
+        WHERE scenario_id = ?
+        ORDER BY subproblem_id, stage_id;""",
+        (scenario_id,),
+    ).fetchall()
+
+
+def clear_subproblem_stages_to_process(conn, cursor, scenario_id):
+    """
+    :param conn: the connection object
+    :param cursor: the cursor object
+    :param scenario_id:
+    :return:
+
+    Clear the subproblems/stages marked for processing once the results
+    have been processed.
+    """
+    spin_on_database_lock(
+        conn=conn,
+        cursor=cursor,
+        sql="""DELETE FROM results_scenario_subproblem_stages_to_process
+        WHERE scenario_id = ?;""",
+        data=(scenario_id,),
+        many=False,
+    )
+
+
 def update_prj_zone_column(
     conn, scenario_id, subscenarios, subscenario, subsc_tbl, prj_tbl, col
 ):
@@ -203,17 +440,34 @@ def update_prj_zone_column(
         )
     ).fetchall()
 
+    # Only update the rows of the subproblems/stages to process if the table
+    # has results by subproblem and stage
+    table_columns = [
+        column[1]
+        for column in c.execute("PRAGMA table_info({});".format(prj_tbl)).fetchall()
+    ]
+    by_subproblem_stage = (
+        "subproblem_id" in table_columns and "stage_id" in table_columns
+    )
+
     updates = []
     for (prj, zone) in project_zones:
-        updates.append((zone, scenario_id, prj))
+        if by_subproblem_stage:
+            updates.append((zone, scenario_id, prj, scenario_id))
+        else:
+            updates.append((zone, scenario_id, prj))
 
     sql = """
         UPDATE {}
         SET {} = ?
         WHERE scenario_id = ?
-        AND project = ?;
+        AND project = ?{};
         """.format(
-        prj_tbl, col
+        prj_tbl,
+        col,
+        "\n        AND " + SUBPROBLEM_STAGES_TO_PROCESS_FILTER
+        if by_subproblem_stage
+        else "",
     )
     spin_on_database_lock(conn=conn, cursor=c, sql=sql, data=updates)
 
@@ -241,3 +495,153 @@ def determine_table_subset_by_start_and_column(conn, tbl_start, cols):
                 table_subset.append(table)
 
     return table_subset
+
+
+def write_time_series_model_inputs(
+    scenario_directory,
+    subproblem,
+    stage,
+    conn,
+    fname,
+    get_data,
+    header=None,
+    replace_nulls=False,
+    write_if_empty=True,
+):
+    """
+    :param scenario_directory: string, the scenario directory
+    :param subproblem: the active subproblem, set to "" if only 1 subproblem
+    :param stage: the active stage, set to "" if only 1 stage
+    :param conn: database connection
+    :param fname: the filename (with the .tab file extension)
+    :param get_data: function of the subproblem and stage returning a cursor
+        with the query results; called with None as the subproblem and
+        stage, it must return the results for all subproblems/stages with
+        the subproblem_id and stage_id as the first two columns, ordered by
+        them
+    :param header: list of the column names; if None, the names of the
+        query's columns are used
+    :param replace_nulls: Boolean, whether to replace Nulls with "."
+    :param write_if_empty: Boolean, whether to write the file if there are
+        no rows
+    :return:
+
+    Write a time series (e.g. timepoint-indexed) input file to the
+    subproblem/stage's inputs directory; if the file already exists, the
+    rows are appended to it.
+
+    When the connection knows all of the scenario's subproblems/stages (see
+    QueryCache), the query is run once for the whole scenario instead of
+    once for each subproblem/stage: when called for the first
+    subproblem/stage, the rows of all subproblems/stages are streamed in
+    order and partitioned into their inputs directories; the calls for the
+    other subproblems/stages then have nothing left to do.
+    """
+    subproblem_stages = getattr(conn, "subproblem_stages", None)
+
+    if subproblem_stages is None:
+        data = get_data(subproblem, stage)
+        write_tab_file_rows(
+            file_path=os.path.join(
+                scenario_directory, str(subproblem), str(stage), "inputs", fname
+            ),
+            header=[s[0] for s in data.description] if header is None else header,
+            rows=data,
+            replace_nulls=replace_nulls,
+            write_if_empty=write_if_empty,
+        )
+    elif (subproblem, stage) == subproblem_stages[0]:
+        data = get_data(None, None)
+        if header is None:
+            header = [s[0] for s in data.description[2:]]
+        rows = iter(data)
+        row = next(rows, None)
+        for (subproblem_dir, stage_dir) in sorted(
+            subproblem_stages, key=get_subproblem_stage_ids
+        ):
+            subproblem_stage_ids = get_subproblem_stage_ids((subproblem_dir, stage_dir))
+            # Skip the rows of any subproblems/stages not in the scenario
+            while row is not None and tuple(row[:2]) < subproblem_stage_ids:
+                row = next(rows, None)
+            partition = []
+            while row is not None and tuple(row[:2]) == subproblem_stage_ids:
+                partition.append(row[2:])
+                row = next(rows, None)
+
+            write_tab_file_rows(
+                file_path=os.path.join(
+                    scenario_directory, subproblem_dir, stage_dir, "inputs", fname
+                ),
+                header=header,
+                rows=partition,
+                replace_nulls=replace_nulls,
+                write_if_empty=write_if_empty,
+            )
+    else:
+        pass
+
+
+def get_subproblem_stage_query_parts(subproblem, stage):
+    """
+    :param subproblem: the subproblem_id, or None for all subproblems
+    :param stage: the stage_id, or None for all stages
+    :return: tuple of the columns to select first, the filter, and the
+        ORDER BY clause of a time series query, and the parameters of the
+        filter
+
+    For a subproblem and stage, the query is filtered on their IDs. For all
+    subproblems and stages (see write_time_series_model_inputs), the
+    subproblem_id and stage_id are selected as the first two columns and
+    the results are ordered by them.
+    """
+    if subproblem is None:
+        return (
+            "subproblem_id, stage_id, ",
+            "",
+            "ORDER BY subproblem_id, stage_id",
+            (),
+        )
+    else:
+        return ("", "AND subproblem_id = ? AND stage_id = ?", "", (subproblem, stage))
+
+
+def get_subproblem_stage_ids(subproblem_stage):
+    """
+    :param subproblem_stage: tuple of the subproblem and stage directory
+        names ("" if there is only 1 subproblem or stage)
+    :return: tuple of the subproblem_id and stage_id in the database
+    """
+    (subproblem, stage) = subproblem_stage
+    return (
+        1 if subproblem == "" else int(subproblem),
+        1 if stage == "" else int(stage),
+    )
+
+
+def write_tab_file_rows(file_path, header, rows, replace_nulls, write_if_empty):
+    """
+    :param file_path: the path of the .tab file
+    :param header: list of the column names
+    :param rows: iterable of the rows
+    :param replace_nulls: Boolean, whether to replace Nulls with "."
+    :param write_if_empty: Boolean, whether to write the file if there are
+        no rows
+    :return:
+
+    Write the rows to a tab-delimited file, appending them if the file
+    already exists.
+    """
+    if not write_if_empty:
+        rows = list(rows)
+        if not rows:
+            return
+
+    f_exists = os.path.isfile(file_path)
+    with open(file_path, "a" if f_exists else "w", newline="") as f:
+        writer = csv.writer(f, delimiter="\t", lineterminator="\n")
+        if not f_exists:
+            writer.writerow(header)
+        for row in rows:
+            if replace_nulls:
+                row = ["." if i is None else i for i in row]
+            writer.writerow(row)
@@ -48,6 +48,8 @@ local_capacity_balance_provision_components = (
 cost_components = "cost_components"
 revenue_components = "revenue_components"
 
+results_format = "results_format"
+
 
 class DynamicComponents(object):
     """
@@ -121,3 +123,9 @@ class DynamicComponents(object):
         # Modules will add component names to this list
         setattr(self, cost_components, list())
         setattr(self, revenue_components, list())
+
+        # ### Results ### #
+        # The format in which modules using the columnar results export
+        # write their results tables (see auxiliary/results_export.py); this
+        # is set from the user arguments before exporting results
+        setattr(self, results_format, "csv")
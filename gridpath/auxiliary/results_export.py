@@ -0,0 +1,288 @@
+# Copyright 2016-2020 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Columnar results export: rather than looping over an index set and writing
+each row with its own component and param lookups, the modules' export_results
+functions can get whole columns at once (index columns, static attributes
+such as period, horizon, load_zone, and technology, and the values of
+variables and expressions) and write each results table in a single call.
+
+Tables written this way can also be written in a binary columnar format
+(Parquet or Arrow IPC/Feather, selected with the --results_format argument)
+instead of CSV; the results importers read them back with
+read_results_table_rows regardless of the format.
+"""
+
+from collections import OrderedDict
+import csv
+import os.path
+import pandas as pd
+from pyomo.environ import Param, Var, value
+
+
+def get_index_columns(keys):
+    """
+    :param keys: list of the (multi-dimensional) indices of the results table
+    :return: list of lists, one for each dimension of the indices
+
+    Split the table's indices into one column per dimension.
+    """
+    keys = list(keys)
+    if not keys:
+        return []
+    if not isinstance(keys[0], tuple):
+        return [keys]
+    return [list(col) for col in zip(*keys)]
+
+
+def get_param_column(param, keys):
+    """
+    :param param: a Pyomo Param
+    :param keys: list of indices of the param
+    :return: list of the param values for the indices
+
+    Extract all of the param's values once and look them up in a dictionary
+    rather than calling the param's __getitem__ for each row.
+    """
+    values = param.extract_values()
+    return [values[k] for k in keys]
+
+
+def get_component_column(component, keys):
+    """
+    :param component: a Pyomo Var, Expression, or Param
+    :param keys: list of indices
+    :return: list of the component's values for the indices; None for
+        indices the component is not defined over
+
+    Get the values of a component for all rows of a results table. Variable
+    values are extracted in bulk; expressions are evaluated once per index.
+    """
+    if isinstance(component, (Var, Param)):
+        values = component.extract_values()
+        return [values.get(k) for k in keys]
+    else:
+        return [value(component[k]) if k in component else None for k in keys]
+
+
+def get_project_timepoint_columns(m, prj_tmps, attributes):
+    """
+    :param m: the Pyomo model
+    :param prj_tmps: list of (project, timepoint) tuples
+    :param attributes: list of the static attribute columns to get, in
+        order; any of "project," "period," "horizon," "timepoint,"
+        "operational_type," "balancing_type," "timepoint_weight,"
+        "number_of_hours_in_timepoint," "load_zone," and "technology"
+    :return: OrderedDict of the columns
+
+    Get the static attribute columns shared by most project-timepoint
+    results tables, joining the project and timepoint attributes onto the
+    (project, timepoint) indices.
+    """
+    prjs, tmps = get_index_columns(prj_tmps) if prj_tmps else ([], [])
+
+    columns = OrderedDict()
+    for attribute in attributes:
+        if attribute == "project":
+            columns[attribute] = prjs
+        elif attribute == "timepoint":
+            columns[attribute] = tmps
+        elif attribute == "period":
+            columns[attribute] = get_param_column(m.period, tmps)
+        elif attribute == "timepoint_weight":
+            columns[attribute] = get_param_column(m.tmp_weight, tmps)
+        elif attribute == "number_of_hours_in_timepoint":
+            columns[attribute] = get_param_column(m.hrs_in_tmp, tmps)
+        elif attribute == "horizon":
+            balancing_types = get_param_column(m.balancing_type_project, prjs)
+            columns[attribute] = get_param_column(
+                m.horizon, list(zip(tmps, balancing_types))
+            )
+        elif attribute == "balancing_type":
+            columns[attribute] = get_param_column(m.balancing_type_project, prjs)
+        elif attribute in ["operational_type", "load_zone", "technology"]:
+            columns[attribute] = get_param_column(getattr(m, attribute), prjs)
+        else:
+            raise ValueError(
+                "Unknown project-timepoint attribute '{}'".format(attribute)
+            )
+
+    return columns
+
+
+def get_aggregated_columns(columns, group_by, first, sums):
+    """
+    :param columns: OrderedDict of {column name: list of values}
+    :param group_by: list of the columns to group the rows by
+    :param first: list of the columns that are attributes of the groups
+        (e.g. the period of a timepoint); the group's first value is used
+    :param sums: list of the columns to sum within each group
+    :return: OrderedDict of the aggregated columns (the group_by, first,
+        and sums columns, in that order), with the groups in the order in
+        which they first appear
+
+    Aggregate a results table in memory, e.g. to write an aggregated table
+    alongside the detailed one without reading the detailed one back. As
+    in SQL, None values are ignored in the sums and the sum of a group
+    with only None values is None.
+    """
+    group_rows = OrderedDict()
+    for (row, key) in enumerate(zip(*[columns[col] for col in group_by])):
+        group_rows.setdefault(key, []).append(row)
+
+    aggregated = OrderedDict()
+    for (i, col) in enumerate(group_by):
+        aggregated[col] = [key[i] for key in group_rows.keys()]
+    for col in first:
+        aggregated[col] = [columns[col][rows[0]] for rows in group_rows.values()]
+    for col in sums:
+        aggregated[col] = []
+        for rows in group_rows.values():
+            values = [columns[col][row] for row in rows]
+            values = [v for v in values if v is not None]
+            aggregated[col].append(sum(values) if values else None)
+
+    return aggregated
+
+
+RESULTS_FORMAT_EXTENSIONS = OrderedDict(
+    [("csv", ".csv"), ("parquet", ".parquet"), ("feather", ".feather")]
+)
+
+
+# The size of the write buffer of the CSV results files (in bytes)
+CSV_WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+def get_results_file_path(file_path, results_format):
+    """
+    :param file_path: the path of the results file with a .csv extension
+    :param results_format: "csv," "parquet," or "feather"
+    :return: the path of the results file in the requested format
+    """
+    if results_format not in RESULTS_FORMAT_EXTENSIONS.keys():
+        raise ValueError("Unknown results format '{}'".format(results_format))
+    return os.path.splitext(file_path)[0] + RESULTS_FORMAT_EXTENSIONS[results_format]
+
+
+def write_results_table(file_path, columns, results_format="csv"):
+    """
+    :param file_path: the path of the results file (with a .csv extension;
+        the extension is replaced for the binary formats)
+    :param columns: OrderedDict of {column name: list of values}
+    :param results_format: "csv" (default), "parquet," or "feather"
+
+    Write a results table in a single call.
+
+    For CSV, the rows are streamed from the columns straight to csv.writer
+    through a large write buffer, without building an intermediate
+    DataFrame (which would hold a second copy of the table), so the output
+    is the same as writing the rows with csv.writer; None values are
+    written as empty strings. For the binary formats, the column types are
+    inferred (None values are missing values) and the file is written with
+    pyarrow.
+
+    Any files of the same table in the other formats (e.g. from an earlier
+    run with a different results format) are removed, so that the results
+    importers can't read stale results (see *find_results_file*).
+    """
+    file_path = get_results_file_path(file_path, results_format)
+    if results_format == "csv":
+        with open(file_path, "w", newline="", buffering=CSV_WRITE_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(list(columns.keys()))
+            writer.writerows(zip(*columns.values()))
+    else:
+        df = pd.DataFrame(
+            OrderedDict((name, pd.Series(col)) for name, col in columns.items())
+        )
+        if results_format == "parquet":
+            df.to_parquet(file_path, index=False)
+        else:
+            df.to_feather(file_path)
+
+    for other_format in RESULTS_FORMAT_EXTENSIONS.keys():
+        other_file_path = get_results_file_path(file_path, other_format)
+        if other_format != results_format and os.path.exists(other_file_path):
+            os.remove(other_file_path)
+
+
+def find_results_file(file_path):
+    """
+    :param file_path: the path of the results file with a .csv extension
+    :return: the path of the results file in whichever format it was
+        written, and the format
+
+    Look for the results table in each of the results formats. Writing a
+    results table removes its files in the other formats, so only one
+    should exist; if there are files in more than one format (e.g. written
+    by an older version of GridPath), the most recently written one is
+    used.
+    """
+    found = [
+        (get_results_file_path(file_path, results_format), results_format)
+        for results_format in RESULTS_FORMAT_EXTENSIONS.keys()
+        if os.path.exists(get_results_file_path(file_path, results_format))
+    ]
+    if not found:
+        raise IOError(
+            "Results file {} not found in any results format".format(file_path)
+        )
+
+    return max(found, key=lambda f: os.path.getmtime(f[0]))
+
+
+def read_results_table(file_path):
+    """
+    :param file_path: the path of the results file with a .csv extension
+    :return: the results table as a DataFrame
+
+    Read a results table written with write_results_table in any format.
+    """
+    return read_results_file(*find_results_file(file_path))
+
+
+def read_results_file(file_path, results_format):
+    """
+    :param file_path: the path of the results file
+    :param results_format: the format of the file
+    :return: the results table as a DataFrame
+    """
+    if results_format == "csv":
+        return pd.read_csv(file_path)
+    elif results_format == "parquet":
+        return pd.read_parquet(file_path)
+    else:
+        return pd.read_feather(file_path)
+
+
+def read_results_table_rows(file_path):
+    """
+    :param file_path: the path of the results file with a .csv extension
+    :return: list of the table's rows (without the header)
+
+    Get the rows of a results table for import into the database. CSV rows
+    are returned as read by csv.reader; rows of the binary formats have
+    native Python values with None for missing values.
+    """
+    file_path, results_format = find_results_file(file_path)
+    if results_format == "csv":
+        with open(file_path, "r") as f:
+            reader = csv.reader(f)
+            next(reader)  # skip header
+            return list(reader)
+    else:
+        df = read_results_file(file_path, results_format).astype(object)
+        return df.where(pd.notnull(df), None).values.tolist()
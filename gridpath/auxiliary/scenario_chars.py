@@ -134,10 +134,9 @@ def get_subproblem_structure_from_db(conn, scenario_id):
                FROM inputs_temporal_subproblems_stages
                INNER JOIN scenarios
                USING (temporal_scenario_id)
-               WHERE scenario_id = {}
-               AND subproblem_id = {};""".format(
-                scenario_id, s
-            )
+               WHERE scenario_id = ?
+               AND subproblem_id = ?;""",
+            (scenario_id, s),
         ).fetchall()
         stages = [stage[0] for stage in stages]  # convert to simple list
         stages_by_subproblem[s] = stages
@@ -21,7 +21,6 @@ import numpy as np
 import pandas as pd
 
 from db.common_functions import spin_on_database_lock
-from gridpath.auxiliary.auxiliary import cursor_to_df
 
 
 def _get_idx_col(df):
@@ -138,13 +137,14 @@ def get_expected_dtypes(conn, tables):
 
     expected_dtypes = {}
     for table in tables:
-        # Get the expected datatypes from the table info (pragma)
-        table_info = conn.execute("""PRAGMA table_info({})""".format(table))
-        df = cursor_to_df(table_info)
-
-        df["type_category"] = df["type"].map(get_type_category)
-        dtypes_dict = dict(zip(df.name, df.type_category))
-        expected_dtypes.update(dtypes_dict)
+        # Get the expected datatypes from the table info (pragma); the
+        # table-valued function is queried with SELECT, so the table info
+        # can be served from a query cache
+        table_info = conn.execute(
+            "SELECT name, type FROM pragma_table_info(?);", (table,)
+        ).fetchall()
+        for (name, detailed_type) in table_info:
+            expected_dtypes[name] = get_type_category(detailed_type)
 
     return expected_dtypes
 
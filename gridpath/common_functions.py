@@ -149,6 +149,21 @@ def get_parallel_get_inputs_parser():
         default=1,
         help="Get inputs for n subproblems in parallel.",
     )
+    parser.add_argument(
+        "--profile_queries",
+        default=False,
+        action="store_true",
+        help="Print the time spent in each database query when getting "
+        "the inputs (without parallelization only).",
+    )
+    parser.add_argument(
+        "--materialize_operational_timepoints",
+        default=False,
+        action="store_true",
+        help="Materialize the project and transmission operational "
+        "timepoints/horizons views for the scenario's subscenario IDs and "
+        "read them from the materialized tables when getting the inputs.",
+    )
 
     return parser
 
@@ -164,6 +179,42 @@ def get_parallel_solve_parser():
     return parser
 
 
+def get_parallel_import_parser():
+    """ """
+
+    parser = ArgumentParser(add_help=False)
+    parser.add_argument(
+        "--n_parallel_import",
+        default=1,
+        help="Prepare the results of n subproblems/modules for import in " "parallel.",
+    )
+    parser.add_argument(
+        "--import_wal",
+        default=False,
+        action="store_true",
+        help="Switch the database to WAL journal mode when importing "
+        "results, so that readers (e.g. the UI) are not blocked by the "
+        "import. The database stays in WAL mode, which uses -wal and -shm "
+        "files next to the database file and doesn't work on network "
+        "filesystems.",
+    )
+
+    return parser
+
+
+def get_parallel_validate_parser():
+    """ """
+
+    parser = ArgumentParser(add_help=False)
+    parser.add_argument(
+        "--n_parallel_validate",
+        default=1,
+        help="Validate the inputs of n subproblems/modules in parallel.",
+    )
+
+    return parser
+
+
 def get_solve_parser():
     """
     Create ArgumentParser object which has the common set of arguments for
@@ -229,6 +280,40 @@ def get_solve_parser():
         action="store_true",
         help="Use symbolic labels in solver files.",
     )
+    parser.add_argument(
+        "--persistent_solver",
+        default=False,
+        action="store_true",
+        help="Keep the solver across the stages of a subproblem (and "
+        "across linked subproblems) and warm-start each solve from the "
+        "previous stage's (or linked subproblem's) solution. If only the "
+        "stage inputs (e.g. the fixed commitment) change between stages, "
+        "the previous problem instance is updated in place rather than "
+        "rebuilt. Use a Pyomo persistent solver interface (e.g. "
+        "gurobi_persistent) to also keep the solver process alive between "
+        "stages and only pass it the changes; other solvers are "
+        "warm-started via a solution file if they support it.",
+    )
+    # Results options
+    parser.add_argument(
+        "--results_format",
+        default="csv",
+        choices=["csv", "parquet", "feather"],
+        help="The format of the results tables written with the columnar "
+        "results export (e.g. dispatch_all). The binary formats (Parquet, "
+        "Arrow IPC/Feather) have typed, compressed columns and require "
+        "pyarrow. Defaults to csv.",
+    )
+    # Model build options
+    parser.add_argument(
+        "--direct_model_build",
+        default=False,
+        action="store_true",
+        help="Construct the problem instance directly from the abstract "
+        "model and the loaded data instead of creating a copy of the "
+        "abstract model with create_instance. Saves time and memory on "
+        "large problems.",
+    )
     # Flag for test runs (various changes in behavior)
     parser.add_argument(
         "--testing",
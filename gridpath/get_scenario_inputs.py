@@ -29,7 +29,13 @@ import pandas as pd
 import sys
 import warnings
 
-from db.common_functions import connect_to_database
+from db.common_functions import (
+    CachedConnection,
+    QueryCache,
+    connect_to_database,
+    materialize_operational_timepoints,
+    use_materialized_operational_timepoints,
+)
 from gridpath.auxiliary.db_interface import get_scenario_id_and_name
 from gridpath.common_functions import (
     determine_scenario_directory,
@@ -55,6 +61,8 @@ def write_model_inputs(
     subscenarios,
     db_path,
     n_parallel_subproblems,
+    profile_queries=False,
+    materialize_views=False,
 ):
     """
     For each module, load the inputs from the database and write out the inputs
@@ -69,6 +77,10 @@ def write_model_inputs(
     :param subscenarios: SubScenarios object with all subscenario info
     :param db_path: database connection
     :param n_parallel_subproblems: int; get inputs for subproblems in parallel
+    :param profile_queries: Boolean; print the time spent in each query
+    :param materialize_views: Boolean; materialize the operational
+        timepoints/horizons views for the scenario's subscenario IDs and
+        read them from the materialized tables
 
 
     :return:
@@ -99,19 +111,73 @@ def write_model_inputs(
         )
         n_parallel_subproblems = 1
 
+    if profile_queries and n_parallel_subproblems > 1:
+        warnings.warn(
+            "Queries can only be profiled when getting inputs without "
+            "parallelization. Not profiling queries."
+        )
+        profile_queries = False
+
+    # Materialize the operational timepoints/horizons views (unless already
+    # materialized for the scenario's subscenario IDs), so that the input
+    # queries don't evaluate them for each subproblem and operational type
+    # (the views are read if the database doesn't have the tables)
+    if materialize_views:
+        conn = connect_to_database(db_path=db_path)
+        materialization_id = materialize_operational_timepoints(
+            conn=conn, scenario_id=scenario_id
+        )
+        conn.close()
+    else:
+        materialization_id = None
+
     # If no parallelization requested, loop through the subproblems
+    # The queries that are the same for all subproblems are run once and
+    # their results shared through the query cache; a single connection is
+    # used, so that its prepared statements are reused for all subproblems
+    # (each process of the pool has its own cache and connection when
+    # getting the inputs in parallel)
+    # The time series inputs of all subproblems/stages are written when
+    # getting the inputs of the first one, so all inputs directories are
+    # created and cleared first
     if n_parallel_subproblems == 1:
+        subproblem_stages = []
         for subproblem in subproblem_structure.SUBPROBLEM_STAGES.keys():
-            get_inputs_for_subproblem(
-                scenario_directory=scenario_directory,
+            subproblem_stages += get_subproblem_stage_directories(
                 subproblem_structure=subproblem_structure,
                 subproblem=subproblem,
                 make_subproblem_directories=make_subproblem_directories,
-                modules_to_use=modules_to_use,
-                scenario_id=scenario_id,
-                subscenarios=subscenarios,
-                db_path=db_path,
             )
+        for (subproblem_str, stage_str) in subproblem_stages:
+            prepare_inputs_directory(
+                inputs_directory=os.path.join(
+                    scenario_directory, subproblem_str, stage_str, "inputs"
+                )
+            )
+
+        initialize_query_cache(
+            db_path=db_path,
+            subproblem_stages=subproblem_stages,
+            profile=profile_queries,
+            materialization_id=materialization_id,
+        )
+        try:
+            for subproblem in subproblem_structure.SUBPROBLEM_STAGES.keys():
+                get_inputs_for_subproblem(
+                    scenario_directory=scenario_directory,
+                    subproblem_structure=subproblem_structure,
+                    subproblem=subproblem,
+                    make_subproblem_directories=make_subproblem_directories,
+                    modules_to_use=modules_to_use,
+                    scenario_id=scenario_id,
+                    subscenarios=subscenarios,
+                    db_path=db_path,
+                    prepare_inputs_directories=False,
+                )
+            if profile_queries:
+                print_query_profile(query_profile=_query_cache.get_query_profile())
+        finally:
+            clear_query_cache()
     else:
         pool_data = tuple(
             [
@@ -129,11 +195,84 @@ def write_model_inputs(
             ]
         )
 
-        pool = Pool(n_parallel_subproblems)
+        pool = Pool(
+            n_parallel_subproblems,
+            initializer=initialize_query_cache,
+            initargs=(db_path, None, False, materialization_id),
+        )
         pool.map(get_inputs_for_subproblem_pool, pool_data)
         pool.close()
 
 
+# The query cache and database connection of this process; see
+# initialize_query_cache()
+_query_cache = None
+_conn = None
+
+
+def initialize_query_cache(
+    db_path, subproblem_stages=None, profile=False, materialization_id=None
+):
+    """
+    Create the query cache and the database connection shared by the
+    subproblems whose inputs are written by this process (also used as the
+    initializer of the pool processes).
+
+    :param db_path: the database path
+    :param subproblem_stages: list of the (subproblem, stage) directory
+        names of all of the scenario's subproblems/stages if this process
+        writes all of their inputs
+    :param profile: Boolean; whether to time the queries
+    :param materialization_id: the materialization of the operational
+        timepoints/horizons views to read them from, if any
+    """
+    global _query_cache, _conn
+    _query_cache = QueryCache(subproblem_stages=subproblem_stages, profile=profile)
+    conn = connect_to_database(db_path=db_path)
+    if materialization_id is not None:
+        use_materialized_operational_timepoints(
+            conn=conn, materialization_id=materialization_id
+        )
+    _conn = CachedConnection(conn=conn, cache=_query_cache)
+
+
+def clear_query_cache():
+    """
+    Drop the query cache and close the connection once the inputs of all
+    subproblems have been written, so that results from the database are
+    not reused for another scenario.
+    """
+    global _query_cache, _conn
+    _conn.close()
+    _query_cache = None
+    _conn = None
+
+
+def print_query_profile(query_profile, n_queries=20):
+    """
+    :param query_profile: list of the (sql, executions, seconds) of the
+        queries, sorted by decreasing time
+    :param n_queries: int; the number of queries to print
+    :return:
+
+    Print the total time spent in the queries and the queries that took
+    the longest.
+    """
+    print(
+        "Spent {:.2f} seconds in {} executions of {} queries; "
+        "slowest queries:".format(
+            sum(seconds for (sql, executions, seconds) in query_profile),
+            sum(executions for (sql, executions, seconds) in query_profile),
+            len(query_profile),
+        )
+    )
+    print("{:>10} {:>10}  {}".format("seconds", "executions", "query"))
+    for (sql, executions, seconds) in query_profile[:n_queries]:
+        # Print the start of the query on a single line
+        query = " ".join(sql.split())[:120]
+        print("{:>10.3f} {:>10}  {}".format(seconds, executions, query))
+
+
 def get_inputs_for_subproblem(
     scenario_directory,
     subproblem_structure,
@@ -143,37 +282,33 @@ def get_inputs_for_subproblem(
     scenario_id,
     subscenarios,
     db_path,
+    prepare_inputs_directories=True,
 ):
 
     loaded_modules = load_modules(modules_to_use=modules_to_use)
 
-    # First make inputs directory if needed
-    # If there are subproblems/stages, input directory will be nested
-    if make_subproblem_directories:
-        subproblem_str = str(subproblem)
-    else:
-        subproblem_str = ""
-
     stages = subproblem_structure.SUBPROBLEM_STAGES[subproblem]
-    if len(stages) == 1:
-        make_stage_directories = False
-    else:
-        make_stage_directories = True
 
-    for stage in stages:
-        if make_stage_directories:
-            stage_str = str(stage)
-        else:
-            stage_str = ""
-        inputs_directory = os.path.join(
-            scenario_directory, subproblem_str, stage_str, "inputs"
-        )
-        if not os.path.exists(inputs_directory):
-            os.makedirs(inputs_directory)
+    # Use the connection of this process if there is one
+    if _conn is None:
+        conn = connect_to_database(db_path=db_path)
+    else:
+        conn = _conn
 
-        # Delete input files that may have existed before to avoid
-        # phantom inputs
-        delete_prior_inputs(inputs_directory=inputs_directory)
+    for (subproblem_str, stage_str) in get_subproblem_stage_directories(
+        subproblem_structure=subproblem_structure,
+        subproblem=subproblem,
+        make_subproblem_directories=make_subproblem_directories,
+    ):
+        # First make inputs directory if needed and delete input files that
+        # may have existed before to avoid phantom inputs (unless already
+        # done for all subproblems)
+        if prepare_inputs_directories:
+            prepare_inputs_directory(
+                inputs_directory=os.path.join(
+                    scenario_directory, subproblem_str, stage_str, "inputs"
+                )
+            )
 
         # Write model input .tab files for each of the loaded_modules if
         # appropriate. Note that all input files are saved in the
@@ -181,7 +316,6 @@ def get_inputs_for_subproblem(
         # dependent on the subproblem or stage. This simplifies the file
         # structure at the expense of unnecessarily duplicating
         # non-temporal input files such as projects.tab.
-        conn = connect_to_database(db_path=db_path)
         for m in loaded_modules:
             if hasattr(m, "write_model_inputs"):
                 m.write_model_inputs(
@@ -194,6 +328,8 @@ def get_inputs_for_subproblem(
                 )
             else:
                 pass
+
+    if _conn is None:
         conn.close()
 
     # If there are stages in the subproblem, we also need a pass-through
@@ -233,6 +369,51 @@ def get_inputs_for_subproblem(
             )
 
 
+def get_subproblem_stage_directories(
+    subproblem_structure, subproblem, make_subproblem_directories
+):
+    """
+    :param subproblem_structure: SubProblems object with info on the
+        subproblem/stage structure
+    :param subproblem: the subproblem
+    :param make_subproblem_directories: Boolean, whether there are
+        subproblem directories
+    :return: list of the (subproblem, stage) directory names of the
+        subproblem's stages
+
+    If there are subproblems/stages, input directories will be nested;
+    otherwise the directory name is "".
+    """
+    if make_subproblem_directories:
+        subproblem_str = str(subproblem)
+    else:
+        subproblem_str = ""
+
+    stages = subproblem_structure.SUBPROBLEM_STAGES[subproblem]
+    if len(stages) == 1:
+        make_stage_directories = False
+    else:
+        make_stage_directories = True
+
+    return [
+        (subproblem_str, str(stage) if make_stage_directories else "")
+        for stage in stages
+    ]
+
+
+def prepare_inputs_directory(inputs_directory):
+    """
+    Make the inputs directory if needed and delete input files that may have
+    existed before to avoid phantom inputs
+    :param inputs_directory: local directory where .tab files are saved
+    :return:
+    """
+    if not os.path.exists(inputs_directory):
+        os.makedirs(inputs_directory)
+
+    delete_prior_inputs(inputs_directory=inputs_directory)
+
+
 def get_inputs_for_subproblem_pool(pool_datum):
     """
     Helper function to easily pass to pool.map if running subproblems in
@@ -500,6 +681,8 @@ def main(args=None):
         subscenarios=subscenarios,
         db_path=db_path,
         n_parallel_subproblems=int(parsed_arguments.n_parallel_get_inputs),
+        profile_queries=parsed_arguments.profile_queries,
+        materialize_views=parsed_arguments.materialize_operational_timepoints,
     )
 
     # Save the list of optional features to a file (will be used to determine
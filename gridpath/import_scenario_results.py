@@ -23,17 +23,30 @@ The main()_ function of this script can also be called with the
 
 from argparse import ArgumentParser
 import csv
+from multiprocessing import Pool
+from multiprocessing.util import Finalize
 import os.path
 import pandas as pd
 import sys
+import warnings
 
-from gridpath.auxiliary.db_interface import get_scenario_id_and_name
+from gridpath.auxiliary.db_interface import (
+    get_scenario_id_and_name,
+    create_subproblem_stages_to_process_table,
+    mark_subproblem_stage_to_process,
+)
 from gridpath.common_functions import (
     determine_scenario_directory,
     get_db_parser,
+    get_parallel_import_parser,
     get_required_e2e_arguments_parser,
 )
-from db.common_functions import connect_to_database, spin_on_database_lock
+from db.common_functions import (
+    DatabaseWriter,
+    DeferredWrites,
+    connect_to_database,
+    spin_on_database_lock,
+)
 from db.utilities.scenario import delete_scenario_results
 from gridpath.auxiliary.module_list import determine_modules, load_modules
 from gridpath.auxiliary.scenario_chars import get_subproblem_structure_from_db
@@ -53,6 +66,29 @@ def _import_rule(
     return import_results
 
 
+def get_results_directory(scenario_directory, subproblems, subproblem, stage):
+    """
+    :param scenario_directory: the scenario directory
+    :param subproblems: SubProblems object with info on the subproblem/stage
+        structure
+    :param subproblem:
+    :param stage:
+    :return: the results directory of the subproblem/stage
+
+    If there are subproblems/stages, the results directory is nested.
+    """
+    subproblems_list = subproblems.SUBPROBLEM_STAGES.keys()
+    stages = subproblems.SUBPROBLEM_STAGES[subproblem]
+    if len(subproblems_list) > 1 and len(stages) > 1:
+        return os.path.join(scenario_directory, str(subproblem), str(stage), "results")
+    elif len(subproblems_list) > 1:
+        return os.path.join(scenario_directory, str(subproblem), "results")
+    elif len(stages) > 1:
+        return os.path.join(scenario_directory, str(stage), "results")
+    else:
+        return os.path.join(scenario_directory, "results")
+
+
 def import_scenario_results_into_database(
     import_rule,
     loaded_modules,
@@ -62,6 +98,7 @@ def import_scenario_results_into_database(
     db,
     scenario_directory,
     quiet,
+    subproblems_to_import=None,
 ):
     """
     :param import_rule:
@@ -72,62 +109,48 @@ def import_scenario_results_into_database(
     :param db:
     :param scenario_directory:
     :param quiet: boolean
+    :param subproblems_to_import: list of the subproblems to import; all
+        subproblems are imported if None
 
     :return:
     """
 
     subproblems_list = subproblems.SUBPROBLEM_STAGES.keys()
     for subproblem in subproblems_list:
+        if (
+            subproblems_to_import is not None
+            and subproblem not in subproblems_to_import
+        ):
+            continue
         stages = subproblems.SUBPROBLEM_STAGES[subproblem]
         for stage in stages:
-            # if there are subproblems/stages, input directory will be nested
-            if len(subproblems_list) > 1 and len(stages) > 1:
-                results_directory = os.path.join(
-                    scenario_directory, str(subproblem), str(stage), "results"
-                )
-                if not quiet:
-                    print("--- subproblem {}".format(str(subproblem)))
-                    print("--- stage {}".format(str(stage)))
-            elif len(subproblems.SUBPROBLEM_STAGES.keys()) > 1:
-                results_directory = os.path.join(
-                    scenario_directory, str(subproblem), "results"
-                )
-                if not quiet:
+            results_directory = get_results_directory(
+                scenario_directory=scenario_directory,
+                subproblems=subproblems,
+                subproblem=subproblem,
+                stage=stage,
+            )
+            if not quiet:
+                if len(subproblems_list) > 1:
                     print("--- subproblem {}".format(str(subproblem)))
-            elif len(stages) > 1:
-                results_directory = os.path.join(
-                    scenario_directory, str(stage), "results"
-                )
-                if not quiet:
+                if len(stages) > 1:
                     print("--- stage {}".format(str(stage)))
-            else:
-                results_directory = os.path.join(scenario_directory, "results")
 
             # Import termination condition data
-            c = db.cursor()
-            with open(
-                os.path.join(results_directory, "termination_condition.txt"), "r"
-            ) as f:
-                termination_condition = f.read()
-
-            termination_condition_sql = """
-                INSERT INTO results_scenario
-                (scenario_id, subproblem_id, stage_id, 
-                solver_termination_condition)
-                VALUES (?, ?, ?, ?)
-            ;"""
-            termination_condition_data = (
-                scenario_id,
-                subproblem,
-                stage,
-                termination_condition,
+            termination_condition = import_termination_condition(
+                db=db,
+                scenario_id=scenario_id,
+                subproblem=subproblem,
+                stage=stage,
+                results_directory=results_directory,
             )
-            spin_on_database_lock(
+            # Flag the subproblem/stage for process_results
+            mark_subproblem_stage_to_process(
                 conn=db,
-                cursor=c,
-                sql=termination_condition_sql,
-                data=termination_condition_data,
-                many=False,
+                cursor=cursor,
+                scenario_id=scenario_id,
+                subproblem=subproblem,
+                stage=stage,
             )
 
             with open(
@@ -160,17 +183,319 @@ def import_scenario_results_into_database(
                 )
             else:
                 if not quiet:
-                    print(
-                        """
-                    Solver status for subproblem {}, stage {} was '{}', 
-                    not 'ok', so there are no results to import. 
-                    Termination condition was '{}'.
-                    """.format(
-                            subproblem, stage, solver_status, termination_condition
-                        )
+                    print_no_results_to_import(
+                        subproblem=subproblem,
+                        stage=stage,
+                        solver_status=solver_status,
+                        termination_condition=termination_condition,
                     )
 
 
+def import_scenario_results_into_database_in_parallel(
+    import_rule,
+    modules_to_use,
+    loaded_modules,
+    scenario_id,
+    subproblems,
+    db,
+    db_path,
+    scenario_directory,
+    n_parallel_import,
+    quiet,
+    subproblems_to_import=None,
+):
+    """
+    :param import_rule:
+    :param modules_to_use: list of the names of the modules
+    :param loaded_modules: list of the imported modules (in the same order)
+    :param scenario_id:
+    :param subproblems:
+    :param db:
+    :param db_path: the path to the database (for the worker processes)
+    :param scenario_directory:
+    :param n_parallel_import: int, the number of processes to use
+    :param quiet: boolean
+    :param subproblems_to_import: list of the subproblems to import; all
+        subproblems are imported if None
+
+    :return:
+
+    Import the results as in import_scenario_results_into_database, but
+    run the modules' *import_results_into_database()* methods for each
+    subproblem/stage (reading the results files and preparing the rows) in
+    a pool of processes. The processes don't write to the database:
+    their writes are collected (see DeferredWrites) and executed here with
+    this process's connection, in the same order as in the serial import,
+    so the imported results are the same.
+    """
+    c = db.cursor()
+    import_modules = [
+        m_name
+        for (m_name, m) in zip(modules_to_use, loaded_modules)
+        if hasattr(m, "import_results_into_database")
+    ]
+
+    # Check the solver status and the import rule for each subproblem/stage
+    subproblem_stages = []
+    pool_data = []
+    for subproblem in subproblems.SUBPROBLEM_STAGES.keys():
+        if (
+            subproblems_to_import is not None
+            and subproblem not in subproblems_to_import
+        ):
+            continue
+        for stage in subproblems.SUBPROBLEM_STAGES[subproblem]:
+            results_directory = get_results_directory(
+                scenario_directory=scenario_directory,
+                subproblems=subproblems,
+                subproblem=subproblem,
+                stage=stage,
+            )
+            with open(
+                os.path.join(results_directory, "solver_status.txt"), "r"
+            ) as status_f:
+                solver_status = status_f.read()
+            import_results = solver_status == "ok" and import_rule(
+                db=db,
+                scenario_id=scenario_id,
+                subproblem=subproblem,
+                stage=stage,
+                results_directory=results_directory,
+                loaded_modules=loaded_modules,
+                quiet=quiet,
+            )
+            subproblem_stages.append(
+                (subproblem, stage, results_directory, solver_status, import_results)
+            )
+            if import_results:
+                pool_data += [
+                    [
+                        m_name,
+                        scenario_id,
+                        subproblem,
+                        stage,
+                        results_directory,
+                        quiet,
+                    ]
+                    for m_name in import_modules
+                ]
+
+    pool = Pool(
+        n_parallel_import,
+        initializer=connect_worker_to_database,
+        initargs=(db_path,),
+    )
+    # The modules' writes, in the order of pool_data
+    module_writes = pool.imap(
+        import_module_results_pool,
+        pool_data,
+        chunksize=max(1, len(pool_data) // (4 * n_parallel_import)),
+    )
+
+    try:
+        for (
+            subproblem,
+            stage,
+            results_directory,
+            solver_status,
+            import_results,
+        ) in subproblem_stages:
+            termination_condition = import_termination_condition(
+                db=db,
+                scenario_id=scenario_id,
+                subproblem=subproblem,
+                stage=stage,
+                results_directory=results_directory,
+            )
+            mark_subproblem_stage_to_process(
+                conn=db,
+                cursor=c,
+                scenario_id=scenario_id,
+                subproblem=subproblem,
+                stage=stage,
+            )
+            if solver_status == "ok":
+                import_objective_function_value(
+                    db=db,
+                    scenario_id=scenario_id,
+                    subproblem=subproblem,
+                    stage=stage,
+                    results_directory=results_directory,
+                )
+                if import_results:
+                    for _ in import_modules:
+                        for (sql, data, many) in next(module_writes):
+                            spin_on_database_lock(
+                                conn=db, cursor=c, sql=sql, data=data, many=many
+                            )
+                elif not quiet:
+                    print("Results-import skipped based on import rule.")
+            else:
+                if not quiet:
+                    print_no_results_to_import(
+                        subproblem=subproblem,
+                        stage=stage,
+                        solver_status=solver_status,
+                        termination_condition=termination_condition,
+                    )
+
+    except BaseException:
+        # Don't wait for the remaining tasks
+        pool.terminate()
+        raise
+
+    pool.close()
+    pool.join()
+
+
+# The database connection of a worker process importing results in parallel
+_worker_db = None
+
+
+def connect_worker_to_database(db_path):
+    """
+    :param db_path: the path to the database
+
+    Connect a worker process to the database once rather than for each
+    module, as connecting (and reading the database schema) is slow
+    compared to importing the results of most modules. The worker's writes
+    are collected rather than executed (see import_module_results). The
+    connection is closed when the worker process exits.
+    """
+    global _worker_db
+    _worker_db = connect_to_database(db_path=db_path)
+    Finalize(None, _worker_db.close, exitpriority=10)
+
+
+def import_module_results(
+    module_name, scenario_id, subproblem, stage, results_directory, quiet
+):
+    """
+    :param module_name: the name of the module
+    :param scenario_id:
+    :param subproblem:
+    :param stage:
+    :param results_directory:
+    :param quiet: boolean
+    :return: list of the (sql, data, many) writes of the module's
+        *import_results_into_database()* method
+
+    Run a module's *import_results_into_database()* method with its writes
+    collected rather than executed.
+    """
+    [module] = load_modules([module_name])
+    deferred_writes = DeferredWrites()
+    deferred_writes.register_connection(_worker_db)
+
+    try:
+        module.import_results_into_database(
+            scenario_id=scenario_id,
+            subproblem=subproblem,
+            stage=stage,
+            c=_worker_db.cursor(),
+            db=_worker_db,
+            results_directory=results_directory,
+            quiet=quiet,
+        )
+    except SystemExit as e:
+        # Some errors are handled with sys.exit() (e.g. SQL errors in
+        # spin_on_database_lock); a SystemExit would kill the worker process
+        # without returning a result and pool.imap would wait for it
+        # forever, so raise an exception, which is passed on to the main
+        # process, instead
+        raise RuntimeError(
+            "Importing the results of module {} for subproblem {}, stage {} "
+            "failed.".format(module_name, subproblem, stage)
+        ) from e
+    finally:
+        deferred_writes.unregister_connection(_worker_db)
+
+    return deferred_writes.requests
+
+
+def import_module_results_pool(pool_datum):
+    """
+    :param pool_datum:
+    :return:
+
+    Helper function to easily pass to pool.imap if importing in parallel
+    """
+    [
+        module_name,
+        scenario_id,
+        subproblem,
+        stage,
+        results_directory,
+        quiet,
+    ] = pool_datum
+
+    return import_module_results(
+        module_name=module_name,
+        scenario_id=scenario_id,
+        subproblem=subproblem,
+        stage=stage,
+        results_directory=results_directory,
+        quiet=quiet,
+    )
+
+
+def import_termination_condition(db, scenario_id, subproblem, stage, results_directory):
+    """
+    :return: the solver termination condition
+
+    Import the solver termination condition for the subproblem/stage.
+    Delete prior results first.
+    """
+    c = db.cursor()
+    with open(os.path.join(results_directory, "termination_condition.txt"), "r") as f:
+        termination_condition = f.read()
+
+    spin_on_database_lock(
+        conn=db,
+        cursor=c,
+        sql="""DELETE FROM results_scenario
+        WHERE scenario_id = ?
+        AND subproblem_id = ?
+        AND stage_id = ?;""",
+        data=(scenario_id, subproblem, stage),
+        many=False,
+    )
+
+    termination_condition_sql = """
+        INSERT INTO results_scenario
+        (scenario_id, subproblem_id, stage_id, 
+        solver_termination_condition)
+        VALUES (?, ?, ?, ?)
+    ;"""
+    termination_condition_data = (
+        scenario_id,
+        subproblem,
+        stage,
+        termination_condition,
+    )
+    spin_on_database_lock(
+        conn=db,
+        cursor=c,
+        sql=termination_condition_sql,
+        data=termination_condition_data,
+        many=False,
+    )
+
+    return termination_condition
+
+
+def print_no_results_to_import(subproblem, stage, solver_status, termination_condition):
+    print(
+        """
+    Solver status for subproblem {}, stage {} was '{}', 
+    not 'ok', so there are no results to import. 
+    Termination condition was '{}'.
+    """.format(
+            subproblem, stage, solver_status, termination_condition
+        )
+    )
+
+
 def import_objective_function_value(
     db, scenario_id, subproblem, stage, results_directory
 ):
@@ -259,7 +584,19 @@ def parse_arguments(args):
     :return:
     """
     parser = ArgumentParser(
-        add_help=True, parents=[get_db_parser(), get_required_e2e_arguments_parser()]
+        add_help=True,
+        parents=[
+            get_db_parser(),
+            get_required_e2e_arguments_parser(),
+            get_parallel_import_parser(),
+        ],
+    )
+    parser.add_argument(
+        "--subproblems",
+        nargs="+",
+        type=int,
+        help="Only (re-)import the results of these subproblems. The prior "
+        "results of the other subproblems are kept.",
     )
     parsed_arguments = parser.parse_known_args(args=args)[0]
 
@@ -281,10 +618,24 @@ def main(import_rule, args=None):
     scenario_name_arg = parsed_arguments.scenario
     scenario_location = parsed_arguments.scenario_location
     quiet = parsed_arguments.quiet
+    n_parallel_import = int(parsed_arguments.n_parallel_import)
+    if n_parallel_import < 1:
+        warnings.warn(
+            "n_parallel_import can't be less than 1. Importing without "
+            "parallelization."
+        )
+        n_parallel_import = 1
 
     conn = connect_to_database(db_path=db_path)
     c = conn.cursor()
 
+    # Send all writes to a single writer that owns the write connection
+    # (and, if requested, switches the database to WAL mode, so that
+    # readers, e.g. the UI, are not blocked during the import)
+    writer = DatabaseWriter(db_path=db_path, wal=parsed_arguments.import_wal)
+    writer.start()
+    writer.register_connection(conn)
+
     if not parsed_arguments.quiet:
         print("Importing results... (connected to database {})".format(db_path))
 
@@ -299,6 +650,10 @@ def main(import_rule, args=None):
         conn=conn, scenario_id=scenario_id
     )
 
+    # The imported subproblems/stages are marked for processing in this
+    # table, which databases created before it was added don't have
+    create_subproblem_stages_to_process_table(conn=conn, cursor=c)
+
     # Determine scenario directory
     scenario_directory = determine_scenario_directory(
         scenario_location=scenario_location, scenario_name=scenario_name
@@ -318,25 +673,46 @@ def main(import_rule, args=None):
     # Each module also makes sure results are deleted, but this step ensures
     # that if a scenario_id was run with different modules before, we also
     # delete previously imported "phantom" results
-    delete_scenario_results(conn=conn, scenario_id=scenario_id)
+    # If only some subproblems are re-imported, the modules delete the prior
+    # results of those subproblems and the other subproblems' results are kept
+    subproblems_to_import = parsed_arguments.subproblems
+    if subproblems_to_import is None:
+        delete_scenario_results(conn=conn, scenario_id=scenario_id)
 
     # Go through modules
     modules_to_use = determine_modules(scenario_directory=scenario_directory)
     loaded_modules = load_modules(modules_to_use)
 
     # Import appropriate results into database
-    import_scenario_results_into_database(
-        import_rule=import_rule,
-        loaded_modules=loaded_modules,
-        scenario_id=scenario_id,
-        subproblems=subproblem_structure,
-        cursor=c,
-        db=conn,
-        scenario_directory=scenario_directory,
-        quiet=quiet,
-    )
-
-    # Close the database connection
+    if n_parallel_import == 1:
+        import_scenario_results_into_database(
+            import_rule=import_rule,
+            loaded_modules=loaded_modules,
+            scenario_id=scenario_id,
+            subproblems=subproblem_structure,
+            cursor=c,
+            db=conn,
+            scenario_directory=scenario_directory,
+            quiet=quiet,
+            subproblems_to_import=subproblems_to_import,
+        )
+    else:
+        import_scenario_results_into_database_in_parallel(
+            import_rule=import_rule,
+            modules_to_use=modules_to_use,
+            loaded_modules=loaded_modules,
+            scenario_id=scenario_id,
+            subproblems=subproblem_structure,
+            db=conn,
+            db_path=db_path,
+            scenario_directory=scenario_directory,
+            n_parallel_import=n_parallel_import,
+            quiet=quiet,
+            subproblems_to_import=subproblems_to_import,
+        )
+
+    # Stop the writer and close the database connection
+    writer.close()
     conn.close()
 
 
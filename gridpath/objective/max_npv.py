@@ -54,6 +54,13 @@ from db.common_functions import spin_on_database_lock
 from gridpath.auxiliary.dynamic_components import cost_components, revenue_components
 from gridpath.auxiliary.db_interface import setup_results_import
 
+# Register numpy types with sqlite, so that they are properly inserted
+# from pandas dataframes (also by the process writing to the database when
+# the results are imported in parallel, so do it when the module is loaded)
+# https://stackoverflow.com/questions/38753737/inserting-numpy-integer-types-into-sqlite-with-python3
+sqlite3.register_adapter(np.int64, lambda val: int(val))
+sqlite3.register_adapter(np.float64, lambda val: float(val))
+
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
     """
@@ -155,12 +162,6 @@ def import_results_into_database(
     df["stage_id"] = stage
     results = df.to_records(index=False)
 
-    # Register numpy types with sqlite, so that they are properly inserted
-    # from pandas dataframes
-    # https://stackoverflow.com/questions/38753737/inserting-numpy-integer-types-into-sqlite-with-python3
-    sqlite3.register_adapter(np.int64, lambda val: int(val))
-    sqlite3.register_adapter(np.float64, lambda val: float(val))
-
     insert_sql = """
         INSERT INTO results_system_costs
         ({})
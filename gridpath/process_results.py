@@ -17,6 +17,17 @@ This script iterates over all modules required for a GridPath scenario and
 calls their *process_results()* method, which makes updates to database
 tables.
 
+Results processing is incremental: the results import flags the
+subproblems/stages it imports (in the
+*results_scenario_subproblem_stages_to_process* table) and the modules only
+re-aggregate the results of the flagged subproblems/stages, so re-importing
+a single subproblem (see the *--subproblems* option of
+*import_scenario_results.py*) does not trigger a full re-aggregation. The
+flags are cleared once the results have been processed. The results of all
+subproblems/stages are processed if none are flagged (e.g. if the results
+were imported before the import flagged subproblems/stages) or with the
+*--reprocess_all* flag.
+
 The main() function of this script can also be called with the
 *gridpath_process_results* command when GridPath is installed.
 """
@@ -33,7 +44,13 @@ from gridpath.common_functions import (
     get_db_parser,
     get_required_e2e_arguments_parser,
 )
-from gridpath.auxiliary.db_interface import get_scenario_id_and_name
+from gridpath.auxiliary.db_interface import (
+    clear_subproblem_stages_to_process,
+    create_subproblem_stages_to_process_table,
+    get_scenario_id_and_name,
+    get_subproblem_stages_to_process,
+    mark_all_subproblem_stages_to_process,
+)
 from gridpath.auxiliary.module_list import determine_modules, load_modules
 from gridpath.auxiliary.scenario_chars import SubScenarios
 
@@ -66,6 +83,13 @@ def parse_arguments(args):
     parser = ArgumentParser(
         add_help=True, parents=[get_db_parser(), get_required_e2e_arguments_parser()]
     )
+    parser.add_argument(
+        "--reprocess_all",
+        default=False,
+        action="store_true",
+        help="Process the results of all subproblems/stages, not only the "
+        "ones imported since the results were last processed.",
+    )
     parsed_arguments = parser.parse_known_args(args=args)[0]
 
     return parsed_arguments
@@ -111,6 +135,17 @@ def main(args=None):
     # Subscenarios
     subscenarios = SubScenarios(conn=conn, scenario_id=scenario_id)
 
+    # Process all subproblems/stages if requested or if none are flagged,
+    # e.g. if the results were imported before the import flagged the
+    # subproblems/stages it imports (or before the table existed)
+    create_subproblem_stages_to_process_table(conn=conn, cursor=c)
+    if parsed_arguments.reprocess_all or not get_subproblem_stages_to_process(
+        cursor=c, scenario_id=scenario_id
+    ):
+        mark_all_subproblem_stages_to_process(
+            conn=conn, cursor=c, scenario_id=scenario_id
+        )
+
     process_results(
         loaded_modules=loaded_modules,
         db=conn,
@@ -119,6 +154,7 @@ def main(args=None):
         subscenarios=subscenarios,
         quiet=parsed_arguments.quiet,
     )
+    clear_subproblem_stages_to_process(conn=conn, cursor=c, scenario_id=scenario_id)
 
     # Close the database connection
     conn.close()
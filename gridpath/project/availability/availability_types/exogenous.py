@@ -22,11 +22,14 @@ optimization.
 
 """
 
-import csv
 import os.path
 from pyomo.environ import Param, Set, NonNegativeReals
 
 from gridpath.auxiliary.auxiliary import cursor_to_df
+from gridpath.auxiliary.db_interface import (
+    get_subproblem_stage_query_parts,
+    write_time_series_model_inputs,
+)
 from gridpath.auxiliary.validations import (
     write_validation_to_database,
     get_expected_dtypes,
@@ -158,25 +161,35 @@ def get_inputs_from_database(scenario_id, subscenarios, subproblem, stage, conn)
     :param stage:
     :param conn:
     :return:
+
+    If the subproblem and stage are None, the derates of all subproblems
+    and stages are selected, with the subproblem_id and stage_id as the
+    first two columns and ordered by them.
     """
     subproblem = 1 if subproblem == "" else subproblem
     stage = 1 if stage == "" else stage
 
+    (
+        subproblem_stage_columns,
+        subproblem_stage_filter,
+        order_by,
+        subproblem_stage_params,
+    ) = get_subproblem_stage_query_parts(subproblem=subproblem, stage=stage)
+
     sql = """
-        SELECT project, timepoint, availability_derate
+        SELECT {}project, timepoint, availability_derate
         -- Select only projects, periods, timepoints from the relevant 
         -- portfolio, relevant opchar scenario id, operational type, 
         -- and temporal scenario id
         FROM 
-            (SELECT project, stage_id, timepoint
+            (SELECT subproblem_id, project, stage_id, timepoint
             FROM project_operational_timepoints
-            WHERE project_portfolio_scenario_id = {}
-            AND project_operational_chars_scenario_id = {}
-            AND temporal_scenario_id = {}
-            AND (project_specified_capacity_scenario_id = {}
-                 OR project_new_cost_scenario_id = {})
-            AND subproblem_id = {}
-            AND stage_id = {}
+            WHERE project_portfolio_scenario_id = ?
+            AND project_operational_chars_scenario_id = ?
+            AND temporal_scenario_id = ?
+            AND (project_specified_capacity_scenario_id = ?
+                 OR project_new_cost_scenario_id = ?)
+            {}
             ) as projects_periods_timepoints_tbl
         -- Of the projects in the portfolio, select only those that are in 
         -- this project_availability_scenario_id and have 'exogenous' as 
@@ -187,8 +200,8 @@ def get_inputs_from_database(scenario_id, subscenarios, subproblem, stage, conn)
         INNER JOIN (
             SELECT project, exogenous_availability_scenario_id
             FROM inputs_project_availability
-            WHERE project_availability_scenario_id = {}
-            AND availability_type = '{}'
+            WHERE project_availability_scenario_id = ?
+            AND availability_type = ?
             AND exogenous_availability_scenario_id IS NOT NULL
             ) AS avail_char
         USING (project)
@@ -199,21 +212,24 @@ def get_inputs_from_database(scenario_id, subscenarios, subproblem, stage, conn)
             inputs_project_availability_exogenous
         USING (exogenous_availability_scenario_id, project, stage_id, 
         timepoint)
-        ;
+        {};
     """.format(
-        subscenarios.PROJECT_PORTFOLIO_SCENARIO_ID,
-        subscenarios.PROJECT_OPERATIONAL_CHARS_SCENARIO_ID,
-        subscenarios.TEMPORAL_SCENARIO_ID,
-        subscenarios.PROJECT_SPECIFIED_CAPACITY_SCENARIO_ID,
-        subscenarios.PROJECT_NEW_COST_SCENARIO_ID,
-        subproblem,
-        stage,
-        subscenarios.PROJECT_AVAILABILITY_SCENARIO_ID,
-        "exogenous",
+        subproblem_stage_columns, subproblem_stage_filter, order_by
     )
 
     c = conn.cursor()
-    availabilities = c.execute(sql)
+    availabilities = c.execute(
+        sql,
+        (
+            subscenarios.PROJECT_PORTFOLIO_SCENARIO_ID,
+            subscenarios.PROJECT_OPERATIONAL_CHARS_SCENARIO_ID,
+            subscenarios.TEMPORAL_SCENARIO_ID,
+            subscenarios.PROJECT_SPECIFIED_CAPACITY_SCENARIO_ID,
+            subscenarios.PROJECT_NEW_COST_SCENARIO_ID,
+        )
+        + subproblem_stage_params
+        + (subscenarios.PROJECT_AVAILABILITY_SCENARIO_ID, "exogenous"),
+    )
 
     return availabilities
 
@@ -229,31 +245,19 @@ def write_model_inputs(
     :param conn:
     :return:
     """
-    availabilities = get_inputs_from_database(
-        scenario_id, subscenarios, subproblem, stage, conn
-    ).fetchall()
-
-    if availabilities:
-        with open(
-            os.path.join(
-                scenario_directory,
-                str(subproblem),
-                str(stage),
-                "inputs",
-                "project_availability_exogenous.tab",
-            ),
-            "w",
-            newline="",
-        ) as availability_tab_file:
-            writer = csv.writer(
-                availability_tab_file, delimiter="\t", lineterminator="\n"
-            )
-
-            writer.writerow(["project", "timepoint", "availability_derate"])
-
-            for row in availabilities:
-                row = ["." if i is None else i for i in row]
-                writer.writerow(row)
+    write_time_series_model_inputs(
+        scenario_directory=scenario_directory,
+        subproblem=subproblem,
+        stage=stage,
+        conn=conn,
+        fname="project_availability_exogenous.tab",
+        get_data=lambda subproblem, stage: get_inputs_from_database(
+            scenario_id, subscenarios, subproblem, stage, conn
+        ),
+        header=["project", "timepoint", "availability_derate"],
+        replace_nulls=True,
+        write_if_empty=False,
+    )
 
 
 # Validation
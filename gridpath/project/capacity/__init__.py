@@ -21,8 +21,7 @@ infrastructure 'projects' in the optimization problem.
 import csv
 import os.path
 
-from db.common_functions import spin_on_database_lock
-from gridpath.auxiliary.db_interface import setup_results_import
+from gridpath.auxiliary.db_interface import import_results_into_table
 
 
 # Database
@@ -47,17 +46,6 @@ def import_results_into_database(
     if not quiet:
         print("project capacity")
 
-    # Delete prior results and create temporary import table for ordering
-    setup_results_import(
-        conn=db,
-        cursor=c,
-        table="results_project_capacity",
-        scenario_id=scenario_id,
-        subproblem=subproblem,
-        stage=stage,
-    )
-
-    # Load results into the temporary table
     results = []
     with open(
         os.path.join(results_directory, "capacity_all.csv"), "r"
@@ -93,30 +81,28 @@ def import_results_into_database(
                 )
             )
 
-    insert_temp_sql = """
-        INSERT INTO temp_results_project_capacity{}
-        (scenario_id, project, period, subproblem_id, stage_id, capacity_type,
-        technology, load_zone, capacity_mw, hyb_gen_capacity_mw, 
-        hyb_stor_capacity_mw, energy_capacity_mwh)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
-        """.format(
-        scenario_id
-    )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_temp_sql, data=results)
-
-    # Insert sorted results into permanent results table
-    insert_sql = """
-        INSERT INTO results_project_capacity
-        (scenario_id, project, period, subproblem_id, stage_id, capacity_type,
-        technology, load_zone, capacity_mw, hyb_gen_capacity_mw, 
-        hyb_stor_capacity_mw, energy_capacity_mwh)
-        SELECT
-        scenario_id, project, period, subproblem_id, stage_id, capacity_type,
-        technology, load_zone, capacity_mw, hyb_gen_capacity_mw, 
-        hyb_stor_capacity_mw, energy_capacity_mwh
-        FROM temp_results_project_capacity{}
-        ORDER BY scenario_id, project, period, subproblem_id, 
-        stage_id;""".format(
-        scenario_id
+    # Delete prior results and insert the sorted results
+    import_results_into_table(
+        conn=db,
+        cursor=c,
+        table="results_project_capacity",
+        scenario_id=scenario_id,
+        subproblem=subproblem,
+        stage=stage,
+        columns=[
+            "scenario_id",
+            "project",
+            "period",
+            "subproblem_id",
+            "stage_id",
+            "capacity_type",
+            "technology",
+            "load_zone",
+            "capacity_mw",
+            "hyb_gen_capacity_mw",
+            "hyb_stor_capacity_mw",
+            "energy_capacity_mwh",
+        ],
+        results=results,
+        order_by=["scenario_id", "project", "period", "subproblem_id", "stage_id"],
     )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_sql, data=(), many=False)
@@ -28,6 +28,7 @@ from pyomo.environ import Set, Expression, value
 
 from gridpath.auxiliary.auxiliary import (
     get_required_subtype_modules_from_projects_file,
+    get_indexed_subset,
     join_sets,
 )
 from gridpath.project.capacity.common_functions import (
@@ -208,17 +209,16 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
 # Set Rules
 ###############################################################################
 
-# TODO: the creation of the OPR_PRJS_IN_TMPS is by far
-#  the most time-consuming step in instantiating the problem; is there
-#  any way to speed it up? It is perhaps inefficient to iterate over all
-#  (g, t) for every timepoint, but how do we get around having to do that?
-#  Also, this is a more general problem with all the indexed sets,
-#  but the larger timepoints-based sets are more of a problem
+
 def op_gens_by_tmp(mod, tmp):
     """
-    Figure out which generators are operational in each timepoins.
+    Figure out which generators are operational in each timepoins. The
+    projects for all timepoints are grouped in a single pass over
+    PRJ_OPR_TMPS (see *get_indexed_subset*).
     """
-    gens = list(g for (g, t) in mod.PRJ_OPR_TMPS if t == tmp)
+    gens = get_indexed_subset(
+        mod, "PRJ_OPR_TMPS", tmp, index_position=1, subset_position=0
+    )
     return gens
 
 
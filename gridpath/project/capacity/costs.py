@@ -32,7 +32,10 @@ from gridpath.auxiliary.auxiliary import get_required_subtype_modules_from_proje
 from gridpath.project.capacity.common_functions import (
     load_project_capacity_type_modules,
 )
-from gridpath.auxiliary.db_interface import setup_results_import
+from gridpath.auxiliary.db_interface import (
+    SUBPROBLEM_STAGES_TO_PROCESS_FILTER,
+    import_results_into_table,
+)
 import gridpath.project.capacity.capacity_types as cap_type_init
 
 
@@ -171,16 +174,7 @@ def import_results_into_database(
     # Capacity cost results
     if not quiet:
         print("project capacity costs")
-    setup_results_import(
-        conn=db,
-        cursor=c,
-        table="results_project_costs_capacity",
-        scenario_id=scenario_id,
-        subproblem=subproblem,
-        stage=stage,
-    )
 
-    # Load results into the temporary table
     results = []
     with open(
         os.path.join(results_directory, "costs_capacity_all_projects.csv"), "r"
@@ -212,33 +206,29 @@ def import_results_into_database(
                 )
             )
 
-    insert_temp_sql = """
-        INSERT INTO temp_results_project_costs_capacity{}
-        (scenario_id, project, period, subproblem_id, stage_id,
-        hours_in_period_timepoints, hours_in_subproblem_period, technology, load_zone, 
-        capacity_cost)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
-        """.format(
-        scenario_id
-    )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_temp_sql, data=results)
-
-    # Insert sorted results into permanent results table
-    insert_sql = """
-        INSERT INTO results_project_costs_capacity
-        (scenario_id, project, period, subproblem_id, stage_id,
-        hours_in_period_timepoints, hours_in_subproblem_period, technology, load_zone, 
-        capacity_cost)
-        SELECT
-        scenario_id, project, period, subproblem_id, stage_id, 
-        hours_in_period_timepoints, hours_in_subproblem_period, technology, load_zone, 
-        capacity_cost
-        FROM temp_results_project_costs_capacity{}
-        ORDER BY scenario_id, project, period, subproblem_id, 
-        stage_id;""".format(
-        scenario_id
+    # Delete prior results and insert the sorted results
+    import_results_into_table(
+        conn=db,
+        cursor=c,
+        table="results_project_costs_capacity",
+        scenario_id=scenario_id,
+        subproblem=subproblem,
+        stage=stage,
+        columns=[
+            "scenario_id",
+            "project",
+            "period",
+            "subproblem_id",
+            "stage_id",
+            "hours_in_period_timepoints",
+            "hours_in_subproblem_period",
+            "technology",
+            "load_zone",
+            "capacity_cost",
+        ],
+        results=results,
+        order_by=["scenario_id", "project", "period", "subproblem_id", "stage_id"],
     )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_sql, data=(), many=False)
 
     # Update the capacity cost removing the fraction attributable to the
     # spinup and lookahead hours
@@ -280,9 +270,12 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
     del_sql = """
         DELETE FROM results_project_costs_capacity_agg 
         WHERE scenario_id = ?
-        """
+        AND {}
+        """.format(
+        SUBPROBLEM_STAGES_TO_PROCESS_FILTER
+    )
     spin_on_database_lock(
-        conn=db, cursor=c, sql=del_sql, data=(scenario_id,), many=False
+        conn=db, cursor=c, sql=del_sql, data=(scenario_id, scenario_id), many=False
     )
 
     # Insert new results
@@ -314,11 +307,19 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
         (SELECT scenario_id, subproblem_id, stage_id, period, load_zone,
         SUM(capacity_cost) AS capacity_cost
         FROM results_project_costs_capacity
+        WHERE scenario_id = ?
+        AND {}
         GROUP BY scenario_id, subproblem_id, stage_id, period, load_zone
         ) AS cap_table
         USING (scenario_id, subproblem_id, stage_id, period, load_zone)
-        ;"""
+        ;""".format(
+        SUBPROBLEM_STAGES_TO_PROCESS_FILTER
+    )
 
     spin_on_database_lock(
-        conn=db, cursor=c, sql=agg_sql, data=(scenario_id,), many=False
+        conn=db,
+        cursor=c,
+        sql=agg_sql,
+        data=(scenario_id, scenario_id, scenario_id),
+        many=False,
     )
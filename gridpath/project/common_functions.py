@@ -18,7 +18,8 @@
 
 import csv
 import os.path
-import pandas as pd
+
+from gridpath.auxiliary.auxiliary import read_input_file
 
 
 # TODO: use this in capacity and operational type project subset
@@ -38,7 +39,7 @@ def determine_project_subset(
 
     project_subset = list()
 
-    dynamic_components = pd.read_csv(
+    dynamic_components = read_input_file(
         os.path.join(
             scenario_directory,
             str(subproblem),
@@ -46,7 +47,6 @@ def determine_project_subset(
             "inputs",
             "{}s.tab".format(prj_or_tx),
         ),
-        sep="\t",
         usecols=[prj_or_tx, column],
     )
 
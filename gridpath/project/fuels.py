@@ -207,11 +207,10 @@ def validate_inputs(scenario_id, subscenarios, subproblem, stage, conn):
     periods_months = c2.execute(
         """SELECT DISTINCT period, month
         FROM inputs_temporal
-        WHERE temporal_scenario_id = {}
-        AND subproblem_id = {}
-        AND stage_id = {};""".format(
-            subscenarios.TEMPORAL_SCENARIO_ID, subproblem, stage
-        )
+        WHERE temporal_scenario_id = ?
+        AND subproblem_id = ?
+        AND stage_id = ?;""",
+        (subscenarios.TEMPORAL_SCENARIO_ID, subproblem, stage),
     )
 
     # Convert input data into pandas DataFrame
@@ -672,18 +672,19 @@ def get_inputs_from_database(scenario_id, subscenarios, subproblem, stage, conn)
         FROM
         (SELECT project, capacity_type
         FROM inputs_project_portfolios
-        WHERE project_portfolio_scenario_id = {}) as portfolio_tbl
+        WHERE project_portfolio_scenario_id = ?) as portfolio_tbl
         LEFT OUTER JOIN
         -- Select the operational characteristics based on the 
         -- project_operational_chars_scenario_id
         inputs_project_operational_chars
         USING (project)
-        WHERE project_operational_chars_scenario_id = {}
+        WHERE project_operational_chars_scenario_id = ?
         ;
-        """.format(
+        """,
+        (
             subscenarios.PROJECT_PORTFOLIO_SCENARIO_ID,
             subscenarios.PROJECT_OPERATIONAL_CHARS_SCENARIO_ID,
-        )
+        ),
     )
 
     c2 = conn.cursor()
@@ -696,7 +697,7 @@ def get_inputs_from_database(scenario_id, subscenarios, subproblem, stage, conn)
         INNER JOIN
         (SELECT project, heat_rate_curves_scenario_id
         FROM inputs_project_operational_chars
-        WHERE project_operational_chars_scenario_id = {}
+        WHERE project_operational_chars_scenario_id = ?
         ) AS op_char
         USING(project)
         -- select only heat curves of matching projects
@@ -705,11 +706,12 @@ def get_inputs_from_database(scenario_id, subscenarios, subproblem, stage, conn)
         USING(project, heat_rate_curves_scenario_id)
         -- Get only the subset of projects in the portfolio based on the 
         -- project_portfolio_scenario_id 
-        WHERE project_portfolio_scenario_id = {}
-        """.format(
+        WHERE project_portfolio_scenario_id = ?
+        """,
+        (
             subscenarios.PROJECT_OPERATIONAL_CHARS_SCENARIO_ID,
             subscenarios.PROJECT_PORTFOLIO_SCENARIO_ID,
-        )
+        ),
     )
 
     c3 = conn.cursor()
@@ -722,21 +724,22 @@ def get_inputs_from_database(scenario_id, subscenarios, subproblem, stage, conn)
         INNER JOIN
         (SELECT project, variable_om_curves_scenario_id
         FROM inputs_project_operational_chars
-        WHERE project_operational_chars_scenario_id = {}
+        WHERE project_operational_chars_scenario_id = ?
         ) AS op_char
         USING(project)
         -- select only variable OM curves inputs with matching projects
         INNER JOIN
         inputs_project_variable_om_curves
         USING(project, variable_om_curves_scenario_id)
-        WHERE project_portfolio_scenario_id = {}
+        WHERE project_portfolio_scenario_id = ?
         -- Get only the subset of projects in the portfolio based on the 
         -- project_portfolio_scenario_id 
         AND variable_om_curves_scenario_id is not Null
-        """.format(
+        """,
+        (
             subscenarios.PROJECT_OPERATIONAL_CHARS_SCENARIO_ID,
             subscenarios.PROJECT_PORTFOLIO_SCENARIO_ID,
-        )
+        ),
     )
 
     c4 = conn.cursor()
@@ -748,18 +751,19 @@ def get_inputs_from_database(scenario_id, subscenarios, subproblem, stage, conn)
         INNER JOIN
         (SELECT project, startup_chars_scenario_id
         FROM inputs_project_operational_chars
-        WHERE project_operational_chars_scenario_id = {}
+        WHERE project_operational_chars_scenario_id = ?
         ) AS op_char
         USING(project)
         INNER JOIN
         inputs_project_startup_chars
         USING(project, startup_chars_scenario_id)
-        WHERE project_portfolio_scenario_id = {}
+        WHERE project_portfolio_scenario_id = ?
         AND startup_chars_scenario_id is not Null
-        """.format(
+        """,
+        (
             subscenarios.PROJECT_OPERATIONAL_CHARS_SCENARIO_ID,
             subscenarios.PROJECT_PORTFOLIO_SCENARIO_ID,
-        )
+        ),
     )
 
     return proj_opchar, heat_rates, vom_curves, startup_chars
@@ -1060,11 +1064,10 @@ def validate_inputs(scenario_id, subscenarios, subproblem, stage, conn):
     tmp_durations = c.execute(
         """SELECT number_of_hours_in_timepoint
            FROM inputs_temporal
-           WHERE temporal_scenario_id = {}
-           AND subproblem_id = {}
-           AND stage_id = {};""".format(
-            subscenarios.TEMPORAL_SCENARIO_ID, subproblem, stage
-        )
+           WHERE temporal_scenario_id = ?
+           AND subproblem_id = ?
+           AND stage_id = ?;""",
+        (subscenarios.TEMPORAL_SCENARIO_ID, subproblem, stage),
     ).fetchall()
     hrs_in_tmp = min(tmp_durations)
 
@@ -20,12 +20,21 @@ from __future__ import print_function
 
 from builtins import next
 from builtins import str
-import csv
 import os.path
-from pyomo.environ import Expression, value
+from pyomo.environ import Expression
 
 from db.common_functions import spin_on_database_lock
-from gridpath.auxiliary.db_interface import setup_results_import
+from gridpath.auxiliary.db_interface import (
+    SUBPROBLEM_STAGES_TO_PROCESS_FILTER,
+    import_results_into_table,
+)
+from gridpath.auxiliary.dynamic_components import results_format
+from gridpath.auxiliary.results_export import (
+    get_component_column,
+    get_project_timepoint_columns,
+    read_results_table_rows,
+    write_results_table,
+)
 
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
@@ -79,7 +88,26 @@ def export_results(scenario_directory, subproblem, stage, m, d):
     :param d:
     :return:
     """
-    with open(
+    prj_tmps = list(m.FUEL_PRJ_OPR_TMPS)
+    columns = get_project_timepoint_columns(
+        m,
+        prj_tmps,
+        [
+            "project",
+            "period",
+            "horizon",
+            "timepoint",
+            "timepoint_weight",
+            "number_of_hours_in_timepoint",
+            "load_zone",
+            "technology",
+        ],
+    )
+    columns["carbon_emissions_tons"] = get_component_column(
+        m.Project_Carbon_Emissions, prj_tmps
+    )
+
+    write_results_table(
         os.path.join(
             scenario_directory,
             str(subproblem),
@@ -87,37 +115,9 @@ def export_results(scenario_directory, subproblem, stage, m, d):
             "results",
             "carbon_emissions_by_project.csv",
         ),
-        "w",
-        newline="",
-    ) as carbon_emissions_results_file:
-        writer = csv.writer(carbon_emissions_results_file)
-        writer.writerow(
-            [
-                "project",
-                "period",
-                "horizon",
-                "timepoint",
-                "timepoint_weight",
-                "number_of_hours_in_timepoint",
-                "load_zone",
-                "technology",
-                "carbon_emissions_tons",
-            ]
-        )
-        for (p, tmp) in m.FUEL_PRJ_OPR_TMPS:
-            writer.writerow(
-                [
-                    p,
-                    m.period[tmp],
-                    m.horizon[tmp, m.balancing_type_project[p]],
-                    tmp,
-                    m.tmp_weight[tmp],
-                    m.hrs_in_tmp[tmp],
-                    m.load_zone[p],
-                    m.technology[p],
-                    value(m.Project_Carbon_Emissions[p, tmp]),
-                ]
-            )
+        columns,
+        results_format=getattr(d, results_format),
+    )
 
 
 # Database
@@ -140,82 +140,63 @@ def import_results_into_database(
     if not quiet:
         print("project carbon emissions")
 
-    # Delete prior results and create temporary import table for ordering
-    setup_results_import(
+    results = []
+    for row in read_results_table_rows(
+        os.path.join(results_directory, "carbon_emissions_by_project.csv")
+    ):
+        project = row[0]
+        period = row[1]
+        horizon = row[2]
+        timepoint = row[3]
+        timepoint_weight = row[4]
+        number_of_hours_in_timepoint = row[5]
+        load_zone = row[6]
+        technology = row[7]
+        carbon_emissions_tons = row[8]
+
+        results.append(
+            (
+                scenario_id,
+                project,
+                period,
+                subproblem,
+                stage,
+                horizon,
+                timepoint,
+                timepoint_weight,
+                number_of_hours_in_timepoint,
+                load_zone,
+                technology,
+                carbon_emissions_tons,
+            )
+        )
+
+    # Delete prior results and insert the sorted results
+    import_results_into_table(
         conn=db,
         cursor=c,
         table="results_project_carbon_emissions",
         scenario_id=scenario_id,
         subproblem=subproblem,
         stage=stage,
+        columns=[
+            "scenario_id",
+            "project",
+            "period",
+            "subproblem_id",
+            "stage_id",
+            "horizon",
+            "timepoint",
+            "timepoint_weight",
+            "number_of_hours_in_timepoint",
+            "load_zone",
+            "technology",
+            "carbon_emission_tons",
+        ],
+        results=results,
+        order_by=["scenario_id", "project", "subproblem_id", "stage_id", "timepoint"],
     )
 
-    # Load results into the temporary table
-    results = []
-    with open(
-        os.path.join(results_directory, "carbon_emissions_by_project.csv"), "r"
-    ) as emissions_file:
-        reader = csv.reader(emissions_file)
-
-        next(reader)  # skip header
-        for row in reader:
-            project = row[0]
-            period = row[1]
-            horizon = row[2]
-            timepoint = row[3]
-            timepoint_weight = row[4]
-            number_of_hours_in_timepoint = row[5]
-            load_zone = row[6]
-            technology = row[7]
-            carbon_emissions_tons = row[8]
-
-            results.append(
-                (
-                    scenario_id,
-                    project,
-                    period,
-                    subproblem,
-                    stage,
-                    horizon,
-                    timepoint,
-                    timepoint_weight,
-                    number_of_hours_in_timepoint,
-                    load_zone,
-                    technology,
-                    carbon_emissions_tons,
-                )
-            )
-
-    insert_temp_sql = """
-        INSERT INTO 
-        temp_results_project_carbon_emissions{}
-         (scenario_id, project, period, subproblem_id, stage_id,
-         horizon, timepoint, timepoint_weight,
-         number_of_hours_in_timepoint,
-         load_zone, technology, carbon_emission_tons)
-         VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
-         """.format(
-        scenario_id
-    )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_temp_sql, data=results)
-
-    # Insert sorted results into permanent results table
-    insert_sql = """
-        INSERT INTO results_project_carbon_emissions
-        (scenario_id, project, period, subproblem_id, stage_id,
-        horizon, timepoint, timepoint_weight, number_of_hours_in_timepoint,
-        load_zone, technology, carbon_emission_tons)
-        SELECT
-        scenario_id, project, period, subproblem_id, stage_id,
-        horizon, timepoint, timepoint_weight, number_of_hours_in_timepoint,
-        load_zone, technology, carbon_emission_tons
-        FROM temp_results_project_carbon_emissions{}
-         ORDER BY scenario_id, project, subproblem_id, stage_id, timepoint;
-         """.format(
-        scenario_id
-    )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_sql, data=(), many=False)
-
 
 def process_results(db, c, scenario_id, subscenarios, quiet):
     """
@@ -233,9 +214,12 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
     del_sql = """
         DELETE FROM results_project_carbon_emissions_by_technology_period 
         WHERE scenario_id = ?
-        """
+        AND {}
+        """.format(
+        SUBPROBLEM_STAGES_TO_PROCESS_FILTER
+    )
     spin_on_database_lock(
-        conn=db, cursor=c, sql=del_sql, data=(scenario_id,), many=False
+        conn=db, cursor=c, sql=del_sql, data=(scenario_id, scenario_id), many=False
     )
 
     # Aggregate emissions by technology, period, and spinup_or_lookahead
@@ -249,10 +233,13 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
         * number_of_hours_in_timepoint ) AS carbon_emission_tons 
         FROM results_project_carbon_emissions
         WHERE scenario_id = ?
+        AND {}
         GROUP BY subproblem_id, stage_id, period, load_zone, technology, 
         spinup_or_lookahead
         ORDER BY subproblem_id, stage_id, period, load_zone, technology, 
-        spinup_or_lookahead;"""
+        spinup_or_lookahead;""".format(
+        SUBPROBLEM_STAGES_TO_PROCESS_FILTER
+    )
     spin_on_database_lock(
-        conn=db, cursor=c, sql=agg_sql, data=(scenario_id,), many=False
+        conn=db, cursor=c, sql=agg_sql, data=(scenario_id, scenario_id), many=False
     )
@@ -29,7 +29,10 @@ from pyomo.environ import Set, Var, Expression, Constraint, NonNegativeReals, va
 from db.common_functions import spin_on_database_lock
 from gridpath.auxiliary.auxiliary import get_required_subtype_modules_from_projects_file
 from gridpath.project.operations.common_functions import load_operational_type_modules
-from gridpath.auxiliary.db_interface import setup_results_import
+from gridpath.auxiliary.db_interface import (
+    SUBPROBLEM_STAGES_TO_PROCESS_FILTER,
+    import_results_into_table,
+)
 import gridpath.project.operations.operational_types as op_type_init
 
 
@@ -543,17 +546,7 @@ def import_results_into_database(
         print("project costs operations")
 
     # costs_operations.csv
-    # Delete prior results and create temporary import table for ordering
-    setup_results_import(
-        conn=db,
-        cursor=c,
-        table="results_project_costs_operations",
-        scenario_id=scenario_id,
-        subproblem=subproblem,
-        stage=stage,
-    )
 
-    # Load results into the temporary table
     results = []
     with open(
         os.path.join(results_directory, "costs_operations.csv"), "r"
@@ -595,37 +588,34 @@ def import_results_into_database(
                 )
             )
 
-    insert_temp_sql = """
-        INSERT INTO
-        temp_results_project_costs_operations{}
-        (scenario_id, project, period, subproblem_id, stage_id,
-        horizon, timepoint, timepoint_weight,
-        number_of_hours_in_timepoint, load_zone, technology, 
-        variable_om_cost, fuel_cost, startup_cost, shutdown_cost)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);""".format(
-        scenario_id
-    )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_temp_sql, data=results)
-
-    # Insert sorted results into permanent results table
-    insert_sql = """
-        INSERT INTO 
-        results_project_costs_operations
-        (scenario_id, project, period, subproblem_id, stage_id, 
-        horizon, timepoint, timepoint_weight, 
-        number_of_hours_in_timepoint, load_zone, technology, 
-        variable_om_cost, fuel_cost, startup_cost, shutdown_cost)
-        SELECT
-        scenario_id, project, period, subproblem_id, stage_id, 
-        horizon, timepoint, timepoint_weight, 
-        number_of_hours_in_timepoint, load_zone, technology, 
-        variable_om_cost, fuel_cost, startup_cost, shutdown_cost
-        FROM temp_results_project_costs_operations{}
-        ORDER BY scenario_id, project, subproblem_id, stage_id, timepoint;
-        """.format(
-        scenario_id
+    # Delete prior results and insert the sorted results
+    import_results_into_table(
+        conn=db,
+        cursor=c,
+        table="results_project_costs_operations",
+        scenario_id=scenario_id,
+        subproblem=subproblem,
+        stage=stage,
+        columns=[
+            "scenario_id",
+            "project",
+            "period",
+            "subproblem_id",
+            "stage_id",
+            "horizon",
+            "timepoint",
+            "timepoint_weight",
+            "number_of_hours_in_timepoint",
+            "load_zone",
+            "technology",
+            "variable_om_cost",
+            "fuel_cost",
+            "startup_cost",
+            "shutdown_cost",
+        ],
+        results=results,
+        order_by=["scenario_id", "project", "subproblem_id", "stage_id", "timepoint"],
     )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_sql, data=(), many=False)
 
 
 def process_results(db, c, scenario_id, subscenarios, quiet):
@@ -645,9 +635,12 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
     del_sql = """
         DELETE FROM results_project_costs_operations_agg
         WHERE scenario_id = ?
-        """
+        AND {}
+        """.format(
+        SUBPROBLEM_STAGES_TO_PROCESS_FILTER
+    )
     spin_on_database_lock(
-        conn=db, cursor=c, sql=del_sql, data=(scenario_id,), many=False
+        conn=db, cursor=c, sql=del_sql, data=(scenario_id, scenario_id), many=False
     )
 
     # Aggregate operational costs by period and load zone
@@ -666,9 +659,12 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
         SUM(shutdown_cost * timepoint_weight) AS shutdown_cost
         FROM results_project_costs_operations
         WHERE scenario_id = ?
+        AND {}
         GROUP BY subproblem_id, stage_id, period, load_zone, spinup_or_lookahead
         ORDER BY subproblem_id, stage_id, period, load_zone, spinup_or_lookahead
-        ;"""
+        ;""".format(
+        SUBPROBLEM_STAGES_TO_PROCESS_FILTER
+    )
     spin_on_database_lock(
-        conn=db, cursor=c, sql=agg_sql, data=(scenario_id,), many=False
+        conn=db, cursor=c, sql=agg_sql, data=(scenario_id, scenario_id), many=False
     )
@@ -20,7 +20,6 @@ import csv
 import os.path
 from pyomo.environ import Param, Set, Expression, value
 
-from db.common_functions import spin_on_database_lock
 from gridpath.auxiliary.auxiliary import (
     get_required_subtype_modules_from_projects_file,
     cursor_to_df,
@@ -30,7 +29,7 @@ from gridpath.auxiliary.db_interface import (
     determine_table_subset_by_start_and_column,
 )
 from gridpath.project.operations.common_functions import load_operational_type_modules
-from gridpath.auxiliary.db_interface import setup_results_import
+from gridpath.auxiliary.db_interface import import_results_into_table
 from gridpath.auxiliary.validations import write_validation_to_database, validate_idxs
 import gridpath.project.operations.operational_types as op_type_init
 
@@ -448,17 +447,7 @@ def import_results_into_database(
     # REC provision by project and timepoint
     if not quiet:
         print("project recs")
-    # Delete prior results and create temporary import table for ordering
-    setup_results_import(
-        conn=db,
-        cursor=c,
-        table="results_project_period_energy_target",
-        scenario_id=scenario_id,
-        subproblem=subproblem,
-        stage=stage,
-    )
 
-    # Load results into the temporary table
     results = []
     with open(
         os.path.join(results_directory, "energy_target_by_project.csv"), "r"
@@ -502,41 +491,35 @@ def import_results_into_database(
                 )
             )
 
-    insert_temp_sql = """
-        INSERT INTO 
-        temp_results_project_period_energy_target{}
-         (scenario_id, project, period, subproblem_id, stage_id, 
-         horizon, timepoint, timepoint_weight, 
-         number_of_hours_in_timepoint, 
-         load_zone, energy_target_zone, technology, 
-         scheduled_energy_target_energy_mw, scheduled_curtailment_mw, 
-         subhourly_energy_target_energy_delivered_mw, subhourly_curtailment_mw)
-         VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
-         """.format(
-        scenario_id
-    )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_temp_sql, data=results)
-
-    # Insert sorted results into permanent results table
-    insert_sql = """
-        INSERT INTO results_project_period_energy_target
-        (scenario_id, project, period, subproblem_id, stage_id, 
-        horizon, timepoint, timepoint_weight, number_of_hours_in_timepoint, 
-        load_zone, energy_target_zone, technology, 
-        scheduled_energy_target_energy_mw, scheduled_curtailment_mw, 
-        subhourly_energy_target_energy_delivered_mw, subhourly_curtailment_mw)
-        SELECT
-        scenario_id, project, period, subproblem_id, stage_id,
-        horizon, timepoint, timepoint_weight, number_of_hours_in_timepoint, 
-        load_zone, energy_target_zone, technology, 
-        scheduled_energy_target_energy_mw, scheduled_curtailment_mw, 
-        subhourly_energy_target_energy_delivered_mw, subhourly_curtailment_mw
-        FROM temp_results_project_period_energy_target{}
-         ORDER BY scenario_id, project, subproblem_id, stage_id, timepoint;
-         """.format(
-        scenario_id
+    # Delete prior results and insert the sorted results
+    import_results_into_table(
+        conn=db,
+        cursor=c,
+        table="results_project_period_energy_target",
+        scenario_id=scenario_id,
+        subproblem=subproblem,
+        stage=stage,
+        columns=[
+            "scenario_id",
+            "project",
+            "period",
+            "subproblem_id",
+            "stage_id",
+            "horizon",
+            "timepoint",
+            "timepoint_weight",
+            "number_of_hours_in_timepoint",
+            "load_zone",
+            "energy_target_zone",
+            "technology",
+            "scheduled_energy_target_energy_mw",
+            "scheduled_curtailment_mw",
+            "subhourly_energy_target_energy_delivered_mw",
+            "subhourly_curtailment_mw",
+        ],
+        results=results,
+        order_by=["scenario_id", "project", "subproblem_id", "stage_id", "timepoint"],
     )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_sql, data=(), many=False)
 
 
 def process_results(db, c, scenario_id, subscenarios, quiet):
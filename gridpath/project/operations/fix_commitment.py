@@ -28,6 +28,7 @@ from pyomo.environ import Set, Param, NonNegativeReals, Expression
 from gridpath.auxiliary.auxiliary import (
     get_required_subtype_modules_from_projects_file,
     check_for_integer_subdirectories,
+    read_input_file,
 )
 from gridpath.project.operations.common_functions import load_operational_type_modules
 
@@ -105,12 +106,30 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
         required_operational_modules
     )
 
+    add_commitment_components(m, imported_operational_modules)
+
+
+def add_commitment_components(m, imported_operational_modules, data=None):
+    """
+    :param m: the Pyomo model
+    :param imported_operational_modules: the imported operational type modules
+    :param data: the model data to initialize the components with when
+        adding them to an instance that has already been constructed (see
+        *update_stage_components*); None when adding them to the abstract
+        model, whose data are loaded with *load_model_data*
+
+    Add the fixed and final commitment sets, params, and expressions (see
+    *add_model_components*).
+    """
+    if data is None:
+        data = dict()
+
     # Sets
     ###########################################################################
 
-    m.FNL_COMMIT_PRJS = Set()
+    m.FNL_COMMIT_PRJS = Set(initialize=data.get("FNL_COMMIT_PRJS", {None: []})[None])
 
-    m.FXD_COMMIT_PRJS = Set()
+    m.FXD_COMMIT_PRJS = Set(initialize=data.get("FXD_COMMIT_PRJS", {None: []})[None])
 
     m.FNL_COMMIT_PRJ_OPR_TMPS = Set(
         dimen=2,
@@ -121,7 +140,9 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
 
     m.FXD_COMMIT_PRJ_OPR_TMPS = Set(
         dimen=2,
-        initialize=lambda mod: set(
+        initialize=data["FXD_COMMIT_PRJ_OPR_TMPS"][None]
+        if "FXD_COMMIT_PRJ_OPR_TMPS" in data
+        else lambda mod: set(
             (g, tmp) for (g, tmp) in mod.PRJ_OPR_TMPS if g in mod.FXD_COMMIT_PRJS
         ),
     )
@@ -129,7 +150,11 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
     # Input Params
     ###########################################################################
 
-    m.fixed_commitment = Param(m.FXD_COMMIT_PRJ_OPR_TMPS, within=NonNegativeReals)
+    m.fixed_commitment = Param(
+        m.FXD_COMMIT_PRJ_OPR_TMPS,
+        within=NonNegativeReals,
+        initialize=data.get("fixed_commitment", {}),
+    )
 
     # Expressions
     ###########################################################################
@@ -182,6 +207,62 @@ def fix_variables(m, d, scenario_directory, subproblem, stage):
                 imp_op_m.fix_commitment(m, g, tmp)
 
 
+def get_stage_components():
+    """
+    :return: the names of the components whose data change between the
+        stages of a subproblem
+
+    The fixed and final commitment components are only used to fix the
+    commitment variables and to export the commitment for the next stage,
+    so they can be replaced in the previous stage's instance (see
+    *update_stage_components*) rather than rebuilding the instance.
+    """
+    return [
+        "FNL_COMMIT_PRJS",
+        "FXD_COMMIT_PRJS",
+        "FXD_COMMIT_PRJ_OPR_TMPS",
+        "fixed_commitment",
+    ]
+
+
+def update_stage_components(m, d, data_portal, scenario_directory, subproblem, stage):
+    """
+    :param m: the previous stage's problem instance
+    :param d: the dynamic components class
+    :param data_portal: the Pyomo DataPortal with the current stage's data
+    :param scenario_directory:
+    :param subproblem:
+    :param stage:
+    :return:
+
+    Replace the fixed and final commitment components of the previous
+    stage's instance with components initialized with the current stage's
+    data.
+    """
+    required_operational_modules = get_required_subtype_modules_from_projects_file(
+        scenario_directory=scenario_directory,
+        subproblem=subproblem,
+        stage=stage,
+        which_type="operational_type",
+    )
+
+    imported_operational_modules = load_operational_type_modules(
+        required_operational_modules
+    )
+
+    for component in [
+        m.Commitment,
+        m.fixed_commitment,
+        m.FXD_COMMIT_PRJ_OPR_TMPS,
+        m.FNL_COMMIT_PRJ_OPR_TMPS,
+        m.FXD_COMMIT_PRJS,
+        m.FNL_COMMIT_PRJS,
+    ]:
+        m.del_component(component)
+
+    add_commitment_components(m, imported_operational_modules, data=data_portal.data())
+
+
 # Input-Output
 ###############################################################################
 
@@ -221,7 +302,7 @@ def load_model_data(m, d, data_portal, scenario_directory, subproblem, stage):
         final commitment stage.
         """
         fnl_commit_prjs = list()
-        df = read_csv(
+        df = read_input_file(
             os.path.join(
                 scenario_directory,
                 str(subproblem),
@@ -229,7 +310,6 @@ def load_model_data(m, d, data_portal, scenario_directory, subproblem, stage):
                 "inputs",
                 "projects.tab",
             ),
-            sep="\t",
             usecols=["project", "last_commitment_stage"],
             dtype={"last_commitment_stage": str},
         )
@@ -285,11 +365,10 @@ def export_pass_through_inputs(scenario_directory, subproblem, stage, m):
     :return:
     """
 
-    df = read_csv(
+    df = read_input_file(
         os.path.join(
             scenario_directory, str(subproblem), str(stage), "inputs", "projects.tab"
         ),
-        sep="\t",
         usecols=["project", "last_commitment_stage"],
     )
 
@@ -18,13 +18,19 @@ both operational fuel burn for power production, and startup fuel burn (if
 applicable).
 """
 
-import csv
 import os.path
-from pyomo.environ import Set, Var, Expression, Constraint, NonNegativeReals, value
+from pyomo.environ import Set, Var, Expression, Constraint, NonNegativeReals
 
-from db.common_functions import spin_on_database_lock
-from gridpath.auxiliary.db_interface import setup_results_import
+from gridpath.auxiliary.db_interface import import_results_into_table
 from gridpath.auxiliary.auxiliary import get_required_subtype_modules_from_projects_file
+from gridpath.auxiliary.dynamic_components import results_format
+from gridpath.auxiliary.results_export import (
+    get_component_column,
+    get_param_column,
+    get_project_timepoint_columns,
+    read_results_table_rows,
+    write_results_table,
+)
 from gridpath.project.operations.common_functions import load_operational_type_modules
 import gridpath.project.operations.operational_types as op_type_init
 
@@ -276,49 +282,39 @@ def export_results(scenario_directory, subproblem, stage, m, d):
     :return:
     Nothing
     """
-    with open(
+    prj_tmps = list(m.FUEL_PRJ_OPR_TMPS)
+    columns = get_project_timepoint_columns(
+        m,
+        prj_tmps,
+        [
+            "project",
+            "period",
+            "horizon",
+            "timepoint",
+            "timepoint_weight",
+            "number_of_hours_in_timepoint",
+            "load_zone",
+            "technology",
+        ],
+    )
+    columns["fuel"] = get_param_column(m.fuel, columns["project"])
+    columns["fuel_burn_operations_mmbtu"] = get_component_column(
+        m.Operations_Fuel_Burn_MMBtu, prj_tmps
+    )
+    columns["fuel_burn_startup_mmbtu"] = get_component_column(
+        m.Startup_Fuel_Burn_MMBtu, prj_tmps
+    )
+    columns["total_fuel_burn_mmbtu"] = get_component_column(
+        m.Total_Fuel_Burn_MMBtu, prj_tmps
+    )
+
+    write_results_table(
         os.path.join(
             scenario_directory, str(subproblem), str(stage), "results", "fuel_burn.csv"
         ),
-        "w",
-        newline="",
-    ) as f:
-        writer = csv.writer(f)
-        writer.writerow(
-            [
-                "project",
-                "period",
-                "horizon",
-                "timepoint",
-                "timepoint_weight",
-                "number_of_hours_in_timepoint",
-                "load_zone",
-                "technology",
-                "fuel",
-                "fuel_burn_operations_mmbtu",
-                "fuel_burn_startup_mmbtu",
-                "total_fuel_burn_mmbtu",
-            ]
-        )
-        for (p, tmp) in m.FUEL_PRJ_OPR_TMPS:
-            writer.writerow(
-                [
-                    p,
-                    m.period[tmp],
-                    m.horizon[tmp, m.balancing_type_project[p]],
-                    tmp,
-                    m.tmp_weight[tmp],
-                    m.hrs_in_tmp[tmp],
-                    m.load_zone[p],
-                    m.technology[p],
-                    m.fuel[p],
-                    value(m.Operations_Fuel_Burn_MMBtu[p, tmp]),
-                    value(m.Startup_Fuel_Burn_MMBtu[p, tmp])
-                    if p in m.STARTUP_FUEL_PRJS
-                    else None,
-                    value(m.Total_Fuel_Burn_MMBtu[p, tmp]),
-                ]
-            )
+        columns,
+        results_format=getattr(d, results_format),
+    )
 
 
 # Database
@@ -340,85 +336,69 @@ def import_results_into_database(
     # Fuel burned by project and timepoint
     if not quiet:
         print("project fuel burn")
-    # Delete prior results and create temporary import table for ordering
-    setup_results_import(
+
+    results = []
+    for row in read_results_table_rows(
+        os.path.join(results_directory, "fuel_burn.csv")
+    ):
+        project = row[0]
+        period = row[1]
+        horizon = row[2]
+        timepoint = row[3]
+        timepoint_weight = row[4]
+        number_of_hours_in_timepoint = row[5]
+        load_zone = row[6]
+        technology = row[7]
+        fuel = row[8]
+        opr_fuel_burn_tons = row[9]
+        startup_fuel_burn_tons = row[10]
+        total_fuel_burn = row[11]
+
+        results.append(
+            (
+                scenario_id,
+                project,
+                period,
+                subproblem,
+                stage,
+                horizon,
+                timepoint,
+                timepoint_weight,
+                number_of_hours_in_timepoint,
+                load_zone,
+                technology,
+                fuel,
+                opr_fuel_burn_tons,
+                startup_fuel_burn_tons,
+                total_fuel_burn,
+            )
+        )
+
+    # Delete prior results and insert the sorted results
+    import_results_into_table(
         conn=db,
         cursor=c,
         table="results_project_fuel_burn",
         scenario_id=scenario_id,
         subproblem=subproblem,
         stage=stage,
+        columns=[
+            "scenario_id",
+            "project",
+            "period",
+            "subproblem_id",
+            "stage_id",
+            "horizon",
+            "timepoint",
+            "timepoint_weight",
+            "number_of_hours_in_timepoint",
+            "load_zone",
+            "technology",
+            "fuel",
+            "operations_fuel_burn_mmbtu",
+            "startup_fuel_burn_mmbtu",
+            "total_fuel_burn_mmbtu",
+        ],
+        results=results,
+        order_by=["scenario_id", "project", "subproblem_id", "stage_id", "timepoint"],
     )
-
-    # Load results into the temporary table
-    results = []
-    with open(os.path.join(results_directory, "fuel_burn.csv"), "r") as fuel_burn_file:
-        reader = csv.reader(fuel_burn_file)
-
-        next(reader)  # skip header
-        for row in reader:
-            project = row[0]
-            period = row[1]
-            horizon = row[2]
-            timepoint = row[3]
-            timepoint_weight = row[4]
-            number_of_hours_in_timepoint = row[5]
-            load_zone = row[6]
-            technology = row[7]
-            fuel = row[8]
-            opr_fuel_burn_tons = row[9]
-            startup_fuel_burn_tons = row[10]
-            total_fuel_burn = row[11]
-
-            results.append(
-                (
-                    scenario_id,
-                    project,
-                    period,
-                    subproblem,
-                    stage,
-                    horizon,
-                    timepoint,
-                    timepoint_weight,
-                    number_of_hours_in_timepoint,
-                    load_zone,
-                    technology,
-                    fuel,
-                    opr_fuel_burn_tons,
-                    startup_fuel_burn_tons,
-                    total_fuel_burn,
-                )
-            )
-
-    insert_temp_sql = """
-        INSERT INTO 
-        temp_results_project_fuel_burn{}
-         (scenario_id, project, period, subproblem_id, stage_id, 
-         horizon, timepoint, timepoint_weight,
-         number_of_hours_in_timepoint,
-         load_zone, technology, fuel, operations_fuel_burn_mmbtu, 
-         startup_fuel_burn_mmbtu, total_fuel_burn_mmbtu)
-         VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
-         """.format(
-        scenario_id
-    )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_temp_sql, data=results)
-
-    # Insert sorted results into permanent results table
-    insert_sql = """
-        INSERT INTO results_project_fuel_burn
-        (scenario_id, project, period, subproblem_id, stage_id, 
-        horizon, timepoint, timepoint_weight, number_of_hours_in_timepoint,
-        load_zone, technology, fuel, operations_fuel_burn_mmbtu, 
-         startup_fuel_burn_mmbtu, total_fuel_burn_mmbtu)
-        SELECT
-        scenario_id, project, period, subproblem_id, stage_id, 
-        horizon, timepoint, timepoint_weight, number_of_hours_in_timepoint,
-        load_zone, technology, fuel, operations_fuel_burn_mmbtu, 
-         startup_fuel_burn_mmbtu, total_fuel_burn_mmbtu
-        FROM temp_results_project_fuel_burn{}
-         ORDER BY scenario_id, project, subproblem_id, stage_id, timepoint;
-         """.format(
-        scenario_id
-    )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_sql, data=(), many=False)
@@ -22,13 +22,15 @@ If an operational type module method is not specified in an operational type
 module, these defaults are used.
 """
 
-import csv
 import os.path
 
-from db.common_functions import spin_on_database_lock
 from gridpath.auxiliary.auxiliary import get_required_subtype_modules_from_projects_file
 from gridpath.project.operations.common_functions import load_operational_type_modules
-from gridpath.auxiliary.db_interface import setup_results_import
+from gridpath.project.operations.operational_types.common_functions import (
+    MODULE_SPECIFIC_DISPATCH_COLUMNS,
+)
+from gridpath.auxiliary.db_interface import import_results_into_table
+from gridpath.auxiliary.results_export import read_results_table_rows
 
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
@@ -90,6 +92,41 @@ def load_model_data(m, d, data_portal, scenario_directory, subproblem, stage):
             pass
 
 
+def load_linked_model_data(m, d, data_portal, scenario_directory, subproblem, stage):
+    """
+
+    :param m:
+    :param d:
+    :param data_portal:
+    :param scenario_directory:
+    :param subproblem:
+    :param stage:
+    :return:
+
+    Load the linked timepoint params of the operational types, i.e. the
+    inputs exported by the previous subproblem when subproblems are linked.
+    """
+    # Import needed operational modules
+    required_operational_modules = get_required_subtype_modules_from_projects_file(
+        scenario_directory=scenario_directory,
+        subproblem=subproblem,
+        stage=stage,
+        which_type="operational_type",
+    )
+
+    imported_operational_modules = load_operational_type_modules(
+        required_operational_modules
+    )
+
+    for op_m in required_operational_modules:
+        if hasattr(imported_operational_modules[op_m], "load_linked_model_data"):
+            imported_operational_modules[op_m].load_linked_model_data(
+                m, d, data_portal, scenario_directory, subproblem, stage
+            )
+        else:
+            pass
+
+
 def export_results(scenario_directory, subproblem, stage, m, d):
     """
     Export operations results.
@@ -260,95 +297,100 @@ def import_results_into_database(
     """
     if not quiet:
         print("project dispatch all")
+
+    # Load in the required operational modules
+    required_opchar_modules = get_required_opchar_modules(scenario_id, c)
+    imported_operational_modules = load_operational_type_modules(
+        required_opchar_modules
+    )
+
+    # Get the module-specific dispatch results, so that we can insert complete
+    # rows into the dispatch results table rather than updating it row by row
+    module_specific_results = dict()
+    for op_m in required_opchar_modules:
+        if hasattr(
+            imported_operational_modules[op_m], "get_module_specific_dispatch_results"
+        ):
+            if not quiet:
+                print("project dispatch {}".format(op_m))
+            module_specific_results.update(
+                imported_operational_modules[op_m].get_module_specific_dispatch_results(
+                    results_directory
+                )
+            )
+        else:
+            pass
+    no_module_specific_results = (None,) * len(MODULE_SPECIFIC_DISPATCH_COLUMNS)
+
     # dispatch_all.csv
-    # Delete prior results and create temporary import table for ordering
-    setup_results_import(
+    results = []
+    for row in read_results_table_rows(
+        os.path.join(results_directory, "dispatch_all.csv")
+    ):
+        project = row[0]
+        period = row[1]
+        horizon = row[2]
+        timepoint = row[3]
+        operational_type = row[4]
+        balancing_type = row[5]
+        timepoint_weight = row[6]
+        number_of_hours_in_timepoint = row[7]
+        load_zone = row[8]
+        technology = row[9]
+        power_mw = row[10]
+
+        results.append(
+            (
+                scenario_id,
+                project,
+                period,
+                subproblem,
+                stage,
+                timepoint,
+                operational_type,
+                balancing_type,
+                horizon,
+                timepoint_weight,
+                number_of_hours_in_timepoint,
+                load_zone,
+                technology,
+                power_mw,
+            )
+            + module_specific_results.get(
+                (project, str(timepoint)), no_module_specific_results
+            )
+        )
+
+    # Delete prior results and insert the sorted rows
+    import_results_into_table(
         conn=db,
         cursor=c,
         table="results_project_dispatch",
         scenario_id=scenario_id,
         subproblem=subproblem,
         stage=stage,
+        columns=[
+            "scenario_id",
+            "project",
+            "period",
+            "subproblem_id",
+            "stage_id",
+            "timepoint",
+            "operational_type",
+            "balancing_type",
+            "horizon",
+            "timepoint_weight",
+            "number_of_hours_in_timepoint",
+            "load_zone",
+            "technology",
+            "power_mw",
+        ]
+        + MODULE_SPECIFIC_DISPATCH_COLUMNS,
+        results=results,
+        order_by=["scenario_id", "project", "subproblem_id", "stage_id", "timepoint"],
     )
 
-    # Load results into the temporary table
-    results = []
-    with open(
-        os.path.join(results_directory, "dispatch_all.csv"), "r"
-    ) as dispatch_file:
-        reader = csv.reader(dispatch_file)
-
-        next(reader)  # skip header
-        for row in reader:
-            project = row[0]
-            period = row[1]
-            horizon = row[2]
-            timepoint = row[3]
-            operational_type = row[4]
-            balancing_type = row[5]
-            timepoint_weight = row[6]
-            number_of_hours_in_timepoint = row[7]
-            load_zone = row[8]
-            technology = row[9]
-            power_mw = row[10]
-
-            results.append(
-                (
-                    scenario_id,
-                    project,
-                    period,
-                    subproblem,
-                    stage,
-                    timepoint,
-                    operational_type,
-                    balancing_type,
-                    horizon,
-                    timepoint_weight,
-                    number_of_hours_in_timepoint,
-                    load_zone,
-                    technology,
-                    power_mw,
-                )
-            )
-    insert_temp_sql = """
-        INSERT INTO temp_results_project_dispatch{}
-        (scenario_id, project, period, subproblem_id, stage_id, timepoint,
-        operational_type, balancing_type,
-        horizon, timepoint_weight,
-        number_of_hours_in_timepoint,
-        load_zone, technology, power_mw)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
-        """.format(
-        scenario_id
-    )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_temp_sql, data=results)
-
-    # Insert sorted results into permanent results table
-    insert_sql = """
-        INSERT INTO results_project_dispatch
-        (scenario_id, project, period, subproblem_id, stage_id, timepoint,
-        operational_type, balancing_type,
-        horizon, timepoint_weight, number_of_hours_in_timepoint,
-        load_zone, technology, power_mw)
-        SELECT
-        scenario_id, project, period, subproblem_id, stage_id, timepoint,
-        operational_type, balancing_type,
-        horizon, timepoint_weight, number_of_hours_in_timepoint,
-        load_zone, technology, power_mw
-        FROM temp_results_project_dispatch{}
-        ORDER BY scenario_id, project, subproblem_id, stage_id, timepoint;
-        """.format(
-        scenario_id
-    )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_sql, data=(), many=False)
-
-    # Load in the required operational modules
-    required_opchar_modules = get_required_opchar_modules(scenario_id, c)
-    imported_operational_modules = load_operational_type_modules(
-        required_opchar_modules
-    )
-
-    # Import module-specific results
+    # Import other module-specific results
     for op_m in required_opchar_modules:
         if hasattr(
             imported_operational_modules[op_m], "import_model_results_to_database"
@@ -18,13 +18,13 @@ import numpy as np
 import pandas as pd
 import warnings
 
-from db.common_functions import spin_on_database_lock
 from gridpath.project.common_functions import (
     check_if_boundary_type_and_first_timepoint,
     get_column_row_value,
     check_boundary_type,
 )
-from gridpath.auxiliary.auxiliary import cursor_to_df
+from gridpath.auxiliary.auxiliary import cursor_to_df, read_input_file
+from gridpath.auxiliary.db_interface import get_subproblem_stage_query_parts
 from gridpath.auxiliary.validations import (
     write_validation_to_database,
     validate_req_cols,
@@ -75,6 +75,44 @@ def determine_relevant_timepoints(mod, g, tmp, min_time):
     t-2. By the time we reach t-3, we will have reached the 4-hour minimum
     up/down time, so t-3 will not be relevant for the minimum up time
     constraint in timepoint *t*.
+
+    The relevant timepoints only depend on the project's balancing type, the
+    timepoint, and the min time, so we look them up in a table keyed by
+    (balancing_type, min_time) that is memoized on the model; the backward
+    walk through *prev_tmp* is therefore done only once for each timepoint
+    rather than for every project that shares a balancing type and min time.
+    """
+    if not hasattr(mod, "_relevant_tmps_lookback"):
+        mod._relevant_tmps_lookback = dict()
+
+    lookback_table = mod._relevant_tmps_lookback.setdefault(
+        (mod.balancing_type_project[g], min_time), dict()
+    )
+    if tmp not in lookback_table:
+        lookback_table[tmp] = walk_back_relevant_timepoints(
+            mod=mod,
+            balancing_type=mod.balancing_type_project[g],
+            tmp=tmp,
+            min_time=min_time,
+        )
+
+    relevant_tmps, relevant_linked_tmps = lookback_table[tmp]
+
+    return list(relevant_tmps), list(relevant_linked_tmps)
+
+
+def walk_back_relevant_timepoints(mod, balancing_type, tmp, min_time):
+    """
+    :param mod:
+    :param balancing_type:
+    :param tmp:
+    :param min_time:
+    :return: the relevant timepoints to look at for the minimum up/down time
+        constraints
+
+    Walk backward from *tmp* through the previous timepoints of the
+    balancing type (and then the linked timepoints, if applicable) until
+    the min time is reached. See *determine_relevant_timepoints*.
     """
 
     # The first possible relevant timepoint is the current timepoint
@@ -89,7 +127,7 @@ def determine_relevant_timepoints(mod, g, tmp, min_time):
     if check_if_boundary_type_and_first_timepoint(
         mod=mod,
         tmp=tmp,
-        balancing_type=mod.balancing_type_project[g],
+        balancing_type=balancing_type,
         boundary_type="linear",
     ):
         pass  # no more relevant timepoints, keep list limited to *t*
@@ -99,7 +137,7 @@ def determine_relevant_timepoints(mod, g, tmp, min_time):
     elif check_if_boundary_type_and_first_timepoint(
         mod=mod,
         tmp=tmp,
-        balancing_type=mod.balancing_type_project[g],
+        balancing_type=balancing_type,
         boundary_type="linked",
     ):
         # Add the first linked timepoint's duration to hours_from_tmp
@@ -123,10 +161,8 @@ def determine_relevant_timepoints(mod, g, tmp, min_time):
         # The next possible relevant timepoint is the previous timepoint,
         # so we'll check its duration (if it's longer than or equal to the
         # minimum up/down time, we'll break out of the loop immediately)
-        relevant_tmp = mod.prev_tmp[tmp, mod.balancing_type_project[g]]
-        hours_from_tmp = mod.hrs_in_tmp[
-            mod.prev_tmp[tmp, mod.balancing_type_project[g]]
-        ]
+        relevant_tmp = mod.prev_tmp[tmp, balancing_type]
+        hours_from_tmp = mod.hrs_in_tmp[mod.prev_tmp[tmp, balancing_type]]
 
         while hours_from_tmp < min_time:
             # If we haven't exceed the minimum up/down time yet, this timepoint
@@ -139,7 +175,7 @@ def determine_relevant_timepoints(mod, g, tmp, min_time):
             if check_if_boundary_type_and_first_timepoint(
                 mod=mod,
                 tmp=relevant_tmp,
-                balancing_type=mod.balancing_type_project[g],
+                balancing_type=balancing_type,
                 boundary_type="linear",
             ):
                 break
@@ -151,7 +187,7 @@ def determine_relevant_timepoints(mod, g, tmp, min_time):
                 check_boundary_type(
                     mod=mod,
                     tmp=tmp,
-                    balancing_type=mod.balancing_type_project[g],
+                    balancing_type=balancing_type,
                     boundary_type="circular",
                 )
                 and relevant_tmp == tmp
@@ -165,7 +201,7 @@ def determine_relevant_timepoints(mod, g, tmp, min_time):
             elif check_if_boundary_type_and_first_timepoint(
                 mod=mod,
                 tmp=relevant_tmp,
-                balancing_type=mod.balancing_type_project[g],
+                balancing_type=balancing_type,
                 boundary_type="linked",
             ):
                 # Add the first linked timepoint's duration to hours_from_tmp
@@ -191,17 +227,52 @@ def determine_relevant_timepoints(mod, g, tmp, min_time):
             # hours_from_tmp
             else:
                 hours_from_tmp += mod.hrs_in_tmp[
-                    mod.prev_tmp[relevant_tmp, mod.balancing_type_project[g]]
+                    mod.prev_tmp[relevant_tmp, balancing_type]
                 ]
-                relevant_tmp = mod.prev_tmp[relevant_tmp, mod.balancing_type_project[g]]
-
-    return relevant_tmps, relevant_linked_tmps
-
-
-def update_dispatch_results_table(
-    db, c, results_directory, scenario_id, subproblem, stage, results_file
-):
-    results = []
+                relevant_tmp = mod.prev_tmp[relevant_tmp, balancing_type]
+
+    return tuple(relevant_tmps), tuple(relevant_linked_tmps)
+
+
+# The module-specific columns of the results_project_dispatch table; these
+# are the same as the column names in the module-specific dispatch results
+# files (columns a module does not export are NULL)
+MODULE_SPECIFIC_DISPATCH_COLUMNS = [
+    "scheduled_curtailment_mw",
+    "subhourly_curtailment_mw",
+    "subhourly_energy_delivered_mw",
+    "total_curtailment_mw",
+    "committed_mw",
+    "committed_units",
+    "started_units",
+    "stopped_units",
+    "synced_units",
+    "auxiliary_consumption_mw",
+    "gross_power_mw",
+    "ramp_up_violation",
+    "ramp_down_violation",
+    "min_up_time_violation",
+    "min_down_time_violation",
+    "hyb_storage_charge_mw",
+    "hyb_storage_discharge_mw",
+]
+
+
+def get_dispatch_results(results_directory, results_file):
+    """
+    :param results_directory: the results directory
+    :param results_file: the name of the module-specific dispatch results
+        file
+    :return: dictionary of the values of the module-specific dispatch
+        columns (tuples in the order of MODULE_SPECIFIC_DISPATCH_COLUMNS)
+        by (project, timepoint), with the timepoint as a string
+
+    Read an operational type's dispatch results file, so that the
+    module-specific columns can be joined onto the rows of dispatch_all.csv
+    before the complete rows are inserted into the results_project_dispatch
+    table at once (rather than updating the table one row at a time).
+    """
+    results = dict()
     with open(os.path.join(results_directory, results_file), "r") as dispatch_file:
         reader = csv.reader(dispatch_file)
 
@@ -209,110 +280,13 @@ def update_dispatch_results_table(
 
         for row in reader:
             project = row[0]
-            period = row[1]
-            balancing_type = row[2]
-            horizon = row[3]
             timepoint = row[4]
-            timepoint_weight = row[5]
-            n_hours_in_tmp = row[6]
-            technology = row[7]
-            load_zone = row[8]
-            power = row[9]
-            scheduled_curtailment_mw = get_column_row_value(
-                header, "scheduled_curtailment_mw", row
-            )
-            subhourly_curtailment_mw = get_column_row_value(
-                header, "subhourly_curtailment_mw", row
-            )
-            subhourly_energy_delivered_mw = get_column_row_value(
-                header, "subhourly_energy_delivered_mw", row
-            )
-            total_curtailment_mw = get_column_row_value(
-                header, "total_curtailment_mw", row
-            )
-            committed_mw = get_column_row_value(header, "committed_mw", row)
-            committed_units = get_column_row_value(header, "committed_units", row)
-            started_units = get_column_row_value(header, "started_units", row)
-            stopped_units = get_column_row_value(header, "stopped_units", row)
-            synced_units = get_column_row_value(header, "synced_units", row)
-            auxiliary_consumption = get_column_row_value(
-                header, "auxiliary_consumption_mw", row
-            )
-            gross_power = get_column_row_value(header, "gross_power_mw", row)
-            ramp_up_violation = get_column_row_value(header, "ramp_up_violation", row)
-            ramp_down_violation = get_column_row_value(
-                header, "ramp_down_violation", row
-            )
-            min_up_time_violation = get_column_row_value(
-                header, "min_up_time_violation", row
-            )
-            min_down_time_violation = get_column_row_value(
-                header, "min_down_time_violation", row
-            )
-            hyb_storage_charge = get_column_row_value(
-                header, "hyb_storage_charge_mw", row
-            )
-            hyb_storage_discharge = get_column_row_value(
-                header, "hyb_storage_discharge_mw", row
-            )
-
-            results.append(
-                (
-                    scheduled_curtailment_mw,
-                    subhourly_curtailment_mw,
-                    subhourly_energy_delivered_mw,
-                    total_curtailment_mw,
-                    committed_mw,
-                    committed_units,
-                    started_units,
-                    stopped_units,
-                    synced_units,
-                    auxiliary_consumption,
-                    gross_power,
-                    ramp_up_violation,
-                    ramp_down_violation,
-                    min_up_time_violation,
-                    min_down_time_violation,
-                    hyb_storage_charge,
-                    hyb_storage_discharge,
-                    scenario_id,
-                    project,
-                    period,
-                    subproblem,
-                    stage,
-                    timepoint,
-                )
+            results[(project, str(timepoint))] = tuple(
+                get_column_row_value(header, column, row)
+                for column in MODULE_SPECIFIC_DISPATCH_COLUMNS
             )
 
-    # Update the results table with the module-specific results
-    update_sql = """
-        UPDATE results_project_dispatch
-        SET scheduled_curtailment_mw = ?,
-        subhourly_curtailment_mw = ?,
-        subhourly_energy_delivered_mw = ?,
-        total_curtailment_mw = ?,
-        committed_mw = ?,
-        committed_units = ?,
-        started_units = ?,
-        stopped_units = ?,
-        synced_units = ?,
-        auxiliary_consumption_mw = ?,
-        gross_power_mw = ?,
-        ramp_up_violation = ?,
-        ramp_down_violation = ?,
-        min_up_time_violation = ?,
-        min_down_time_violation = ?,
-        hyb_storage_charge_mw = ?,
-        hyb_storage_discharge_mw = ?
-        WHERE scenario_id = ?
-        AND project = ?
-        AND period = ?
-        AND subproblem_id = ?
-        AND stage_id = ?
-        AND timepoint = ?;
-        """
-
-    spin_on_database_lock(conn=db, cursor=c, sql=update_sql, data=results)
+    return results
 
 
 def get_optype_inputs_as_df(
@@ -333,24 +307,20 @@ def get_optype_inputs_as_df(
     type and only the columns required or optional for the operational type.
     """
 
+    projects_file = os.path.join(
+        scenario_directory, str(subproblem), str(stage), "inputs", "projects.tab"
+    )
+
     # Figure out which headers we have
-    header = pd.read_csv(
-        os.path.join(scenario_directory, subproblem, stage, "inputs", "projects.tab"),
-        sep="\t",
-        header=None,
-        nrows=1,
-    ).values[0]
+    header = read_input_file(projects_file).columns
 
     # Get the columns for the optional params (it's OK if they don't exist)
     used_columns = [c for c in optional_columns if c in header]
 
     # Read in the appropriate columns for the operational type from
     # projects.tab
-    df = pd.read_csv(
-        os.path.join(
-            scenario_directory, str(subproblem), str(stage), "inputs", "projects.tab"
-        ),
-        sep="\t",
+    df = read_input_file(
+        projects_file,
         usecols=["project", "operational_type"] + required_columns + used_columns,
     )
 
@@ -549,9 +519,8 @@ def load_var_profile_inputs(
 
     # Determine projects of this op_type and other var op_types
     # TODO: re-factor getting projects of certain op-type?
-    prj_df = pd.read_csv(
+    prj_df = read_input_file(
         os.path.join(scenario_directory, subproblem, stage, "inputs", "projects.tab"),
-        sep="\t",
         usecols=["project", "operational_type"],
     )
     op_type_prjs = prj_df[prj_df["operational_type"] == op_type]["project"]
@@ -610,6 +579,10 @@ def get_var_profile_inputs_from_database(
     (periods with existing project capacity for existing projects or
     with costs specified for new projects)
 
+    If the subproblem and stage are None, the profiles of all subproblems
+    and stages are selected, with the subproblem_id and stage_id as the
+    first two columns and ordered by them.
+
     :param subscenarios: SubScenarios object with all subscenario info
     :param subproblem:
     :param stage:
@@ -625,23 +598,29 @@ def get_var_profile_inputs_from_database(
     # table and in new build table, but depending on capacity type you'd only
     # use one of them, so filtering with OR is not 100% correct.
 
+    (
+        subproblem_stage_columns,
+        subproblem_stage_filter,
+        order_by,
+        subproblem_stage_params,
+    ) = get_subproblem_stage_query_parts(subproblem=subproblem, stage=stage)
+
     sql = """
-        SELECT project, timepoint, cap_factor
+        SELECT {}project, timepoint, cap_factor
         -- Select only projects, periods, horizons from the relevant portfolio, 
         -- relevant opchar scenario id, operational type, 
         -- and temporal scenario id
         FROM 
-            (SELECT project, stage_id, timepoint, 
+            (SELECT subproblem_id, project, stage_id, timepoint, 
             variable_generator_profile_scenario_id
             FROM project_operational_timepoints
-            WHERE project_portfolio_scenario_id = {}
-            AND project_operational_chars_scenario_id = {}
-            AND operational_type = '{}'
-            AND temporal_scenario_id = {}
-            AND (project_specified_capacity_scenario_id = {}
-                 OR project_new_cost_scenario_id = {})
-            AND subproblem_id = {}
-            AND stage_id = {}
+            WHERE project_portfolio_scenario_id = ?
+            AND project_operational_chars_scenario_id = ?
+            AND operational_type = ?
+            AND temporal_scenario_id = ?
+            AND (project_specified_capacity_scenario_id = ?
+                 OR project_new_cost_scenario_id = ?)
+            {}
             ) as projects_periods_timepoints_tbl
         -- Now that we have the relevant projects and timepoints, get the 
         -- respective cap factors (and no others) from 
@@ -650,19 +629,23 @@ def get_var_profile_inputs_from_database(
             inputs_project_variable_generator_profiles
         USING (variable_generator_profile_scenario_id, project, 
         stage_id, timepoint)
-        ;
+        {};
         """.format(
-        subscenarios.PROJECT_PORTFOLIO_SCENARIO_ID,
-        subscenarios.PROJECT_OPERATIONAL_CHARS_SCENARIO_ID,
-        op_type,
-        subscenarios.TEMPORAL_SCENARIO_ID,
-        subscenarios.PROJECT_SPECIFIED_CAPACITY_SCENARIO_ID,
-        subscenarios.PROJECT_NEW_COST_SCENARIO_ID,
-        subproblem,
-        stage,
+        subproblem_stage_columns, subproblem_stage_filter, order_by
     )
 
-    variable_profiles = c.execute(sql)
+    variable_profiles = c.execute(
+        sql,
+        (
+            subscenarios.PROJECT_PORTFOLIO_SCENARIO_ID,
+            subscenarios.PROJECT_OPERATIONAL_CHARS_SCENARIO_ID,
+            op_type,
+            subscenarios.TEMPORAL_SCENARIO_ID,
+            subscenarios.PROJECT_SPECIFIED_CAPACITY_SCENARIO_ID,
+            subscenarios.PROJECT_NEW_COST_SCENARIO_ID,
+        )
+        + subproblem_stage_params,
+    )
 
     return variable_profiles
 
@@ -788,6 +771,10 @@ def get_hydro_inputs_from_database(
     (periods with existing project capacity for existing projects or
     with costs specified for new projects)
 
+    If the subproblem and stage are None, the opchars of all subproblems
+    and stages are selected, with the subproblem_id and stage_id as the
+    first two columns and ordered by them.
+
     :param subscenarios: SubScenarios object with all subscenario info
     :param subproblem:
     :param stage:
@@ -804,22 +791,29 @@ def get_hydro_inputs_from_database(
     # table and in new build table, but depending on capacity type you'd only
     # use one of them, so filtering with OR is not 100% correct.
 
+    (
+        subproblem_stage_columns,
+        subproblem_stage_filter,
+        order_by,
+        subproblem_stage_params,
+    ) = get_subproblem_stage_query_parts(subproblem=subproblem, stage=stage)
+
     sql = """
-    SELECT project, horizon, average_power_fraction, min_power_fraction,
+    SELECT {}project, horizon, average_power_fraction, min_power_fraction,
     max_power_fraction
     -- Select only projects, horizons from the relevant portfolio, 
     -- relevant opchar scenario id, operational type, and temporal scenario id
     FROM 
-        (SELECT project, horizon, hydro_operational_chars_scenario_id
+        (SELECT subproblem_id, stage_id, project, horizon, 
+        hydro_operational_chars_scenario_id
         FROM project_operational_horizons
-        WHERE project_portfolio_scenario_id = {}
-        AND project_operational_chars_scenario_id = {}
-        AND operational_type = '{}'
-        AND temporal_scenario_id = {}
-        AND (project_specified_capacity_scenario_id = {}
-             OR project_new_cost_scenario_id = {})
-        AND subproblem_id = {}
-        AND stage_id = {}
+        WHERE project_portfolio_scenario_id = ?
+        AND project_operational_chars_scenario_id = ?
+        AND operational_type = ?
+        AND temporal_scenario_id = ?
+        AND (project_specified_capacity_scenario_id = ?
+             OR project_new_cost_scenario_id = ?)
+        {}
         ) as projects_periods_horizon_tbl
     -- Now that we have the relevant projects and horizons, get the 
     -- respective hydro opchars (and no others) from 
@@ -827,19 +821,23 @@ def get_hydro_inputs_from_database(
     LEFT OUTER JOIN
         inputs_project_hydro_operational_chars
     USING (hydro_operational_chars_scenario_id, project, horizon)
-    ;
+    {};
     """.format(
-        subscenarios.PROJECT_PORTFOLIO_SCENARIO_ID,
-        subscenarios.PROJECT_OPERATIONAL_CHARS_SCENARIO_ID,
-        op_type,
-        subscenarios.TEMPORAL_SCENARIO_ID,
-        subscenarios.PROJECT_SPECIFIED_CAPACITY_SCENARIO_ID,
-        subscenarios.PROJECT_NEW_COST_SCENARIO_ID,
-        subproblem,
-        stage,
+        subproblem_stage_columns, subproblem_stage_filter, order_by
     )
 
-    hydro_chars = c.execute(sql)
+    hydro_chars = c.execute(
+        sql,
+        (
+            subscenarios.PROJECT_PORTFOLIO_SCENARIO_ID,
+            subscenarios.PROJECT_OPERATIONAL_CHARS_SCENARIO_ID,
+            op_type,
+            subscenarios.TEMPORAL_SCENARIO_ID,
+            subscenarios.PROJECT_SPECIFIED_CAPACITY_SCENARIO_ID,
+            subscenarios.PROJECT_NEW_COST_SCENARIO_ID,
+        )
+        + subproblem_stage_params,
+    )
 
     return hydro_chars
 
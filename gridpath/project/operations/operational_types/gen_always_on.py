@@ -615,6 +615,20 @@ def load_model_data(mod, d, data_portal, scenario_directory, subproblem, stage):
         op_type="gen_always_on",
     )
 
+
+def load_linked_model_data(mod, d, data_portal, scenario_directory, subproblem, stage):
+    """
+    :param mod:
+    :param d:
+    :param data_portal:
+    :param scenario_directory:
+    :param subproblem:
+    :param stage:
+    :return:
+
+    Load the linked timepoint params exported by the previous subproblem,
+    if any.
+    """
     # Linked timepoint params
     linked_inputs_filename = os.path.join(
         scenario_directory,
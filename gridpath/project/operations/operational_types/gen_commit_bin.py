@@ -45,7 +45,7 @@ Morales-Espana et al. (2013).
 """
 
 from gridpath.project.operations.operational_types.common_functions import (
-    update_dispatch_results_table,
+    get_dispatch_results,
     validate_opchars,
 )
 import gridpath.project.operations.operational_types.gen_commit_unit_common as gen_commit_unit_common
@@ -233,6 +233,28 @@ def load_model_data(mod, d, data_portal, scenario_directory, subproblem, stage):
     )
 
 
+def load_linked_model_data(mod, d, data_portal, scenario_directory, subproblem, stage):
+    """
+    :param mod:
+    :param data_portal:
+    :param scenario_directory:
+    :param subproblem:
+    :param stage:
+    :return:
+    """
+
+    gen_commit_unit_common.load_linked_model_data(
+        mod=mod,
+        d=d,
+        data_portal=data_portal,
+        scenario_directory=scenario_directory,
+        subproblem=subproblem,
+        stage=stage,
+        bin_or_lin="bin",
+        BIN_OR_LIN="BIN",
+    )
+
+
 def export_results(mod, d, scenario_directory, subproblem, stage):
     """
     :param scenario_directory:
@@ -259,30 +281,14 @@ def export_results(mod, d, scenario_directory, subproblem, stage):
 ###############################################################################
 
 
-def import_model_results_to_database(
-    scenario_id, subproblem, stage, c, db, results_directory, quiet
-):
+def get_module_specific_dispatch_results(results_directory):
     """
-    :param scenario_id:
-    :param subproblem:
-    :param stage:
-    :param c:
-    :param db:
     :param results_directory:
-    :param quiet:
-    :return:
+    :return: dictionary of the module-specific dispatch results by
+        (project, timepoint)
     """
-    if not quiet:
-        print("project dispatch binary commit")
-
-    update_dispatch_results_table(
-        db=db,
-        c=c,
-        results_directory=results_directory,
-        scenario_id=scenario_id,
-        subproblem=subproblem,
-        stage=stage,
-        results_file="dispatch_binary_commit.csv",
+    return get_dispatch_results(
+        results_directory=results_directory, results_file="dispatch_binary_commit.csv"
     )
 
 
@@ -67,7 +67,7 @@ from gridpath.auxiliary.auxiliary import subset_init_by_param_value
 from gridpath.auxiliary.dynamic_components import headroom_variables, footroom_variables
 from gridpath.project.operations.operational_types.common_functions import (
     determine_relevant_timepoints,
-    update_dispatch_results_table,
+    get_dispatch_results,
     load_optype_model_data,
     check_for_tmps_to_link,
     validate_opchars,
@@ -1406,6 +1406,20 @@ def load_model_data(mod, d, data_portal, scenario_directory, subproblem, stage):
         op_type="gen_commit_cap",
     )
 
+
+def load_linked_model_data(mod, d, data_portal, scenario_directory, subproblem, stage):
+    """
+    :param mod:
+    :param d:
+    :param data_portal:
+    :param scenario_directory:
+    :param subproblem:
+    :param stage:
+    :return:
+
+    Load the linked timepoint params exported by the previous subproblem,
+    if any.
+    """
     # Linked timepoint params
     linked_inputs_filename = os.path.join(
         scenario_directory,
@@ -1556,31 +1570,14 @@ def export_results(mod, d, scenario_directory, subproblem, stage):
 ###############################################################################
 
 
-def import_model_results_to_database(
-    scenario_id, subproblem, stage, c, db, results_directory, quiet
-):
+def get_module_specific_dispatch_results(results_directory):
     """
-
-    :param scenario_id:
-    :param subproblem:
-    :param stage:
-    :param c:
-    :param db:
     :param results_directory:
-    :param quiet:
-    :return:
+    :return: dictionary of the module-specific dispatch results by
+        (project, timepoint)
     """
-    if not quiet:
-        print("project dispatch capacity commit")
-
-    update_dispatch_results_table(
-        db=db,
-        c=c,
-        results_directory=results_directory,
-        scenario_id=scenario_id,
-        subproblem=subproblem,
-        stage=stage,
-        results_file="dispatch_capacity_commit.csv",
+    return get_dispatch_results(
+        results_directory=results_directory, results_file="dispatch_capacity_commit.csv"
     )
 
 
@@ -3318,6 +3318,28 @@ def load_model_data(
         projects=projects,
     )
 
+
+def load_linked_model_data(
+    mod,
+    d,
+    data_portal,
+    scenario_directory,
+    subproblem,
+    stage,
+    bin_or_lin,
+    BIN_OR_LIN,
+):
+    """
+    :param mod:
+    :param data_portal:
+    :param scenario_directory:
+    :param subproblem:
+    :param stage:
+    :return:
+
+    Load the linked timepoint params exported by the previous subproblem,
+    if any.
+    """
     # Linked timepoint params
     linked_inputs_filename = os.path.join(
         scenario_directory,
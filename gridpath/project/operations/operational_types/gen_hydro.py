@@ -42,6 +42,10 @@ import warnings
 
 from db.common_functions import spin_on_database_lock
 from gridpath.auxiliary.auxiliary import subset_init_by_param_value
+from gridpath.auxiliary.db_interface import (
+    SUBPROBLEM_STAGES_TO_PROCESS_FILTER,
+    write_time_series_model_inputs,
+)
 from gridpath.auxiliary.dynamic_components import headroom_variables, footroom_variables
 from gridpath.project.common_functions import (
     check_if_boundary_type_and_first_timepoint,
@@ -49,11 +53,10 @@ from gridpath.project.common_functions import (
     check_boundary_type,
 )
 from gridpath.project.operations.operational_types.common_functions import (
-    update_dispatch_results_table,
+    get_dispatch_results,
     load_optype_model_data,
     load_hydro_opchars,
     get_hydro_inputs_from_database,
-    write_tab_file_model_inputs,
     check_for_tmps_to_link,
     validate_opchars,
     validate_hydro_opchars,
@@ -726,6 +729,20 @@ def load_model_data(m, d, data_portal, scenario_directory, subproblem, stage):
         projects=projects,
     )
 
+
+def load_linked_model_data(m, d, data_portal, scenario_directory, subproblem, stage):
+    """
+    :param m:
+    :param d:
+    :param data_portal:
+    :param scenario_directory:
+    :param subproblem:
+    :param stage:
+    :return:
+
+    Load the linked timepoint params exported by the previous subproblem,
+    if any.
+    """
     # Linked timepoint params
     linked_inputs_filename = os.path.join(
         scenario_directory,
@@ -887,39 +904,26 @@ def write_model_inputs(
     :return:
     """
 
-    data = get_model_inputs_from_database(
-        scenario_id, subscenarios, subproblem, stage, conn
+    write_time_series_model_inputs(
+        scenario_directory=scenario_directory,
+        subproblem=subproblem,
+        stage=stage,
+        conn=conn,
+        fname="hydro_conventional_horizon_params.tab",
+        get_data=lambda subproblem, stage: get_model_inputs_from_database(
+            scenario_id, subscenarios, subproblem, stage, conn
+        ),
     )
-    fname = "hydro_conventional_horizon_params.tab"
-
-    write_tab_file_model_inputs(scenario_directory, subproblem, stage, fname, data)
 
 
-def import_model_results_to_database(
-    scenario_id, subproblem, stage, c, db, results_directory, quiet
-):
+def get_module_specific_dispatch_results(results_directory):
     """
-
-    :param scenario_id:
-    :param subproblem:
-    :param stage:
-    :param c:
-    :param db:
     :param results_directory:
-    :param quiet:
-    :return:
+    :return: dictionary of the module-specific dispatch results by
+        (project, timepoint)
     """
-    if not quiet:
-        print("project dispatch hydro curtailable")
-
-    update_dispatch_results_table(
-        db=db,
-        c=c,
-        results_directory=results_directory,
-        scenario_id=scenario_id,
-        subproblem=subproblem,
-        stage=stage,
-        results_file="dispatch_gen_hydro.csv",
+    return get_dispatch_results(
+        results_directory=results_directory, results_file="dispatch_gen_hydro.csv"
     )
 
 
@@ -939,9 +943,12 @@ def process_model_results(db, c, scenario_id, subscenarios, quiet):
     del_sql = """
         DELETE FROM results_project_curtailment_hydro 
         WHERE scenario_id = ?
-        """
+        AND {};
+        """.format(
+        SUBPROBLEM_STAGES_TO_PROCESS_FILTER
+    )
     spin_on_database_lock(
-        conn=db, cursor=c, sql=del_sql, data=(scenario_id,), many=False
+        conn=db, cursor=c, sql=del_sql, data=(scenario_id, scenario_id), many=False
     )
 
     # Aggregate hydro curtailment (just scheduled curtailment)
@@ -974,10 +981,17 @@ def process_model_results(db, c, scenario_id, subscenarios, quiet):
         ) as tmp_info_tbl
         USING (subproblem_id, stage_id, timepoint)
         WHERE scenario_id = ?
+        AND {}
         ORDER BY subproblem_id, stage_id, load_zone, timepoint;
-        """
+        """.format(
+        SUBPROBLEM_STAGES_TO_PROCESS_FILTER
+    )
     spin_on_database_lock(
-        conn=db, cursor=c, sql=agg_sql, data=(scenario_id, scenario_id), many=False
+        conn=db,
+        cursor=c,
+        sql=agg_sql,
+        data=(scenario_id, scenario_id, scenario_id),
+        many=False,
     )
 
 
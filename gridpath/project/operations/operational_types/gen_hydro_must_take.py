@@ -36,6 +36,7 @@ from pyomo.environ import (
 import warnings
 
 from gridpath.auxiliary.auxiliary import subset_init_by_param_value
+from gridpath.auxiliary.db_interface import write_time_series_model_inputs
 from gridpath.auxiliary.dynamic_components import headroom_variables, footroom_variables
 from gridpath.project.common_functions import (
     check_if_boundary_type_and_first_timepoint,
@@ -46,7 +47,6 @@ from gridpath.project.operations.operational_types.common_functions import (
     load_optype_model_data,
     load_hydro_opchars,
     get_hydro_inputs_from_database,
-    write_tab_file_model_inputs,
     check_for_tmps_to_link,
     validate_opchars,
     validate_hydro_opchars,
@@ -684,6 +684,20 @@ def load_model_data(m, d, data_portal, scenario_directory, subproblem, stage):
         projects=projects,
     )
 
+
+def load_linked_model_data(m, d, data_portal, scenario_directory, subproblem, stage):
+    """
+    :param m:
+    :param d:
+    :param data_portal:
+    :param scenario_directory:
+    :param subproblem:
+    :param stage:
+    :return:
+
+    Load the linked timepoint params exported by the previous subproblem,
+    if any.
+    """
     # Linked timepoint params
     linked_inputs_filename = os.path.join(
         scenario_directory,
@@ -855,12 +869,16 @@ def write_model_inputs(
     :return:
     """
 
-    data = get_model_inputs_from_database(
-        scenario_id, subscenarios, subproblem, stage, conn
+    write_time_series_model_inputs(
+        scenario_directory=scenario_directory,
+        subproblem=subproblem,
+        stage=stage,
+        conn=conn,
+        fname="hydro_conventional_horizon_params.tab",
+        get_data=lambda subproblem, stage: get_model_inputs_from_database(
+            scenario_id, subscenarios, subproblem, stage, conn
+        ),
     )
-    fname = "hydro_conventional_horizon_params.tab"
-
-    write_tab_file_model_inputs(scenario_directory, subproblem, stage, fname, data)
 
 
 # Validation
@@ -23,6 +23,7 @@ from pyomo.environ import Param, Set, Reals, Constraint
 import warnings
 
 from gridpath.auxiliary.auxiliary import subset_init_by_param_value
+from gridpath.auxiliary.db_interface import write_time_series_model_inputs
 from gridpath.auxiliary.validations import (
     write_validation_to_database,
     get_projects_by_reserve,
@@ -36,7 +37,6 @@ from gridpath.project.common_functions import (
 from gridpath.project.operations.operational_types.common_functions import (
     load_var_profile_inputs,
     get_var_profile_inputs_from_database,
-    write_tab_file_model_inputs,
     validate_opchars,
     validate_var_profiles,
     load_optype_model_data,
@@ -302,12 +302,16 @@ def write_model_inputs(
     :return:
     """
 
-    data = get_model_inputs_from_database(
-        scenario_id, subscenarios, subproblem, stage, conn
+    write_time_series_model_inputs(
+        scenario_directory=scenario_directory,
+        subproblem=subproblem,
+        stage=stage,
+        conn=conn,
+        fname="variable_generator_profiles.tab",
+        get_data=lambda subproblem, stage: get_model_inputs_from_database(
+            scenario_id, subscenarios, subproblem, stage, conn
+        ),
     )
-    fname = "variable_generator_profiles.tab"
-
-    write_tab_file_model_inputs(scenario_directory, subproblem, stage, fname, data)
 
 
 # Validation
@@ -52,6 +52,10 @@ from pyomo.environ import (
 
 from db.common_functions import spin_on_database_lock
 from gridpath.auxiliary.auxiliary import subset_init_by_param_value
+from gridpath.auxiliary.db_interface import (
+    SUBPROBLEM_STAGES_TO_PROCESS_FILTER,
+    write_time_series_model_inputs,
+)
 from gridpath.auxiliary.dynamic_components import (
     footroom_variables,
     headroom_variables,
@@ -66,10 +70,9 @@ from gridpath.project.common_functions import (
     check_boundary_type,
 )
 from gridpath.project.operations.operational_types.common_functions import (
-    update_dispatch_results_table,
+    get_dispatch_results,
     load_var_profile_inputs,
     get_var_profile_inputs_from_database,
-    write_tab_file_model_inputs,
     validate_opchars,
     validate_var_profiles,
     load_optype_model_data,
@@ -891,38 +894,26 @@ def write_model_inputs(
     :return:
     """
 
-    data = get_model_inputs_from_database(
-        scenario_id, subscenarios, subproblem, stage, conn
+    write_time_series_model_inputs(
+        scenario_directory=scenario_directory,
+        subproblem=subproblem,
+        stage=stage,
+        conn=conn,
+        fname="variable_generator_profiles.tab",
+        get_data=lambda subproblem, stage: get_model_inputs_from_database(
+            scenario_id, subscenarios, subproblem, stage, conn
+        ),
     )
-    fname = "variable_generator_profiles.tab"
-
-    write_tab_file_model_inputs(scenario_directory, subproblem, stage, fname, data)
 
 
-def import_model_results_to_database(
-    scenario_id, subproblem, stage, c, db, results_directory, quiet
-):
+def get_module_specific_dispatch_results(results_directory):
     """
-
-    :param scenario_id:
-    :param subproblem:
-    :param stage:
-    :param c:
-    :param db:
     :param results_directory:
-    :param quiet:
-    :return:
+    :return: dictionary of the module-specific dispatch results by
+        (project, timepoint)
     """
-    if not quiet:
-        print("project dispatch gen_var_stor_hyb")
-
-    update_dispatch_results_table(
-        db=db,
-        c=c,
+    return get_dispatch_results(
         results_directory=results_directory,
-        scenario_id=scenario_id,
-        subproblem=subproblem,
-        stage=stage,
         results_file="dispatch_gen_var_stor_hybrid.csv",
     )
 
@@ -942,10 +933,13 @@ def process_model_results(db, c, scenario_id, subscenarios, quiet):
     # Delete old aggregated variable curtailment results
     del_sql = """
         DELETE FROM results_project_curtailment_variable 
-        WHERE scenario_id = ?;
-        """
+        WHERE scenario_id = ?
+        AND {};
+        """.format(
+        SUBPROBLEM_STAGES_TO_PROCESS_FILTER
+    )
     spin_on_database_lock(
-        conn=db, cursor=c, sql=del_sql, data=(scenario_id,), many=False
+        conn=db, cursor=c, sql=del_sql, data=(scenario_id, scenario_id), many=False
     )
 
     # Aggregate variable curtailment (just scheduled curtailment)
@@ -978,10 +972,17 @@ def process_model_results(db, c, scenario_id, subscenarios, quiet):
         ) as tmp_info_tbl
         USING (subproblem_id, stage_id, timepoint)
         WHERE scenario_id = ?
-        ORDER BY subproblem_id, stage_id, load_zone, timepoint;"""
+        AND {}
+        ORDER BY subproblem_id, stage_id, load_zone, timepoint;""".format(
+        SUBPROBLEM_STAGES_TO_PROCESS_FILTER
+    )
 
     spin_on_database_lock(
-        conn=db, cursor=c, sql=insert_sql, data=(scenario_id, scenario_id), many=False
+        conn=db,
+        cursor=c,
+        sql=insert_sql,
+        data=(scenario_id, scenario_id, scenario_id),
+        many=False,
     )
 
 
@@ -23,13 +23,26 @@ from __future__ import print_function
 
 from builtins import next
 from builtins import str
-import csv
+from collections import OrderedDict
 import os.path
 import pandas as pd
-from pyomo.environ import Expression, value
+from pyomo.environ import Expression
 
 from db.common_functions import spin_on_database_lock
+from gridpath.auxiliary.db_interface import (
+    SUBPROBLEM_STAGES_TO_PROCESS_FILTER,
+    import_results_into_table,
+)
 from gridpath.auxiliary.auxiliary import get_required_subtype_modules_from_projects_file
+from gridpath.auxiliary.dynamic_components import results_format
+from gridpath.auxiliary.results_export import (
+    get_aggregated_columns,
+    get_component_column,
+    get_project_timepoint_columns,
+    read_results_table,
+    read_results_table_rows,
+    write_results_table,
+)
 from gridpath.project.operations.common_functions import load_operational_type_modules
 import gridpath.project.operations.operational_types as op_type_init
 
@@ -112,7 +125,26 @@ def export_results(scenario_directory, subproblem, stage, m, d):
     """
 
     # First power
-    with open(
+    prj_tmps = list(m.PRJ_OPR_TMPS)
+    columns = get_project_timepoint_columns(
+        m,
+        prj_tmps,
+        [
+            "project",
+            "period",
+            "horizon",
+            "timepoint",
+            "operational_type",
+            "balancing_type",
+            "timepoint_weight",
+            "number_of_hours_in_timepoint",
+            "load_zone",
+            "technology",
+        ],
+    )
+    columns["power_mw"] = get_component_column(m.Power_Provision_MW, prj_tmps)
+
+    write_results_table(
         os.path.join(
             scenario_directory,
             str(subproblem),
@@ -120,41 +152,41 @@ def export_results(scenario_directory, subproblem, stage, m, d):
             "results",
             "dispatch_all.csv",
         ),
-        "w",
-        newline="",
-    ) as f:
-        writer = csv.writer(f)
-        writer.writerow(
-            [
-                "project",
+        columns,
+        results_format=getattr(d, results_format),
+    )
+
+    # Aggregate the power by technology in memory and write it alongside
+    # the detailed results, so that the results summary and import don't
+    # need to aggregate dispatch_all
+    columns = get_aggregated_columns(
+        columns,
+        group_by=["timepoint", "load_zone", "technology"],
+        first=["period", "timepoint_weight", "number_of_hours_in_timepoint"],
+        sums=["power_mw"],
+    )
+    write_results_table(
+        os.path.join(
+            scenario_directory,
+            str(subproblem),
+            str(stage),
+            "results",
+            "dispatch_by_technology.csv",
+        ),
+        OrderedDict(
+            (col, columns[col])
+            for col in [
                 "period",
-                "horizon",
                 "timepoint",
-                "operational_type",
-                "balancing_type",
                 "timepoint_weight",
                 "number_of_hours_in_timepoint",
                 "load_zone",
                 "technology",
                 "power_mw",
             ]
-        )
-        for (p, tmp) in m.PRJ_OPR_TMPS:
-            writer.writerow(
-                [
-                    p,
-                    m.period[tmp],
-                    m.horizon[tmp, m.balancing_type_project[p]],
-                    tmp,
-                    m.operational_type[p],
-                    m.balancing_type_project[p],
-                    m.tmp_weight[tmp],
-                    m.hrs_in_tmp[tmp],
-                    m.load_zone[p],
-                    m.technology[p],
-                    value(m.Power_Provision_MW[p, tmp]),
-                ]
-            )
+        ),
+        results_format=getattr(d, results_format),
+    )
 
 
 def summarize_results(scenario_directory, subproblem, stage):
@@ -180,14 +212,14 @@ def summarize_results(scenario_directory, subproblem, stage):
     # zone, technology, and period
     # Note: this includes power from spinup_or_lookahead timepoints as well!
 
-    # Get the results CSV as dataframe
-    operational_results_df = pd.read_csv(
+    # Get the results table (already aggregated by technology) as dataframe
+    operational_results_df = read_results_table(
         os.path.join(
             scenario_directory,
             str(subproblem),
             str(stage),
             "results",
-            "dispatch_all.csv",
+            "dispatch_by_technology.csv",
         )
     )
 
@@ -269,52 +301,117 @@ def import_results_into_database(
     :param results_directory:
     :param quiet:
     :return:
+
+    Import the dispatch by technology aggregated during the results export.
+    If the results were exported without it, aggregate the imported
+    project dispatch instead.
     """
-    pass
+    if not quiet:
+        print("project dispatch by technology")
 
+    dispatch_by_technology_file = os.path.join(
+        results_directory, "dispatch_by_technology.csv"
+    )
+    try:
+        rows = read_results_table_rows(dispatch_by_technology_file)
+    except IOError:
+        import_aggregated_project_dispatch(
+            scenario_id=scenario_id, subproblem=subproblem, stage=stage, c=c, db=db
+        )
+        return
+
+    results = [(scenario_id, subproblem, stage) + tuple(row) for row in rows]
+    import_results_into_table(
+        conn=db,
+        cursor=c,
+        table="results_project_dispatch_by_technology",
+        scenario_id=scenario_id,
+        subproblem=subproblem,
+        stage=stage,
+        columns=[
+            "scenario_id",
+            "subproblem_id",
+            "stage_id",
+            "period",
+            "timepoint",
+            "timepoint_weight",
+            "number_of_hours_in_timepoint",
+            "load_zone",
+            "technology",
+            "power_mw",
+        ],
+        results=results,
+        order_by=[
+            "scenario_id",
+            "subproblem_id",
+            "stage_id",
+            "timepoint",
+            "load_zone",
+            "technology",
+        ],
+    )
 
-def process_results(db, c, scenario_id, subscenarios, quiet):
+
+def import_aggregated_project_dispatch(scenario_id, subproblem, stage, c, db):
     """
-    Aggregate dispatch by technology
-    Aggregate dispatch by technology and period
-    :param db:
+    :param scenario_id:
+    :param subproblem:
+    :param stage:
     :param c:
-    :param subscenarios:
-    :param quiet:
+    :param db:
     :return:
-    """
-    if not quiet:
-        print("aggregate dispatch by technology")
 
-    # Delete old dispatch by technology
+    Aggregate the subproblem/stage's project dispatch by technology in the
+    database.
+    """
     del_sql = """
-        DELETE FROM results_project_dispatch_by_technology 
+        DELETE FROM results_project_dispatch_by_technology
         WHERE scenario_id = ?
+        AND subproblem_id = ?
+        AND stage_id = ?;
         """
     spin_on_database_lock(
-        conn=db, cursor=c, sql=del_sql, data=(scenario_id,), many=False
+        conn=db,
+        cursor=c,
+        sql=del_sql,
+        data=(scenario_id, subproblem, stage),
+        many=False,
     )
 
-    # Aggregate dispatch by technology
     agg_sql = """
         INSERT INTO results_project_dispatch_by_technology
         (scenario_id, subproblem_id, stage_id, period, timepoint, 
-        timepoint_weight, number_of_hours_in_timepoint, spinup_or_lookahead,
-        load_zone, technology, power_mw)
+        timepoint_weight, number_of_hours_in_timepoint, load_zone, technology,
+        power_mw)
         SELECT
         scenario_id, subproblem_id, stage_id, period, timepoint, 
-        timepoint_weight, number_of_hours_in_timepoint, spinup_or_lookahead,
-        load_zone, technology, sum(power_mw) AS power_mw
+        timepoint_weight, number_of_hours_in_timepoint, load_zone, technology,
+        sum(power_mw) AS power_mw
         FROM results_project_dispatch
         WHERE scenario_id = ?
-        GROUP BY subproblem_id, stage_id, timepoint, 
-        load_zone, technology
-        ORDER BY subproblem_id, stage_id, timepoint, 
-        load_zone, technology;"""
+        AND subproblem_id = ?
+        AND stage_id = ?
+        GROUP BY timepoint, load_zone, technology
+        ORDER BY timepoint, load_zone, technology;"""
     spin_on_database_lock(
-        conn=db, cursor=c, sql=agg_sql, data=(scenario_id,), many=False
+        conn=db,
+        cursor=c,
+        sql=agg_sql,
+        data=(scenario_id, subproblem, stage),
+        many=False,
     )
 
+
+def process_results(db, c, scenario_id, subscenarios, quiet):
+    """
+    Aggregate dispatch by technology and period (the dispatch by technology
+    is aggregated during the results export and imported with the results)
+    :param db:
+    :param c:
+    :param subscenarios:
+    :param quiet:
+    :return:
+    """
     if not quiet:
         print("aggregate dispatch by technology-period")
 
@@ -322,9 +419,12 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
     del_sql = """
         DELETE FROM results_project_dispatch_by_technology_period 
         WHERE scenario_id = ?
-        """
+        AND {}
+        """.format(
+        SUBPROBLEM_STAGES_TO_PROCESS_FILTER
+    )
     spin_on_database_lock(
-        conn=db, cursor=c, sql=del_sql, data=(scenario_id,), many=False
+        conn=db, cursor=c, sql=del_sql, data=(scenario_id, scenario_id), many=False
     )
 
     # Aggregate dispatch by technology, period, and spinup_or_lookahead
@@ -339,10 +439,13 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
         energy_mwh 
         FROM results_project_dispatch_by_technology
         WHERE scenario_id = ?
+        AND {}
         GROUP BY subproblem_id, stage_id, period, load_zone, technology, 
         spinup_or_lookahead
         ORDER BY subproblem_id, stage_id, period, load_zone, technology, 
-        spinup_or_lookahead;"""
+        spinup_or_lookahead;""".format(
+        SUBPROBLEM_STAGES_TO_PROCESS_FILTER
+    )
     spin_on_database_lock(
-        conn=db, cursor=c, sql=agg_sql, data=(scenario_id,), many=False
+        conn=db, cursor=c, sql=agg_sql, data=(scenario_id, scenario_id), many=False
     )
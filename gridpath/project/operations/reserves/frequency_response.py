@@ -21,8 +21,7 @@ import os.path
 import pandas as pd
 from pyomo.environ import Set, value
 
-from db.common_functions import spin_on_database_lock
-from gridpath.auxiliary.db_interface import setup_results_import
+from gridpath.auxiliary.db_interface import import_results_into_table
 from gridpath.auxiliary.dynamic_components import headroom_variables
 from gridpath.project.operations.reserves.reserve_provision import (
     generic_record_dynamic_components,
@@ -391,17 +390,7 @@ def import_results_into_database(
     :param quiet:
     :return:
     """
-    # Delete prior results and create temporary import table for ordering
-    setup_results_import(
-        conn=db,
-        cursor=c,
-        table="results_project_frequency_response",
-        scenario_id=scenario_id,
-        subproblem=subproblem,
-        stage=stage,
-    )
 
-    # Load results into the temporary table
     results = []
     with open(
         os.path.join(results_directory, "reserves_provision_frequency_response.csv"),
@@ -441,34 +430,30 @@ def import_results_into_database(
                     partial,
                 )
             )
-    insert_temp_sql = """
-        INSERT INTO temp_results_project_frequency_response{}
-        (scenario_id, project, period, subproblem_id, stage_id,
-        horizon, timepoint, timepoint_weight, 
-        number_of_hours_in_timepoint, 
-        frequency_response_ba, load_zone, technology,
-        reserve_provision_mw, partial)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 
-        ?, ?, ?, ?, ?);""".format(
-        scenario_id
-    )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_temp_sql, data=results)
-
-    # Insert sorted results into permanent results table
-    insert_sql = """
-        INSERT INTO results_project_frequency_response
-        (scenario_id, project, period, subproblem_id, stage_id, 
-        horizon, timepoint, timepoint_weight, number_of_hours_in_timepoint, 
-        frequency_response_ba, load_zone, technology,
-        reserve_provision_mw, partial)
-        SELECT
-        scenario_id, project, period, subproblem_id, stage_id, 
-        horizon, timepoint, timepoint_weight, number_of_hours_in_timepoint,
-        frequency_response_ba, load_zone, technology,
-        reserve_provision_mw, partial
-        FROM temp_results_project_frequency_response{} 
-        ORDER BY scenario_id, project, subproblem_id, stage_id, timepoint;
-        """.format(
-        scenario_id
+    # Delete prior results and insert the sorted results
+    import_results_into_table(
+        conn=db,
+        cursor=c,
+        table="results_project_frequency_response",
+        scenario_id=scenario_id,
+        subproblem=subproblem,
+        stage=stage,
+        columns=[
+            "scenario_id",
+            "project",
+            "period",
+            "subproblem_id",
+            "stage_id",
+            "horizon",
+            "timepoint",
+            "timepoint_weight",
+            "number_of_hours_in_timepoint",
+            "frequency_response_ba",
+            "load_zone",
+            "technology",
+            "reserve_provision_mw",
+            "partial",
+        ],
+        results=results,
+        order_by=["scenario_id", "project", "subproblem_id", "stage_id", "timepoint"],
     )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_sql, data=(), many=False)
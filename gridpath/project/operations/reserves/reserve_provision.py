@@ -18,19 +18,26 @@
 import csv
 import os.path
 import pandas as pd
-from pyomo.environ import Set, Param, Var, NonNegativeReals, PercentFraction, value
+from pyomo.environ import Set, Param, Var, NonNegativeReals, PercentFraction
 
-from db.common_functions import spin_on_database_lock
 from gridpath.auxiliary.validations import write_validation_to_database, validate_idxs
 from gridpath.auxiliary.auxiliary import (
     check_list_items_are_unique,
     find_list_item_position,
     cursor_to_df,
 )
-from gridpath.auxiliary.db_interface import setup_results_import
+from gridpath.auxiliary.db_interface import import_results_into_table
+from gridpath.auxiliary.results_export import (
+    get_component_column,
+    get_param_column,
+    get_project_timepoint_columns,
+    read_results_table_rows,
+    write_results_table,
+)
 from gridpath.auxiliary.dynamic_components import (
     reserve_variable_derate_params,
     reserve_to_energy_adjustment_params,
+    results_format,
 )
 
 
@@ -390,7 +397,30 @@ def generic_export_results(
     :param reserve_ba_param_name:
     :return:
     """
-    with open(
+    prj_tmps = list(getattr(m, reserve_project_operational_timepoints_set))
+    columns = get_project_timepoint_columns(
+        m,
+        prj_tmps,
+        [
+            "project",
+            "period",
+            "horizon",
+            "timepoint",
+            "timepoint_weight",
+            "number_of_hours_in_timepoint",
+        ],
+    )
+    columns["balancing_area"] = get_param_column(
+        getattr(m, reserve_ba_param_name), columns["project"]
+    )
+    columns.update(
+        get_project_timepoint_columns(m, prj_tmps, ["load_zone", "technology"])
+    )
+    columns["reserve_provision_mw"] = get_component_column(
+        getattr(m, reserve_provision_variable_name), prj_tmps
+    )
+
+    write_results_table(
         os.path.join(
             scenario_directory,
             str(subproblem),
@@ -398,39 +428,9 @@ def generic_export_results(
             "results",
             "reserves_provision_" + module_name + ".csv",
         ),
-        "w",
-        newline="",
-    ) as f:
-        writer = csv.writer(f)
-        writer.writerow(
-            [
-                "project",
-                "period",
-                "horizon",
-                "timepoint",
-                "timepoint_weight",
-                "number_of_hours_in_timepoint",
-                "balancing_area",
-                "load_zone",
-                "technology",
-                "reserve_provision_mw",
-            ]
-        )
-        for (p, tmp) in getattr(m, reserve_project_operational_timepoints_set):
-            writer.writerow(
-                [
-                    p,
-                    m.period[tmp],
-                    m.horizon[tmp, m.balancing_type_project[p]],
-                    tmp,
-                    m.tmp_weight[tmp],
-                    m.hrs_in_tmp[tmp],
-                    getattr(m, reserve_ba_param_name)[p],
-                    m.load_zone[p],
-                    m.technology[p],
-                    value(getattr(m, reserve_provision_variable_name)[p, tmp]),
-                ]
-            )
+        columns,
+        results_format=getattr(d, results_format),
+    )
 
 
 def generic_get_inputs_from_database(
@@ -629,82 +629,62 @@ def generic_import_results_into_database(
     :return:
     """
 
-    # Delete prior results and create temporary import table for ordering
-    setup_results_import(
+    results = []
+    for row in read_results_table_rows(
+        os.path.join(results_directory, "reserves_provision_" + reserve_type + ".csv")
+    ):
+        project = row[0]
+        period = row[1]
+        horizon = row[2]
+        timepoint = row[3]
+        timepoint_weight = row[4]
+        number_of_hours_in_timepoint = row[5]
+        ba = row[6]
+        load_zone = row[7]
+        technology = row[8]
+        reserve_provision = row[9]
+
+        results.append(
+            (
+                scenario_id,
+                project,
+                period,
+                subproblem,
+                stage,
+                horizon,
+                timepoint,
+                timepoint_weight,
+                number_of_hours_in_timepoint,
+                ba,
+                load_zone,
+                technology,
+                reserve_provision,
+            )
+        )
+
+    # Delete prior results and insert the sorted results
+    import_results_into_table(
         conn=db,
         cursor=c,
-        table="results_project_{}" "".format(reserve_type),
+        table="results_project_{}".format(reserve_type),
         scenario_id=scenario_id,
         subproblem=subproblem,
         stage=stage,
+        columns=[
+            "scenario_id",
+            "project",
+            "period",
+            "subproblem_id",
+            "stage_id",
+            "horizon",
+            "timepoint",
+            "timepoint_weight",
+            "number_of_hours_in_timepoint",
+            "{}_ba".format(reserve_type),
+            "load_zone",
+            "technology",
+            "reserve_provision_mw",
+        ],
+        results=results,
+        order_by=["scenario_id", "project", "subproblem_id", "stage_id", "timepoint"],
     )
-
-    # Load results into the temporary table
-    results = []
-    with open(
-        os.path.join(results_directory, "reserves_provision_" + reserve_type + ".csv"),
-        "r",
-    ) as reserve_provision_file:
-        reader = csv.reader(reserve_provision_file)
-
-        next(reader)  # skip header
-        for row in reader:
-            project = row[0]
-            period = row[1]
-            horizon = row[2]
-            timepoint = row[3]
-            timepoint_weight = row[4]
-            number_of_hours_in_timepoint = row[5]
-            ba = row[6]
-            load_zone = row[7]
-            technology = row[8]
-            reserve_provision = row[9]
-
-            results.append(
-                (
-                    scenario_id,
-                    project,
-                    period,
-                    subproblem,
-                    stage,
-                    horizon,
-                    timepoint,
-                    timepoint_weight,
-                    number_of_hours_in_timepoint,
-                    ba,
-                    load_zone,
-                    technology,
-                    reserve_provision,
-                )
-            )
-
-    insert_temp_sql = """
-        INSERT INTO temp_results_project_{}{}
-        (scenario_id, project, period, subproblem_id, stage_id,
-        horizon, timepoint, timepoint_weight,
-        number_of_hours_in_timepoint,
-        load_zone, {}_ba, technology, 
-        reserve_provision_mw)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
-        """.format(
-        reserve_type, scenario_id, reserve_type
-    )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_temp_sql, data=results)
-
-    # Insert sorted results into permanent results table
-    insert_sql = """
-        INSERT INTO results_project_{}
-        (scenario_id, project, period, subproblem_id, stage_id,
-        horizon, timepoint, timepoint_weight, number_of_hours_in_timepoint, 
-        {}_ba, load_zone, technology, reserve_provision_mw)
-        SELECT
-        scenario_id, project, period, subproblem_id, stage_id, 
-        horizon, timepoint, timepoint_weight, number_of_hours_in_timepoint, 
-        {}_ba, load_zone, technology, reserve_provision_mw
-        FROM temp_results_project_{}{}
-        ORDER BY scenario_id, project, subproblem_id, stage_id, 
-        timepoint;""".format(
-        reserve_type, reserve_type, reserve_type, reserve_type, scenario_id
-    )
-
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_sql, data=(), many=False)
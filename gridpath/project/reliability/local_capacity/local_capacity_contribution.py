@@ -24,8 +24,7 @@ import csv
 import os.path
 from pyomo.environ import Param, PercentFraction, Expression, value
 
-from db.common_functions import spin_on_database_lock
-from gridpath.auxiliary.db_interface import setup_results_import
+from gridpath.auxiliary.db_interface import import_results_into_table
 
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
@@ -237,17 +236,6 @@ def import_results_into_database(
     if not quiet:
         print("project local capacity contributions")
 
-    # Delete prior results and create temporary import table for ordering
-    setup_results_import(
-        conn=db,
-        cursor=c,
-        table="results_project_local_capacity",
-        scenario_id=scenario_id,
-        subproblem=subproblem,
-        stage=stage,
-    )
-
-    # Load results into the temporary table
     results = []
     with open(
         os.path.join(results_directory, "project_local_capacity_contribution.csv"), "r"
@@ -281,31 +269,27 @@ def import_results_into_database(
                 )
             )
 
-    insert_temp_sql = """
-        INSERT INTO temp_results_project_local_capacity{}
-        (scenario_id, project, period, subproblem_id, stage_id,
-        local_capacity_zone, technology, load_zone, 
-        capacity_mw, local_capacity_fraction,
-        local_capacity_contribution_mw)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
-        """.format(
-        scenario_id
-    )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_temp_sql, data=results)
-
-    # Insert sorted results into permanent results table
-    insert_sql = """
-        INSERT INTO results_project_local_capacity
-        (scenario_id, project, period, subproblem_id, stage_id,
-        local_capacity_zone, technology, load_zone, 
-        capacity_mw, local_capacity_fraction, local_capacity_contribution_mw)
-        SELECT
-        scenario_id, project, period, subproblem_id, stage_id,
-        local_capacity_zone, technology, load_zone,
-        capacity_mw, local_capacity_fraction, local_capacity_contribution_mw
-        FROM temp_results_project_local_capacity{}
-        ORDER BY scenario_id, project, subproblem_id, stage_id, period;
-        """.format(
-        scenario_id
+    # Delete prior results and insert the sorted results
+    import_results_into_table(
+        conn=db,
+        cursor=c,
+        table="results_project_local_capacity",
+        scenario_id=scenario_id,
+        subproblem=subproblem,
+        stage=stage,
+        columns=[
+            "scenario_id",
+            "project",
+            "period",
+            "subproblem_id",
+            "stage_id",
+            "local_capacity_zone",
+            "technology",
+            "load_zone",
+            "capacity_mw",
+            "local_capacity_fraction",
+            "local_capacity_contribution_mw",
+        ],
+        results=results,
+        order_by=["scenario_id", "project", "subproblem_id", "stage_id", "period"],
     )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_sql, data=(), many=False)
@@ -21,9 +21,8 @@ import os.path
 import pandas as pd
 from pyomo.environ import Param, Set, NonNegativeReals, Binary, Expression, value
 
-from db.common_functions import spin_on_database_lock
 from gridpath.auxiliary.auxiliary import subset_init_by_param_value
-from gridpath.auxiliary.db_interface import setup_results_import
+from gridpath.auxiliary.db_interface import import_results_into_table
 from gridpath.project.operations.operational_types.common_functions import (
     get_param_dict,
 )
@@ -466,17 +465,6 @@ def import_results_into_database(
     if not quiet:
         print("project elcc surface")
 
-    # Delete prior results and create temporary import table for ordering
-    setup_results_import(
-        conn=db,
-        cursor=c,
-        table="results_project_elcc_surface",
-        scenario_id=scenario_id,
-        subproblem=subproblem,
-        stage=stage,
-    )
-
-    # Load results into the temporary table
     results = []
     with open(
         os.path.join(results_directory, "prm_project_elcc_surface_contribution.csv"),
@@ -515,33 +503,29 @@ def import_results_into_database(
                 )
             )
 
-    insert_temp_sql = """
-        INSERT INTO temp_results_project_elcc_surface{}
-        (scenario_id, project, period, subproblem_id, stage_id, 
-        prm_zone, facet, technology, load_zone,
-        capacity_mw, elcc_eligible_capacity_mw,
-        elcc_surface_coefficient, elcc_mw)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?,  ?, ?, ?, ?);
-        """.format(
-        scenario_id
-    )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_temp_sql, data=results)
-
-    # Insert sorted results into permanent results table
-    insert_sql = """
-        INSERT INTO results_project_elcc_surface
-        (scenario_id, project, period, subproblem_id, stage_id,
-        prm_zone, facet, technology, load_zone, 
-        capacity_mw, elcc_eligible_capacity_mw, 
-        elcc_surface_coefficient, elcc_mw)
-        SELECT
-        scenario_id, project, period, subproblem_id, stage_id,
-        prm_zone, facet, technology, load_zone, 
-        capacity_mw, elcc_eligible_capacity_mw,
-        elcc_surface_coefficient, elcc_mw
-        FROM temp_results_project_elcc_surface{}
-        ORDER BY scenario_id, project, period, subproblem_id, stage_id;
-        """.format(
-        scenario_id
+    # Delete prior results and insert the sorted results
+    import_results_into_table(
+        conn=db,
+        cursor=c,
+        table="results_project_elcc_surface",
+        scenario_id=scenario_id,
+        subproblem=subproblem,
+        stage=stage,
+        columns=[
+            "scenario_id",
+            "project",
+            "period",
+            "subproblem_id",
+            "stage_id",
+            "prm_zone",
+            "facet",
+            "technology",
+            "load_zone",
+            "capacity_mw",
+            "elcc_eligible_capacity_mw",
+            "elcc_surface_coefficient",
+            "elcc_mw",
+        ],
+        results=results,
+        order_by=["scenario_id", "project", "period", "subproblem_id", "stage_id"],
     )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_sql, data=(), many=False)
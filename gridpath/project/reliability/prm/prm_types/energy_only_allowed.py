@@ -35,7 +35,10 @@ from pyomo.environ import (
 )
 
 from db.common_functions import spin_on_database_lock
-from gridpath.auxiliary.db_interface import setup_results_import
+from gridpath.auxiliary.db_interface import (
+    SUBPROBLEM_STAGES_TO_PROCESS_FILTER,
+    import_results_into_table,
+)
 from gridpath.auxiliary.dynamic_components import (
     prm_cost_group_sets,
     prm_cost_group_prm_type,
@@ -571,17 +574,7 @@ def import_results_into_database(
     # Energy-only and deliverable capacity by project
     if not quiet:
         print("project energy-only and deliverable capacities")
-    # Delete prior results and create temporary import table for ordering
-    setup_results_import(
-        conn=db,
-        cursor=c,
-        table="results_project_prm_deliverability",
-        scenario_id=scenario_id,
-        subproblem=subproblem,
-        stage=stage,
-    )
 
-    # Load results into the temporary table
     results = []
     with open(
         os.path.join(
@@ -614,50 +607,33 @@ def import_results_into_database(
                 )
             )
 
-    insert_temp_sql = """
-        INSERT INTO 
-        temp_results_project_prm_deliverability{}
-        (scenario_id, project, period, subproblem_id, stage_id,
-        prm_zone, capacity_mw, 
-        deliverable_capacity_mw, energy_only_capacity_mw)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?);
-        """.format(
-        scenario_id
-    )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_temp_sql, data=results)
-
-    # Insert sorted results into permanent results table
-    insert_sql = """
-        INSERT INTO results_project_prm_deliverability
-        (scenario_id, project, period, subproblem_id, stage_id,
-        prm_zone, capacity_mw, 
-        deliverable_capacity_mw, energy_only_capacity_mw)
-        SELECT
-        scenario_id, project, period, subproblem_id, stage_id,
-        prm_zone, capacity_mw, 
-        deliverable_capacity_mw, energy_only_capacity_mw
-        FROM temp_results_project_prm_deliverability{}
-         ORDER BY scenario_id, project, period, subproblem_id, stage_id;
-        """.format(
-        scenario_id
-    )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_sql, data=(), many=False)
-
-    # Group capacity cost results
-    if not quiet:
-        print("project prm group deliverability costs")
-
-    # Delete prior results and create temporary import table for ordering
-    setup_results_import(
+    # Delete prior results and insert the sorted results
+    import_results_into_table(
         conn=db,
         cursor=c,
-        table="results_project_prm_deliverability_group_capacity_and_costs",
+        table="results_project_prm_deliverability",
         scenario_id=scenario_id,
         subproblem=subproblem,
         stage=stage,
+        columns=[
+            "scenario_id",
+            "project",
+            "period",
+            "subproblem_id",
+            "stage_id",
+            "prm_zone",
+            "capacity_mw",
+            "deliverable_capacity_mw",
+            "energy_only_capacity_mw",
+        ],
+        results=results,
+        order_by=["scenario_id", "project", "period", "subproblem_id", "stage_id"],
     )
 
-    # Load results into the temporary table
+    # Group capacity cost results
+    if not quiet:
+        print("project prm group deliverability costs")
+
     results = []
     with open(
         os.path.join(results_directory, "deliverability_group_capacity_and_costs.csv"),
@@ -692,48 +668,36 @@ def import_results_into_database(
                 )
             )
 
-    insert_temp_sql = """
-        INSERT INTO 
-        temp_results_project_prm_deliverability_group_capacity_and_costs{}
-        (scenario_id, deliverability_group, period, subproblem_id, 
-        stage_id,
-        deliverability_group_no_cost_deliverable_capacity_mw, 
-        deliverability_group_deliverability_cost_per_mw,
-        total_capacity_mw, 
-        deliverable_capacity_mw, 
-        energy_only_capacity_mw,
-        deliverable_capacity_cost)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
-        """.format(
-        scenario_id
-    )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_temp_sql, data=results)
-
-    # Insert sorted results into permanent results table
-    insert_sql = """
-        INSERT INTO 
-        results_project_prm_deliverability_group_capacity_and_costs
-        (scenario_id, deliverability_group, period, subproblem_id, stage_id,
-        deliverability_group_no_cost_deliverable_capacity_mw, 
-        deliverability_group_deliverability_cost_per_mw,
-        total_capacity_mw, 
-        deliverable_capacity_mw, energy_only_capacity_mw,
-        deliverable_capacity_cost)
-        SELECT
-        scenario_id, deliverability_group, period, subproblem_id, stage_id,
-        deliverability_group_no_cost_deliverable_capacity_mw, 
-        deliverability_group_deliverability_cost_per_mw,
-        total_capacity_mw, 
-        deliverable_capacity_mw, energy_only_capacity_mw,
-        deliverable_capacity_cost
-        FROM 
-        temp_results_project_prm_deliverability_group_capacity_and_costs{}
-        ORDER BY scenario_id, deliverability_group, period, subproblem_id, 
-        stage_id;
-        """.format(
-        scenario_id
+    # Delete prior results and insert the sorted results
+    import_results_into_table(
+        conn=db,
+        cursor=c,
+        table="results_project_prm_deliverability_group_capacity_and_costs",
+        scenario_id=scenario_id,
+        subproblem=subproblem,
+        stage=stage,
+        columns=[
+            "scenario_id",
+            "deliverability_group",
+            "period",
+            "subproblem_id",
+            "stage_id",
+            "deliverability_group_no_cost_deliverable_capacity_mw",
+            "deliverability_group_deliverability_cost_per_mw",
+            "total_capacity_mw",
+            "deliverable_capacity_mw",
+            "energy_only_capacity_mw",
+            "deliverable_capacity_cost",
+        ],
+        results=results,
+        order_by=[
+            "scenario_id",
+            "deliverability_group",
+            "period",
+            "subproblem_id",
+            "stage_id",
+        ],
     )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_sql, data=(), many=False)
 
 
 def process_model_results(db, c, scenario_id, subscenarios, quiet):
@@ -782,9 +746,12 @@ def process_model_results(db, c, scenario_id, subscenarios, quiet):
         DELETE FROM 
         results_project_prm_deliverability_group_capacity_and_costs_agg 
         WHERE scenario_id = ?
-        """
+        AND {}
+        """.format(
+        SUBPROBLEM_STAGES_TO_PROCESS_FILTER
+    )
     spin_on_database_lock(
-        conn=db, cursor=c, sql=del_sql, data=(scenario_id,), many=False
+        conn=db, cursor=c, sql=del_sql, data=(scenario_id, scenario_id), many=False
     )
 
     # Insert new results
@@ -809,11 +776,14 @@ def process_model_results(db, c, scenario_id, subscenarios, quiet):
         SUM(deliverable_capacity_cost) AS deliverable_capacity_cost
         FROM results_project_prm_deliverability_group_capacity_and_costs
         WHERE scenario_id = ?
+        AND {}
         GROUP BY scenario_id, subproblem_id, stage_id, period
         ) AS cap_table
         USING (scenario_id, subproblem_id, stage_id, period)
-        ;"""
+        ;""".format(
+        SUBPROBLEM_STAGES_TO_PROCESS_FILTER
+    )
 
     spin_on_database_lock(
-        conn=db, cursor=c, sql=agg_sql, data=(scenario_id,), many=False
+        conn=db, cursor=c, sql=agg_sql, data=(scenario_id, scenario_id), many=False
     )
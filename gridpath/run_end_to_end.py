@@ -37,6 +37,7 @@ from gridpath.common_functions import (
     get_solve_parser,
     get_required_e2e_arguments_parser,
     get_parallel_get_inputs_parser,
+    get_parallel_import_parser,
     get_parallel_solve_parser,
     create_logs_directory_if_not_exists,
     Logging,
@@ -69,6 +70,7 @@ def parse_arguments(args):
             get_solve_parser(),
             get_parallel_get_inputs_parser(),
             get_parallel_solve_parser(),
+            get_parallel_import_parser(),
         ],
     )
 
@@ -21,24 +21,33 @@ The main() function of this script can also be called with the
 """
 
 import argparse
-from csv import reader, writer
+from collections import OrderedDict
+from csv import reader
 import datetime
 from multiprocessing import Pool, Manager
 import os.path
 from pyomo.environ import (
     AbstractModel,
+    ConcreteModel,
+    Constraint,
+    Objective,
+    Param,
     Suffix,
     DataPortal,
     SolverFactory,
     SolverStatus,
     TerminationCondition,
+    Var,
 )
+from pyomo.core.expr.current import identify_mutable_parameters
+from pyomo.solvers.plugins.solvers.persistent_solver import PersistentSolver
 
 # from pyomo.util.infeasible import log_infeasible_constraints
 from pyomo.common.tempfiles import TempfileManager
 import sys
 import warnings
 
+from gridpath.auxiliary.auxiliary import clear_input_file_cache
 from gridpath.auxiliary.scenario_chars import get_subproblem_structure_from_disk
 from gridpath.common_functions import (
     determine_scenario_directory,
@@ -49,16 +58,30 @@ from gridpath.common_functions import (
     create_logs_directory_if_not_exists,
     Logging,
 )
-from gridpath.auxiliary.dynamic_components import DynamicComponents
+from gridpath.auxiliary.dynamic_components import DynamicComponents, results_format
+from gridpath.auxiliary.results_export import get_index_columns, write_results_table
 from gridpath.auxiliary.module_list import determine_modules, load_modules
 
 
-def create_and_solve_problem(scenario_directory, subproblem, stage, parsed_arguments):
+def create_and_solve_problem(
+    scenario_directory,
+    subproblem,
+    stage,
+    parsed_arguments,
+    solver_session=None,
+    linked_pipeline=None,
+):
     """
     :param scenario_directory: the main scenario directory
     :param subproblem: the horizon subproblem name
     :param stage: the stage subproblem name
     :param parsed_arguments: the user-defined script arguments
+    :param solver_session: dictionary with the solver and the previous
+        solution to reuse if running in persistent-solver mode (see
+        *solve*); None otherwise
+    :param linked_pipeline: dictionary with the events used to coordinate
+        linked subproblems solved in parallel (see
+        *run_linked_subproblems_pipelined*); None otherwise
     :return: modules_to_use (list of module names used in scenario),
         loaded_modules (Python objects), dynamic_inputs (the populated
         dynamic components class), instance (the problem instance), results
@@ -85,10 +108,26 @@ def create_and_solve_problem(scenario_directory, subproblem, stage, parsed_argum
     Finally, we compile and solve the problem (*create_problem_instance* and
     *solve* methods respectively). If any variables need to be fixed,
     this is done before solving (see the *fix_variables* method).
+
+    In persistent-solver mode, the solver is kept in the *solver_session* and
+    the previous solution (e.g. of the previous stage) is applied to the new
+    instance's unfixed variables before solving, so that it can be used to
+    warm-start the solver (see *apply_previous_solution*). If only the
+    stage inputs (e.g. the fixed commitment) have changed since the
+    previous solve, the previous instance is updated in place instead of
+    creating a new one (see *update_previous_instance*), and only the
+    changes are passed to a persistent solver interface (see
+    *update_persistent_solver*).
+
+    When linked subproblems are pipelined, we build the abstract model and
+    load the inputs while the previous subproblem is still being solved and
+    only wait for its linked inputs before loading them (see
+    *load_scenario_data*).
     """
     # Create pyomo abstract model class
     model = AbstractModel()
     dynamic_components = DynamicComponents()
+    setattr(dynamic_components, results_format, parsed_arguments.results_format)
 
     # Determine/load modules and dynamic components
     modules_to_use, loaded_modules = set_up_gridpath_modules(
@@ -106,16 +145,43 @@ def create_and_solve_problem(scenario_directory, subproblem, stage, parsed_argum
     # TODO: maybe this shouldn't always be needed
     model.dual = Suffix(direction=Suffix.IMPORT)
 
-    # Load the scenario data
+    # Load the scenario data; if pipelining linked subproblems, this waits for
+    # the previous subproblem to export the linked inputs of this subproblem
     if not parsed_arguments.quiet:
         print("Loading data...")
     scenario_data = load_scenario_data(
-        model, dynamic_components, loaded_modules, scenario_directory, subproblem, stage
+        model,
+        dynamic_components,
+        loaded_modules,
+        scenario_directory,
+        subproblem,
+        stage,
+        linked_pipeline=linked_pipeline,
     )
 
-    if not parsed_arguments.quiet:
-        print("Creating problem instance...")
-    instance = create_problem_instance(model, scenario_data)
+    # In persistent-solver mode, reuse the previous instance if the problem
+    # structure has not changed
+    instance = None
+    if solver_session is not None:
+        instance = update_previous_instance(
+            solver_session,
+            modules_to_use,
+            loaded_modules,
+            dynamic_components,
+            scenario_data,
+            scenario_directory,
+            subproblem,
+            stage,
+        )
+
+    if instance is None:
+        if not parsed_arguments.quiet:
+            print("Creating problem instance...")
+        instance = create_problem_instance(
+            model, scenario_data, direct=parsed_arguments.direct_model_build
+        )
+    elif not parsed_arguments.quiet:
+        print("Updating previous problem instance...")
 
     # Fix variables if modules request so
     instance = fix_variables(
@@ -127,22 +193,56 @@ def create_and_solve_problem(scenario_directory, subproblem, stage, parsed_argum
         loaded_modules,
     )
 
+    # Keep track of the fixed variables and warm-start from the previous
+    # solution if in persistent-solver mode; a reused instance already has
+    # the previous solution's values
+    if solver_session is not None:
+        fixed_variables = [
+            var
+            for var in instance.component_data_objects(Var, descend_into=True)
+            if var.fixed
+        ]
+        if instance is solver_session.get("instance"):
+            solver_session["updated_variables"] = (
+                solver_session["fixed_variables"] + fixed_variables
+            )
+        else:
+            apply_previous_solution(instance, solver_session)
+        solver_session["fixed_variables"] = fixed_variables
+
     # Solve
     if not parsed_arguments.quiet:
         print("Solving...")
-    results = solve(instance, parsed_arguments)
+    results = solve(instance, parsed_arguments, solver_session=solver_session)
+
+    # Save the instance, its data, and its solution for the next solve in
+    # persistent-solver mode
+    if solver_session is not None:
+        save_solution_for_next_solve(instance, solver_session)
+        solver_session["instance"] = instance
+        solver_session["modules_to_use"] = modules_to_use
+        solver_session["data"] = scenario_data.data()
 
     return instance, results, dynamic_components
 
 
 def run_optimization_for_subproblem_stage(
-    scenario_directory, subproblem_directory, stage_directory, parsed_arguments
+    scenario_directory,
+    subproblem_directory,
+    stage_directory,
+    parsed_arguments,
+    solver_session=None,
+    linked_pipeline=None,
 ):
     """
     :param scenario_directory: the main scenario directory
     :param subproblem_directory: if there are horizon subproblems, the horizon
     :param stage_directory: if there are stage subproblems, the stage
     :param parsed_arguments: the parsed script arguments
+    :param solver_session: the solver session shared by the stages of a
+        subproblem in persistent-solver mode; None otherwise
+    :param linked_pipeline: the events coordinating linked subproblems
+        solved in parallel; None otherwise
     :return: return the objective function value (Total_Cost); only used in
         testing
 
@@ -208,7 +308,12 @@ def run_optimization_for_subproblem_stage(
 
     # Create problem instance and solve it
     solved_instance, results, dynamic_components = create_and_solve_problem(
-        scenario_directory, subproblem_directory, stage_directory, parsed_arguments
+        scenario_directory,
+        subproblem_directory,
+        stage_directory,
+        parsed_arguments,
+        solver_session=solver_session,
+        linked_pipeline=linked_pipeline,
     )
 
     # Save the scenario results to disk
@@ -220,6 +325,7 @@ def run_optimization_for_subproblem_stage(
         results,
         dynamic_components,
         parsed_arguments,
+        linked_pipeline=linked_pipeline,
     )
 
     # Summarize results
@@ -227,6 +333,9 @@ def run_optimization_for_subproblem_stage(
         scenario_directory, subproblem_directory, stage_directory, parsed_arguments
     )
 
+    # The parsed inputs of this subproblem/stage won't be needed again
+    clear_input_file_cache()
+
     # If logging, we need to return sys.stdout to original (i.e. stop writing
     # to log file)
     if parsed_arguments.log:
@@ -250,11 +359,21 @@ def run_optimization_for_subproblem(
     subproblem,
     parsed_arguments,
     objective_values,
+    solver_session=None,
+    linked_pipeline=None,
 ):
     """
     Check if there are stages in the subproblem; if not solve subproblem;
     if, yes, solve each stage sequentially
+
+    In persistent-solver mode, the stages share a solver session, so the
+    solver is reused and each stage is warm-started from the solution of the
+    previous stage. A session can also be passed in to be shared with other
+    subproblems (e.g. linked subproblems); otherwise, a new one is created.
     """
+    if parsed_arguments.persistent_solver and solver_session is None:
+        solver_session = dict()
+
     # If we only have a single subproblem, set the subproblem_string to an
     # empty string (no directory created)
     if list(subproblem_structure.SUBPROBLEM_STAGES.keys()) == [1]:
@@ -267,7 +386,12 @@ def run_optimization_for_subproblem(
     if subproblem_structure.SUBPROBLEM_STAGES[subproblem] == [1]:
         stage_directory = ""
         objective_values[subproblem] = run_optimization_for_subproblem_stage(
-            scenario_directory, subproblem_directory, stage_directory, parsed_arguments
+            scenario_directory,
+            subproblem_directory,
+            stage_directory,
+            parsed_arguments,
+            solver_session=solver_session,
+            linked_pipeline=linked_pipeline,
         )
     # Otherwise, run the stage problem
     else:
@@ -278,6 +402,8 @@ def run_optimization_for_subproblem(
                 subproblem_directory,
                 stage_directory,
                 parsed_arguments,
+                solver_session=solver_session,
+                linked_pipeline=linked_pipeline,
             )
 
 
@@ -303,6 +429,162 @@ def run_optimization_for_subproblem_pool(pool_datum):
     )
 
 
+def run_linked_subproblem_pool(pool_datum):
+    """
+    Helper function to pass to pool.map when pipelining linked subproblems;
+    if the subproblem fails, flag the failure for the next subproblems and
+    make sure they don't wait on this subproblem's linked inputs forever
+    """
+    [
+        scenario_directory,
+        subproblem_structure,
+        subproblem,
+        parsed_arguments,
+        objective_values,
+        linked_pipeline,
+    ] = pool_datum
+
+    try:
+        run_optimization_for_subproblem(
+            scenario_directory=scenario_directory,
+            subproblem_structure=subproblem_structure,
+            subproblem=subproblem,
+            parsed_arguments=parsed_arguments,
+            objective_values=objective_values,
+            linked_pipeline=linked_pipeline,
+        )
+    except BaseException:
+        linked_pipeline["status"]["failed"] = True
+        raise
+    finally:
+        for (sbp, stg) in linked_pipeline["events"].keys():
+            if sbp == subproblem:
+                linked_pipeline["events"][sbp, stg].set()
+
+
+def run_linked_subproblems_pipelined(
+    scenario_directory, subproblem_structure, parsed_arguments, n_parallel_subproblems
+):
+    """
+    :param scenario_directory: scenario directory path
+    :param subproblem_structure: the subproblem structure object
+    :param parsed_arguments:
+    :param n_parallel_subproblems: int, the number of processes to use
+    :return: the objective function values by subproblem and stage
+
+    Only the linked timepoint inputs of a subproblem depend on the previous
+    subproblem, so we don't have to wait for the previous subproblem to be
+    done before starting the next one. Each subproblem is started in its own
+    process: it sets up its modules, builds its abstract model, and loads
+    its inputs, then waits until the previous subproblem (same stage) has
+    exported the linked inputs before loading them and solving (see
+    *load_scenario_data* and *wait_for_linked_inputs*). The previous subproblem signals this right
+    after exporting its results (see *save_results*), and saves the rest of
+    its results (pass-through inputs, duals, summaries) while the next
+    subproblem is built and solved.
+    """
+    manager = Manager()
+    objective_values = manager.dict()
+    for subproblem in subproblem_structure.SUBPROBLEM_STAGES.keys():
+        objective_values[subproblem] = manager.dict()
+
+    subproblems = list(subproblem_structure.SUBPROBLEM_STAGES.keys())
+    stage_directories = dict()
+    for subproblem in subproblems:
+        if subproblem_structure.SUBPROBLEM_STAGES[subproblem] == [1]:
+            stage_directories[subproblem] = [""]
+        else:
+            stage_directories[subproblem] = [
+                str(stage)
+                for stage in subproblem_structure.SUBPROBLEM_STAGES[subproblem]
+            ]
+
+    linked_pipeline = {
+        "previous_subproblem": {
+            str(subproblems[i]): str(subproblems[i - 1])
+            for i in range(1, len(subproblems))
+        },
+        "events": {
+            (str(subproblem), stage): manager.Event()
+            for subproblem in subproblems
+            for stage in stage_directories[subproblem]
+        },
+        "status": manager.dict(),
+    }
+
+    pool = Pool(n_parallel_subproblems)
+    pool_data = tuple(
+        [
+            [
+                scenario_directory,
+                subproblem_structure,
+                subproblem,
+                parsed_arguments,
+                objective_values,
+                linked_pipeline,
+            ]
+            for subproblem in subproblems
+        ]
+    )
+
+    # Dispatch one subproblem at a time, in order, so that each subproblem
+    # is started before the ones that depend on it
+    pool.map(run_linked_subproblem_pool, pool_data, chunksize=1)
+    pool.close()
+
+    return objective_values
+
+
+def wait_for_linked_inputs(linked_pipeline, subproblem, stage):
+    """
+    :param linked_pipeline: dictionary with the events coordinating the
+        linked subproblems
+    :param subproblem: str, the subproblem directory
+    :param stage: str, the stage directory
+
+    Wait until the previous subproblem has exported the linked inputs for
+    this subproblem and stage. If the previous subproblem doesn't have this
+    stage, wait for all of its stages. Raise an exception if a previous
+    subproblem failed, as we then don't have the linked inputs.
+    """
+    previous_subproblem = linked_pipeline["previous_subproblem"].get(str(subproblem))
+    if previous_subproblem is None:
+        return
+
+    if (previous_subproblem, stage) in linked_pipeline["events"].keys():
+        linked_pipeline["events"][previous_subproblem, stage].wait()
+    else:
+        for (sbp, stg) in linked_pipeline["events"].keys():
+            if sbp == previous_subproblem:
+                linked_pipeline["events"][sbp, stg].wait()
+
+    if linked_pipeline["status"].get("failed", False):
+        raise Exception(
+            "A subproblem before subproblem {}, stage {} failed. "
+            "Exiting linked subproblem run.".format(subproblem, stage)
+        )
+
+
+def get_linked_subproblems_solver_session(scenario_directory, parsed_arguments):
+    """
+    :param scenario_directory: scenario directory path
+    :param parsed_arguments:
+    :return: a solver session to share across subproblems if the
+        subproblems are linked and we are in persistent-solver mode; None
+        otherwise (each subproblem then gets its own session if needed)
+
+    Linked subproblems are solved sequentially, each one picking up where
+    the previous one left off, so the previous subproblem's solution can be
+    used to warm-start the next one (see *apply_previous_solution*).
+    """
+    if parsed_arguments.persistent_solver and os.path.exists(
+        os.path.join(scenario_directory, "linked_subproblems_map.csv")
+    ):
+        return dict()
+    else:
+        return None
+
+
 def run_scenario(scenario_directory, subproblem_structure, parsed_arguments):
     """
     :param scenario_directory: scenario directory path
@@ -343,6 +625,9 @@ def run_scenario(scenario_directory, subproblem_structure, parsed_arguments):
         # objective function values
         objective_values = {}
 
+        solver_session = get_linked_subproblems_solver_session(
+            scenario_directory, parsed_arguments
+        )
         for subproblem in list(subproblem_structure.SUBPROBLEM_STAGES.keys()):
             objective_values[subproblem] = {}
             run_optimization_for_subproblem(
@@ -351,6 +636,7 @@ def run_scenario(scenario_directory, subproblem_structure, parsed_arguments):
                 subproblem=subproblem,
                 parsed_arguments=parsed_arguments,
                 objective_values=objective_values,
+                solver_session=solver_session,
             )
 
         # Should probably just remove this logic here and have a dictionary
@@ -363,31 +649,24 @@ def run_scenario(scenario_directory, subproblem_structure, parsed_arguments):
     # If parallelization is requested, proceed with some checks
     elif n_parallel_subproblems > 1:
         # Check if the subproblems are linked, in which case
-        # we can't parallelize and throw a warning, then solve
-        # sequentially
+        # we can't solve them independently, so we pipeline them instead
+        # (each subproblem only waits for the previous subproblem's linked
+        # inputs before loading its data)
         if os.path.exists(
             os.path.join(scenario_directory, "linked_subproblems_map.csv")
         ):
-            warnings.warn(
-                "GridPath WARNING: subproblems are linked and "
-                "cannot be solved in parallel. Solving "
-                "sequentially."
-            )
-            # Solve sequentially
-            objective_values = {}
-            for subproblem in list(subproblem_structure.SUBPROBLEM_STAGES.keys()):
-                run_optimization_for_subproblem(
-                    scenario_directory=scenario_directory,
-                    subproblem_structure=subproblem_structure,
-                    subproblem=subproblem,
-                    parsed_arguments=parsed_arguments,
-                    objective_values=objective_values,
+            if parsed_arguments.persistent_solver:
+                warnings.warn(
+                    "GridPath WARNING: linked subproblems solved in "
+                    "parallel are not warm-started from the previous "
+                    "subproblem's solution."
                 )
-
-            if len(objective_values.keys()) == 1:
-                objective_values = objective_values[1]
-
-            return objective_values
+            return run_linked_subproblems_pipelined(
+                scenario_directory=scenario_directory,
+                subproblem_structure=subproblem_structure,
+                parsed_arguments=parsed_arguments,
+                n_parallel_subproblems=n_parallel_subproblems,
+            )
 
         # If subproblems are independent, we create pool of subproblems
         # and solve them in parallel
@@ -428,6 +707,7 @@ def save_results(
     results,
     dynamic_components,
     parsed_arguments,
+    linked_pipeline=None,
 ):
     """
     :param scenario_directory:
@@ -436,6 +716,8 @@ def save_results(
     :param instance: model instance (solution loaded after solving by default)
     :param dynamic_components:
     :param parsed_arguments:
+    :param linked_pipeline: the events coordinating linked subproblems
+        solved in parallel; None otherwise
     :return:
 
     Create a results directory for the (sub)problem.
@@ -443,6 +725,9 @@ def save_results(
     Export pass through imports.
     Save objective function value.
     Save constraint duals.
+
+    If pipelining linked subproblems, signal that the next subproblem's
+    linked inputs are ready as soon as the results have been exported.
     """
     if not parsed_arguments.quiet:
         print("Saving results...")
@@ -482,11 +767,14 @@ def save_results(
             scenario_directory, subproblem, stage, instance, dynamic_components
         )
 
+        if linked_pipeline is not None:
+            linked_pipeline["events"][str(subproblem), str(stage)].set()
+
         export_pass_through_inputs(scenario_directory, subproblem, stage, instance)
 
         save_objective_function_value(scenario_directory, subproblem, stage, instance)
 
-        save_duals(scenario_directory, subproblem, stage, instance)
+        save_duals(scenario_directory, subproblem, stage, instance, dynamic_components)
     # If solver status is not ok, don't export results and print some
     # messages for the user
     else:
@@ -535,7 +823,13 @@ def create_abstract_model(
 
 
 def load_scenario_data(
-    model, dynamic_components, loaded_modules, scenario_directory, subproblem, stage
+    model,
+    dynamic_components,
+    loaded_modules,
+    scenario_directory,
+    subproblem,
+    stage,
+    linked_pipeline=None,
 ):
     """
     :param model: the Pyomo abstract model object with components added
@@ -545,12 +839,21 @@ def load_scenario_data(
     :param scenario_directory: the main scenario directory
     :param subproblem: the horizon subproblem
     :param stage: the stage subproblem
+    :param linked_pipeline: dictionary with the events used to coordinate
+        linked subproblems solved in parallel (see
+        *run_linked_subproblems_pipelined*); None otherwise
     :return: the DataPortal object populated with the input data
 
     Iterate over all required GridPath modules and call their
     *load_model_data* method in order to load input data into the relevant
-    model components. Return the resulting DataPortal object with the data
-    loaded in.
+    model components, then their *load_linked_model_data* method in order
+    to load the linked timepoint inputs exported by the previous subproblem
+    (if any). Return the resulting DataPortal object with the data loaded in.
+
+    When pipelining linked subproblems, all the other inputs are loaded
+    while the previous subproblem is still being solved, and we only wait
+    for the previous subproblem to export the linked inputs before loading
+    them.
     """
     # Load data
     data_portal = DataPortal()
@@ -566,21 +869,172 @@ def load_scenario_data(
             )
         else:
             pass
+
+    # If pipelining linked subproblems, wait for the previous subproblem to
+    # export the linked inputs of this subproblem
+    if linked_pipeline is not None:
+        wait_for_linked_inputs(linked_pipeline, subproblem, stage)
+
+    for m in loaded_modules:
+        if hasattr(m, "load_linked_model_data"):
+            m.load_linked_model_data(
+                model,
+                dynamic_components,
+                data_portal,
+                scenario_directory,
+                subproblem,
+                stage,
+            )
+        else:
+            pass
+
     return data_portal
 
 
-def create_problem_instance(model, loaded_data):
+def create_problem_instance(model, loaded_data, direct=False):
     """
     :param model: the AbstractModel Pyomo object with components added
     :param loaded_data: the DataPortal object with the data loaded in and
         linked to the relevant model components
+    :param direct: boolean; whether to construct the model components in
+        place rather than on a copy of the abstract model
     :return: the compiled problem instance
 
     Compile the problem based on the abstract model formulation and the data
     loaded into the model components.
+
+    By default, we use Pyomo's *create_instance*, which first clones the
+    abstract model and then constructs the clone's components. If *direct*
+    is True, we skip the clone and construct the abstract model's
+    components directly from the loaded data, turning the model itself into
+    the concrete problem instance (as *create_instance* does with the
+    clone). The abstract model can't be reused afterwards, which we never
+    do, and the module hooks are unaffected.
     """
     # Create problem instance
-    instance = model.create_instance(loaded_data)
+    if direct:
+        instance = construct_model_in_place(model=model, loaded_data=loaded_data)
+    else:
+        instance = model.create_instance(loaded_data)
+    return instance
+
+
+def construct_model_in_place(model, loaded_data):
+    """
+    :param model: the AbstractModel Pyomo object with components added
+    :param loaded_data: the DataPortal object with the data loaded in and
+        linked to the relevant model components
+    :return: the model, turned into the concrete problem instance
+
+    Construct the abstract model's components from the loaded data without
+    cloning the model first. This repeats the steps of Pyomo's
+    *Model.create_instance* after the clone, including two that rely on
+    Pyomo internals rather than its public API: setting the private
+    *_constructed* flag and changing the model's class to ConcreteModel.
+    These are as of Pyomo 5.7.3 (the version pinned in setup.py) and must
+    be checked against *create_instance* when upgrading Pyomo (see
+    tests/test_run_scenario.py).
+    """
+    model.load(loaded_data)
+    model._constructed = True
+    model.__class__ = ConcreteModel
+    return model
+
+
+def update_previous_instance(
+    solver_session,
+    modules_to_use,
+    loaded_modules,
+    dynamic_components,
+    scenario_data,
+    scenario_directory,
+    subproblem,
+    stage,
+):
+    """
+    :param solver_session: dictionary with the previous instance and its data
+    :param modules_to_use: list of the names of the GridPath modules used
+    :param loaded_modules: list of imported GridPath modules as Python objects
+    :param dynamic_components: the dynamic components class
+    :param scenario_data: the DataPortal with the current (sub)problem's data
+    :param scenario_directory: str
+    :param subproblem: str
+    :param stage: str
+    :return: the previous problem instance updated with the current data, or
+        None if the problem structure has changed and a new instance must be
+        created
+
+    Consecutive stages of a subproblem usually share their timepoints and
+    inputs, except for the inputs that the modules use to fix variables to
+    their values in the previous stage (e.g. the fixed commitment). Compare
+    the current data with the previous instance's data; if only the modules'
+    stage components (see their *get_stage_components*) and mutable params
+    with the same indices have changed, update the previous instance in
+    place instead of creating a new one:
+
+    * the modules replace their stage components (see their
+      *update_stage_components*),
+    * the mutable params are given their new values, and
+    * the variables fixed in the previous stage are unfixed, so that they
+      can be fixed again by *fix_variables*.
+
+    The updated variables and param values are kept in the *solver_session*
+    so that they can be passed to a persistent solver interface (see
+    *update_persistent_solver*).
+    """
+    instance = solver_session.get("instance")
+    if instance is None or modules_to_use != solver_session["modules_to_use"]:
+        return None
+
+    data = scenario_data.data()
+    previous_data = solver_session["data"]
+    changed_components = [
+        name
+        for name in set(data.keys()) | set(previous_data.keys())
+        if data.get(name) != previous_data.get(name)
+    ]
+
+    stage_components = list()
+    for m in loaded_modules:
+        if hasattr(m, "get_stage_components"):
+            stage_components += m.get_stage_components()
+
+    updated_params = list()
+    for name in changed_components:
+        if name in stage_components:
+            continue
+        component = instance.component(name)
+        if (
+            isinstance(component, Param)
+            and component.mutable
+            and data.get(name, {}).keys() == previous_data.get(name, {}).keys()
+        ):
+            updated_params.append(component)
+        else:
+            return None
+
+    for m in loaded_modules:
+        if hasattr(m, "update_stage_components"):
+            m.update_stage_components(
+                instance,
+                dynamic_components,
+                scenario_data,
+                scenario_directory,
+                subproblem,
+                stage,
+            )
+    for param in updated_params:
+        param.store_values(data[param.name])
+    updated_params = [
+        param[idx]
+        for param in updated_params
+        for idx in data[param.name].keys()
+        if data[param.name][idx] != previous_data[param.name][idx]
+    ]
+    for var in solver_session["fixed_variables"]:
+        var.unfix()
+    solver_session["updated_params"] = updated_params
+
     return instance
 
 
@@ -624,13 +1078,14 @@ def view_loaded_data(loaded_modules, instance):
             m.view_loaded_data(instance)
 
 
-def solve(instance, parsed_arguments):
+def create_solver(parsed_arguments):
     """
-    :param instance: the compiled problem instance
     :param parsed_arguments: the user-defined arguments (parsed)
-    :return: the problem results
+    :return: the Pyomo solver object with the solver options applied
 
-    Send the compiled problem instance to the solver and solve.
+    Get the solver requested on the command line or in the
+    solver_options.csv file (Cbc if neither is specified) and apply any
+    user-requested solver options.
     """
     # Start with solver name specified on command line
     solver_name = parsed_arguments.solver
@@ -686,18 +1141,76 @@ def solve(instance, parsed_arguments):
         else:
             solver.options[opt] = solver_options[opt]
 
+    return solver
+
+
+def solve(instance, parsed_arguments, solver_session=None):
+    """
+    :param instance: the compiled problem instance
+    :param parsed_arguments: the user-defined arguments (parsed)
+    :param solver_session: dictionary with the solver to reuse in
+        persistent-solver mode; None otherwise
+    :return: the problem results
+
+    Send the compiled problem instance to the solver and solve.
+
+    In persistent-solver mode, the solver is created once and kept in the
+    *solver_session*. Pyomo persistent solver interfaces keep the solver
+    process (and license) alive between solves and are given the new
+    instance with *set_instance*; other solvers write the problem file for
+    each solve as usual. The solve is warm-started with the variable values
+    on the instance if a previous solution has been applied and the solver
+    supports warm starts.
+    """
+    if solver_session is None:
+        solver = create_solver(parsed_arguments)
+        warmstart = False
+    else:
+        if "solver" not in solver_session.keys():
+            solver_session["solver"] = create_solver(parsed_arguments)
+        solver = solver_session["solver"]
+        warmstart = (
+            solver_session.get("previous_solution") is not None
+            and solver.warm_start_capable()
+        )
+
     # Solve
     # Note: Pyomo moves the results to the instance object by default.
     # If you want the results to stay into a results object, set the
     # load_solutions argument to False:
     # >>> results = solver.solve(instance, load_solutions=False)
 
-    results = solver.solve(
-        instance,
-        tee=not parsed_arguments.mute_solver_output,
-        keepfiles=parsed_arguments.keepfiles,
-        symbolic_solver_labels=parsed_arguments.symbolic,
-    )
+    if isinstance(solver, PersistentSolver):
+        if (
+            solver_session is not None
+            and solver.has_instance()
+            and instance is solver_session.get("instance")
+        ):
+            update_persistent_solver(solver, instance, solver_session)
+        else:
+            solver.set_instance(
+                instance, symbolic_solver_labels=parsed_arguments.symbolic
+            )
+        results = solver.solve(
+            tee=not parsed_arguments.mute_solver_output,
+            keepfiles=parsed_arguments.keepfiles,
+            warmstart=warmstart,
+        )
+    elif warmstart:
+        results = solver.solve(
+            instance,
+            tee=not parsed_arguments.mute_solver_output,
+            keepfiles=parsed_arguments.keepfiles,
+            symbolic_solver_labels=parsed_arguments.symbolic,
+            warmstart=True,
+        )
+    else:
+        results = solver.solve(
+            instance,
+            tee=not parsed_arguments.mute_solver_output,
+            keepfiles=parsed_arguments.keepfiles,
+            symbolic_solver_labels=parsed_arguments.symbolic,
+        )
 
     # Can optionally log infeasibilities but this has resulted in false
     # positives due to rounding errors larger than the default tolerance
@@ -707,6 +1220,145 @@ def solve(instance, parsed_arguments):
     return results
 
 
+def update_persistent_solver(solver, instance, solver_session):
+    """
+    :param solver: the persistent solver interface with the instance set
+    :param instance: the problem instance, updated since the previous solve
+    :param solver_session: dictionary with the variables and params updated
+        since the previous solve (see *update_previous_instance*)
+
+    Pass the changes to the instance since the previous solve to the
+    persistent solver instead of setting the whole instance again: update
+    the variables that have been fixed or unfixed, and replace the
+    constraints and the objective that include an updated mutable param.
+    """
+    for var in solver_session.pop("updated_variables", []):
+        solver.update_var(var)
+
+    updated_params = set(
+        id(param_data) for param_data in solver_session.pop("updated_params", [])
+    )
+    if not updated_params:
+        return
+
+    def includes_updated_params(expr):
+        return any(
+            id(param_data) in updated_params
+            for param_data in identify_mutable_parameters(expr)
+        )
+
+    for c in instance.component_data_objects(Constraint, active=True):
+        if includes_updated_params(c.expr):
+            solver.remove_constraint(c)
+            solver.add_constraint(c)
+    for o in instance.component_data_objects(Objective, active=True):
+        if includes_updated_params(o.expr):
+            solver.set_objective(o)
+
+
+def apply_previous_solution(instance, solver_session):
+    """
+    :param instance: the compiled problem instance
+    :param solver_session: dictionary with the previous solution (if any)
+
+    Set the value of each unfixed variable of the instance to its value in
+    the previous solution, if the variable (same component name and index)
+    existed in the previously solved instance. Variables that have been
+    fixed (e.g. the commitment fixed from a previous stage) are not touched.
+
+    If the previous instance had different timepoints (e.g. the previous
+    subproblem in a linked rolling-horizon run), the timepoints of the
+    instance are mapped by position to the previous instance's timepoints,
+    i.e. the previous subproblem's commitment, storage state of charge,
+    dispatch, etc. are used as the starting point for the same position
+    in the current subproblem. Only the timepoint position of each
+    variable's index is remapped (see *get_timepoint_index_position*); other
+    indices (projects, periods, horizons, etc.) are left unchanged even if
+    they happen to be equal to a timepoint. The solver checks the start's
+    feasibility and discards or repairs it as needed, so this only affects
+    solve time.
+    """
+    previous_solution = solver_session.get("previous_solution")
+    if previous_solution is None:
+        return
+
+    tmp_map = dict()
+    previous_tmps = solver_session.get("previous_timepoints", [])
+    if hasattr(instance, "TMPS") and list(instance.TMPS) != previous_tmps:
+        previous_tmps_set = set(previous_tmps)
+        tmp_map = {
+            tmp: prev_tmp
+            for (tmp, prev_tmp) in zip(instance.TMPS, previous_tmps)
+            if tmp not in previous_tmps_set
+        }
+
+    def previous_index(idx, tmp_position):
+        if not tmp_map or tmp_position is None:
+            return idx
+        elif isinstance(idx, tuple):
+            return (
+                idx[:tmp_position]
+                + (tmp_map.get(idx[tmp_position], idx[tmp_position]),)
+                + idx[tmp_position + 1 :]
+            )
+        else:
+            return tmp_map.get(idx, idx)
+
+    for var in instance.component_objects(Var, active=True):
+        previous_values = previous_solution.get(var.name)
+        if previous_values is None:
+            continue
+        tmp_position = get_timepoint_index_position(var)
+        for idx in var:
+            prev_idx = previous_index(idx, tmp_position)
+            if not var[idx].fixed and prev_idx in previous_values.keys():
+                var[idx].set_value(previous_values[prev_idx], valid=True)
+
+
+def get_timepoint_index_position(var):
+    """
+    :param var: the Pyomo Var
+    :return: the position of the timepoint in the variable's index, or None
+        if the variable is not indexed by timepoint
+
+    The variable is indexed by timepoint if its index set is (or is the
+    product of other sets with) the TMPS set, or one of the operational
+    timepoint sets (e.g. PRJ_OPR_TMPS, GEN_COMMIT_LIN_OPR_TMPS_STR_TYPES),
+    whose elements are (object, timepoint, ...) tuples.
+    """
+    if not var.is_indexed():
+        return None
+    position = 0
+    for index_set in var.index_set().subsets():
+        if index_set.name == "TMPS":
+            return position
+        elif "OPR_TMPS" in index_set.name:
+            return position + 1
+        elif index_set.dimen is None:
+            return None
+        position += index_set.dimen
+
+    return None
+
+
+def save_solution_for_next_solve(instance, solver_session):
+    """
+    :param instance: the solved problem instance
+    :param solver_session: dictionary in which to save the solution
+
+    Save the variable values of the solved instance by component name and
+    index, as well as the instance's timepoints, so that they can be applied
+    to the next instance (see *apply_previous_solution*).
+    """
+    solver_session["previous_solution"] = {
+        var.name: {idx: var[idx].value for idx in var if var[idx].value is not None}
+        for var in instance.component_objects(Var, active=True)
+    }
+    solver_session["previous_timepoints"] = (
+        list(instance.TMPS) if hasattr(instance, "TMPS") else []
+    )
+
+
 def export_results(scenario_directory, subproblem, stage, instance, dynamic_components):
     """
     :param scenario_directory:
@@ -790,15 +1442,21 @@ def save_objective_function_value(scenario_directory, subproblem, stage, instanc
         # objective_file.write(str(objective_function_value))
 
 
-def save_duals(scenario_directory, subproblem, stage, instance):
+def save_duals(scenario_directory, subproblem, stage, instance, dynamic_components):
     """
     :param scenario_directory:
     :param subproblem:
     :param stage:
     :param instance:
+    :param dynamic_components:
     :return:
 
     Save the duals of various constraints.
+
+    The duals of each constraint are extracted in a single pass over the
+    constraint's data objects and written as one results table in the
+    selected results format. Indices without a dual (e.g. when solving a
+    MIP with CPLEX) are skipped, with a single warning per constraint.
     """
     # Determine/load modules and dynamic components
     modules_to_use, loaded_modules = set_up_gridpath_modules(
@@ -814,32 +1472,45 @@ def save_duals(scenario_directory, subproblem, stage, instance):
 
     for c in list(instance.constraint_indices.keys()):
         constraint_object = getattr(instance, c)
-        with open(
+        indices = []
+        duals = []
+        n_missing = 0
+        for (index, constraint_data) in constraint_object.items():
+            dual = instance.dual.get(constraint_data)
+            if dual is None:
+                n_missing += 1
+            else:
+                indices.append(index)
+                duals.append(dual)
+
+        # We don't get duals when exporting them with CPLEX when solving
+        # MIPs, so skip them to avoid breaking the script, but throw a
+        # warning
+        if n_missing:
+            warnings.warn(
+                """
+                {} of the {} duals of {} were not found and were not exported.
+                This is expected if solving a MIP with CPLEX, not otherwise.
+                """.format(
+                    n_missing, len(constraint_object), c
+                )
+            )
+
+        column_names = instance.constraint_indices[c]
+        columns = OrderedDict(
+            zip(
+                column_names[:-1],
+                get_index_columns(indices) or [[]] * (len(column_names) - 1),
+            )
+        )
+        columns[column_names[-1]] = duals
+        write_results_table(
             os.path.join(
                 scenario_directory, subproblem, stage, "results", str(c) + ".csv"
             ),
-            "w",
-            newline="",
-        ) as duals_results_file:
-            duals_writer = writer(duals_results_file)
-            duals_writer.writerow(instance.constraint_indices[c])
-            for index in constraint_object:
-                try:
-                    duals_writer.writerow(
-                        list(index) + [instance.dual[constraint_object[index]]]
-                    )
-                # We get an error when trying to export duals with CPLEX
-                # when solving MIPs, so catch it here and ignore to avoid
-                # breaking the script, but throw a warning
-                except KeyError:
-                    warnings.warn(
-                        """
-                    KeyError caught when saving duals. Duals were not exported.
-                    This is expected if solving a MIP with CPLEX, 
-                    not otherwise.
-                    """
-                    )
-                    pass
+            columns,
+            results_format=getattr(dynamic_components, results_format),
+        )
 
 
 def summarize_results(scenario_directory, subproblem, stage, parsed_arguments):
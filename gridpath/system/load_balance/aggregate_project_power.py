@@ -20,6 +20,7 @@ load-balance constraint.
 
 from pyomo.environ import Expression
 
+from gridpath.auxiliary.auxiliary import get_zone_timepoint_subset
 from gridpath.auxiliary.dynamic_components import load_balance_production_components
 
 
@@ -39,13 +40,13 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
     """
 
     # Add power generation to load balance constraint
-    # TODO: is this better done with a set intersection (all projects in the
-    #  zone intersected with all operational project sin the timepoint)
+    # The operational projects are grouped by zone and timepoint in a single
+    # pass over PRJ_OPR_TMPS, so we don't scan all operational projects in
+    # the timepoint for each zone
     def total_power_production_rule(mod, z, tmp):
         return sum(
             mod.Power_Provision_MW[g, tmp]
-            for g in mod.OPR_PRJS_IN_TMP[tmp]
-            if mod.load_zone[g] == z
+            for g in get_zone_timepoint_subset(mod, "PRJ_OPR_TMPS", "load_zone", z, tmp)
         )
 
     m.Power_Production_in_Zone_MW = Expression(
@@ -26,8 +26,7 @@ import csv
 import os.path
 from pyomo.environ import Expression, value
 
-from db.common_functions import spin_on_database_lock
-from gridpath.auxiliary.db_interface import setup_results_import
+from gridpath.auxiliary.db_interface import import_results_into_table
 from gridpath.auxiliary.dynamic_components import (
     load_balance_production_components,
     load_balance_consumption_components,
@@ -168,17 +167,6 @@ def import_results_into_database(
     if not quiet:
         print("imports and exports")
 
-    # Delete prior results and create temporary import table for ordering
-    setup_results_import(
-        conn=db,
-        cursor=c,
-        table="results_transmission_imports_exports",
-        scenario_id=scenario_id,
-        subproblem=subproblem,
-        stage=stage,
-    )
-
-    # Load results into the temporary table
     results = []
     with open(
         os.path.join(results_directory, "imports_exports.csv"), "r"
@@ -212,31 +200,27 @@ def import_results_into_database(
                 )
             )
 
-    insert_temp_sql = """
-        INSERT INTO temp_results_transmission_imports_exports{}
-        (scenario_id, load_zone, period, subproblem_id, stage_id, 
-        timepoint, timepoint_weight, 
-        number_of_hours_in_timepoint, 
-        imports_mw, exports_mw, net_imports_mw)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
-        """.format(
-        scenario_id
-    )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_temp_sql, data=results)
-
-    # Insert sorted results into permanent results table
-    insert_sql = """
-        INSERT INTO results_transmission_imports_exports
-        (scenario_id, load_zone, period, subproblem_id, stage_id, 
-        timepoint, timepoint_weight, number_of_hours_in_timepoint,
-        imports_mw, exports_mw, net_imports_mw)
-        SELECT
-        scenario_id, load_zone, period, subproblem_id, stage_id, 
-        timepoint, timepoint_weight, number_of_hours_in_timepoint,
-        imports_mw, exports_mw, net_imports_mw
-        FROM temp_results_transmission_imports_exports{}
-        ORDER BY scenario_id, load_zone, subproblem_id, stage_id, timepoint;
-        """.format(
-        scenario_id
+    # Delete prior results and insert the sorted results
+    import_results_into_table(
+        conn=db,
+        cursor=c,
+        table="results_transmission_imports_exports",
+        scenario_id=scenario_id,
+        subproblem=subproblem,
+        stage=stage,
+        columns=[
+            "scenario_id",
+            "load_zone",
+            "period",
+            "subproblem_id",
+            "stage_id",
+            "timepoint",
+            "timepoint_weight",
+            "number_of_hours_in_timepoint",
+            "imports_mw",
+            "exports_mw",
+            "net_imports_mw",
+        ],
+        results=results,
+        order_by=["scenario_id", "load_zone", "subproblem_id", "stage_id", "timepoint"],
     )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_sql, data=(), many=False)
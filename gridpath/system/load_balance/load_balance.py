@@ -44,11 +44,12 @@ import os.path
 from pyomo.environ import Var, Constraint, Expression, NonNegativeReals, value
 
 from db.common_functions import spin_on_database_lock
-from gridpath.auxiliary.db_interface import setup_results_import
+from gridpath.auxiliary.db_interface import import_results_into_table
 from gridpath.auxiliary.dynamic_components import (
     load_balance_consumption_components,
     load_balance_production_components,
 )
+from gridpath.auxiliary.results_export import read_results_table_rows
 
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
@@ -217,17 +218,6 @@ def import_results_into_database(
     if not quiet:
         print("system load balance")
 
-    # Delete prior results and create temporary import table for ordering
-    setup_results_import(
-        conn=db,
-        cursor=c,
-        table="results_system_load_balance",
-        scenario_id=scenario_id,
-        subproblem=subproblem,
-        stage=stage,
-    )
-
-    # Load results into the temporary table
     results = []
     with open(
         os.path.join(results_directory, "load_balance.csv"), "r"
@@ -264,51 +254,39 @@ def import_results_into_database(
                     unserved_energy,
                 )
             )
-    insert_temp_sql = """
-        INSERT INTO 
-        temp_results_system_load_balance{}
-        (scenario_id, load_zone, period, subproblem_id, stage_id,
-        timepoint, discount_factor, number_years_represented,
-        timepoint_weight, number_of_hours_in_timepoint,
-        load_mw, overgeneration_mw, unserved_energy_mw)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
-        """.format(
-        scenario_id
-    )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_temp_sql, data=results)
-
-    # Insert sorted results into permanent results table
-    insert_sql = """
-        INSERT INTO results_system_load_balance
-        (scenario_id, load_zone, period, subproblem_id, stage_id, 
-        timepoint, discount_factor, number_years_represented,
-        timepoint_weight, number_of_hours_in_timepoint,
-        load_mw, overgeneration_mw, unserved_energy_mw)
-        SELECT
-        scenario_id, load_zone, period, subproblem_id, stage_id, 
-        timepoint, discount_factor, number_years_represented,
-        timepoint_weight, number_of_hours_in_timepoint,
-        load_mw, overgeneration_mw, unserved_energy_mw
-        FROM temp_results_system_load_balance{}
-        ORDER BY scenario_id, load_zone, subproblem_id, stage_id, timepoint;
-        """.format(
-        scenario_id
+    # Delete prior results and insert the sorted results
+    import_results_into_table(
+        conn=db,
+        cursor=c,
+        table="results_system_load_balance",
+        scenario_id=scenario_id,
+        subproblem=subproblem,
+        stage=stage,
+        columns=[
+            "scenario_id",
+            "load_zone",
+            "period",
+            "subproblem_id",
+            "stage_id",
+            "timepoint",
+            "discount_factor",
+            "number_years_represented",
+            "timepoint_weight",
+            "number_of_hours_in_timepoint",
+            "load_mw",
+            "overgeneration_mw",
+            "unserved_energy_mw",
+        ],
+        results=results,
+        order_by=["scenario_id", "load_zone", "subproblem_id", "stage_id", "timepoint"],
     )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_sql, data=(), many=False)
 
     # Update duals
     duals_results = []
-    with open(
-        os.path.join(results_directory, "Meet_Load_Constraint.csv"), "r"
-    ) as load_balance_duals_file:
-        reader = csv.reader(load_balance_duals_file)
-
-        next(reader)  # skip header
-
-        for row in reader:
-            duals_results.append(
-                (row[2], row[0], row[1], scenario_id, subproblem, stage)
-            )
+    for row in read_results_table_rows(
+        os.path.join(results_directory, "Meet_Load_Constraint.csv")
+    ):
+        duals_results.append((row[2], row[0], row[1], scenario_id, subproblem, stage))
     duals_sql = """
         UPDATE results_system_load_balance
         SET dual = ?
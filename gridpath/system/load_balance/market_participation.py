@@ -16,12 +16,11 @@ import csv
 import os.path
 from pyomo.environ import Set, Var, Expression, NonNegativeReals, value
 
-from db.common_functions import spin_on_database_lock
 from gridpath.auxiliary.dynamic_components import (
     load_balance_production_components,
     load_balance_consumption_components,
 )
-from gridpath.auxiliary.db_interface import setup_results_import
+from gridpath.auxiliary.db_interface import import_results_into_table
 
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
@@ -250,17 +249,6 @@ def import_results_into_database(
     if not quiet:
         print("market participation")
 
-    # Delete prior results and create temporary import table for ordering
-    setup_results_import(
-        conn=db,
-        cursor=c,
-        table="results_system_market_participation",
-        scenario_id=scenario_id,
-        subproblem=subproblem,
-        stage=stage,
-    )
-
-    # Load results into the temporary table
     results = []
     with open(
         os.path.join(results_directory, "market_participation.csv"), "r"
@@ -297,35 +285,36 @@ def import_results_into_database(
                     buy_power,
                 )
             )
-    insert_temp_sql = """
-        INSERT INTO 
-        temp_results_system_market_participation{}
-        (scenario_id, load_zone, market, subproblem_id, stage_id,
-        timepoint, period, discount_factor, number_years_represented,
-        timepoint_weight, number_of_hours_in_timepoint,
-        sell_power, buy_power)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
-        """.format(
-        scenario_id
-    )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_temp_sql, data=results)
-
-    # Insert sorted results into permanent results table
-    insert_sql = """
-        INSERT INTO results_system_market_participation
-        (scenario_id, load_zone, market, subproblem_id, stage_id,
-        timepoint, period, discount_factor, number_years_represented,
-        timepoint_weight, number_of_hours_in_timepoint,
-        sell_power, buy_power)
-        SELECT
-        scenario_id, load_zone, market, subproblem_id, stage_id,
-        timepoint, period, discount_factor, number_years_represented,
-        timepoint_weight, number_of_hours_in_timepoint,
-        sell_power, buy_power
-        FROM temp_results_system_market_participation{}
-        ORDER BY scenario_id, load_zone, market, subproblem_id, stage_id, 
-        timepoint;
-        """.format(
-        scenario_id
+    # Delete prior results and insert the sorted results
+    import_results_into_table(
+        conn=db,
+        cursor=c,
+        table="results_system_market_participation",
+        scenario_id=scenario_id,
+        subproblem=subproblem,
+        stage=stage,
+        columns=[
+            "scenario_id",
+            "load_zone",
+            "market",
+            "subproblem_id",
+            "stage_id",
+            "timepoint",
+            "period",
+            "discount_factor",
+            "number_years_represented",
+            "timepoint_weight",
+            "number_of_hours_in_timepoint",
+            "sell_power",
+            "buy_power",
+        ],
+        results=results,
+        order_by=[
+            "scenario_id",
+            "load_zone",
+            "market",
+            "subproblem_id",
+            "stage_id",
+            "timepoint",
+        ],
     )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_sql, data=(), many=False)
@@ -17,10 +17,13 @@ This module adds the main load-balance consumption component, the static
 load requirement to the load-balance constraint.
 """
 
-import csv
 import os.path
 from pyomo.environ import Param, NonNegativeReals
 
+from gridpath.auxiliary.db_interface import (
+    get_subproblem_stage_query_parts,
+    write_time_series_model_inputs,
+)
 from gridpath.auxiliary.dynamic_components import load_balance_consumption_components
 
 
@@ -79,6 +82,10 @@ def get_inputs_from_database(scenario_id, subscenarios, subproblem, stage, conn)
     :param stage:
     :param conn: database connection
     :return:
+
+    If the subproblem and stage are None, the loads of all subproblems and
+    stages are selected, with the subproblem_id and stage_id as the first
+    two columns and ordered by them.
     """
     subproblem = 1 if subproblem == "" else subproblem
     stage = 1 if stage == "" else stage
@@ -88,31 +95,34 @@ def get_inputs_from_database(scenario_id, subscenarios, subproblem, stage, conn)
     # Select only profiles of load_zones that are part of the correct
     # load_zone_scenario
     # Select only profiles for the correct load_scenario
+    (
+        subproblem_stage_columns,
+        subproblem_stage_filter,
+        order_by,
+        subproblem_stage_params,
+    ) = get_subproblem_stage_query_parts(subproblem=subproblem, stage=stage)
     loads = c.execute(
-        """SELECT load_zone, timepoint, load_mw
+        """SELECT {}load_zone, timepoint, load_mw
         FROM inputs_system_load
         INNER JOIN
-        (SELECT timepoint
+        (SELECT subproblem_id, stage_id, timepoint
         FROM inputs_temporal
-        WHERE temporal_scenario_id = {}
-        AND subproblem_id ={}
-        AND stage_id = {}) as relevant_timepoints
-        USING (timepoint)
+        WHERE temporal_scenario_id = ?
+        {}) as relevant_timepoints
+        USING (stage_id, timepoint)
         INNER JOIN
         (SELECT load_zone
         FROM inputs_geography_load_zones
-        WHERE load_zone_scenario_id = {}) as relevant_load_zones
+        WHERE load_zone_scenario_id = ?) as relevant_load_zones
         USING (load_zone)
-        WHERE load_scenario_id = {}
-        and stage_id = {}
+        WHERE load_scenario_id = ?
+        {}
         """.format(
-            subscenarios.TEMPORAL_SCENARIO_ID,
-            subproblem,
-            stage,
-            subscenarios.LOAD_ZONE_SCENARIO_ID,
-            subscenarios.LOAD_SCENARIO_ID,
-            stage,
-        )
+            subproblem_stage_columns, subproblem_stage_filter, order_by
+        ),
+        (subscenarios.TEMPORAL_SCENARIO_ID,)
+        + subproblem_stage_params
+        + (subscenarios.LOAD_ZONE_SCENARIO_ID, subscenarios.LOAD_SCENARIO_ID),
     )
 
     return loads
@@ -147,19 +157,14 @@ def write_model_inputs(
     :return:
     """
 
-    loads = get_inputs_from_database(scenario_id, subscenarios, subproblem, stage, conn)
-
-    with open(
-        os.path.join(
-            scenario_directory, str(subproblem), str(stage), "inputs", "load_mw.tab"
+    write_time_series_model_inputs(
+        scenario_directory=scenario_directory,
+        subproblem=subproblem,
+        stage=stage,
+        conn=conn,
+        fname="load_mw.tab",
+        get_data=lambda subproblem, stage: get_inputs_from_database(
+            scenario_id, subscenarios, subproblem, stage, conn
         ),
-        "w",
-        newline="",
-    ) as load_tab_file:
-        writer = csv.writer(load_tab_file, delimiter="\t", lineterminator="\n")
-
-        # Write header
-        writer.writerow(["LOAD_ZONES", "timepoint", "load_mw"])
-
-        for row in loads:
-            writer.writerow(row)
+        header=["LOAD_ZONES", "timepoint", "load_mw"],
+    )
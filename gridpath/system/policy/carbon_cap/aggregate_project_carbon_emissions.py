@@ -25,8 +25,7 @@ import csv
 import os.path
 from pyomo.environ import Param, Set, Expression, value
 
-from db.common_functions import spin_on_database_lock
-from gridpath.auxiliary.db_interface import setup_results_import
+from gridpath.auxiliary.db_interface import import_results_into_table
 from gridpath.auxiliary.dynamic_components import carbon_cap_balance_emission_components
 
 
@@ -135,17 +134,6 @@ def import_results_into_database(
     if not quiet:
         print("system carbon emissions (project)")
 
-    # Delete prior results and create temporary import table for ordering
-    setup_results_import(
-        conn=db,
-        cursor=c,
-        table="results_system_carbon_emissions",
-        scenario_id=scenario_id,
-        subproblem=subproblem,
-        stage=stage,
-    )
-
-    # Load results into the temporary table
     results = []
     with open(
         os.path.join(results_directory, "carbon_cap_total_project.csv"), "r"
@@ -171,29 +159,29 @@ def import_results_into_database(
                 )
             )
 
-    insert_temp_sql = """
-        INSERT INTO 
-        temp_results_system_carbon_emissions{}
-         (scenario_id, carbon_cap_zone, period, subproblem_id, stage_id,
-         carbon_cap, in_zone_project_emissions)
-         VALUES (?, ?, ?, ?, ?, ?, ?);
-         """.format(
-        scenario_id
-    )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_temp_sql, data=results)
-
-    # Insert sorted results into permanent results table
-    insert_sql = """
-        INSERT INTO results_system_carbon_emissions
-        (scenario_id, carbon_cap_zone, period, subproblem_id, stage_id,
-        carbon_cap, in_zone_project_emissions)
-        SELECT
-        scenario_id, carbon_cap_zone, period, subproblem_id, stage_id,
-        carbon_cap, in_zone_project_emissions
-        FROM temp_results_system_carbon_emissions{}
-         ORDER BY scenario_id, carbon_cap_zone, period, subproblem_id, 
-        stage_id;
-        """.format(
-        scenario_id
+    # Delete prior results and insert the sorted results
+    import_results_into_table(
+        conn=db,
+        cursor=c,
+        table="results_system_carbon_emissions",
+        scenario_id=scenario_id,
+        subproblem=subproblem,
+        stage=stage,
+        columns=[
+            "scenario_id",
+            "carbon_cap_zone",
+            "period",
+            "subproblem_id",
+            "stage_id",
+            "carbon_cap",
+            "in_zone_project_emissions",
+        ],
+        results=results,
+        order_by=[
+            "scenario_id",
+            "carbon_cap_zone",
+            "period",
+            "subproblem_id",
+            "stage_id",
+        ],
     )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_sql, data=(), many=False)
@@ -77,23 +77,24 @@ def get_inputs_from_database(scenario_id, subscenarios, subproblem, stage, conn)
         JOIN
         (SELECT period
         FROM inputs_temporal_periods
-        WHERE temporal_scenario_id = {}) as relevant_periods
+        WHERE temporal_scenario_id = ?) as relevant_periods
         USING (period)
         JOIN
         (SELECT carbon_cap_zone
         FROM inputs_geography_carbon_cap_zones
-        WHERE carbon_cap_zone_scenario_id = {}) as relevant_zones
+        WHERE carbon_cap_zone_scenario_id = ?) as relevant_zones
         using (carbon_cap_zone)
-        WHERE carbon_cap_target_scenario_id = {}
-        AND subproblem_id = {}
-        AND stage_id = {};
-        """.format(
+        WHERE carbon_cap_target_scenario_id = ?
+        AND subproblem_id = ?
+        AND stage_id = ?;
+        """,
+        (
             subscenarios.TEMPORAL_SCENARIO_ID,
             subscenarios.CARBON_CAP_ZONE_SCENARIO_ID,
             subscenarios.CARBON_CAP_TARGET_SCENARIO_ID,
             subproblem,
             stage,
-        )
+        ),
     )
 
     return carbon_cap_targets
@@ -76,23 +76,24 @@ def get_inputs_from_database(scenario_id, subscenarios, subproblem, stage, conn)
         JOIN
         (SELECT period
         FROM inputs_temporal_periods
-        WHERE temporal_scenario_id = {}) as relevant_periods
+        WHERE temporal_scenario_id = ?) as relevant_periods
         USING (period)
         JOIN
         (SELECT carbon_tax_zone
         FROM inputs_geography_carbon_tax_zones
-        WHERE carbon_tax_zone_scenario_id = {}) as relevant_zones
+        WHERE carbon_tax_zone_scenario_id = ?) as relevant_zones
         using (carbon_tax_zone)
-        WHERE carbon_tax_scenario_id = {}
-        AND subproblem_id = {}
-        AND stage_id = {};
-        """.format(
+        WHERE carbon_tax_scenario_id = ?
+        AND subproblem_id = ?
+        AND stage_id = ?;
+        """,
+        (
             subscenarios.TEMPORAL_SCENARIO_ID,
             subscenarios.CARBON_TAX_ZONE_SCENARIO_ID,
             subscenarios.CARBON_TAX_SCENARIO_ID,
             subproblem,
             stage,
-        )
+        ),
     )
 
     return carbon_tax
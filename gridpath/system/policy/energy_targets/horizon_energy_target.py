@@ -154,23 +154,24 @@ def get_inputs_from_database(scenario_id, subscenarios, subproblem, stage, conn)
         JOIN
         (SELECT balancing_type_horizon, horizon
         FROM inputs_temporal_horizons
-        WHERE temporal_scenario_id = {}) as relevant_horizons
+        WHERE temporal_scenario_id = ?) as relevant_horizons
         USING (balancing_type_horizon, horizon)
         JOIN
         (SELECT energy_target_zone
         FROM inputs_geography_energy_target_zones
-        WHERE energy_target_zone_scenario_id = {}) as relevant_zones
+        WHERE energy_target_zone_scenario_id = ?) as relevant_zones
         USING (energy_target_zone)
-        WHERE horizon_energy_target_scenario_id = {}
-        AND subproblem_id = {}
-        AND stage_ID = {};
-        """.format(
+        WHERE horizon_energy_target_scenario_id = ?
+        AND subproblem_id = ?
+        AND stage_ID = ?;
+        """,
+        (
             subscenarios.TEMPORAL_SCENARIO_ID,
             subscenarios.ENERGY_TARGET_ZONE_SCENARIO_ID,
             subscenarios.HORIZON_ENERGY_TARGET_SCENARIO_ID,
             subproblem,
             stage,
-        )
+        ),
     )
 
     # Get any RPS zone to load zone mapping for the percent target
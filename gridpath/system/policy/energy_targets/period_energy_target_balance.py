@@ -27,7 +27,11 @@ import pandas as pd
 from pyomo.environ import Var, Constraint, NonNegativeReals, Expression, value
 
 from db.common_functions import spin_on_database_lock
-from gridpath.auxiliary.db_interface import setup_results_import
+from gridpath.auxiliary.db_interface import import_results_into_table
+from gridpath.auxiliary.results_export import (
+    read_results_table,
+    read_results_table_rows,
+)
 
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
@@ -181,7 +185,7 @@ def summarize_results(scenario_directory, subproblem, stage):
     )
 
     # Get the energy-target dual results
-    energy_target_duals_df = pd.read_csv(
+    energy_target_duals_df = read_results_table(
         os.path.join(
             scenario_directory,
             str(subproblem),
@@ -273,17 +277,7 @@ def import_results_into_database(
     :param quiet:
     :return:
     """
-    # Delete prior results and create temporary import table for ordering
-    setup_results_import(
-        conn=db,
-        cursor=c,
-        table="results_system_period_energy_target",
-        scenario_id=scenario_id,
-        subproblem=subproblem,
-        stage=stage,
-    )
 
-    # Load results into the temporary table
     results = []
     with open(
         os.path.join(results_directory, "period_energy_target.csv"), "r"
@@ -323,55 +317,46 @@ def import_results_into_database(
                 )
             )
 
-    insert_temp_sql = """
-        INSERT INTO temp_results_system_period_energy_target{}
-         (scenario_id, energy_target_zone, period, subproblem_id, stage_id,
-         discount_factor, number_years_represented, energy_target_mwh, 
-         delivered_energy_target_energy_mwh, curtailed_energy_target_energy_mwh,
-         total_energy_target_energy_mwh,
-         fraction_of_energy_target_met, fraction_of_energy_target_energy_curtailed,
-         energy_target_shortage_mwh)
-         VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
-         """.format(
-        scenario_id
-    )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_temp_sql, data=results)
-
-    # Insert sorted results into permanent results table
-    insert_sql = """
-        INSERT INTO results_system_period_energy_target
-        (scenario_id, energy_target_zone, period, subproblem_id, stage_id,
-        discount_factor, number_years_represented, energy_target_mwh, 
-        delivered_energy_target_energy_mwh, curtailed_energy_target_energy_mwh,
-        total_energy_target_energy_mwh,
-        fraction_of_energy_target_met, fraction_of_energy_target_energy_curtailed, 
-        energy_target_shortage_mwh)
-        SELECT scenario_id, energy_target_zone, period, subproblem_id, stage_id,
-        discount_factor, number_years_represented, energy_target_mwh, 
-        delivered_energy_target_energy_mwh, curtailed_energy_target_energy_mwh,
-        total_energy_target_energy_mwh,
-        fraction_of_energy_target_met, fraction_of_energy_target_energy_curtailed,
-        energy_target_shortage_mwh
-        FROM temp_results_system_period_energy_target{}
-        ORDER BY scenario_id, energy_target_zone, period, subproblem_id, stage_id;
-        """.format(
-        scenario_id
+    # Delete prior results and insert the sorted results
+    import_results_into_table(
+        conn=db,
+        cursor=c,
+        table="results_system_period_energy_target",
+        scenario_id=scenario_id,
+        subproblem=subproblem,
+        stage=stage,
+        columns=[
+            "scenario_id",
+            "energy_target_zone",
+            "period",
+            "subproblem_id",
+            "stage_id",
+            "discount_factor",
+            "number_years_represented",
+            "energy_target_mwh",
+            "delivered_energy_target_energy_mwh",
+            "curtailed_energy_target_energy_mwh",
+            "total_energy_target_energy_mwh",
+            "fraction_of_energy_target_met",
+            "fraction_of_energy_target_energy_curtailed",
+            "energy_target_shortage_mwh",
+        ],
+        results=results,
+        order_by=[
+            "scenario_id",
+            "energy_target_zone",
+            "period",
+            "subproblem_id",
+            "stage_id",
+        ],
     )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_sql, data=(), many=False)
 
     # Update duals
     duals_results = []
-    with open(
-        os.path.join(results_directory, "Period_Energy_Target_Constraint.csv"), "r"
-    ) as energy_target_duals_file:
-        reader = csv.reader(energy_target_duals_file)
-
-        next(reader)  # skip header
-
-        for row in reader:
-            duals_results.append(
-                (row[2], row[0], row[1], scenario_id, subproblem, stage)
-            )
+    for row in read_results_table_rows(
+        os.path.join(results_directory, "Period_Energy_Target_Constraint.csv")
+    ):
+        duals_results.append((row[2], row[0], row[1], scenario_id, subproblem, stage))
 
     duals_sql = """
         UPDATE results_system_period_energy_target
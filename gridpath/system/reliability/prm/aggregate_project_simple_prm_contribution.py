@@ -24,8 +24,7 @@ import csv
 import os.path
 from pyomo.environ import Expression, value
 
-from db.common_functions import spin_on_database_lock
-from gridpath.auxiliary.db_interface import setup_results_import
+from gridpath.auxiliary.db_interface import import_results_into_table
 from gridpath.auxiliary.dynamic_components import prm_balance_provision_components
 
 
@@ -103,17 +102,6 @@ def import_results_into_database(
     if not quiet:
         print("system prm simple elcc")
 
-    # Delete prior results and create temporary import table for ordering
-    setup_results_import(
-        conn=db,
-        cursor=c,
-        table="results_system_prm",
-        scenario_id=scenario_id,
-        subproblem=subproblem,
-        stage=stage,
-    )
-
-    # Load results into the temporary table
     results = []
     with open(
         os.path.join(results_directory, "prm_elcc_simple.csv"), "r"
@@ -128,24 +116,22 @@ def import_results_into_database(
 
             results.append((scenario_id, prm_zone, period, subproblem, stage, elcc))
 
-    insert_temp_sql = """
-        INSERT INTO 
-        temp_results_system_prm{}
-         (scenario_id, prm_zone, period, subproblem_id, stage_id, 
-         elcc_simple_mw)
-         VALUES (?, ?, ?, ?, ?, ?);""".format(
-        scenario_id
-    )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_temp_sql, data=results)
-
-    # Insert sorted results into permanent results table
-    insert_sql = """
-        INSERT INTO results_system_prm
-        (scenario_id, prm_zone, period, subproblem_id, stage_id, elcc_simple_mw)
-        SELECT scenario_id, prm_zone, period, subproblem_id, stage_id, elcc_simple_mw
-        FROM temp_results_system_prm{}
-         ORDER BY scenario_id, prm_zone, period, subproblem_id, stage_id;
-         """.format(
-        scenario_id
+    # Delete prior results and insert the sorted results
+    import_results_into_table(
+        conn=db,
+        cursor=c,
+        table="results_system_prm",
+        scenario_id=scenario_id,
+        subproblem=subproblem,
+        stage=stage,
+        columns=[
+            "scenario_id",
+            "prm_zone",
+            "period",
+            "subproblem_id",
+            "stage_id",
+            "elcc_simple_mw",
+        ],
+        results=results,
+        order_by=["scenario_id", "prm_zone", "period", "subproblem_id", "stage_id"],
     )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_sql, data=(), many=False)
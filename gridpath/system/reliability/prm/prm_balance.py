@@ -26,6 +26,7 @@ from pyomo.environ import Var, Constraint, Expression, NonNegativeReals, value
 
 from db.common_functions import spin_on_database_lock
 from gridpath.auxiliary.dynamic_components import prm_balance_provision_components
+from gridpath.auxiliary.results_export import read_results_table_rows
 
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
@@ -204,17 +205,10 @@ def import_results_into_database(
 
     # Update duals
     duals_results = []
-    with open(
-        os.path.join(results_directory, "PRM_Constraint.csv"), "r"
-    ) as prm_duals_file:
-        reader = csv.reader(prm_duals_file)
-
-        next(reader)  # skip header
-
-        for row in reader:
-            duals_results.append(
-                (row[2], row[0], row[1], scenario_id, subproblem, stage)
-            )
+    for row in read_results_table_rows(
+        os.path.join(results_directory, "PRM_Constraint.csv")
+    ):
+        duals_results.append((row[2], row[0], row[1], scenario_id, subproblem, stage))
     duals_sql = """
         UPDATE results_system_prm
         SET dual = ?
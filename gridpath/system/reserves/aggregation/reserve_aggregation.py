@@ -15,6 +15,11 @@
 from builtins import str
 from pyomo.environ import Set, Expression
 
+from gridpath.auxiliary.auxiliary import (
+    get_indexed_subset,
+    get_zone_timepoint_subset,
+)
+
 
 def generic_add_model_components(
     m,
@@ -41,24 +46,34 @@ def generic_add_model_components(
 
     # Reserve generators operational generators in timepoint
     # This will be the intersection of the reserve generator set and the set of
-    # generators operational in the timepoint
+    # generators operational in the timepoint, in the order of the reserve
+    # generator set; membership is checked against the operational projects
+    # grouped by timepoint in a single pass over PRJ_OPR_TMPS (the grouping
+    # is shared with OPR_PRJS_IN_TMP)
+    def op_set_init(mod, tmp):
+        opr_prjs_in_tmp = set(
+            get_indexed_subset(
+                mod, "PRJ_OPR_TMPS", tmp, index_position=1, subset_position=0
+            )
+        )
+        return [g for g in getattr(mod, reserve_generator_set) if g in opr_prjs_in_tmp]
+
     op_set = str(reserve_generator_set) + "_OPERATIONAL_IN_TIMEPOINT"
     setattr(
         m,
         op_set,
-        Set(
-            m.TMPS,
-            initialize=lambda mod, tmp: getattr(mod, reserve_generator_set)
-            & mod.OPR_PRJS_IN_TMP[tmp],
-        ),
+        Set(m.TMPS, initialize=op_set_init),
     )
 
     # Reserve provision
+    # The reserve projects (those in the reserve_zone_param index) are grouped
+    # by BA and timepoint in a single pass over PRJ_OPR_TMPS
     def total_reserve_rule(mod, ba, tmp):
         return sum(
             getattr(mod, generator_reserve_provision_variable)[g, tmp]
-            for g in getattr(mod, op_set)[tmp]
-            if getattr(mod, reserve_zone_param)[g] == ba
+            for g in get_zone_timepoint_subset(
+                mod, "PRJ_OPR_TMPS", reserve_zone_param, ba, tmp
+            )
         )
 
     setattr(
@@ -18,7 +18,8 @@ import os.path
 from pyomo.environ import Var, Constraint, NonNegativeReals, Expression, value
 
 from db.common_functions import spin_on_database_lock
-from gridpath.auxiliary.db_interface import setup_results_import
+from gridpath.auxiliary.db_interface import import_results_into_table
+from gridpath.auxiliary.results_export import read_results_table_rows
 
 
 def generic_add_model_components(
@@ -173,17 +174,6 @@ def generic_import_results_to_database(
     :return:
     """
 
-    # Delete prior results and create temporary import table for ordering
-    setup_results_import(
-        conn=db,
-        cursor=c,
-        table="results_system_{}_balance" "".format(reserve_type),
-        scenario_id=scenario_id,
-        subproblem=subproblem,
-        stage=stage,
-    )
-
-    # Load results into the temporary table
     results = []
     with open(
         os.path.join(results_directory, reserve_type + "_violation.csv"), "r"
@@ -217,44 +207,36 @@ def generic_import_results_to_database(
                 )
             )
 
-    insert_temp_sql = """
-        INSERT INTO 
-        temp_results_system_{}_balance{}
-        (scenario_id, {}_ba, period,
-        subproblem_id, stage_id, timepoint, 
-        discount_factor, number_years_represented, timepoint_weight, 
-        number_of_hours_in_timepoint,
-        violation_mw)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
-        """.format(
-        reserve_type, scenario_id, reserve_type
-    )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_temp_sql, data=results)
-
-    # Insert sorted results into permanent results table
-    insert_sql = """
-        INSERT INTO results_system_{}_balance
-        (scenario_id, {}_ba, period, 
-        subproblem_id, stage_id, timepoint,
-        discount_factor, number_years_represented, timepoint_weight, 
-        number_of_hours_in_timepoint, violation_mw)
-        SELECT
-        scenario_id, {}_ba, period, 
-        subproblem_id, stage_id, timepoint,
-        discount_factor, number_years_represented, timepoint_weight, 
-        number_of_hours_in_timepoint, violation_mw
-        FROM temp_results_system_{}_balance{}
-        ORDER BY scenario_id, {}_ba, 
-        subproblem_id, stage_id, timepoint;
-        """.format(
-        reserve_type,
-        reserve_type,
-        reserve_type,
-        reserve_type,
-        scenario_id,
-        reserve_type,
+    # Delete prior results and insert the sorted results
+    import_results_into_table(
+        conn=db,
+        cursor=c,
+        table="results_system_{}_balance".format(reserve_type),
+        scenario_id=scenario_id,
+        subproblem=subproblem,
+        stage=stage,
+        columns=[
+            "scenario_id",
+            "{}_ba".format(reserve_type),
+            "period",
+            "subproblem_id",
+            "stage_id",
+            "timepoint",
+            "discount_factor",
+            "number_years_represented",
+            "timepoint_weight",
+            "number_of_hours_in_timepoint",
+            "violation_mw",
+        ],
+        results=results,
+        order_by=[
+            "scenario_id",
+            "{}_ba".format(reserve_type),
+            "subproblem_id",
+            "stage_id",
+            "timepoint",
+        ],
     )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_sql, data=(), many=False)
 
     # Update duals
     dual_files = {
@@ -268,17 +250,10 @@ def generic_import_results_to_database(
     }
 
     duals_results = []
-    with open(
-        os.path.join(results_directory, dual_files[reserve_type]), "r"
-    ) as reserve_balance_duals_file:
-        reader = csv.reader(reserve_balance_duals_file)
-
-        next(reader)  # skip header
-
-        for row in reader:
-            duals_results.append(
-                (row[2], row[0], row[1], scenario_id, subproblem, stage)
-            )
+    for row in read_results_table_rows(
+        os.path.join(results_directory, dual_files[reserve_type])
+    ):
+        duals_results.append((row[2], row[0], row[1], scenario_id, subproblem, stage))
 
     duals_sql = """
         UPDATE results_system_{}_balance
@@ -16,6 +16,11 @@ import csv
 import os.path
 from pyomo.environ import Param, Set, NonNegativeReals, PercentFraction, Expression
 
+from gridpath.auxiliary.db_interface import (
+    get_subproblem_stage_query_parts,
+    write_time_series_model_inputs,
+)
+
 
 def generic_add_model_components(
     m,
@@ -174,6 +179,50 @@ def generic_get_inputs_from_database(
     :param reserve_type_req_subscenario_id:
     :return:
     """
+    tmp_req = generic_get_tmp_requirement_from_database(
+        subscenarios=subscenarios,
+        subproblem=subproblem,
+        stage=stage,
+        conn=conn,
+        reserve_type=reserve_type,
+        reserve_type_ba_subscenario_id=reserve_type_ba_subscenario_id,
+        reserve_type_req_subscenario_id=reserve_type_req_subscenario_id,
+    )
+
+    percentage_req, lz_mapping = generic_get_percent_requirement_from_database(
+        conn=conn,
+        reserve_type=reserve_type,
+        reserve_type_ba_subscenario_id=reserve_type_ba_subscenario_id,
+        reserve_type_req_subscenario_id=reserve_type_req_subscenario_id,
+    )
+
+    return tmp_req, percentage_req, lz_mapping
+
+
+def generic_get_tmp_requirement_from_database(
+    subscenarios,
+    subproblem,
+    stage,
+    conn,
+    reserve_type,
+    reserve_type_ba_subscenario_id,
+    reserve_type_req_subscenario_id,
+):
+    """
+    :param subscenarios:
+    :param subproblem:
+    :param stage:
+    :param conn:
+    :param reserve_type:
+    :param reserve_type_ba_subscenario_id:
+    :param reserve_type_req_subscenario_id:
+    :return:
+
+    Get the by-timepoint requirement of the subproblem/stage. If the
+    subproblem and stage are None, the requirement of all subproblems and
+    stages is selected, with the subproblem_id and stage_id as the first two
+    columns and ordered by them.
+    """
     subproblem = 1 if subproblem == "" else subproblem
     stage = 1 if stage == "" else stage
     c = conn.cursor()
@@ -184,42 +233,64 @@ def generic_get_inputs_from_database(
         else ""
     )
 
+    (
+        subproblem_stage_columns,
+        subproblem_stage_filter,
+        order_by,
+        subproblem_stage_params,
+    ) = get_subproblem_stage_query_parts(subproblem=subproblem, stage=stage)
+
     tmp_req = c.execute(
-        """SELECT {}_ba, timepoint, {}_mw{}
+        """SELECT {}{}_ba, timepoint, {}_mw{}
         FROM inputs_system_{}
         INNER JOIN
-        (SELECT timepoint
+        (SELECT subproblem_id, stage_id, timepoint
         FROM inputs_temporal
-        WHERE temporal_scenario_id = {}
-        AND subproblem_id = {}
-        AND stage_id = {}) as relevant_timepoints
-        USING (timepoint)
+        WHERE temporal_scenario_id = ?
+        {}) as relevant_timepoints
+        USING (stage_id, timepoint)
         INNER JOIN
         (SELECT {}_ba
         FROM inputs_geography_{}_bas
-        WHERE {}_ba_scenario_id = {}) as relevant_bas
+        WHERE {}_ba_scenario_id = ?) as relevant_bas
         USING ({}_ba)
-        WHERE {}_scenario_id = {}
-        AND stage_id = {}
+        WHERE {}_scenario_id = ?
+        {}
         """.format(
+            subproblem_stage_columns,
             reserve_type,
             reserve_type,
             partial_freq_resp_extra_column,
             reserve_type,
-            subscenarios.TEMPORAL_SCENARIO_ID,
-            subproblem,
-            stage,
+            subproblem_stage_filter,
             reserve_type,
             reserve_type,
             reserve_type,
-            reserve_type_ba_subscenario_id,
             reserve_type,
             reserve_type,
-            reserve_type_req_subscenario_id,
-            stage,
-        )
+            order_by,
+        ),
+        (subscenarios.TEMPORAL_SCENARIO_ID,)
+        + subproblem_stage_params
+        + (reserve_type_ba_subscenario_id, reserve_type_req_subscenario_id),
     )
 
+    return tmp_req
+
+
+def generic_get_percent_requirement_from_database(
+    conn,
+    reserve_type,
+    reserve_type_ba_subscenario_id,
+    reserve_type_req_subscenario_id,
+):
+    """
+    :param conn:
+    :param reserve_type:
+    :param reserve_type_ba_subscenario_id:
+    :param reserve_type_req_subscenario_id:
+    :return:
+    """
     c2 = conn.cursor()
     # Get any percentage requirement
     percentage_req = c2.execute(
@@ -257,50 +328,63 @@ def generic_get_inputs_from_database(
         )
     )
 
-    return tmp_req, percentage_req, lz_mapping
+    return percentage_req, lz_mapping
 
 
 def generic_write_model_inputs(
     scenario_directory,
+    subscenarios,
     subproblem,
     stage,
-    timepoint_req,
-    percent_req,
-    percent_map,
+    conn,
     reserve_type,
+    reserve_type_ba_subscenario_id,
+    reserve_type_req_subscenario_id,
 ):
     """
     Get inputs from database and write out the model input
     lf_reserves_down_requirement.tab file.
     :param scenario_directory: string, the scenario directory
+    :param subscenarios:
     :param subproblem:
     :param stage:
-    :param timepoint_req:
-    :param percent_req:
-    :param percent_map:
+    :param conn:
     :param reserve_type:
+    :param reserve_type_ba_subscenario_id:
+    :param reserve_type_req_subscenario_id:
     :return:
     """
     inputs_dir = os.path.join(scenario_directory, str(subproblem), str(stage), "inputs")
 
     # Write the by-timepoint requirement file if by-tmp requirement specified
-    timepoint_req = timepoint_req.fetchall()
-    if timepoint_req:
-        with open(
-            os.path.join(inputs_dir, "{}_tmp_requirement.tab".format(reserve_type)),
-            "w",
-            newline="",
-        ) as tmp_req_file:
-            writer = csv.writer(tmp_req_file, delimiter="\t", lineterminator="\n")
-
-            # Write header
-            extra_column = (
-                ["partial_requirement"] if reserve_type == "frequency_response" else []
-            )
-            writer.writerow(["ba", "timepoint", "requirement"] + extra_column)
+    extra_column = (
+        ["partial_requirement"] if reserve_type == "frequency_response" else []
+    )
+    write_time_series_model_inputs(
+        scenario_directory=scenario_directory,
+        subproblem=subproblem,
+        stage=stage,
+        conn=conn,
+        fname="{}_tmp_requirement.tab".format(reserve_type),
+        get_data=lambda subproblem, stage: generic_get_tmp_requirement_from_database(
+            subscenarios=subscenarios,
+            subproblem=subproblem,
+            stage=stage,
+            conn=conn,
+            reserve_type=reserve_type,
+            reserve_type_ba_subscenario_id=reserve_type_ba_subscenario_id,
+            reserve_type_req_subscenario_id=reserve_type_req_subscenario_id,
+        ),
+        header=["ba", "timepoint", "requirement"] + extra_column,
+        write_if_empty=False,
+    )
 
-            for row in timepoint_req:
-                writer.writerow(row)
+    percent_req, percent_map = generic_get_percent_requirement_from_database(
+        conn=conn,
+        reserve_type=reserve_type,
+        reserve_type_ba_subscenario_id=reserve_type_ba_subscenario_id,
+        reserve_type_req_subscenario_id=reserve_type_req_subscenario_id,
+    )
 
     # Write the percent requirement files only if there's a mapping
     ba_lz_map_list = [row for row in percent_map]
@@ -103,16 +103,13 @@ def write_model_inputs(
     :return:
     """
 
-    tmp_req, percent_req, percent_map = get_inputs_from_database(
-        scenario_id, subscenarios, subproblem, stage, conn
-    )
-
     generic_write_model_inputs(
         scenario_directory=scenario_directory,
+        subscenarios=subscenarios,
         subproblem=subproblem,
         stage=stage,
-        timepoint_req=tmp_req,
-        percent_req=percent_req,
-        percent_map=percent_map,
+        conn=conn,
         reserve_type="spinning_reserves",
+        reserve_type_ba_subscenario_id=subscenarios.SPINNING_RESERVES_BA_SCENARIO_ID,
+        reserve_type_req_subscenario_id=subscenarios.SPINNING_RESERVES_SCENARIO_ID,
     )
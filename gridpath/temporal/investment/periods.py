@@ -42,7 +42,7 @@ import os.path
 
 from pyomo.environ import Set, Param, PositiveIntegers, NonNegativeReals
 
-from gridpath.auxiliary.auxiliary import cursor_to_df
+from gridpath.auxiliary.auxiliary import cursor_to_df, get_indexed_subset
 from gridpath.auxiliary.validations import (
     write_validation_to_database,
     get_expected_dtypes,
@@ -209,7 +209,11 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
     m.TMPS_IN_PRD = Set(
         m.PERIODS,
         initialize=lambda mod, p: list(
-            set(tmp for tmp in mod.TMPS if mod.period[tmp] == p)
+            set(
+                get_indexed_subset(
+                    mod, "period", p, index_position=1, subset_position=0
+                )
+            )
         ),
     )
 
@@ -233,7 +237,7 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
     m.prev_period = Param(
         m.NOT_FIRST_PRDS,
         within=m.PERIODS,
-        initialize=lambda mod, p: list(mod.PERIODS)[list(mod.PERIODS).index(p) - 1],
+        initialize=prev_period_init,
     )
 
     m.hours_in_subproblem_period = Param(
@@ -245,6 +249,22 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
     )
 
 
+# Param Rules
+###############################################################################
+
+
+def prev_period_init(mod, p):
+    """
+    **Param Name**: prev_period
+    **Defined Over**: NOT_FIRST_PRDS
+
+    Determine the previous period for each period but the first. All previous
+    periods are derived in a single pass over the ordered PERIODS set.
+    """
+    periods = list(mod.PERIODS)
+    return {periods[i]: periods[i - 1] for i in range(1, len(periods))}
+
+
 # Input-Output
 ###############################################################################
 
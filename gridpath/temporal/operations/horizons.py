@@ -188,13 +188,13 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
     m.first_hrz_tmp = Param(
         m.BLN_TYPE_HRZS,
         within=PositiveIntegers,
-        initialize=lambda mod, b, h: list(mod.TMPS_BY_BLN_TYPE_HRZ[b, h])[0],
+        initialize=lambda mod, b, h: mod.TMPS_BY_BLN_TYPE_HRZ[b, h].first(),
     )
 
     m.last_hrz_tmp = Param(
         m.BLN_TYPE_HRZS,
         within=PositiveIntegers,
-        initialize=lambda mod, b, h: list(mod.TMPS_BY_BLN_TYPE_HRZ[b, h])[-1],
+        initialize=lambda mod, b, h: mod.TMPS_BY_BLN_TYPE_HRZ[b, h].last(),
     )
 
     m.prev_tmp = Param(
@@ -259,11 +259,15 @@ def prev_tmp_init(mod, tmp, balancing_type_horizon):
     of a horizon and the horizon boundary is linear, then no previous
     timepoint is defined. In all other cases, the previous timepoints is the
     one with an index of tmp-1.
+
+    The param is derived in a single pass over each horizon's ordered
+    timepoints (Pyomo initializes the whole param from the returned dict).
     """
     prev_tmp_dict = {}
     for (bt, hrz) in mod.BLN_TYPE_HRZS:
-        for tmp in mod.TMPS_BY_BLN_TYPE_HRZ[bt, hrz]:
-            if tmp == mod.first_hrz_tmp[bt, hrz]:
+        hrz_tmps = list(mod.TMPS_BY_BLN_TYPE_HRZ[bt, hrz])
+        for i, tmp in enumerate(hrz_tmps):
+            if i == 0:
                 if mod.boundary[bt, hrz] == "circular":
                     prev_tmp_dict[tmp, bt] = mod.last_hrz_tmp[bt, hrz]
                 elif mod.boundary[bt, hrz] in ["linear", "linked"]:
@@ -277,9 +281,7 @@ def prev_tmp_init(mod, tmp, balancing_type_horizon):
                         "or 'linked.'"
                     )
             else:
-                prev_tmp_dict[tmp, bt] = list(mod.TMPS_BY_BLN_TYPE_HRZ[bt, hrz])[
-                    list(mod.TMPS_BY_BLN_TYPE_HRZ[bt, hrz]).index(tmp) - 1
-                ]
+                prev_tmp_dict[tmp, bt] = hrz_tmps[i - 1]
 
     return prev_tmp_dict
 
@@ -295,11 +297,15 @@ def next_tmp_init(mod, tmp, balancing_type_horizon):
     horizon. If the timepoint is the last timepoint of a horizon and the
     horizon boundary is linear, then no next timepoint is defined. In all
     other cases, the next timepoint is the one with an index of tmp+1.
+
+    The param is derived in a single pass over each horizon's ordered
+    timepoints (Pyomo initializes the whole param from the returned dict).
     """
     next_tmp_dict = {}
     for (bt, hrz) in mod.BLN_TYPE_HRZS:
-        for tmp in mod.TMPS_BY_BLN_TYPE_HRZ[bt, hrz]:
-            if tmp == mod.last_hrz_tmp[bt, hrz]:
+        hrz_tmps = list(mod.TMPS_BY_BLN_TYPE_HRZ[bt, hrz])
+        for i, tmp in enumerate(hrz_tmps):
+            if i == len(hrz_tmps) - 1:
                 if mod.boundary[bt, hrz] == "circular":
                     next_tmp_dict[tmp, bt] = mod.first_hrz_tmp[bt, hrz]
                 elif mod.boundary[bt, hrz] in ["linear", "linked"]:
@@ -313,9 +319,7 @@ def next_tmp_init(mod, tmp, balancing_type_horizon):
                         "or 'linked.'"
                     )
             else:
-                next_tmp_dict[tmp, bt] = list(mod.TMPS_BY_BLN_TYPE_HRZ[bt, hrz])[
-                    list(mod.TMPS_BY_BLN_TYPE_HRZ[bt, hrz]).index(tmp) + 1
-                ]
+                next_tmp_dict[tmp, bt] = hrz_tmps[i + 1]
 
     return next_tmp_dict
 
@@ -378,24 +382,22 @@ def get_inputs_from_database(scenario_id, subscenarios, subproblem, stage, conn)
     horizons = c1.execute(
         """SELECT horizon, balancing_type_horizon, boundary
         FROM inputs_temporal_horizons
-        WHERE temporal_scenario_id = {}
-        AND subproblem_id = {}
+        WHERE temporal_scenario_id = ?
+        AND subproblem_id = ?
         ORDER BY balancing_type_horizon, horizon;
-        """.format(
-            subscenarios.TEMPORAL_SCENARIO_ID, subproblem, stage
-        )
+        """,
+        (subscenarios.TEMPORAL_SCENARIO_ID, subproblem),
     )
 
     c2 = conn.cursor()
     horizon_timepoints = c2.execute(
         """SELECT horizon, balancing_type_horizon, timepoint
         FROM inputs_temporal_horizon_timepoints
-        WHERE temporal_scenario_id = {}
-       AND subproblem_id = {}
-       AND stage_id = {}
-       ORDER BY balancing_type_horizon, timepoint;""".format(
-            subscenarios.TEMPORAL_SCENARIO_ID, subproblem, stage
-        )
+        WHERE temporal_scenario_id = ?
+       AND subproblem_id = ?
+       AND stage_id = ?
+       ORDER BY balancing_type_horizon, timepoint;""",
+        (subscenarios.TEMPORAL_SCENARIO_ID, subproblem, stage),
     )
 
     return horizons, horizon_timepoints
@@ -479,12 +481,11 @@ def validate_inputs(scenario_id, subscenarios, subproblem, stage, conn):
         """
         SELECT balancing_type_horizon, period, horizon
         FROM periods_horizons
-        WHERE temporal_scenario_id = {}
-        AND subproblem_id = {}
-        and stage_id = {}
-        """.format(
-            subscenarios.TEMPORAL_SCENARIO_ID, subproblem, stage
-        )
+        WHERE temporal_scenario_id = ?
+        AND subproblem_id = ?
+        and stage_id = ?
+        """,
+        (subscenarios.TEMPORAL_SCENARIO_ID, subproblem, stage),
     )
 
     df_hrzs = cursor_to_df(hrzs)
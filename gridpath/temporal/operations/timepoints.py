@@ -72,7 +72,10 @@ from pyomo.environ import (
 )
 
 from db.common_functions import spin_on_database_lock
-from gridpath.auxiliary.db_interface import determine_table_subset_by_start_and_column
+from gridpath.auxiliary.db_interface import (
+    SUBPROBLEM_STAGES_TO_PROCESS_FILTER,
+    determine_table_subset_by_start_and_column,
+)
 from gridpath.auxiliary.validations import write_validation_to_database
 
 
@@ -176,6 +179,44 @@ def add_model_components(m, d, scenario_directory, subproblem, stage):
     m.furthest_linked_tmp = Param(within=NonPositiveIntegers)
 
 
+# Stage Updates
+###############################################################################
+
+
+def get_stage_components():
+    """
+    :return: the names of the components whose data change between the
+        stages of a subproblem
+
+    The previous stage timepoint map is only used to fix variables to their
+    values in the previous stage, so it can be replaced in the previous
+    stage's instance (see *update_stage_components*) rather than rebuilding
+    the instance.
+    """
+    return ["prev_stage_tmp_map"]
+
+
+def update_stage_components(m, d, data_portal, scenario_directory, subproblem, stage):
+    """
+    :param m: the previous stage's problem instance
+    :param d: the dynamic components class
+    :param data_portal: the Pyomo DataPortal with the current stage's data
+    :param scenario_directory: str
+    :param subproblem: str
+    :param stage: str
+    :return:
+
+    Replace the previous stage timepoint map of the previous stage's
+    instance with the current stage's map.
+    """
+    m.del_component(m.prev_stage_tmp_map)
+    m.prev_stage_tmp_map = Param(
+        m.TMPS,
+        within=NonNegativeIntegers,
+        initialize=data_portal.data().get("prev_stage_tmp_map", {}),
+    )
+
+
 # Input-Output
 ###############################################################################
 
@@ -257,11 +298,10 @@ def get_inputs_from_database(scenario_id, subscenarios, subproblem, stage, conn)
         """SELECT timepoint, period, timepoint_weight,
            number_of_hours_in_timepoint, previous_stage_timepoint_map, month
            FROM inputs_temporal
-           WHERE temporal_scenario_id = {}
-           AND subproblem_id = {}
-           AND stage_id = {};""".format(
-            subscenarios.TEMPORAL_SCENARIO_ID, subproblem, stage
-        )
+           WHERE temporal_scenario_id = ?
+           AND subproblem_id = ?
+           AND stage_id = ?;""",
+        (subscenarios.TEMPORAL_SCENARIO_ID, subproblem, stage),
     )
 
     return timepoints
@@ -346,13 +386,19 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
             inputs_temporal.subproblem_id
             AND {}.stage_id = inputs_temporal.stage_id
             AND {}.timepoint = inputs_temporal.timepoint
-            );
+            )
+            WHERE scenario_id = ?
+            AND {};
             """.format(
-            tbl, tbl, tbl, tbl
+            tbl, tbl, tbl, tbl, SUBPROBLEM_STAGES_TO_PROCESS_FILTER
         )
 
         spin_on_database_lock(
-            conn=db, cursor=c, sql=sql, data=(scenario_id,), many=False
+            conn=db,
+            cursor=c,
+            sql=sql,
+            data=(scenario_id, scenario_id, scenario_id),
+            many=False,
         )
 
 
@@ -174,13 +174,13 @@ def get_inputs_from_database(scenario_id, subscenarios, subproblem, stage, conn)
         FROM 
             (SELECT transmission_line, stage_id, timepoint
             FROM transmission_operational_timepoints
-            WHERE transmission_portfolio_scenario_id = {}
-            AND transmission_operational_chars_scenario_id = {}
-            AND temporal_scenario_id = {}
-            AND (transmission_specified_capacity_scenario_id = {}
-                 OR transmission_new_cost_scenario_id = {})
-            AND subproblem_id = {}
-            AND stage_id = {}
+            WHERE transmission_portfolio_scenario_id = ?
+            AND transmission_operational_chars_scenario_id = ?
+            AND temporal_scenario_id = ?
+            AND (transmission_specified_capacity_scenario_id = ?
+                 OR transmission_new_cost_scenario_id = ?)
+            AND subproblem_id = ?
+            AND stage_id = ?
             ) as tx_periods_timepoints_tbl
         -- Of the lines in the portfolio, select only those that are in 
         -- this transmission_availability_scenario_id and have 'exogenous' as 
@@ -191,8 +191,8 @@ def get_inputs_from_database(scenario_id, subscenarios, subproblem, stage, conn)
         INNER JOIN (
             SELECT transmission_line, exogenous_availability_scenario_id
             FROM inputs_transmission_availability
-            WHERE transmission_availability_scenario_id = {}
-            AND availability_type = '{}'
+            WHERE transmission_availability_scenario_id = ?
+            AND availability_type = ?
             AND exogenous_availability_scenario_id IS NOT NULL
             ) AS avail_char
         USING (transmission_line)
@@ -205,7 +205,8 @@ def get_inputs_from_database(scenario_id, subscenarios, subproblem, stage, conn)
         timepoint)
         WHERE timepoint != 0 -- exclude timepoint=0 (monthly availability)
         ;
-    """.format(
+    """
+    params = (
         subscenarios.TRANSMISSION_PORTFOLIO_SCENARIO_ID,
         subscenarios.TRANSMISSION_OPERATIONAL_CHARS_SCENARIO_ID,
         subscenarios.TEMPORAL_SCENARIO_ID,
@@ -218,7 +219,7 @@ def get_inputs_from_database(scenario_id, subscenarios, subproblem, stage, conn)
     )
 
     c = conn.cursor()
-    availabilities = c.execute(sql)
+    availabilities = c.execute(sql, params)
 
     return availabilities
 
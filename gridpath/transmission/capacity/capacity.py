@@ -33,7 +33,10 @@ from gridpath.auxiliary.auxiliary import join_sets
 from gridpath.transmission.capacity.common_functions import (
     load_tx_capacity_type_modules,
 )
-from gridpath.auxiliary.db_interface import setup_results_import
+from gridpath.auxiliary.db_interface import (
+    SUBPROBLEM_STAGES_TO_PROCESS_FILTER,
+    import_results_into_table,
+)
 from gridpath.auxiliary.dynamic_components import (
     tx_capacity_type_operational_period_sets,
 )
@@ -397,17 +400,6 @@ def import_results_into_database(
     if not quiet:
         print("transmission capacity")
 
-    # Delete prior results and create temporary import table for ordering
-    setup_results_import(
-        conn=db,
-        cursor=c,
-        table="results_transmission_capacity",
-        scenario_id=scenario_id,
-        subproblem=subproblem,
-        stage=stage,
-    )
-
-    # Load results into the temporary table
     results = []
     with open(
         os.path.join(results_directory, "transmission_capacity.csv"), "r"
@@ -437,47 +429,33 @@ def import_results_into_database(
                 )
             )
 
-    insert_temp_sql = """
-        INSERT INTO temp_results_transmission_capacity{}
-            (scenario_id, tx_line, period, subproblem_id, stage_id,
-            load_zone_from, load_zone_to,
-            min_mw, max_mw)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?);
-            """.format(
-        scenario_id
-    )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_temp_sql, data=results)
-
-    # Insert sorted results into permanent results table
-    insert_sql = """
-        INSERT INTO results_transmission_capacity
-        (scenario_id, tx_line, period, subproblem_id, stage_id,
-        load_zone_from, load_zone_to, min_mw, max_mw)
-        SELECT
-        scenario_id, tx_line, period, subproblem_id, stage_id,
-        load_zone_from, load_zone_to, min_mw, max_mw
-        FROM temp_results_transmission_capacity{}
-         ORDER BY scenario_id, tx_line, period, subproblem_id, stage_id;
-        """.format(
-        scenario_id
-    )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_sql, data=(), many=False)
-
-    # Capacity cost results
-    if not quiet:
-        print("transmission capacity costs")
-
-    # Delete prior results and create temporary import table for ordering
-    setup_results_import(
+    # Delete prior results and insert the sorted results
+    import_results_into_table(
         conn=db,
         cursor=c,
-        table="results_transmission_costs_capacity",
+        table="results_transmission_capacity",
         scenario_id=scenario_id,
         subproblem=subproblem,
         stage=stage,
+        columns=[
+            "scenario_id",
+            "tx_line",
+            "period",
+            "subproblem_id",
+            "stage_id",
+            "load_zone_from",
+            "load_zone_to",
+            "min_mw",
+            "max_mw",
+        ],
+        results=results,
+        order_by=["scenario_id", "tx_line", "period", "subproblem_id", "stage_id"],
     )
 
-    # Load results into the temporary table
+    # Capacity cost results
+    if not quiet:
+        print("transmission capacity costs")
+
     results = []
     with open(
         os.path.join(results_directory, "costs_transmission_capacity.csv"), "r"
@@ -509,33 +487,29 @@ def import_results_into_database(
                 )
             )
 
-    insert_temp_sql = """
-        INSERT INTO  temp_results_transmission_costs_capacity{}
-        (scenario_id, tx_line, period, subproblem_id, stage_id,
-        hours_in_period_timepoints, hours_in_subproblem_period,
-        load_zone_from, load_zone_to, capacity_cost)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
-        """.format(
-        scenario_id
-    )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_temp_sql, data=results)
-
-    # Insert sorted results into permanent results table
-    insert_sql = """
-        INSERT INTO results_transmission_costs_capacity
-        (scenario_id, tx_line, period, subproblem_id, stage_id, 
-        hours_in_period_timepoints, hours_in_subproblem_period,
-        load_zone_from, load_zone_to, capacity_cost)
-        SELECT
-        scenario_id, tx_line, period, subproblem_id, stage_id,
-        hours_in_period_timepoints, hours_in_subproblem_period, 
-        load_zone_from, load_zone_to, capacity_cost
-        FROM temp_results_transmission_costs_capacity{}
-         ORDER BY scenario_id, tx_line, period, subproblem_id, stage_id;
-        """.format(
-        scenario_id
+    # Delete prior results and insert the sorted results
+    import_results_into_table(
+        conn=db,
+        cursor=c,
+        table="results_transmission_costs_capacity",
+        scenario_id=scenario_id,
+        subproblem=subproblem,
+        stage=stage,
+        columns=[
+            "scenario_id",
+            "tx_line",
+            "period",
+            "subproblem_id",
+            "stage_id",
+            "hours_in_period_timepoints",
+            "hours_in_subproblem_period",
+            "load_zone_from",
+            "load_zone_to",
+            "capacity_cost",
+        ],
+        results=results,
+        order_by=["scenario_id", "tx_line", "period", "subproblem_id", "stage_id"],
     )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_sql, data=(), many=False)
 
     # Update the capacity cost removing the fraction attributable to the
     # spinup and lookahead hours
@@ -577,9 +551,12 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
     del_sql = """
         DELETE FROM results_transmission_costs_capacity_agg 
         WHERE scenario_id = ?
-        """
+        AND {}
+        """.format(
+        SUBPROBLEM_STAGES_TO_PROCESS_FILTER
+    )
     spin_on_database_lock(
-        conn=db, cursor=c, sql=del_sql, data=(scenario_id,), many=False
+        conn=db, cursor=c, sql=del_sql, data=(scenario_id, scenario_id), many=False
     )
 
     # Insert new results
@@ -612,11 +589,19 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
         load_zone_to AS load_zone,
         SUM(capacity_cost) AS capacity_cost
         FROM results_transmission_costs_capacity
+        WHERE scenario_id = ?
+        AND {}
         GROUP BY scenario_id, subproblem_id, stage_id, period, load_zone
         ) AS cap_table
         USING (scenario_id, subproblem_id, stage_id, period, load_zone)
-        ;"""
+        ;""".format(
+        SUBPROBLEM_STAGES_TO_PROCESS_FILTER
+    )
 
     spin_on_database_lock(
-        conn=db, cursor=c, sql=agg_sql, data=(scenario_id,), many=False
+        conn=db,
+        cursor=c,
+        sql=agg_sql,
+        data=(scenario_id, scenario_id, scenario_id),
+        many=False,
     )
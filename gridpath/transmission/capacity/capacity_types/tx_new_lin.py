@@ -43,9 +43,8 @@ from pyomo.environ import (
     Constraint,
 )
 
-from db.common_functions import spin_on_database_lock
 from gridpath.auxiliary.auxiliary import cursor_to_df
-from gridpath.auxiliary.db_interface import setup_results_import
+from gridpath.auxiliary.db_interface import import_results_into_table
 from gridpath.auxiliary.dynamic_components import (
     tx_capacity_type_operational_period_sets,
 )
@@ -698,17 +697,7 @@ def import_results_into_database(
     # New build capacity results
     if not quiet:
         print("transmission new build")
-    # Delete prior results and create temporary import table for ordering
-    setup_results_import(
-        conn=db,
-        cursor=c,
-        table="results_transmission_capacity_new_build",
-        scenario_id=scenario_id,
-        subproblem=subproblem,
-        stage=stage,
-    )
 
-    # Load results into the temporary table
     results = []
     with open(
         os.path.join(results_directory, "transmission_new_capacity.csv"), "r"
@@ -736,33 +725,33 @@ def import_results_into_database(
                 )
             )
 
-    insert_temp_sql = """
-        INSERT INTO 
-        temp_results_transmission_capacity_new_build{}
-        (scenario_id, transmission_line, period, subproblem_id, stage_id, 
-        load_zone_from, load_zone_to, 
-        new_build_transmission_capacity_mw)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?);
-        """.format(
-        scenario_id
-    )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_temp_sql, data=results)
-
-    # Insert sorted results into permanent results table
-    insert_sql = """
-        INSERT INTO results_transmission_capacity_new_build
-        (scenario_id, transmission_line, period, subproblem_id, stage_id,
-        load_zone_from, load_zone_to, new_build_transmission_capacity_mw)
-        SELECT
-        scenario_id, transmission_line, period, subproblem_id, stage_id, 
-        load_zone_from, load_zone_to, new_build_transmission_capacity_mw
-        FROM temp_results_transmission_capacity_new_build{}
-        ORDER BY scenario_id, transmission_line, period, subproblem_id, 
-        stage_id;
-        """.format(
-        scenario_id
+    # Delete prior results and insert the sorted results
+    import_results_into_table(
+        conn=db,
+        cursor=c,
+        table="results_transmission_capacity_new_build",
+        scenario_id=scenario_id,
+        subproblem=subproblem,
+        stage=stage,
+        columns=[
+            "scenario_id",
+            "transmission_line",
+            "period",
+            "subproblem_id",
+            "stage_id",
+            "load_zone_from",
+            "load_zone_to",
+            "new_build_transmission_capacity_mw",
+        ],
+        results=results,
+        order_by=[
+            "scenario_id",
+            "transmission_line",
+            "period",
+            "subproblem_id",
+            "stage_id",
+        ],
     )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_sql, data=(), many=False)
 
 
 # Validation
@@ -33,8 +33,7 @@ from pyomo.environ import (
     value,
 )
 
-from db.common_functions import spin_on_database_lock
-from gridpath.auxiliary.db_interface import setup_results_import
+from gridpath.auxiliary.db_interface import import_results_into_table
 from gridpath.auxiliary.dynamic_components import carbon_cap_balance_emission_components
 
 
@@ -450,17 +449,6 @@ def import_results_into_database(
     if not quiet:
         print("transmission carbon emissions")
 
-    # Delete prior results and create temporary import table for ordering
-    setup_results_import(
-        conn=db,
-        cursor=c,
-        table="results_transmission_carbon_emissions",
-        scenario_id=scenario_id,
-        subproblem=subproblem,
-        stage=stage,
-    )
-
-    # Load results into the temporary table
     results = []
     with open(
         os.path.join(results_directory, "carbon_emission_imports_by_tx_line.csv"), "r"
@@ -492,36 +480,29 @@ def import_results_into_database(
                 )
             )
 
-    insert_temp_sql = """
-        INSERT INTO 
-        temp_results_transmission_carbon_emissions{}
-         (scenario_id, tx_line, period, subproblem_id, stage_id, 
-         timepoint, timepoint_weight, 
-         number_of_hours_in_timepoint, 
-         carbon_emission_imports_tons, 
-         carbon_emission_imports_tons_degen)
-         VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
-         """.format(
-        scenario_id
-    )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_temp_sql, data=results)
-
-    # Insert sorted results into permanent results table
-    insert_sql = """
-        INSERT INTO results_transmission_carbon_emissions
-        (scenario_id, tx_line, period, subproblem_id, stage_id,
-        timepoint, timepoint_weight, number_of_hours_in_timepoint, 
-        carbon_emission_imports_tons, carbon_emission_imports_tons_degen)
-        SELECT
-        scenario_id, tx_line, period, subproblem_id, stage_id,
-        timepoint, timepoint_weight, number_of_hours_in_timepoint, 
-        carbon_emission_imports_tons, carbon_emission_imports_tons_degen
-        FROM temp_results_transmission_carbon_emissions{}
-         ORDER BY scenario_id, tx_line, subproblem_id, stage_id, timepoint;
-        """.format(
-        scenario_id
+    # Delete prior results and insert the sorted results
+    import_results_into_table(
+        conn=db,
+        cursor=c,
+        table="results_transmission_carbon_emissions",
+        scenario_id=scenario_id,
+        subproblem=subproblem,
+        stage=stage,
+        columns=[
+            "scenario_id",
+            "tx_line",
+            "period",
+            "subproblem_id",
+            "stage_id",
+            "timepoint",
+            "timepoint_weight",
+            "number_of_hours_in_timepoint",
+            "carbon_emission_imports_tons",
+            "carbon_emission_imports_tons_degen",
+        ],
+        results=results,
+        order_by=["scenario_id", "tx_line", "subproblem_id", "stage_id", "timepoint"],
     )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_sql, data=(), many=False)
 
 
 # Validation
@@ -29,7 +29,10 @@ from pyomo.environ import Param, Var, Constraint, NonNegativeReals, Expression,
 
 from db.common_functions import spin_on_database_lock
 from gridpath.auxiliary.auxiliary import cursor_to_df
-from gridpath.auxiliary.db_interface import setup_results_import
+from gridpath.auxiliary.db_interface import (
+    SUBPROBLEM_STAGES_TO_PROCESS_FILTER,
+    import_results_into_table,
+)
 from gridpath.auxiliary.validations import (
     write_validation_to_database,
     get_expected_dtypes,
@@ -373,17 +376,6 @@ def import_results_into_database(
     if not quiet:
         print("transmission hurdle costs")
 
-    # Delete prior results and create temporary import table for ordering
-    setup_results_import(
-        conn=db,
-        cursor=c,
-        table="results_transmission_hurdle_costs",
-        scenario_id=scenario_id,
-        subproblem=subproblem,
-        stage=stage,
-    )
-
-    # Load results into the temporary table
     results = []
     with open(
         os.path.join(results_directory, "costs_transmission_hurdle.csv"), "r"
@@ -418,38 +410,37 @@ def import_results_into_database(
                     hurdle_cost_negative_direction,
                 )
             )
-    insert_temp_sql = """
-        INSERT INTO temp_results_transmission_hurdle_costs{}
-        (scenario_id, transmission_line, period, subproblem_id, stage_id,
-        timepoint, timepoint_weight,
-        number_of_hours_in_timepoint,
-        load_zone_from, load_zone_to, 
-        hurdle_cost_positive_direction, hurdle_cost_negative_direction)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
-        """.format(
-        scenario_id
-    )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_temp_sql, data=results)
-
-    # Insert sorted results into permanent results table
-    insert_sql = """
-        INSERT INTO results_transmission_hurdle_costs
-        (scenario_id, transmission_line, period, subproblem_id, stage_id, 
-        timepoint, timepoint_weight, number_of_hours_in_timepoint,
-        load_zone_from, load_zone_to, hurdle_cost_positive_direction,
-        hurdle_cost_negative_direction)
-        SELECT
-        scenario_id, transmission_line, period, subproblem_id, stage_id,
-        timepoint, timepoint_weight, number_of_hours_in_timepoint,
-        load_zone_from, load_zone_to, hurdle_cost_positive_direction,
-        hurdle_cost_negative_direction
-        FROM temp_results_transmission_hurdle_costs{}
-         ORDER BY scenario_id, transmission_line, subproblem_id, stage_id, 
-        timepoint;
-        """.format(
-        scenario_id
+    # Delete prior results and insert the sorted results
+    import_results_into_table(
+        conn=db,
+        cursor=c,
+        table="results_transmission_hurdle_costs",
+        scenario_id=scenario_id,
+        subproblem=subproblem,
+        stage=stage,
+        columns=[
+            "scenario_id",
+            "transmission_line",
+            "period",
+            "subproblem_id",
+            "stage_id",
+            "timepoint",
+            "timepoint_weight",
+            "number_of_hours_in_timepoint",
+            "load_zone_from",
+            "load_zone_to",
+            "hurdle_cost_positive_direction",
+            "hurdle_cost_negative_direction",
+        ],
+        results=results,
+        order_by=[
+            "scenario_id",
+            "transmission_line",
+            "subproblem_id",
+            "stage_id",
+            "timepoint",
+        ],
     )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_sql, data=(), many=False)
 
 
 def process_results(db, c, scenario_id, subscenarios, quiet):
@@ -470,9 +461,12 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
     del_sql = """
         DELETE FROM results_transmission_hurdle_costs_agg
         WHERE scenario_id = ?
-        """
+        AND {}
+        """.format(
+        SUBPROBLEM_STAGES_TO_PROCESS_FILTER
+    )
     spin_on_database_lock(
-        conn=db, cursor=c, sql=del_sql, data=(scenario_id,), many=False
+        conn=db, cursor=c, sql=del_sql, data=(scenario_id, scenario_id), many=False
     )
 
     # Aggregate hurdle costs by period, load zone, and spinup_or_lookahead
@@ -493,6 +487,7 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
         number_of_hours_in_timepoint) AS pos_dir_hurdle_cost
         FROM results_transmission_hurdle_costs
         WHERE scenario_id = ?
+        AND {filter}
         GROUP BY subproblem_id, stage_id, period, load_zone, spinup_or_lookahead
         ORDER BY subproblem_id, stage_id, period, load_zone, spinup_or_lookahead
         ) AS pos_dir_hurdle_costs
@@ -505,16 +500,23 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
         number_of_hours_in_timepoint) AS neg_dir_hurdle_cost
         FROM results_transmission_hurdle_costs
         WHERE scenario_id = ?
+        AND {filter}
         GROUP BY subproblem_id, stage_id, period, load_zone, spinup_or_lookahead
         ORDER BY subproblem_id, stage_id, period, load_zone, spinup_or_lookahead
         ) AS neg_dir_hurdle_costs
         
         USING (scenario_id, subproblem_id, stage_id, period, load_zone, 
         spinup_or_lookahead)
-        ;"""
+        ;""".format(
+        filter=SUBPROBLEM_STAGES_TO_PROCESS_FILTER
+    )
 
     spin_on_database_lock(
-        conn=db, cursor=c, sql=agg_sql, data=(scenario_id, scenario_id), many=False
+        conn=db,
+        cursor=c,
+        sql=agg_sql,
+        data=(scenario_id, scenario_id, scenario_id, scenario_id),
+        many=False,
     )
 
 
@@ -23,7 +23,10 @@ import pandas as pd
 from pyomo.environ import Expression, value
 
 from db.common_functions import spin_on_database_lock
-from gridpath.auxiliary.db_interface import setup_results_import
+from gridpath.auxiliary.db_interface import (
+    SUBPROBLEM_STAGES_TO_PROCESS_FILTER,
+    import_results_into_table,
+)
 from gridpath.transmission.operations.common_functions import (
     load_tx_operational_type_modules,
 )
@@ -231,17 +234,6 @@ def import_results_into_database(
     if not quiet:
         print("transmission operations")
 
-    # Delete prior results and create temporary import table for ordering
-    setup_results_import(
-        conn=db,
-        cursor=c,
-        table="results_transmission_operations",
-        scenario_id=scenario_id,
-        subproblem=subproblem,
-        stage=stage,
-    )
-
-    # Load results into the temporary table
     results = []
     with open(
         os.path.join(results_directory, "transmission_operations.csv"), "r"
@@ -279,38 +271,38 @@ def import_results_into_database(
                 )
             )
 
-    insert_temp_sql = """
-        INSERT INTO temp_results_transmission_operations{}
-        (scenario_id, transmission_line, period, subproblem_id, 
-        stage_id, timepoint, timepoint_weight, 
-        number_of_hours_in_timepoint,
-        load_zone_from, load_zone_to, transmission_flow_mw,
-        transmission_losses_lz_from, transmission_losses_lz_to)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
-        """.format(
-        scenario_id
-    )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_temp_sql, data=results)
-
-    # Insert sorted results into permanent results table
-    insert_sql = """
-        INSERT INTO results_transmission_operations
-        (scenario_id, transmission_line, period, subproblem_id, stage_id,
-        timepoint, timepoint_weight, number_of_hours_in_timepoint,
-        load_zone_from, load_zone_to, transmission_flow_mw,
-        transmission_losses_lz_from, transmission_losses_lz_to)
-        SELECT
-        scenario_id, transmission_line, period, subproblem_id, stage_id,
-        timepoint, timepoint_weight, number_of_hours_in_timepoint,
-        load_zone_from, load_zone_to, transmission_flow_mw,
-        transmission_losses_lz_from, transmission_losses_lz_to
-        FROM temp_results_transmission_operations{}
-         ORDER BY scenario_id, transmission_line, subproblem_id, stage_id, 
-        timepoint;
-        """.format(
-        scenario_id
+    # Delete prior results and insert the sorted results
+    import_results_into_table(
+        conn=db,
+        cursor=c,
+        table="results_transmission_operations",
+        scenario_id=scenario_id,
+        subproblem=subproblem,
+        stage=stage,
+        columns=[
+            "scenario_id",
+            "transmission_line",
+            "period",
+            "subproblem_id",
+            "stage_id",
+            "timepoint",
+            "timepoint_weight",
+            "number_of_hours_in_timepoint",
+            "load_zone_from",
+            "load_zone_to",
+            "transmission_flow_mw",
+            "transmission_losses_lz_from",
+            "transmission_losses_lz_to",
+        ],
+        results=results,
+        order_by=[
+            "scenario_id",
+            "transmission_line",
+            "subproblem_id",
+            "stage_id",
+            "timepoint",
+        ],
     )
-    spin_on_database_lock(conn=db, cursor=c, sql=insert_sql, data=(), many=False)
 
 
 def process_results(db, c, scenario_id, subscenarios, quiet):
@@ -331,9 +323,12 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
     del_sql = """
         DELETE FROM results_transmission_imports_exports_agg
         WHERE scenario_id = ?
-        """
+        AND {}
+        """.format(
+        SUBPROBLEM_STAGES_TO_PROCESS_FILTER
+    )
     spin_on_database_lock(
-        conn=db, cursor=c, sql=del_sql, data=(scenario_id,), many=False
+        conn=db, cursor=c, sql=del_sql, data=(scenario_id, scenario_id), many=False
     )
 
     # Aggregate imports/exports by period, load zone, and spinup_or_lookahead
@@ -361,14 +356,16 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
                 (SELECT DISTINCT scenario_id, subproblem_id, stage_id, period, 
                 load_zone_to AS load_zone, spinup_or_lookahead
                 FROM results_transmission_operations
-                WHERE scenario_id = ?) AS dummy
+                WHERE scenario_id = ?
+                AND {filter}) AS dummy
                 
                 LEFT JOIN 
                 
                 (SELECT DISTINCT scenario_id, subproblem_id, stage_id, period, 
                 load_zone_from AS load_zone, spinup_or_lookahead
                 FROM results_transmission_operations
-                WHERE scenario_id = ?) AS dummy2
+                WHERE scenario_id = ?
+                AND {filter}) AS dummy2
                 USING (scenario_id, subproblem_id, stage_id, period, load_zone,
                 spinup_or_lookahead)
             ) AS left_join1
@@ -381,14 +378,16 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
                 (SELECT DISTINCT scenario_id, subproblem_id, stage_id, period, 
                 load_zone_from AS load_zone, spinup_or_lookahead
                 FROM results_transmission_operations
-                WHERE scenario_id = ?) AS dummy3
+                WHERE scenario_id = ?
+                AND {filter}) AS dummy3
                 
                 LEFT JOIN 
                 
                 (SELECT DISTINCT scenario_id, subproblem_id, stage_id, period, 
                 load_zone_to AS load_zone, spinup_or_lookahead
                 FROM results_transmission_operations
-                WHERE scenario_id = ?) AS dummy4
+                WHERE scenario_id = ?
+                AND {filter}) AS dummy4
                 USING (scenario_id, subproblem_id, stage_id, period, load_zone,
                 spinup_or_lookahead)
             
@@ -407,6 +406,7 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
         FROM results_transmission_operations
         WHERE transmission_flow_mw > 0
         AND scenario_id = ?
+        AND {filter}
         GROUP BY scenario_id, subproblem_id, stage_id, period, load_zone, 
         spinup_or_lookahead) 
         AS imports_pos_dir
@@ -422,6 +422,7 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
         FROM results_transmission_operations
         WHERE transmission_flow_mw > 0
         AND scenario_id = ?
+        AND {filter}
         GROUP BY scenario_id, subproblem_id, stage_id, period, load_zone, 
         spinup_or_lookahead) 
         AS exports_pos_dir
@@ -437,6 +438,7 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
         FROM results_transmission_operations
         WHERE transmission_flow_mw < 0
         AND scenario_id = ?
+        AND {filter}
         GROUP BY scenario_id, subproblem_id, stage_id, period, load_zone,
         spinup_or_lookahead) 
         AS imports_neg_dir
@@ -452,6 +454,7 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
         FROM results_transmission_operations
         WHERE transmission_flow_mw < 0
         AND scenario_id = ?
+        AND {filter}
         GROUP BY scenario_id, subproblem_id, stage_id, period, load_zone,
         spinup_or_lookahead) 
         AS exports_neg_dir
@@ -459,7 +462,9 @@ def process_results(db, c, scenario_id, subscenarios, quiet):
         spinup_or_lookahead)
         
         ORDER BY subproblem_id, stage_id, period, load_zone, spinup_or_lookahead
-        ;"""
+        ;""".format(
+        filter=SUBPROBLEM_STAGES_TO_PROCESS_FILTER
+    )
 
-    scenario_ids = tuple([scenario_id] * 8)
+    scenario_ids = tuple([scenario_id] * 16)
     spin_on_database_lock(conn=db, cursor=c, sql=agg_sql, data=scenario_ids, many=False)
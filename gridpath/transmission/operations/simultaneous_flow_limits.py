@@ -37,7 +37,8 @@ from pyomo.environ import (
 )
 
 from db.common_functions import spin_on_database_lock
-from gridpath.auxiliary.db_interface import setup_results_import
+from gridpath.auxiliary.db_interface import import_results_into_table
+from gridpath.auxiliary.results_export import read_results_table_rows
 
 
 def add_model_components(m, d, scenario_directory, subproblem, stage):
@@ -439,17 +440,6 @@ def import_results_into_database(
     if not quiet:
         print("sim flow limits")
 
-    # Delete prior results and create temporary import table for ordering
-    setup_results_import(
-        conn=db,
-        cursor=c,
-        table="results_transmission_simultaneous_flows",
-        scenario_id=scenario_id,
-        subproblem=subproblem,
-        stage=stage,
-    )
-
-    # Load results into the temporary table
     results = []
     with open(
         os.path.join(results_directory, "transmission_simultaneous_flow_limits.csv"),
@@ -478,49 +468,42 @@ def import_results_into_database(
                 )
             )
 
-        insert_temp_sql = """
-            INSERT INTO 
-            temp_results_transmission_simultaneous_flows{}
-            (scenario_id, transmission_simultaneous_flow_limit, 
-            subproblem_id, stage_id, timepoint, timepoint_weight, period, 
-            flow_mw)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?);
-            """.format(
-            scenario_id
-        )
-        spin_on_database_lock(conn=db, cursor=c, sql=insert_temp_sql, data=results)
-
-        # Insert sorted results into permanent results table
-        insert_sql = """
-            INSERT INTO results_transmission_simultaneous_flows
-            (scenario_id, transmission_simultaneous_flow_limit, 
-            subproblem_id, stage_id, timepoint, timepoint_weight, period, 
-            flow_mw)
-            SELECT
-            scenario_id, transmission_simultaneous_flow_limit, 
-            subproblem_id, stage_id, timepoint, timepoint_weight, period, 
-            flow_mw
-            FROM temp_results_transmission_simultaneous_flows{}
-            ORDER BY scenario_id, transmission_simultaneous_flow_limit, 
-            subproblem_id, stage_id, timepoint;
-            """.format(
-            scenario_id
+        # Delete prior results and insert the sorted results
+        import_results_into_table(
+            conn=db,
+            cursor=c,
+            table="results_transmission_simultaneous_flows",
+            scenario_id=scenario_id,
+            subproblem=subproblem,
+            stage=stage,
+            columns=[
+                "scenario_id",
+                "transmission_simultaneous_flow_limit",
+                "subproblem_id",
+                "stage_id",
+                "timepoint",
+                "timepoint_weight",
+                "period",
+                "flow_mw",
+            ],
+            results=results,
+            order_by=[
+                "scenario_id",
+                "transmission_simultaneous_flow_limit",
+                "subproblem_id",
+                "stage_id",
+                "timepoint",
+            ],
         )
-        spin_on_database_lock(conn=db, cursor=c, sql=insert_sql, data=(), many=False)
 
         # Update duals
         duals_results = []
-        with open(
-            os.path.join(results_directory, "Sim_Flow_Constraint.csv"), "r"
-        ) as duals_file:
-            reader = csv.reader(duals_file)
-
-            next(reader)  # skip header
-
-            for row in reader:
-                duals_results.append(
-                    (row[2], row[0], row[1], scenario_id, subproblem, stage)
-                )
+        for row in read_results_table_rows(
+            os.path.join(results_directory, "Sim_Flow_Constraint.csv")
+        ):
+            duals_results.append(
+                (row[2], row[0], row[1], scenario_id, subproblem, stage)
+            )
         duals_sql = """
             UPDATE results_transmission_simultaneous_flows
             SET dual = ?
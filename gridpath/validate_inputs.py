@@ -18,12 +18,19 @@ calls their *validate_inputs()* method, which performs various validations
 of the input data and scenario setup.
 """
 
+from multiprocessing import Pool
 import pandas as pd
 import sqlite3
 import sys
 from argparse import ArgumentParser
 
-from db.common_functions import connect_to_database, spin_on_database_lock
+from db.common_functions import (
+    CachedConnection,
+    DeferredWrites,
+    QueryCache,
+    connect_to_database,
+    spin_on_database_lock,
+)
 from gridpath.auxiliary.db_interface import (
     get_required_capacity_types_from_database,
     get_scenario_id_and_name,
@@ -32,7 +39,7 @@ from gridpath.auxiliary.validations import (
     write_validation_to_database,
     validate_cols_equal,
 )
-from gridpath.common_functions import get_db_parser
+from gridpath.common_functions import get_db_parser, get_parallel_validate_parser
 from gridpath.auxiliary.module_list import determine_modules, load_modules
 from gridpath.auxiliary.scenario_chars import (
     OptionalFeatures,
@@ -41,17 +48,39 @@ from gridpath.auxiliary.scenario_chars import (
 )
 
 
-def validate_inputs(subproblems, loaded_modules, scenario_id, subscenarios, conn):
+def validate_inputs(
+    subproblems,
+    modules_to_use,
+    loaded_modules,
+    scenario_id,
+    subscenarios,
+    conn,
+    db_path,
+    n_parallel_validate=1,
+):
     """ "
     For each module, load the inputs from the database and validate them
 
     :param subproblems: SubProblems object with info on the subproblem/stage
         structure
+    :param modules_to_use: list of the names of the modules
     :param loaded_modules: list of imported modules (Python <class 'module'>
-        objects)
+        objects) in the same order
     :param subscenarios: SubScenarios object with all subscenario info
     :param conn: database connection
+    :param db_path: the path to the database (for the worker processes)
+    :param n_parallel_validate: int, the number of processes to use
     :return:
+
+    Each module's *validate_inputs()* method is run for each subproblem and
+    stage as a separate task. The tasks don't write to the database: the
+    validations they write with write_validation_to_database are collected
+    (see DeferredWrites) and inserted here in bulk once all tasks are done,
+    in the same order as if each task wrote its own. If validating in
+    parallel, the tasks are run in a pool of processes, each with its own
+    read-only connection to the database. Each process (or this process if
+    not validating in parallel) runs the queries through a query cache, so
+    the queries that are the same for all subproblems are only run once.
     """
 
     # TODO: check if we even need database cursor (and subscenarios?)
@@ -62,27 +91,149 @@ def validate_inputs(subproblems, loaded_modules, scenario_id, subscenarios, conn
     #  each table in the database? Problem is that you don't necessarily want
     #  to check the full table but only the appropriate subscenario
 
-    subproblems_list = subproblems.SUBPROBLEM_STAGES.keys()
-    for subproblem in subproblems_list:
-        stages = subproblems.SUBPROBLEM_STAGES[subproblem]
-        for stage in stages:
-            # 1. input validation within each module
-            for m in loaded_modules:
-                if hasattr(m, "validate_inputs"):
-                    m.validate_inputs(
-                        scenario_id=scenario_id,
-                        subscenarios=subscenarios,
-                        subproblem=subproblem,
-                        stage=stage,
-                        conn=conn,
-                    )
-                else:
-                    pass
+    # 1. input validation within each module
+    pool_data = [
+        [m_name, scenario_id, subscenarios, subproblem, stage]
+        for subproblem in subproblems.SUBPROBLEM_STAGES.keys()
+        for stage in subproblems.SUBPROBLEM_STAGES[subproblem]
+        for (m_name, m) in zip(modules_to_use, loaded_modules)
+        if hasattr(m, "validate_inputs")
+    ]
+
+    if n_parallel_validate > 1 and len(pool_data) > 1:
+        pool = Pool(
+            n_parallel_validate,
+            initializer=connect_worker_to_database,
+            initargs=(db_path,),
+        )
+        # The tasks' writes, in the order of pool_data
+        task_writes = list(
+            pool.imap(
+                validate_module_inputs_pool,
+                pool_data,
+                chunksize=max(1, len(pool_data) // (4 * n_parallel_validate)),
+            )
+        )
+        pool.close()
+        pool.join()
+    else:
+        set_worker_connection(conn=conn)
+        try:
+            task_writes = [
+                validate_module_inputs_pool(pool_datum) for pool_datum in pool_data
+            ]
+        finally:
+            set_worker_connection(conn=None)
+
+    # Merge the consecutive inserts with the same statement, i.e. all
+    # validations, and insert them in bulk
+    bulk_writes = []
+    for writes in task_writes:
+        for (sql, data, many) in writes:
+            if (
+                many
+                and bulk_writes
+                and bulk_writes[-1][2]
+                and bulk_writes[-1][0] == sql
+            ):
+                bulk_writes[-1][1].extend(data)
+            else:
+                bulk_writes.append((sql, list(data) if many else data, many))
+
+    c = conn.cursor()
+    for (sql, data, many) in bulk_writes:
+        spin_on_database_lock(conn=conn, cursor=c, sql=sql, data=data, many=many)
+    c.close()
+
+    # 2. input validation across modules
+    #    make sure geography and projects are in line
+    #    ... (see Evernote validation list)
+    #    create separate function for each validation that you call here
+
 
-            # 2. input validation across modules
-            #    make sure geography and projects are in line
-            #    ... (see Evernote validation list)
-            #    create separate function for each validation that you call here
+# The database connection (through a query cache) of a process validating
+# inputs; see connect_worker_to_database() and set_worker_connection()
+_worker_conn = None
+
+
+def connect_worker_to_database(db_path):
+    """
+    :param db_path: the path to the database
+
+    Connect a worker process validating inputs in parallel to the database
+    once rather than for each task. The connection is read-only, as the
+    worker's writes are collected rather than executed (see
+    validate_module_inputs).
+    """
+    set_worker_connection(
+        conn=connect_to_database(
+            db_path=db_path, detect_types=sqlite3.PARSE_DECLTYPES, read_only=True
+        )
+    )
+
+
+def set_worker_connection(conn):
+    """
+    :param conn: the database connection to validate inputs with, or None
+        to drop the current one
+
+    Set the connection the tasks validating inputs in this process use,
+    wrapped in a new query cache.
+    """
+    global _worker_conn
+    if conn is None:
+        _worker_conn = None
+    else:
+        _worker_conn = CachedConnection(conn=conn, cache=QueryCache())
+
+
+def validate_module_inputs(module_name, scenario_id, subscenarios, subproblem, stage):
+    """
+    :param module_name: the name of the module
+    :param scenario_id:
+    :param subscenarios: SubScenarios object with all subscenario info
+    :param subproblem:
+    :param stage:
+    :return: list of the (sql, data, many) writes of the module's
+        *validate_inputs()* method
+
+    Run a module's *validate_inputs()* method for a subproblem and stage
+    with its writes collected rather than executed.
+    """
+    [module] = load_modules([module_name])
+    deferred_writes = DeferredWrites()
+    deferred_writes.register_connection(_worker_conn)
+
+    try:
+        module.validate_inputs(
+            scenario_id=scenario_id,
+            subscenarios=subscenarios,
+            subproblem=subproblem,
+            stage=stage,
+            conn=_worker_conn,
+        )
+    finally:
+        deferred_writes.unregister_connection(_worker_conn)
+
+    return deferred_writes.requests
+
+
+def validate_module_inputs_pool(pool_datum):
+    """
+    :param pool_datum:
+    :return:
+
+    Helper function to easily pass to pool.imap if validating in parallel
+    """
+    [module_name, scenario_id, subscenarios, subproblem, stage] = pool_datum
+
+    return validate_module_inputs(
+        module_name=module_name,
+        scenario_id=scenario_id,
+        subscenarios=subscenarios,
+        subproblem=subproblem,
+        stage=stage,
+    )
 
 
 def validate_subscenario_ids(scenario_id, subscenarios, optional_features, conn):
@@ -325,7 +476,9 @@ def parse_arguments(args):
 
     Parse the known arguments.
     """
-    parser = ArgumentParser(add_help=True, parents=[get_db_parser()])
+    parser = ArgumentParser(
+        add_help=True, parents=[get_db_parser(), get_parallel_validate_parser()]
+    )
 
     # Add quiet flag which can suppress run output
     parser.add_argument(
@@ -425,7 +578,14 @@ def main(args=None):
 
         # Read in inputs from db and validate inputs for loaded modules
         validate_inputs(
-            subproblem_structure, loaded_modules, scenario_id, subscenarios, conn
+            subproblems=subproblem_structure,
+            modules_to_use=modules_to_use,
+            loaded_modules=loaded_modules,
+            scenario_id=scenario_id,
+            subscenarios=subscenarios,
+            conn=conn,
+            db_path=db_path,
+            n_parallel_validate=int(parsed_arguments.n_parallel_validate),
         )
     else:
         if not parsed_arguments.quiet:
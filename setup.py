@@ -16,12 +16,15 @@ extras_ui = [
     "python-socketio[client]<5,>=4.3.0",  # SocketIO Python client
 ]
 extras_black = ["black"]
+extras_parquet = [
+    "pyarrow",  # Parquet and Arrow IPC (Feather) results formats
+]
 
 extras_coverage = [
     "coverage",  # test coverage
     "coveralls",  # automated coverage results with Travis CI
 ]
-extras_all = extras_ui + extras_doc + extras_black + extras_coverage
+extras_all = extras_ui + extras_doc + extras_black + extras_coverage + extras_parquet
 
 setup(
     name="GridPath",
@@ -49,6 +52,7 @@ setup(
     extras_require={
         "doc": extras_doc,
         "ui": extras_ui,
+        "parquet": extras_parquet,
         "all": extras_all,
         "travis": extras_coverage,
     },
@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from pyomo.environ import AbstractModel
+import os.path
+from pyomo.environ import AbstractModel, Any, ConcreteModel, Set, Param
+import tempfile
 import unittest
 
 import gridpath.auxiliary.auxiliary as auxiliary_module_to_test
@@ -48,6 +50,93 @@ class TestAuxiliary(unittest.TestCase):
         )
         self.assertListEqual(two_sets_joined_expected, two_sets_joined_actual)
 
+    def test_get_indexed_subset(self):
+        """
+
+        :return:
+        """
+        mod = ConcreteModel()
+        mod.TMPS = Set(initialize=[1, 2, 3], ordered=True)
+        mod.PRJ_OPR_TMPS = Set(
+            dimen=2,
+            ordered=True,
+            initialize=[("Coal", 1), ("Coal", 2), ("Gas", 1), ("Gas", 3)],
+        )
+        mod.period = Param(mod.TMPS, initialize={1: 2020, 2: 2020, 3: 2030})
+
+        # Group a two-dimensional set
+        self.assertListEqual(
+            ["Coal", "Gas"],
+            auxiliary_module_to_test.get_indexed_subset(
+                mod, "PRJ_OPR_TMPS", 1, index_position=1, subset_position=0
+            ),
+        )
+        self.assertListEqual(
+            [1, 2],
+            auxiliary_module_to_test.get_indexed_subset(
+                mod, "PRJ_OPR_TMPS", "Coal", index_position=0, subset_position=1
+            ),
+        )
+
+        # Group a param's (index, value) pairs
+        self.assertListEqual(
+            [1, 2],
+            auxiliary_module_to_test.get_indexed_subset(
+                mod, "period", 2020, index_position=1, subset_position=0
+            ),
+        )
+
+        # Indices without any elements get an empty subset
+        self.assertListEqual(
+            [],
+            auxiliary_module_to_test.get_indexed_subset(
+                mod, "period", 2040, index_position=1, subset_position=0
+            ),
+        )
+
+    def test_get_zone_timepoint_subset(self):
+        """
+
+        :return:
+        """
+        mod = ConcreteModel()
+        mod.PROJECTS = Set(initialize=["Coal", "Gas", "Wind"], ordered=True)
+        mod.RESERVE_PROJECTS = Set(initialize=["Gas", "Wind"], ordered=True)
+        mod.PRJ_OPR_TMPS = Set(
+            dimen=2,
+            ordered=True,
+            initialize=[("Coal", 1), ("Gas", 1), ("Gas", 2), ("Wind", 1)],
+        )
+        mod.load_zone = Param(
+            mod.PROJECTS,
+            within=Any,
+            initialize={"Coal": "Z1", "Gas": "Z2", "Wind": "Z1"},
+        )
+        mod.ba = Param(
+            mod.RESERVE_PROJECTS, within=Any, initialize={"Gas": "BA1", "Wind": "BA1"}
+        )
+
+        self.assertListEqual(
+            ["Coal", "Wind"],
+            auxiliary_module_to_test.get_zone_timepoint_subset(
+                mod, "PRJ_OPR_TMPS", "load_zone", "Z1", 1
+            ),
+        )
+        self.assertListEqual(
+            [],
+            auxiliary_module_to_test.get_zone_timepoint_subset(
+                mod, "PRJ_OPR_TMPS", "load_zone", "Z1", 2
+            ),
+        )
+
+        # Projects not in the zone param's index are skipped
+        self.assertListEqual(
+            ["Gas", "Wind"],
+            auxiliary_module_to_test.get_zone_timepoint_subset(
+                mod, "PRJ_OPR_TMPS", "ba", "BA1", 1
+            ),
+        )
+
     def test_check_list_has_single_item(self):
         """
 
@@ -91,6 +180,53 @@ class TestAuxiliary(unittest.TestCase):
         self.assertEqual(True, auxiliary_module_to_test.is_number(100.5))
         self.assertEqual(False, auxiliary_module_to_test.is_number("string"))
 
+    def test_read_input_file(self):
+        """
+        Check that input files are parsed once, that column projections are
+        memoized, and that the cache is invalidated when the file changes
+        :return:
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "projects.tab")
+            with open(file_path, "w") as f:
+                f.write("project\toperational_type\tlast_commitment_stage\n")
+                f.write("Gas_CT\tgen_commit_cap\t1\n")
+                f.write("Wind\tgen_var\t.\n")
+
+            df = auxiliary_module_to_test.read_input_file(file_path)
+            self.assertListEqual(
+                ["project", "operational_type", "last_commitment_stage"],
+                list(df.columns),
+            )
+            self.assertIs(df, auxiliary_module_to_test.read_input_file(file_path))
+
+            projection = auxiliary_module_to_test.read_input_file(
+                file_path,
+                usecols=["project", "last_commitment_stage"],
+                dtype={"last_commitment_stage": str},
+            )
+            self.assertListEqual(["1", "."], list(projection["last_commitment_stage"]))
+            self.assertIs(
+                projection,
+                auxiliary_module_to_test.read_input_file(
+                    file_path,
+                    usecols=["project", "last_commitment_stage"],
+                    dtype={"last_commitment_stage": str},
+                ),
+            )
+
+            # Rewrite the file; the cached entry should be discarded
+            with open(file_path, "w") as f:
+                f.write("project\toperational_type\tlast_commitment_stage\n")
+                f.write("Nuclear\tgen_must_run\t.\n")
+
+            self.assertListEqual(
+                ["Nuclear"],
+                list(auxiliary_module_to_test.read_input_file(file_path)["project"]),
+            )
+
+            auxiliary_module_to_test.clear_input_file_cache()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,338 @@
+# Copyright 2016-2020 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os.path
+import sqlite3
+import tempfile
+import unittest
+
+from db.common_functions import CachedConnection, QueryCache
+import gridpath.auxiliary.db_interface as module_to_test
+
+
+class TestDBInterface(unittest.TestCase):
+    """ """
+
+    def test_import_results_into_table(self):
+        """
+        Check that prior results are deleted and that the rows are inserted
+        in the same order as when sorting them in a temporary table
+        :return:
+        """
+        conn = sqlite3.connect(":memory:")
+        c = conn.cursor()
+        c.execute(
+            """CREATE TABLE results_test (
+            scenario_id INTEGER,
+            project VARCHAR(64),
+            subproblem_id INTEGER,
+            stage_id INTEGER,
+            timepoint INTEGER,
+            power_mw FLOAT
+            );"""
+        )
+        c.execute("INSERT INTO results_test VALUES (1, 'Old', 1, 1, 1, 0.0);")
+        c.execute("INSERT INTO results_test VALUES (2, 'Other', 1, 1, 1, 0.0);")
+
+        columns = [
+            "scenario_id",
+            "project",
+            "subproblem_id",
+            "stage_id",
+            "timepoint",
+            "power_mw",
+        ]
+        # Values as read from the results CSVs, including numbers as text
+        # and project names that look like numbers
+        results = [
+            (1, "Wind", 1, 1, "10", "1.0"),
+            (1, "Wind", 1, 1, "9", ""),
+            (1, "100", 1, 1, "1", "2.0"),
+            (1, "20", 1, 1, "1", None),
+            (1, "Coal", 1, 1, "2", "3.0"),
+        ]
+
+        # Expected order, based on sorting in a temporary table
+        c.execute(
+            """CREATE TEMPORARY TABLE temp_results_test AS
+            SELECT * FROM results_test WHERE 0;"""
+        )
+        c.executemany(
+            "INSERT INTO temp_results_test ({}) VALUES (?, ?, ?, ?, ?, ?);".format(
+                ", ".join(columns)
+            ),
+            results,
+        )
+        expected_rows = c.execute(
+            """SELECT * FROM temp_results_test
+            ORDER BY scenario_id, project, subproblem_id, stage_id, timepoint;"""
+        ).fetchall()
+
+        module_to_test.import_results_into_table(
+            conn=conn,
+            cursor=c,
+            table="results_test",
+            scenario_id=1,
+            subproblem=1,
+            stage=1,
+            columns=columns,
+            results=results,
+            order_by=[
+                "scenario_id",
+                "project",
+                "subproblem_id",
+                "stage_id",
+                "timepoint",
+            ],
+        )
+
+        actual_rows = c.execute(
+            "SELECT * FROM results_test WHERE scenario_id = 1 ORDER BY rowid;"
+        ).fetchall()
+        self.assertListEqual(expected_rows, actual_rows)
+
+        # Results for other scenarios are kept
+        self.assertEqual(
+            1,
+            c.execute(
+                "SELECT COUNT(*) FROM results_test WHERE scenario_id = 2;"
+            ).fetchone()[0],
+        )
+
+    def test_get_sort_value(self):
+        """
+        Check that values sort as in SQLite in numeric and text columns,
+        including text that Python's float() accepts but SQLite stores as
+        text
+        :return:
+        """
+        values = [
+            "nan",
+            "inf",
+            "-Infinity",
+            "1_000",
+            "0x1A",
+            " 12 ",
+            "1e5",
+            ".5",
+            "-3.",
+            "abc",
+            "",
+            float("nan"),
+            2.5,
+            7,
+            None,
+        ]
+
+        conn = sqlite3.connect(":memory:")
+        c = conn.cursor()
+        c.execute("CREATE TABLE sort_test (id INTEGER, num INTEGER, txt TEXT);")
+        c.executemany(
+            "INSERT INTO sort_test VALUES (?, ?, ?);",
+            [(i, value, value) for (i, value) in enumerate(values)],
+        )
+
+        for (column, numeric) in [("num", True), ("txt", False)]:
+            expected_order = [
+                row[0]
+                for row in c.execute(
+                    "SELECT id FROM sort_test ORDER BY {}, id;".format(column)
+                ).fetchall()
+            ]
+            actual_order = sorted(
+                range(len(values)),
+                key=lambda i: (module_to_test.get_sort_value(values[i], numeric), i),
+            )
+            self.assertListEqual(expected_order, actual_order, msg=column)
+
+    def test_subproblem_stages_to_process(self):
+        """
+        Check creating the table of the subproblems/stages to process,
+        marking, getting, and clearing them, and that the filter only selects
+        the marked ones
+        :return:
+        """
+        conn = sqlite3.connect(":memory:")
+        c = conn.cursor()
+        c.execute(
+            """CREATE TABLE results_scenario (
+            scenario_id INTEGER,
+            subproblem_id INTEGER,
+            stage_id INTEGER,
+            PRIMARY KEY (scenario_id, subproblem_id, stage_id)
+            );"""
+        )
+        # The table is created if it doesn't exist (and kept if it does)
+        for _ in range(2):
+            module_to_test.create_subproblem_stages_to_process_table(
+                conn=conn, cursor=c
+            )
+        c.executemany(
+            "INSERT INTO results_scenario VALUES (?, ?, ?);",
+            [(1, 1, 1), (1, 2, 1), (1, 3, 1), (2, 1, 1)],
+        )
+
+        for subproblem in [2, 2, 1]:
+            module_to_test.mark_subproblem_stage_to_process(
+                conn=conn, cursor=c, scenario_id=1, subproblem=subproblem, stage=1
+            )
+        self.assertListEqual(
+            [(1, 1), (2, 1)],
+            module_to_test.get_subproblem_stages_to_process(cursor=c, scenario_id=1),
+        )
+        self.assertListEqual(
+            [(1,), (2,)],
+            c.execute(
+                """SELECT subproblem_id FROM results_scenario
+                WHERE scenario_id = ? AND {}
+                ORDER BY subproblem_id;""".format(
+                    module_to_test.SUBPROBLEM_STAGES_TO_PROCESS_FILTER
+                ),
+                (1, 1),
+            ).fetchall(),
+        )
+
+        module_to_test.clear_subproblem_stages_to_process(
+            conn=conn, cursor=c, scenario_id=1
+        )
+        self.assertListEqual(
+            [], module_to_test.get_subproblem_stages_to_process(cursor=c, scenario_id=1)
+        )
+
+        module_to_test.mark_all_subproblem_stages_to_process(
+            conn=conn, cursor=c, scenario_id=1
+        )
+        self.assertListEqual(
+            [(1, 1), (2, 1), (3, 1)],
+            module_to_test.get_subproblem_stages_to_process(cursor=c, scenario_id=1),
+        )
+
+    def test_write_time_series_model_inputs(self):
+        """
+        Check that writing the inputs of all subproblems/stages with a single
+        query gives the same files as querying each subproblem/stage,
+        including when files are appended to and when there are no rows
+        :return:
+        """
+        conn = sqlite3.connect(":memory:")
+        conn.execute(
+            """CREATE TABLE inputs_test (
+            subproblem_id INTEGER,
+            stage_id INTEGER,
+            project VARCHAR(8),
+            timepoint INTEGER,
+            value FLOAT
+            );"""
+        )
+        conn.executemany(
+            "INSERT INTO inputs_test VALUES (?, ?, ?, ?, ?);",
+            [
+                (2, 1, "Wind", 3, 0.5),
+                (1, 2, "Wind", 1, None),
+                (1, 1, "Wind", 1, 0.1),
+                (1, 1, "Solar", 2, 0.2),
+                (3, 1, "Wind", 4, 0.4),
+            ],
+        )
+
+        # Subproblem 3 is not in the scenario and subproblem 2 has no rows
+        # of the "Solar" type
+        subproblem_stages = [("1", "1"), ("1", "2"), ("2", "")]
+
+        def get_data(subproblem, stage, project):
+            if subproblem is None:
+                return conn.execute(
+                    """SELECT subproblem_id, stage_id, timepoint, value
+                    FROM inputs_test WHERE project = ?
+                    ORDER BY subproblem_id, stage_id;""",
+                    (project,),
+                )
+            return conn.execute(
+                """SELECT timepoint, value FROM inputs_test
+                WHERE subproblem_id = ? AND stage_id = ? AND project = ?;""",
+                (
+                    1 if subproblem == "" else int(subproblem),
+                    1 if stage == "" else int(stage),
+                    project,
+                ),
+            )
+
+        def write_inputs(scenario_directory, connection):
+            for (subproblem, stage) in subproblem_stages:
+                for project in ["Wind", "Solar"]:
+                    module_to_test.write_time_series_model_inputs(
+                        scenario_directory=scenario_directory,
+                        subproblem=subproblem,
+                        stage=stage,
+                        conn=connection,
+                        fname="profiles.tab",
+                        get_data=lambda subproblem, stage: get_data(
+                            subproblem, stage, project
+                        ),
+                    )
+                module_to_test.write_time_series_model_inputs(
+                    scenario_directory=scenario_directory,
+                    subproblem=subproblem,
+                    stage=stage,
+                    conn=connection,
+                    fname="solar.tab",
+                    get_data=lambda subproblem, stage: get_data(
+                        subproblem, stage, "Solar"
+                    ),
+                    header=["timepoint", "value"],
+                    replace_nulls=True,
+                    write_if_empty=False,
+                )
+
+        def read_inputs(scenario_directory):
+            inputs = dict()
+            for (subproblem, stage) in subproblem_stages:
+                for fname in ["profiles.tab", "solar.tab"]:
+                    file_path = os.path.join(
+                        scenario_directory, subproblem, stage, "inputs", fname
+                    )
+                    if os.path.exists(file_path):
+                        with open(file_path) as f:
+                            inputs[(subproblem, stage, fname)] = f.read()
+            return inputs
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for mode in ["by_subproblem", "bulk"]:
+                for (subproblem, stage) in subproblem_stages:
+                    os.makedirs(
+                        os.path.join(tmp_dir, mode, subproblem, stage, "inputs")
+                    )
+            write_inputs(os.path.join(tmp_dir, "by_subproblem"), conn)
+            write_inputs(
+                os.path.join(tmp_dir, "bulk"),
+                CachedConnection(
+                    conn=conn, cache=QueryCache(subproblem_stages=subproblem_stages)
+                ),
+            )
+            expected = read_inputs(os.path.join(tmp_dir, "by_subproblem"))
+            actual = read_inputs(os.path.join(tmp_dir, "bulk"))
+
+        self.assertEqual(
+            "timepoint\tvalue\n1\t0.1\n2\t0.2\n",
+            expected[("1", "1", "profiles.tab")],
+        )
+        self.assertEqual(
+            "timepoint\tvalue\n1\t\n", expected[("1", "2", "profiles.tab")]
+        )
+        self.assertNotIn(("2", "", "solar.tab"), expected)
+        self.assertDictEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,237 @@
+# Copyright 2016-2020 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import OrderedDict
+import csv
+import os.path
+from pyomo.environ import Any, ConcreteModel, Expression, Param, Set, Var
+import tempfile
+import unittest
+
+import gridpath.auxiliary.results_export as results_export_module_to_test
+
+try:
+    import pyarrow
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+class TestResultsExport(unittest.TestCase):
+    """ """
+
+    def setUp(self):
+        """
+        Create a small model with project-timepoint components
+        """
+        m = ConcreteModel()
+        m.TMPS = Set(initialize=[1, 2], ordered=True)
+        m.PROJECTS = Set(initialize=["Coal", "Wind"], ordered=True)
+        m.PRJ_OPR_TMPS = Set(
+            dimen=2,
+            ordered=True,
+            initialize=[("Coal", 1), ("Coal", 2), ("Wind", 2)],
+        )
+        m.period = Param(m.TMPS, initialize={1: 2020, 2: 2030})
+        m.tmp_weight = Param(m.TMPS, initialize={1: 1.0, 2: 0.5})
+        m.hrs_in_tmp = Param(m.TMPS, initialize={1: 1, 2: 1})
+        m.balancing_type_project = Param(
+            m.PROJECTS, within=Any, initialize={"Coal": "day", "Wind": "day"}
+        )
+        m.horizon = Param(m.TMPS, ["day"], initialize={(1, "day"): 1, (2, "day"): 2})
+        m.load_zone = Param(
+            m.PROJECTS, within=Any, initialize={"Coal": "Z1", "Wind": "Z2"}
+        )
+        m.Power_MW = Var(
+            m.PRJ_OPR_TMPS,
+            initialize={("Coal", 1): 10.0, ("Coal", 2): 5.0, ("Wind", 2): 2.5},
+        )
+        m.Double_Power_MW = Expression(
+            m.PRJ_OPR_TMPS, rule=lambda mod, p, tmp: 2 * mod.Power_MW[p, tmp]
+        )
+        m.COAL_OPR_TMPS = Set(dimen=2, initialize=[("Coal", 1), ("Coal", 2)])
+        m.Coal_Power_MW = Expression(
+            m.COAL_OPR_TMPS, rule=lambda mod, p, tmp: mod.Power_MW[p, tmp]
+        )
+        self.m = m
+
+    def test_get_project_timepoint_columns(self):
+        """
+        Check the static attribute columns
+        """
+        prj_tmps = list(self.m.PRJ_OPR_TMPS)
+        columns = results_export_module_to_test.get_project_timepoint_columns(
+            self.m,
+            prj_tmps,
+            ["project", "period", "horizon", "timepoint", "load_zone"],
+        )
+
+        self.assertListEqual(
+            ["project", "period", "horizon", "timepoint", "load_zone"],
+            list(columns.keys()),
+        )
+        self.assertListEqual(["Coal", "Coal", "Wind"], columns["project"])
+        self.assertListEqual([2020, 2030, 2030], columns["period"])
+        self.assertListEqual([1, 2, 2], columns["horizon"])
+        self.assertListEqual([1, 2, 2], columns["timepoint"])
+        self.assertListEqual(["Z1", "Z1", "Z2"], columns["load_zone"])
+
+        with self.assertRaises(ValueError):
+            results_export_module_to_test.get_project_timepoint_columns(
+                self.m, prj_tmps, ["not_an_attribute"]
+            )
+
+    def test_get_component_column(self):
+        """
+        Check variable and expression values, including indices the
+        component is not defined over
+        """
+        prj_tmps = list(self.m.PRJ_OPR_TMPS)
+        self.assertListEqual(
+            [10.0, 5.0, 2.5],
+            results_export_module_to_test.get_component_column(
+                self.m.Power_MW, prj_tmps
+            ),
+        )
+        self.assertListEqual(
+            [20.0, 10.0, 5.0],
+            results_export_module_to_test.get_component_column(
+                self.m.Double_Power_MW, prj_tmps
+            ),
+        )
+        self.assertListEqual(
+            [10.0, 5.0, None],
+            results_export_module_to_test.get_component_column(
+                self.m.Coal_Power_MW, prj_tmps
+            ),
+        )
+
+    def test_get_aggregated_columns(self):
+        """
+        Check the groups, their order, and the sums, including None values
+        """
+        columns = OrderedDict(
+            [
+                ("timepoint", [1, 1, 2, 1, 2]),
+                ("technology", ["Coal", "Wind", "Coal", "Coal", "Wind"]),
+                ("period", [2020, 2020, 2030, 2020, 2030]),
+                ("power_mw", [1.0, None, 2.0, 3.0, None]),
+            ]
+        )
+        aggregated = results_export_module_to_test.get_aggregated_columns(
+            columns,
+            group_by=["timepoint", "technology"],
+            first=["period"],
+            sums=["power_mw"],
+        )
+
+        self.assertListEqual(
+            ["timepoint", "technology", "period", "power_mw"], list(aggregated.keys())
+        )
+        self.assertListEqual([1, 1, 2, 2], aggregated["timepoint"])
+        self.assertListEqual(["Coal", "Wind", "Coal", "Wind"], aggregated["technology"])
+        self.assertListEqual([2020, 2020, 2030, 2030], aggregated["period"])
+        self.assertListEqual([4.0, None, 2.0, None], aggregated["power_mw"])
+
+    def test_write_results_table(self):
+        """
+        Check that the table is the same as if written row by row with
+        csv.writer
+        """
+        columns = OrderedDict(
+            [
+                ("project", ["Coal", "Wind"]),
+                ("timepoint_weight", [1.0, 0.5]),
+                ("number_of_hours_in_timepoint", [1, 1]),
+                ("power_mw", [0.1, None]),
+            ]
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            expected_file = os.path.join(tmp_dir, "expected.csv")
+            with open(expected_file, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(list(columns.keys()))
+                for row in zip(*columns.values()):
+                    writer.writerow(row)
+
+            actual_file = os.path.join(tmp_dir, "actual.csv")
+            results_export_module_to_test.write_results_table(actual_file, columns)
+
+            with open(expected_file, "rb") as f:
+                expected = f.read()
+            with open(actual_file, "rb") as f:
+                actual = f.read()
+
+        self.assertEqual(expected, actual)
+
+    @unittest.skipIf(not PYARROW_AVAILABLE, "pyarrow is not installed")
+    def test_binary_results_formats(self):
+        """
+        Check that results tables written in the binary formats are read
+        back with native values and None for missing values
+        """
+        columns = OrderedDict(
+            [
+                ("project", ["Coal", "Wind"]),
+                ("timepoint", [1, 2]),
+                ("power_mw", [0.1, None]),
+            ]
+        )
+
+        for results_format in ["parquet", "feather"]:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                file_path = os.path.join(tmp_dir, "results.csv")
+                results_export_module_to_test.write_results_table(
+                    file_path, columns, results_format=results_format
+                )
+                self.assertTrue(
+                    os.path.exists(os.path.join(tmp_dir, "results." + results_format))
+                )
+                self.assertFalse(os.path.exists(file_path))
+
+                rows = results_export_module_to_test.read_results_table_rows(file_path)
+                df = results_export_module_to_test.read_results_table(file_path)
+
+            self.assertListEqual([["Coal", 1, 0.1], ["Wind", 2, None]], rows)
+            self.assertListEqual(list(columns.keys()), list(df.columns))
+
+    def test_stale_results_formats_removed(self):
+        """
+        Check that writing a results table removes the table's files in the
+        other formats, so that the stale ones can't be read back
+        """
+        columns = OrderedDict([("project", ["Coal"]), ("power_mw", [0.1])])
+        new_columns = OrderedDict([("project", ["Coal"]), ("power_mw", [0.2])])
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "results.csv")
+            for results_format in ["parquet", "feather"]:
+                results_export_module_to_test.write_results_table(
+                    file_path, columns, results_format=results_format
+                )
+            results_export_module_to_test.write_results_table(
+                file_path, new_columns, results_format="csv"
+            )
+
+            self.assertListEqual(["results.csv"], os.listdir(tmp_dir))
+            self.assertListEqual(
+                [["Coal", "0.2"]],
+                results_export_module_to_test.read_results_table_rows(file_path),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
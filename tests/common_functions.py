@@ -100,5 +100,8 @@ def add_components_and_load_data(
             mod.load_model_data(m, d, data, test_data_dir, subproblem, stage)
     if hasattr(module_to_test, "load_model_data"):
         module_to_test.load_model_data(m, d, data, test_data_dir, subproblem, stage)
+    for mod in prereq_modules + [module_to_test]:
+        if hasattr(mod, "load_linked_model_data"):
+            mod.load_linked_model_data(m, d, data, test_data_dir, subproblem, stage)
 
     return m, data
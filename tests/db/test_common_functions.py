@@ -0,0 +1,425 @@
+# Copyright 2016-2020 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os.path
+import pandas as pd
+import sqlite3
+import tempfile
+import threading
+import unittest
+
+import db.common_functions as module_to_test
+
+
+class TestDatabaseWriter(unittest.TestCase):
+    """ """
+
+    def setUp(self):
+        """
+        Create a database with a results table
+        """
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "test.db")
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(
+            """CREATE TABLE results_test (
+            scenario_id INTEGER,
+            timepoint INTEGER,
+            power_mw FLOAT,
+            PRIMARY KEY (scenario_id, timepoint)
+            );"""
+        )
+        conn.commit()
+        conn.close()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_concurrent_writes(self):
+        """
+        Check that writes from several threads, routed to the writer via
+        spin_on_database_lock, are all committed, and that the database is
+        in WAL mode if requested
+        """
+        n_threads = 8
+        n_rows = 50
+
+        def write(writer, scenario_id):
+            conn = module_to_test.connect_to_database(db_path=self.db_path)
+            writer.register_connection(conn)
+            c = conn.cursor()
+            for tmp in range(n_rows):
+                module_to_test.spin_on_database_lock(
+                    conn=conn,
+                    cursor=c,
+                    sql="INSERT INTO results_test VALUES (?, ?, ?);",
+                    data=(scenario_id, tmp, float(tmp)),
+                    many=False,
+                )
+            # Writes are committed when spin_on_database_lock returns
+            counts.append(
+                c.execute(
+                    "SELECT COUNT(*) FROM results_test WHERE scenario_id = ?;",
+                    (scenario_id,),
+                ).fetchone()[0]
+            )
+            conn.close()
+
+        counts = []
+        with module_to_test.DatabaseWriter(db_path=self.db_path, wal=True) as writer:
+            threads = [
+                threading.Thread(target=write, args=(writer, scenario_id))
+                for scenario_id in range(n_threads)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertListEqual([n_rows] * n_threads, counts)
+
+        # Connections are no longer routed to the writer once it is closed
+        self.assertDictEqual({}, module_to_test._DATABASE_WRITERS)
+
+        conn = sqlite3.connect(self.db_path)
+        self.assertEqual(
+            "wal", conn.execute("PRAGMA journal_mode;").fetchone()[0].lower()
+        )
+        conn.close()
+
+    def test_journal_mode_unchanged(self):
+        """
+        Check that the writer doesn't change the journal mode by default
+        """
+        with module_to_test.DatabaseWriter(db_path=self.db_path) as writer:
+            writer.execute(
+                sql="INSERT INTO results_test VALUES (?, ?, ?);",
+                data=(1, 1, 1.0),
+                many=False,
+            )
+
+        conn = sqlite3.connect(self.db_path)
+        self.assertEqual(
+            "delete", conn.execute("PRAGMA journal_mode;").fetchone()[0].lower()
+        )
+        conn.close()
+        self.assertFalse(os.path.exists(self.db_path + "-wal"))
+
+    def test_errors(self):
+        """
+        Check that only the failing request gets the error and that errors
+        of requests not waited for are raised by flush
+        """
+        with module_to_test.DatabaseWriter(db_path=self.db_path) as writer:
+            writer.execute(
+                sql="INSERT INTO results_test VALUES (?, ?, ?);",
+                data=[(1, 1, 1.0), (1, 2, 2.0)],
+            )
+            with self.assertRaises(sqlite3.IntegrityError):
+                writer.execute(
+                    sql="INSERT INTO results_test VALUES (?, ?, ?);",
+                    data=(1, 1, 1.0),
+                    many=False,
+                )
+
+            writer.execute(
+                sql="INSERT INTO results_test VALUES (?, ?, ?);",
+                data=(1, 2, 2.0),
+                many=False,
+                wait=False,
+            )
+            writer.execute(
+                sql="INSERT INTO results_test VALUES (?, ?, ?);",
+                data=(1, 3, 3.0),
+                many=False,
+                wait=False,
+            )
+            with self.assertRaises(sqlite3.IntegrityError):
+                writer.flush()
+
+        conn = sqlite3.connect(self.db_path)
+        self.assertListEqual(
+            [(1,), (2,), (3,)],
+            conn.execute(
+                "SELECT timepoint FROM results_test ORDER BY timepoint;"
+            ).fetchall(),
+        )
+        conn.close()
+
+    def test_read_only_connection(self):
+        """
+        Check that a read-only connection can read but not write
+        """
+        conn = module_to_test.connect_to_database(db_path=self.db_path, read_only=True)
+        self.assertEqual(
+            0, conn.execute("SELECT COUNT(*) FROM results_test;").fetchone()[0]
+        )
+        with self.assertRaises(sqlite3.OperationalError):
+            conn.execute("INSERT INTO results_test VALUES (1, 1, 1.0);")
+        conn.close()
+
+
+class TestQueryCache(unittest.TestCase):
+    """ """
+
+    def test_cached_connection(self):
+        """
+        Check that repeated queries are served from the cache once they
+        have been run twice, that the results are the same as without the
+        cache, and that other statements clear the cache
+        """
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE inputs_test (project VARCHAR(8), value FLOAT);")
+        conn.executemany(
+            "INSERT INTO inputs_test VALUES (?, ?);", [("A", 1.0), ("B", 2.0)]
+        )
+
+        cache = module_to_test.QueryCache()
+        cached_conn = module_to_test.CachedConnection(conn=conn, cache=cache)
+        sql = "SELECT project, value FROM inputs_test WHERE value > ?;"
+        expected = conn.execute(sql, (0,)).fetchall()
+
+        for _ in range(3):
+            c = cached_conn.cursor()
+            self.assertListEqual(expected, list(c.execute(sql, (0,))))
+        self.assertEqual(1, cache.hits)
+
+        # The fetch methods and pandas also work with results from the cache
+        c = cached_conn.cursor().execute(sql, (0,))
+        self.assertEqual(expected[0], c.fetchone())
+        self.assertListEqual(expected[1:], c.fetchmany(5))
+        self.assertListEqual([], c.fetchall())
+        df = pd.read_sql(sql, cached_conn, params=(0,))
+        self.assertListEqual(["project", "value"], list(df.columns))
+        self.assertListEqual(expected, list(df.itertuples(index=False, name=None)))
+        self.assertEqual(3, cache.hits)
+
+        cached_conn.execute("INSERT INTO inputs_test VALUES ('C', 3.0);")
+        self.assertDictEqual({}, cache.results)
+        self.assertEqual(3, len(cached_conn.execute(sql, (0,)).fetchall()))
+
+        conn.close()
+
+    def test_query_profile(self):
+        """
+        Check that the executions of each query are counted, including
+        those served from the cache, and that queries are only timed if
+        profiling
+        """
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE inputs_test (project VARCHAR(8), value FLOAT);")
+        conn.executemany(
+            "INSERT INTO inputs_test VALUES (?, ?);", [("A", 1.0), ("B", 2.0)]
+        )
+        sql = "SELECT project, value FROM inputs_test WHERE value > ?;"
+        other_sql = "SELECT COUNT(*) FROM inputs_test;"
+
+        cache = module_to_test.QueryCache(profile=True)
+        cached_conn = module_to_test.CachedConnection(conn=conn, cache=cache)
+        for value in [0, 1, 0, 0]:
+            list(cached_conn.cursor().execute(sql, (value,)))
+        cached_conn.execute(other_sql).fetchone()
+
+        query_profile = cache.get_query_profile()
+        self.assertListEqual(
+            [(sql, 4), (other_sql, 1)],
+            sorted(
+                [(query, executions) for (query, executions, _) in query_profile],
+                key=lambda query: query[1],
+                reverse=True,
+            ),
+        )
+        self.assertListEqual(
+            sorted([seconds for (_, _, seconds) in query_profile], reverse=True),
+            [seconds for (_, _, seconds) in query_profile],
+        )
+
+        cache = module_to_test.QueryCache()
+        cached_conn = module_to_test.CachedConnection(conn=conn, cache=cache)
+        cached_conn.execute(sql, (0,)).fetchall()
+        self.assertIsNone(cache.query_times)
+
+        conn.close()
+
+
+class TestMaterializedViews(unittest.TestCase):
+    """ """
+
+    def setUp(self):
+        """
+        Create a database with scenarios and tables standing in for the
+        views to materialize
+        """
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.execute(
+            """CREATE TABLE scenarios (
+            scenario_id INTEGER PRIMARY KEY,
+            {} INTEGER
+            );""".format(
+                " INTEGER, ".join(module_to_test.MATERIALIZED_VIEW_SUBSCENARIO_COLUMNS)
+            )
+        )
+        # Project IDs: temporal, portfolio, opchars, specified, new cost;
+        # transmission IDs are not specified
+        self.conn.executemany(
+            """INSERT INTO scenarios (scenario_id, {})
+            VALUES (?, ?, ?, ?, ?, ?, NULL, NULL, NULL, NULL);""".format(
+                ", ".join(module_to_test.MATERIALIZED_VIEW_SUBSCENARIO_COLUMNS)
+            ),
+            [(1, 1, 1, 1, 1, None), (2, 1, 1, 1, 1, None), (3, 2, 1, 1, 1, 2)],
+        )
+        for (view, prefix) in module_to_test.MATERIALIZED_VIEWS:
+            self.conn.execute(
+                """CREATE TABLE {view} (
+                {prefix}_portfolio_scenario_id INTEGER,
+                {prefix}_operational_chars_scenario_id INTEGER,
+                {prefix}_specified_capacity_scenario_id INTEGER,
+                {prefix}_new_cost_scenario_id INTEGER,
+                temporal_scenario_id INTEGER,
+                subproblem_id INTEGER,
+                timepoint INTEGER
+                );""".format(
+                    view=view, prefix=prefix
+                )
+            )
+            self.conn.executemany(
+                "INSERT INTO {} VALUES (?, ?, ?, ?, ?, ?, ?);".format(view),
+                [
+                    (1, 1, 1, None, 1, 1, 1),
+                    (1, 1, 1, None, 1, 2, 2),
+                    (1, 1, 2, None, 1, 1, 1),
+                    (1, 1, None, 2, 2, 1, 1),
+                    (1, 1, 1, None, 2, 1, 1),
+                ],
+            )
+            self.conn.execute(
+                """CREATE TABLE materialized_{view} AS
+                SELECT NULL AS materialization_id, * FROM {view} WHERE 0;""".format(
+                    view=view
+                )
+            )
+        self.conn.execute(
+            """CREATE TABLE materialized_operational_subscenarios (
+            materialization_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            {} INTEGER
+            );""".format(
+                " INTEGER, ".join(module_to_test.MATERIALIZED_VIEW_SUBSCENARIO_COLUMNS)
+            )
+        )
+        self.conn.commit()
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_materialize_operational_timepoints(self):
+        """
+        Check that scenarios with the same subscenario IDs share a
+        materialization, that queries give the same results with the
+        materialized views, and that materializations are replaced when the
+        IDs change
+        """
+        sql = """SELECT subproblem_id, timepoint
+            FROM project_operational_timepoints
+            WHERE project_portfolio_scenario_id = ?
+            AND project_operational_chars_scenario_id = ?
+            AND temporal_scenario_id = ?
+            AND (project_specified_capacity_scenario_id = ?
+                 OR project_new_cost_scenario_id = ?)
+            ORDER BY subproblem_id, timepoint;"""
+        params = {1: (1, 1, 1, 1, "NULL"), 3: (1, 1, 2, 1, 2)}
+        expected = {
+            scenario_id: self.conn.execute(sql, params[scenario_id]).fetchall()
+            for scenario_id in params
+        }
+        self.assertListEqual([(1, 1), (2, 2)], expected[1])
+        self.assertListEqual([(1, 1), (1, 1)], expected[3])
+
+        materialization_ids = [
+            module_to_test.materialize_operational_timepoints(
+                conn=self.conn, scenario_id=scenario_id
+            )
+            for scenario_id in [1, 2, 3]
+        ]
+        self.assertEqual(materialization_ids[0], materialization_ids[1])
+        self.assertNotEqual(materialization_ids[0], materialization_ids[2])
+
+        for scenario_id in params:
+            conn = sqlite3.connect(":memory:")
+            self.conn.backup(conn)
+            module_to_test.use_materialized_operational_timepoints(
+                conn=conn, materialization_id=materialization_ids[scenario_id - 1]
+            )
+            self.assertListEqual(
+                expected[scenario_id], conn.execute(sql, params[scenario_id]).fetchall()
+            )
+            conn.close()
+
+        # The transmission IDs are not specified, so no rows are materialized
+        self.assertEqual(
+            0,
+            self.conn.execute(
+                "SELECT COUNT(*) FROM materialized_transmission_operational_timepoints;"
+            ).fetchone()[0],
+        )
+
+        # Once scenario 3's IDs are the same as scenario 1's, its
+        # materialization is deleted
+        self.conn.execute(
+            """UPDATE scenarios SET temporal_scenario_id = 1,
+            project_new_cost_scenario_id = NULL WHERE scenario_id = 3;"""
+        )
+        self.conn.commit()
+        self.assertEqual(
+            materialization_ids[0],
+            module_to_test.materialize_operational_timepoints(
+                conn=self.conn, scenario_id=3
+            ),
+        )
+        self.assertListEqual(
+            [(materialization_ids[0],)],
+            self.conn.execute(
+                """SELECT DISTINCT materialization_id
+                FROM materialized_project_operational_timepoints;"""
+            ).fetchall(),
+        )
+
+        module_to_test.clear_materialized_operational_timepoints(conn=self.conn)
+        self.assertEqual(
+            0,
+            self.conn.execute(
+                "SELECT COUNT(*) FROM materialized_operational_subscenarios;"
+            ).fetchone()[0],
+        )
+
+    def test_without_materialized_views_tables(self):
+        """
+        Check that nothing is materialized or cleared (and that there is no
+        error) if the database doesn't have the materialized views' tables
+        """
+        for (view, _) in module_to_test.MATERIALIZED_VIEWS:
+            self.conn.execute("DROP TABLE materialized_{};".format(view))
+        self.conn.execute("DROP TABLE materialized_operational_subscenarios;")
+        self.assertFalse(module_to_test.materialized_views_exist(conn=self.conn))
+
+        with self.assertWarns(UserWarning):
+            self.assertIsNone(
+                module_to_test.materialize_operational_timepoints(
+                    conn=self.conn, scenario_id=1
+                )
+            )
+        module_to_test.clear_materialized_operational_timepoints(conn=self.conn)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -196,6 +196,18 @@ class TestOperationalTypeCommonFunctions(unittest.TestCase):
             # test case
             self.assertListEqual([], actual_linked_tmps)
 
+        # The relevant timepoints are memoized by balancing type and min
+        # time; check that modifying a returned list doesn't change the
+        # lookback table
+        actual_list, _ = determine_relevant_timepoints(
+            mod=instance, g="Gas_CCGT", tmp=20200103, min_time=4
+        )
+        actual_list.append(20200101)
+        actual_list, _ = determine_relevant_timepoints(
+            mod=instance, g="Gas_CCGT", tmp=20200103, min_time=4
+        )
+        self.assertListEqual([20200103, 20200102], actual_list)
+
     def test_determine_relevant_linked_timepoints(self):
         """
         Check that the lists of relevant timepoints and relevant linked
@@ -13,9 +13,11 @@
 # limitations under the License.
 
 import os
+import sqlite3
 import unittest
 
 from db import create_database
+from db.utilities import update_indexes
 
 # Change directory to 'db,' as it's what create_database.py expects
 os.chdir(os.path.join(os.path.dirname(__file__), "..", "db"))
@@ -27,3 +29,53 @@ class TestCreateDatabase(unittest.TestCase):
     """
 
     create_database.main(["--in_memory"])
+
+    def test_indexes(self):
+        """
+        Check that the indexes update_indexes.py gets from the schema are
+        created with the database
+        """
+        conn = sqlite3.connect(":memory:")
+        create_database.create_database_schema(
+            conn=conn,
+            parsed_arguments=create_database.parse_arguments(arguments=[]),
+        )
+        created_indexes = [
+            row[0]
+            for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index';"
+            ).fetchall()
+        ]
+
+        statements = update_indexes.get_index_statements()
+        self.assertGreater(len(statements), 0)
+        for (name, sql) in statements:
+            self.assertIn(name, created_indexes)
+
+    def test_update_indexes_without_tables(self):
+        """
+        Check that update_indexes.py skips the indexes on tables that don't
+        exist in the database (e.g. tables added to the schema after the
+        database was created)
+        """
+        conn = sqlite3.connect(":memory:")
+        conn.execute(
+            """CREATE TABLE results_project_dispatch (scenario_id INTEGER,
+            subproblem_id INTEGER, stage_id INTEGER, timepoint INTEGER);"""
+        )
+        update_indexes.create_indexes(
+            conn=conn,
+            statements=update_indexes.get_index_statements(),
+            analyze=False,
+            quiet=True,
+        )
+        created_indexes = [
+            row[0]
+            for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index';"
+            ).fetchall()
+        ]
+
+        self.assertListEqual(
+            ["results_project_dispatch_subproblem_stage_tmp_idx"], created_indexes
+        )
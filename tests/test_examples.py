@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import importlib.util
 import logging
 import multiprocessing
 import os
@@ -19,7 +20,7 @@ import platform
 import sqlite3
 import unittest
 
-from gridpath import run_end_to_end, validate_inputs
+from gridpath import run_end_to_end, run_scenario, validate_inputs
 from db import create_database
 from db.common_functions import connect_to_database
 from db.utilities import port_csvs_to_db, scenario
@@ -95,18 +96,23 @@ class TestExamples(unittest.TestCase):
 
         self.assertListEqual(expected_validations, actual_validations)
 
-    def run_and_check_objective(self, test, expected_objective, parallel=1):
+    def run_and_check_objective(
+        self, test, expected_objective, parallel=1, extra_args=None
+    ):
         """
 
         :param test: str, name of the test example
         :param expected_objective: float or dict, expected objective
         :param parallel: int, set to a number > 1 to test
             parallelization functionality
+        :param extra_args: list of additional arguments to pass to
+            run_end_to_end (e.g. to test other build or solve modes)
         :return:
         """
 
         actual_objective = run_end_to_end.main(
-            [
+            (extra_args if extra_args is not None else [])
+            + [
                 "--database",
                 DB_PATH,
                 "--scenario",
@@ -200,6 +206,17 @@ class TestExamples(unittest.TestCase):
         self.check_validation("test")
         self.run_and_check_objective("test", -3796309121478.12)
 
+    def test_example_test_direct_model_build(self):
+        """
+        Check objective function value of "test" example when constructing
+        the problem instance directly (without create_instance)
+        :return:
+        """
+
+        self.run_and_check_objective(
+            "test", -3796309121478.12, extra_args=["--direct_model_build"]
+        )
+
     def test_example_test_no_overgen_allowed(self):
         """
         Check validation and objective function value of
@@ -483,6 +500,48 @@ class TestExamples(unittest.TestCase):
             {1: -1265436373826.0408, 2: -1265436373826.0408, 3: -1265436373826.0408},
         )
 
+    def test_example_single_stage_prod_cost_linked_subproblems_warm_start(self):
+        """
+        Check objective function values of
+        "single_stage_prod_cost_linked_subproblems" example when
+        warm-starting each subproblem from the previous subproblem's solution
+        :return:
+        """
+        self.run_and_check_objective(
+            "single_stage_prod_cost_linked_subproblems",
+            {1: -1265436373826.0408, 2: -1265436373826.0408, 3: -1265436373826.0408},
+            extra_args=["--persistent_solver"],
+        )
+
+    def test_example_single_stage_prod_cost_linked_subproblems_parallel(self):
+        """
+        Check objective function values of
+        "single_stage_prod_cost_linked_subproblems" example when pipelining
+        the linked subproblems in parallel; we run the scenario with
+        run_scenario directly (using the example's inputs) rather than
+        end-to-end
+        :return:
+        """
+        actual_objective = run_scenario.main(
+            [
+                "--scenario",
+                "single_stage_prod_cost_linked_subproblems",
+                "--scenario_location",
+                EXAMPLES_DIRECTORY,
+                "--n_parallel_solve",
+                "3",
+                "--quiet",
+                "--mute_solver_output",
+                "--testing",
+            ]
+        )
+
+        self.assertDictAlmostEqual(
+            {1: -1265436373826.0408, 2: -1265436373826.0408, 3: -1265436373826.0408},
+            dict(actual_objective.copy()),
+            places=1,
+        )
+
     def test_example_multi_stage_prod_cost(self):
         """
         Check validation and objective function values of
@@ -512,6 +571,64 @@ class TestExamples(unittest.TestCase):
             },
         )
 
+    def test_example_multi_stage_prod_cost_parallel_import(self):
+        """
+        Check objective function values of "multi_stage_prod_cost" example
+        when importing the results in parallel
+        :return:
+        """
+
+        self.run_and_check_objective(
+            "multi_stage_prod_cost",
+            {
+                1: {
+                    1: -1265436373826.0408,
+                    2: -1265436373826.0408,
+                    3: -1265436373826.099,
+                },
+                2: {
+                    1: -1265436373826.0408,
+                    2: -1265436373826.0408,
+                    3: -1265436373826.099,
+                },
+                3: {
+                    1: -1265436373826.0408,
+                    2: -1265436373826.0408,
+                    3: -1265436373826.099,
+                },
+            },
+            extra_args=["--n_parallel_import", "2"],
+        )
+
+    def test_example_multi_stage_prod_cost_persistent_solver(self):
+        """
+        Check objective function values of "multi_stage_prod_cost" example
+        when reusing the solver and warm-starting across stages
+        :return:
+        """
+
+        self.run_and_check_objective(
+            "multi_stage_prod_cost",
+            {
+                1: {
+                    1: -1265436373826.0408,
+                    2: -1265436373826.0408,
+                    3: -1265436373826.099,
+                },
+                2: {
+                    1: -1265436373826.0408,
+                    2: -1265436373826.0408,
+                    3: -1265436373826.099,
+                },
+                3: {
+                    1: -1265436373826.0408,
+                    2: -1265436373826.0408,
+                    3: -1265436373826.099,
+                },
+            },
+            extra_args=["--persistent_solver"],
+        )
+
     def test_example_multi_stage_prod_cost_parallel(self):
         """
         Check validation and objective function values of
@@ -643,6 +760,22 @@ class TestExamples(unittest.TestCase):
         self.check_validation("test_variable_gen_reserves")
         self.run_and_check_objective("test_variable_gen_reserves", -1343499590014.7651)
 
+    @unittest.skipIf(
+        importlib.util.find_spec("pyarrow") is None, "pyarrow is not installed"
+    )
+    def test_example_variable_gen_reserves_parquet_results(self):
+        """
+        Check objective function value of "test_variable_gen_reserves"
+        example when writing the columnar results tables as Parquet files
+        :return:
+        """
+
+        self.run_and_check_objective(
+            "test_variable_gen_reserves",
+            -1343499590014.7651,
+            extra_args=["--results_format", "parquet"],
+        )
+
     def test_example_2periods_new_build_rps_variable_reserves(self):
         """
         Check validation and objective function value of
@@ -0,0 +1,302 @@
+# Copyright 2016-2020 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from pyomo.environ import (
+    AbstractModel,
+    ConcreteModel,
+    Constraint,
+    DataPortal,
+    Expression,
+    NonNegativeReals,
+    Objective,
+    Param,
+    Set,
+    Suffix,
+    Var,
+)
+
+from gridpath.run_scenario import (
+    apply_previous_solution,
+    create_problem_instance,
+    get_timepoint_index_position,
+    save_solution_for_next_solve,
+    update_persistent_solver,
+    update_previous_instance,
+)
+
+
+def create_model(tmps):
+    """
+    :param tmps: the model's timepoints
+    :return: a small model with variables indexed by timepoint as well as by
+        horizons and periods whose values overlap with the timepoints
+    """
+    m = ConcreteModel()
+    m.TMPS = Set(initialize=tmps, ordered=True)
+    m.PRJ_OPR_TMPS = Set(dimen=2, initialize=[("gen", tmp) for tmp in tmps])
+    m.HRZS = Set(initialize=[1, 2, 3, 4])
+
+    m.Commit = Var(m.PRJ_OPR_TMPS)
+    m.Flow = Var(m.HRZS, m.TMPS)
+    m.Horizon_Var = Var(m.HRZS)
+    m.Scalar_Var = Var()
+
+    return m
+
+
+def create_abstract_model(mutable_load=False):
+    """
+    :param mutable_load: whether the load param is mutable
+    :return: a small abstract model with components of each type used by
+        the GridPath modules
+    """
+    m = AbstractModel()
+    m.dual = Suffix(direction=Suffix.IMPORT)
+    m.PROJECTS = Set()
+    m.TMPS = Set(ordered=True)
+    m.PRJ_OPR_TMPS = Set(
+        dimen=2,
+        initialize=lambda mod: [(g, tmp) for g in mod.PROJECTS for tmp in mod.TMPS],
+    )
+    m.capacity_mw = Param(m.PROJECTS)
+    m.load_mw = Param(m.TMPS, default=1, mutable=mutable_load)
+
+    m.Provide_Power_MW = Var(m.PRJ_OPR_TMPS, within=NonNegativeReals)
+    m.Power_Production_MW = Expression(
+        m.TMPS,
+        rule=lambda mod, tmp: sum(mod.Provide_Power_MW[g, tmp] for g in mod.PROJECTS),
+    )
+    m.Max_Power_Constraint = Constraint(
+        m.PRJ_OPR_TMPS,
+        rule=lambda mod, g, tmp: mod.Provide_Power_MW[g, tmp] <= mod.capacity_mw[g],
+    )
+    m.Meet_Load_Constraint = Constraint(
+        m.TMPS,
+        rule=lambda mod, tmp: mod.Power_Production_MW[tmp] == mod.load_mw[tmp],
+    )
+    m.Total_Power = Objective(
+        rule=lambda mod: sum(mod.Power_Production_MW[tmp] for tmp in mod.TMPS)
+    )
+
+    return m
+
+
+def load_data(model, load_mw=3):
+    """
+    :param model: the abstract model
+    :param load_mw: the load in the first timepoint
+    :return: the DataPortal with the data of the small model
+    """
+    return DataPortal(
+        model=model,
+        data_dict={
+            None: {
+                "PROJECTS": {None: ["Coal", "Wind"]},
+                "TMPS": {None: [20200101, 20200102]},
+                "capacity_mw": {"Coal": 6, "Wind": 2},
+                "load_mw": {20200101: load_mw},
+            }
+        },
+    )
+
+
+class TestCreateProblemInstance(unittest.TestCase):
+    """
+    Check that building the problem instance directly from the abstract model
+    gives the same instance as Pyomo's create_instance.
+    """
+
+    def test_direct_model_build(self):
+        model = create_abstract_model()
+        instance = create_problem_instance(
+            model=model, loaded_data=load_data(model), direct=False
+        )
+        model = create_abstract_model()
+        direct_instance = create_problem_instance(
+            model=model, loaded_data=load_data(model), direct=True
+        )
+
+        self.assertIs(direct_instance, model)
+        self.assertIs(type(direct_instance), ConcreteModel)
+        self.assertTrue(direct_instance.is_constructed())
+
+        components = list(instance.component_objects(descend_into=False))
+        direct_components = list(direct_instance.component_objects(descend_into=False))
+        self.assertListEqual(
+            [(c.name, c.type()) for c in components],
+            [(c.name, c.type()) for c in direct_components],
+        )
+        for (c, direct_c) in zip(components, direct_components):
+            self.assertTrue(direct_c.is_constructed(), c.name)
+            if isinstance(c, Set):
+                self.assertListEqual(list(c), list(direct_c), c.name)
+            elif isinstance(c, Param):
+                self.assertDictEqual(
+                    c.extract_values(), direct_c.extract_values(), c.name
+                )
+            elif isinstance(c, Var):
+                self.assertListEqual(list(c.keys()), list(direct_c.keys()), c.name)
+                for idx in c:
+                    self.assertEqual(c[idx].bounds, direct_c[idx].bounds)
+                    self.assertIs(c[idx].domain, direct_c[idx].domain)
+            elif isinstance(c, (Expression, Constraint, Objective)):
+                self.assertListEqual(list(c.keys()), list(direct_c.keys()), c.name)
+                for idx in c:
+                    self.assertEqual(str(c[idx].expr), str(direct_c[idx].expr))
+
+
+class RecordingSolver(object):
+    """
+    Record the calls to the persistent solver interface methods used to
+    update the solver's instance.
+    """
+
+    def __init__(self):
+        self.calls = list()
+
+    def update_var(self, var):
+        self.calls.append(("update_var", var))
+
+    def remove_constraint(self, con):
+        self.calls.append(("remove_constraint", con))
+
+    def add_constraint(self, con):
+        self.calls.append(("add_constraint", con))
+
+    def set_objective(self, obj):
+        self.calls.append(("set_objective", obj))
+
+
+class TestUpdatePreviousInstance(unittest.TestCase):
+    """
+    Check that the previous instance is only reused if the structure of the
+    problem has not changed.
+    """
+
+    def update_previous_instance(self, mutable_load):
+        """
+        :param mutable_load: whether the load param is mutable
+        :return: the solver session with the previous instance and the
+            result of updating it with a different load
+        """
+        model = create_abstract_model(mutable_load=mutable_load)
+        data = load_data(model)
+        instance = create_problem_instance(model=model, loaded_data=data)
+        instance.Provide_Power_MW["Coal", 20200101].fix(3)
+        solver_session = {
+            "instance": instance,
+            "modules_to_use": [],
+            "data": data.data(),
+            "fixed_variables": [instance.Provide_Power_MW["Coal", 20200101]],
+        }
+
+        model = create_abstract_model(mutable_load=mutable_load)
+        updated_instance = update_previous_instance(
+            solver_session=solver_session,
+            modules_to_use=[],
+            loaded_modules=[],
+            dynamic_components=None,
+            scenario_data=load_data(model, load_mw=5),
+            scenario_directory="",
+            subproblem="",
+            stage="",
+        )
+
+        return solver_session, updated_instance
+
+    def test_update_mutable_param(self):
+        solver_session, updated_instance = self.update_previous_instance(
+            mutable_load=True
+        )
+        self.assertIs(updated_instance, solver_session["instance"])
+        self.assertEqual(updated_instance.load_mw[20200101].value, 5)
+        self.assertEqual(updated_instance.load_mw[20200102].value, 1)
+        self.assertFalse(updated_instance.Provide_Power_MW["Coal", 20200101].fixed)
+        self.assertEqual(len(solver_session["updated_params"]), 1)
+        self.assertIs(
+            solver_session["updated_params"][0], updated_instance.load_mw[20200101]
+        )
+
+    def test_update_persistent_solver(self):
+        solver_session, updated_instance = self.update_previous_instance(
+            mutable_load=True
+        )
+        solver_session["updated_variables"] = solver_session["fixed_variables"]
+        solver = RecordingSolver()
+        update_persistent_solver(
+            solver=solver, instance=updated_instance, solver_session=solver_session
+        )
+        var = updated_instance.Provide_Power_MW["Coal", 20200101]
+        constraint = updated_instance.Meet_Load_Constraint[20200101]
+        self.assertListEqual(
+            solver.calls,
+            [
+                ("update_var", var),
+                ("remove_constraint", constraint),
+                ("add_constraint", constraint),
+            ],
+        )
+
+    def test_rebuild_if_structure_changed(self):
+        solver_session, updated_instance = self.update_previous_instance(
+            mutable_load=False
+        )
+        self.assertIsNone(updated_instance)
+        self.assertTrue(
+            solver_session["instance"].Provide_Power_MW["Coal", 20200101].fixed
+        )
+
+
+class TestPreviousSolution(unittest.TestCase):
+    """
+    Check that the previous solution is applied to the same index,
+    remapping only the timepoints if they have changed.
+    """
+
+    def test_get_timepoint_index_position(self):
+        m = create_model(tmps=[1, 2])
+        self.assertEqual(get_timepoint_index_position(m.Commit), 1)
+        self.assertEqual(get_timepoint_index_position(m.Flow), 1)
+        self.assertIsNone(get_timepoint_index_position(m.Horizon_Var))
+        self.assertIsNone(get_timepoint_index_position(m.Scalar_Var))
+
+    def test_apply_previous_solution(self):
+        solver_session = dict()
+        previous = create_model(tmps=[1, 2])
+        for tmp in [1, 2]:
+            previous.Commit["gen", tmp].set_value(10 * tmp)
+            for hrz in previous.HRZS:
+                previous.Flow[hrz, tmp].set_value(100 * hrz + tmp)
+        for hrz in previous.HRZS:
+            previous.Horizon_Var[hrz].set_value(hrz)
+        save_solution_for_next_solve(instance=previous, solver_session=solver_session)
+
+        # Timepoints 3 and 4 are mapped to timepoints 1 and 2 respectively;
+        # horizons 3 and 4 are not
+        current = create_model(tmps=[3, 4])
+        apply_previous_solution(instance=current, solver_session=solver_session)
+
+        self.assertEqual(current.Commit["gen", 3].value, 10)
+        self.assertEqual(current.Commit["gen", 4].value, 20)
+        self.assertEqual(current.Flow[1, 3].value, 101)
+        self.assertEqual(current.Flow[4, 4].value, 402)
+        self.assertEqual(
+            [current.Horizon_Var[hrz].value for hrz in current.HRZS], [1, 2, 3, 4]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()